@@ -2,6 +2,7 @@
 AIOBotocore stubs/docs generator.
 """
 from collections.abc import Iterable, Sequence
+from functools import partial
 from pathlib import Path
 
 from boto3 import __version__ as boto3_version
@@ -11,6 +12,7 @@ from mypy_boto3_builder.constants import AIOBOTOCORE_PYPI_NAME, AIOBOTOCORE_STUB
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.utils.pypi_manager import PyPIManager
+from mypy_boto3_builder.utils.worker_pool import WorkerPool
 from mypy_boto3_builder.writers.aiobotocore_processors import (
     process_aiobotocore_service,
     process_aiobotocore_service_docs,
@@ -34,6 +36,8 @@ class AioBotocoreGenerator:
         skip_published -- Whether to skip packages that are already published
         disable_smart_version -- Whether to create a new postrelease if version is already published
         version -- Package build version
+        worker_pool -- Pool to run service tasks, in-process by default
+        incremental -- Whether to skip service packages with unchanged inputs
     """
 
     def __init__(
@@ -47,6 +51,8 @@ class AioBotocoreGenerator:
         skip_published: bool,
         disable_smart_version: bool,
         version: str,
+        worker_pool: WorkerPool | None = None,
+        incremental: bool = False,
     ):
         self.session = session
         self.service_names = service_names
@@ -58,6 +64,8 @@ class AioBotocoreGenerator:
         self.skip_published = skip_published
         self.disable_smart_version = disable_smart_version
         self.version = version
+        self.worker_pool = worker_pool or WorkerPool(session)
+        self.incremental = incremental
 
     def _get_package_version(self, pypi_name: str, version: str) -> str | None:
         pypi_manager = PyPIManager(pypi_name)
@@ -75,6 +83,7 @@ class AioBotocoreGenerator:
         """
         Generate `aiobotocore-stubs` package.
         """
+        PyPIManager.prefetch([AIOBOTOCORE_PYPI_NAME, AIOBOTOCORE_STUBS_LITE_PYPI_NAME])
         self._generate_stubs()
         self._generate_stubs_lite()
 
@@ -115,40 +124,66 @@ class AioBotocoreGenerator:
         Generate service stubs.
         """
         total_str = f"{len(self.service_names)}"
-        for index, service_name in enumerate(self.service_names):
-            current_str = f"{{:0{len(total_str)}}}".format(index + 1)
+        PyPIManager.prefetch([i.aiobotocore_pypi_name for i in self.service_names])
+        versions = {
+            service_name: self._get_package_version(
+                service_name.aiobotocore_pypi_name, self.version
+            )
+            for service_name in self.service_names
+        }
+        for service_name in self.service_names:
             service_name.boto3_version = boto3_version
+        try:
+            jobs = self.worker_pool.run(
+                partial(
+                    process_aiobotocore_service,
+                    output_path=self.output_path,
+                    generate_setup=self.generate_setup,
+                    service_names=self.master_service_names,
+                    incremental=self.incremental,
+                ),
+                [
+                    {"service_name": service_name, "version": version}
+                    for service_name, version in versions.items()
+                    if version
+                ],
+            )
+            for index, service_name in enumerate(self.service_names):
+                current_str = f"{{:0{len(total_str)}}}".format(index + 1)
+
+                version = versions[service_name]
+                if not version:
+                    self.logger.info(
+                        f"[{current_str}/{total_str}]"
+                        f" Skipping {service_name.aiobotocore_module_name} {self.version}, already on PyPI"
+                    )
+                    continue
 
-            version = self._get_package_version(service_name.aiobotocore_pypi_name, self.version)
-            if not version:
                 self.logger.info(
                     f"[{current_str}/{total_str}]"
-                    f" Skipping {service_name.aiobotocore_module_name} {self.version}, already on PyPI"
+                    f" Generating {service_name.aiobotocore_module_name} {version}"
                 )
-                continue
-
-            self.logger.info(
-                f"[{current_str}/{total_str}]"
-                f" Generating {service_name.aiobotocore_module_name} {version}"
-            )
-            process_aiobotocore_service(
-                session=self.session,
-                output_path=self.output_path,
-                service_name=service_name,
-                generate_setup=self.generate_setup,
-                service_names=self.master_service_names,
-                version=version,
-            )
-            service_name.boto3_version = ServiceName.LATEST
+                next(jobs)
+        finally:
+            for service_name in self.service_names:
+                service_name.boto3_version = ServiceName.LATEST
 
     def generate_docs(self) -> None:
         """
         Generate service and master docs.
         """
-        logger = get_logger()
         total_str = f"{len(self.service_names)}"
+        jobs = self.worker_pool.run(
+            partial(
+                process_aiobotocore_service_docs,
+                output_path=self.output_path,
+                service_names=self.available_service_names,
+                incremental=self.incremental,
+            ),
+            [{"service_name": service_name} for service_name in self.service_names],
+        )
 
-        logger.info(f"Generating {AIOBOTOCORE_PYPI_NAME} module docs")
+        self.logger.info(f"Generating {AIOBOTOCORE_PYPI_NAME} module docs")
         process_aiobotocore_stubs_docs(
             self.session,
             self.output_path,
@@ -157,12 +192,7 @@ class AioBotocoreGenerator:
 
         for index, service_name in enumerate(self.service_names):
             current_str = f"{{:0{len(total_str)}}}".format(index + 1)
-            logger.info(
+            self.logger.info(
                 f"[{current_str}/{total_str}] Generating {service_name.aiobotocore_module_name} module docs"
             )
-            process_aiobotocore_service_docs(
-                session=self.session,
-                output_path=self.output_path,
-                service_name=service_name,
-                service_names=self.available_service_names,
-            )
+            next(jobs)
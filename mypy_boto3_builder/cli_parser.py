@@ -10,7 +10,13 @@ from typing import List
 
 import pkg_resources
 
-from mypy_boto3_builder.constants import PACKAGE_NAME, PROG_NAME, Product
+from mypy_boto3_builder.constants import (
+    PACKAGE_NAME,
+    PROG_NAME,
+    SERVE_COMMAND,
+    OutputFormat,
+    Product,
+)
 
 
 def get_absolute_path(path: str) -> Path:
@@ -26,6 +32,25 @@ def get_absolute_path(path: str) -> Path:
     return Path(path).absolute()
 
 
+def get_jobs_count(value: str) -> int:
+    """
+    Get number of worker processes from a string.
+
+    Arguments:
+        value -- String containing non-negative integer.
+
+    Returns:
+        Number of worker processes, 0 to use all CPUs.
+    """
+    try:
+        result = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if result < 0:
+        raise argparse.ArgumentTypeError(f"should be 0 or more, got {result}")
+    return result
+
+
 @dataclass
 class Namespace:
     """
@@ -43,6 +68,26 @@ class Namespace:
     partial_overload: bool
     skip_published: bool
     disable_smart_version: bool
+    jobs: int
+    cache_path: Path | None
+    incremental: bool
+    native_format: bool
+    pypi_index_path: Path | None
+    shape_only: bool
+    profile_path: Path | None
+    output_formats: list[OutputFormat]
+    server_path: Path | None
+
+
+@dataclass
+class ServeNamespace:
+    """
+    CLI arguments namespace for `serve` command.
+    """
+
+    log_level: int
+    socket_path: Path
+    watch: bool
 
 
 def parse_args(args: Sequence[str]) -> Namespace:
@@ -118,7 +163,72 @@ def parse_args(args: Sequence[str]) -> Namespace:
         action="store_true",
         help="List supported boto3 service names.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=get_jobs_count,
+        default=1,
+        metavar="N",
+        help="Number of parallel worker processes for service packages, 0 to use all CPUs.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_path",
+        type=get_absolute_path,
+        metavar="CACHE_PATH",
+        help="Directory to keep parsed services and formatted code between runs.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip service packages and docs that have not changed since the last build.",
+    )
+    parser.add_argument(
+        "--native-format",
+        action="store_true",
+        help="Format service modules with built-in formatter instead of isort and black.",
+    )
+    parser.add_argument(
+        "--pypi-index",
+        dest="pypi_index_path",
+        type=get_absolute_path,
+        metavar="PATH",
+        help=(
+            "Read published versions from a JSON file or a local simple index directory"
+            " instead of PyPI."
+        ),
+    )
+    parser.add_argument(
+        "--shape-only",
+        action="store_true",
+        help="Parse clients from service models without creating boto3 clients.",
+    )
+    parser.add_argument(
+        "--profile",
+        dest="profile_path",
+        type=get_absolute_path,
+        metavar="PATH",
+        help="Save build stage timings and a Chrome trace to directory.",
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_formats",
+        type=OutputFormat,
+        choices=list(OutputFormat),
+        nargs="+",
+        default=[OutputFormat.source],
+        help="Write packages as source trees, or as wheel and sdist archives to `dist` directory.",
+    )
+    parser.add_argument(
+        "--server",
+        dest="server_path",
+        type=get_absolute_path,
+        metavar="SOCKET_PATH",
+        help=f"Send build to a running `{SERVE_COMMAND}` process instead of building in place.",
+    )
     result = parser.parse_args(args)
+    if result.installed and set(result.output_formats) != {OutputFormat.source}:
+        parser.error("--installed supports only source format")
     result.builder_version = version
     return Namespace(
         log_level=logging.DEBUG if result.debug else logging.INFO,
@@ -132,4 +242,44 @@ def parse_args(args: Sequence[str]) -> Namespace:
         partial_overload=result.partial_overload,
         skip_published=result.skip_published,
         disable_smart_version=result.no_smart_version,
+        jobs=result.jobs,
+        cache_path=result.cache_path,
+        incremental=result.incremental,
+        native_format=result.native_format,
+        pypi_index_path=result.pypi_index_path,
+        shape_only=result.shape_only,
+        profile_path=result.profile_path,
+        output_formats=result.output_formats,
+        server_path=result.server_path,
+    )
+
+
+def parse_serve_args(args: Sequence[str]) -> ServeNamespace:
+    """
+    CLI parser for `serve` command.
+
+    Returns:
+        Argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        f"{PROG_NAME} {SERVE_COMMAND}",
+        description=(
+            "Keep boto3 session, parsed services and formatter results in a long-running process"
+            f" and build packages requested with `{PROG_NAME} --server SOCKET_PATH`."
+        ),
+    )
+    parser.add_argument("-d", "--debug", action="store_true", help="Show debug messages")
+    parser.add_argument(
+        "socket_path", metavar="SOCKET_PATH", help="Unix socket path", type=get_absolute_path
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Repeat the last build when botocore or boto3 data files change.",
+    )
+    result = parser.parse_args(args)
+    return ServeNamespace(
+        log_level=logging.DEBUG if result.debug else logging.INFO,
+        socket_path=result.socket_path,
+        watch=result.watch,
     )
@@ -61,6 +61,48 @@ PROG_NAME = "mypy_boto3_builder"
 # builder package name
 PACKAGE_NAME = "mypy-boto3-builder"
 
+# Max size of pickled service packages kept in memory by each process, in bytes
+SERVICE_PACKAGE_CACHE_MEMORY_SIZE = 256 * 1024 * 1024
+
+# Formatter cache directory name inside `--cache-dir`
+FORMATTER_CACHE_DIR_NAME = "formatter"
+
+# Max size of formatted code kept in memory, in characters, split between worker processes
+FORMATTER_CACHE_MEMORY_SIZE = 256 * 1024 * 1024
+
+# Max size of formatted code kept on disk, in bytes
+FORMATTER_CACHE_DISK_SIZE = 1024 * 1024 * 1024
+
+# PyPI versions cache directory name inside `--cache-dir`
+PYPI_CACHE_DIR_NAME = "pypi"
+
+# Seconds to trust PyPI versions cached on disk
+PYPI_CACHE_TTL = 60 * 60
+
+# Number of concurrent PyPI requests
+PYPI_PREFETCH_JOBS = 16
+
+# Seconds to wait for PyPI response
+PYPI_REQUEST_TIMEOUT = 30
+
+# Directory name for output manifests inside build manifest directory
+OUTPUT_MANIFEST_DIR_NAME = "output"
+
+# Directory name for wheel and sdist archives inside output directory
+ARCHIVES_DIR_NAME = "dist"
+
+# Default archive timestamp if `SOURCE_DATE_EPOCH` is not set, 1980-01-01 is the earliest for zip
+ARCHIVE_TIMESTAMP = 315532800
+
+# CLI command to start a long-running builder server
+SERVE_COMMAND = "serve"
+
+# Seconds between botocore data checks in server watch mode
+SERVER_WATCH_INTERVAL = 2.0
+
+# Virtual output directory for in-memory builds, generated paths are relative to it
+MEMORY_OUTPUT_PATH = Path("/output")
+
 
 class Product(Enum):
     """
@@ -76,3 +118,16 @@ class Product(Enum):
 
     def __str__(self) -> str:
         return self.name
+
+
+class OutputFormat(Enum):
+    """
+    Package output format choice for CLI.
+    """
+
+    source = "source"
+    wheel = "wheel"
+    sdist = "sdist"
+
+    def __str__(self) -> str:
+        return self.name
@@ -19,6 +19,8 @@ class ImportRecord:
         fallback -- Fallback ImportRecord.
     """
 
+    __slots__ = ("source", "name", "alias", "min_version", "fallback")
+
     builtins_import_string = ImportString("builtins")
     third_party_import_strings = (
         ImportString("boto3"),
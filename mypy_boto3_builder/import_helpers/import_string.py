@@ -26,6 +26,8 @@ class ImportString:
         'my.name.test'
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self, master_name: str, *parts: str) -> None:
         self.parts: list[str] = []
         all_parts = [master_name, *parts]
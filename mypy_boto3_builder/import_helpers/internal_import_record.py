@@ -16,6 +16,8 @@ class InternalImportRecord(ImportRecord):
         alias -- Import local name.
     """
 
+    __slots__ = ("_local_source",)
+
     def __init__(self, service_module_name: ServiceModuleName, name: str = "", alias: str = ""):
         self._local_source = ImportString(service_module_name.name)
         source = ImportString.parent() + self._local_source
@@ -17,6 +17,7 @@ class JinjaManager:
         loader=jinja2.FileSystemLoader(TEMPLATES_PATH.as_posix()),
         undefined=jinja2.StrictUndefined,
     )
+    _globals: dict[str, object] = {}
 
     @classmethod
     def update_globals(cls, **kwargs: object) -> None:
@@ -26,8 +27,16 @@ class JinjaManager:
         Arguments:
             kwargs -- Globals to set.
         """
+        cls._globals.update(kwargs)
         cls._environment.globals.update(kwargs)
 
+    @classmethod
+    def get_globals(cls) -> dict[str, object]:
+        """
+        Get global variables set by `update_globals`.
+        """
+        return dict(cls._globals)
+
     @staticmethod
     def escape_md(value: str) -> str:
         """
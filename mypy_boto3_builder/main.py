@@ -3,6 +3,7 @@ Main entrypoint for builder.
 """
 import sys
 from collections.abc import Iterable
+from pathlib import Path
 
 from boto3 import __version__ as boto3_version
 from boto3.session import Session
@@ -10,24 +11,39 @@ from botocore import __version__ as botocore_version
 
 from mypy_boto3_builder.aiobotocore_generator import AioBotocoreGenerator
 from mypy_boto3_builder.boto3_generator import Boto3Generator
-from mypy_boto3_builder.cli_parser import parse_args
+from mypy_boto3_builder.cli_parser import Namespace, ServeNamespace, parse_args, parse_serve_args
 from mypy_boto3_builder.constants import (
     BOTO3_STUBS_NAME,
-    DUMMY_REGION,
+    FORMATTER_CACHE_DIR_NAME,
+    MEMORY_OUTPUT_PATH,
     MODULE_NAME,
+    PYPI_CACHE_DIR_NAME,
     PYPI_NAME,
+    SERVE_COMMAND,
+    OutputFormat,
     Product,
 )
 from mypy_boto3_builder.jinja_manager import JinjaManager
 from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_session, get_service_metadata
+from mypy_boto3_builder.parsers.service_package_cache import ServicePackageCache
+from mypy_boto3_builder.server import BuilderServer, send_build_request
 from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
 from mypy_boto3_builder.utils.boto3_changelog import Boto3Changelog
+from mypy_boto3_builder.utils.build_manifest import get_builder_hash
+from mypy_boto3_builder.utils.profiler import Profiler
+from mypy_boto3_builder.utils.pypi_manager import PyPIManager
 from mypy_boto3_builder.utils.strings import (
     get_aiobotocore_version,
     get_anchor_link,
     get_botocore_class_name,
     get_min_build_version,
 )
+from mypy_boto3_builder.utils.worker_pool import WorkerPool
+from mypy_boto3_builder.writers.formatter_cache import FormatterCache
+from mypy_boto3_builder.writers.memory_output import MemoryOutput
+from mypy_boto3_builder.writers.output_index import OutputIndex
+from mypy_boto3_builder.writers.package_writer import PackageWriter
 
 
 def get_selected_service_names(
@@ -79,30 +95,48 @@ def get_available_service_names(session: Session) -> list[ServiceName]:
         A list of supported services.
     """
     available_services = session.get_available_services()
-    botocore_session = session._session
     result: list[ServiceName] = []
     for name in available_services:
-        service_data = botocore_session.get_service_data(name)
-        metadata = service_data["metadata"]
+        metadata = get_service_metadata(session, name)
         class_name = get_botocore_class_name(metadata)
         service_name = ServiceNameCatalog.add(name, class_name)
         result.append(service_name)
     return result
 
 
-def main() -> None:
+def reset_settings() -> None:
     """
-    Main entrypoint for builder.
+    Reset build settings left by a previous build in the same process.
+
+    Parsed services and formatter results are kept.
+    Output target selected by `MemoryOutput` is not changed.
     """
-    args = parse_args(sys.argv[1:])
-    logger = get_logger(level=args.log_level)
-    session = Session(region_name=DUMMY_REGION)
+    PackageWriter.native_format = False
+    PackageWriter.set_output_formats([OutputFormat.source])
+    ServicePackageCache.shape_only = False
+    ServicePackageCache.disable_disk_cache()
+    FormatterCache.disable_disk_cache()
+    PyPIManager.clear()
+    Profiler.enabled = False
+    Profiler.clear()
+    get_builder_hash.cache_clear()
+
+
+def run(args: Namespace, session: Session, available_service_names: list[ServiceName]) -> None:
+    """
+    Build selected products.
 
-    botocore_session = session._session
-    botocore_session.set_credentials("access_key", "secret_key", "token")
+    Settings left by a previous build in the same process are reset first.
 
-    args.output_path.mkdir(exist_ok=True, parents=True)
-    available_service_names = get_available_service_names(session)
+    Arguments:
+        args -- Parsed CLI arguments.
+        session -- Boto3 session.
+        available_service_names -- All ServiceNames available in current boto3 release.
+    """
+    logger = get_logger()
+    reset_settings()
+    if not MemoryOutput.enabled:
+        args.output_path.mkdir(exist_ok=True, parents=True)
 
     logger.info(f"{len(available_service_names)} supported boto3 services discovered")
     if args.list_services:
@@ -129,6 +163,33 @@ def main() -> None:
         hasattr=hasattr,
     )
 
+    if args.cache_path:
+        ServicePackageCache.enable_disk_cache(args.cache_path)
+        FormatterCache.enable_disk_cache(args.cache_path / FORMATTER_CACHE_DIR_NAME)
+        PyPIManager.enable_disk_cache(args.cache_path / PYPI_CACHE_DIR_NAME)
+
+    if args.pypi_index_path:
+        PyPIManager.use_offline_index(args.pypi_index_path)
+    elif MemoryOutput.enabled:
+        PyPIManager.use_offline_index()
+
+    if MemoryOutput.enabled:
+        OutputIndex.clear()
+    else:
+        OutputIndex.scan(args.output_path)
+
+    if args.native_format:
+        PackageWriter.enable_native_format()
+
+    PackageWriter.set_output_formats(args.output_formats)
+
+    if args.shape_only:
+        ServicePackageCache.enable_shape_only()
+
+    if args.profile_path:
+        Profiler.enable()
+
+    worker_pool = WorkerPool(session, jobs=args.jobs)
     boto3_generator = Boto3Generator(
         service_names=service_names,
         available_service_names=available_service_names,
@@ -139,6 +200,8 @@ def main() -> None:
         skip_published=args.skip_published,
         disable_smart_version=args.disable_smart_version,
         version=args.build_version or boto3_version,
+        worker_pool=worker_pool,
+        incremental=args.incremental,
     )
     aiobotocore_generator = AioBotocoreGenerator(
         service_names=service_names,
@@ -150,6 +213,8 @@ def main() -> None:
         skip_published=args.skip_published,
         disable_smart_version=args.disable_smart_version,
         version=args.build_version or aiobotocore_version,
+        worker_pool=worker_pool,
+        incremental=args.incremental,
     )
     generators_map = {
         Product.boto3: boto3_generator.generate_stubs,
@@ -159,12 +224,111 @@ def main() -> None:
         Product.aiobotocore_services: aiobotocore_generator.generate_service_stubs,
         Product.aiobotocore_docs: aiobotocore_generator.generate_docs,
     }
-    generators = [generators_map[p] for p in args.products]
-    for generator in generators:
-        generator()
+    with worker_pool:
+        for product in args.products:
+            with Profiler.span(product.value):
+                generators_map[product]()
+
+    if args.profile_path:
+        Profiler.write_report(args.profile_path)
 
     logger.info("Completed")
 
 
+def build(
+    service_names: Iterable[str] = (ServiceName.ALL,),
+    products: Iterable[Product] = (Product.boto3, Product.boto3_services),
+    version: str | None = None,
+    output_formats: Iterable[OutputFormat] = (OutputFormat.source,),
+    native_format: bool = False,
+    jobs: int = 1,
+    session: Session | None = None,
+) -> dict[Path, bytes]:
+    """
+    Build products in memory.
+
+    Nothing is written to disk and PyPI is not queried for published versions,
+    all packages are considered unpublished.
+
+    Arguments:
+        service_names -- Service names, supports `all` and `updated`.
+        products -- Products to build.
+        version -- Package version, library version is used by default.
+        output_formats -- Source files, wheel or sdist archives.
+        native_format -- Format service modules with built-in formatter.
+        jobs -- Number of parallel worker processes, `0` to use all CPUs.
+        session -- Boto3 session to reuse between builds.
+
+    Returns:
+        Map of generated file path relative to output directory to file content.
+    """
+    argv = [
+        MEMORY_OUTPUT_PATH.as_posix(),
+        "--no-smart-version",
+        "--jobs",
+        str(jobs),
+        "--services",
+        *service_names,
+        "--product",
+        *(i.value for i in products),
+        "--format",
+        *(i.value for i in output_formats),
+    ]
+    if version:
+        argv.extend(("--build-version", version))
+    if native_format:
+        argv.append("--native-format")
+    args = parse_args(argv)
+    session = session or get_boto3_session()
+
+    MemoryOutput.enable()
+    try:
+        run(args, session, get_available_service_names(session))
+        files = MemoryOutput.pop_files()
+    finally:
+        MemoryOutput.disable()
+
+    return {path.relative_to(MEMORY_OUTPUT_PATH): files[path] for path in sorted(files)}
+
+
+def serve(args: ServeNamespace) -> None:
+    """
+    Run builder server until interrupted.
+
+    Arguments:
+        args -- Parsed `serve` CLI arguments.
+    """
+    logger = get_logger(level=args.log_level)
+    with BuilderServer(
+        args.socket_path,
+        build=run,
+        discover=get_available_service_names,
+        watch=args.watch,
+    ) as server:
+        logger.info(f"Serving builds on {args.socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Stopped")
+
+
+def main() -> None:
+    """
+    Main entrypoint for builder.
+    """
+    argv = sys.argv[1:]
+    if argv[:1] == [SERVE_COMMAND]:
+        serve(parse_serve_args(argv[1:]))
+        return
+
+    args = parse_args(argv)
+    get_logger(level=args.log_level)
+    if args.server_path:
+        sys.exit(send_build_request(args.server_path, argv))
+
+    session = get_boto3_session()
+    run(args, session, get_available_service_names(session))
+
+
 if __name__ == "__main__":
     main()
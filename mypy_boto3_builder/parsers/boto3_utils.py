@@ -1,13 +1,39 @@
 """
-Getters for boto3 client and resource from session.
+Getters for boto3 session, client, resource and service model data.
 """
+import gzip
+import hashlib
+import io
+import json
+from pathlib import Path
+
 from boto3.exceptions import ResourceNotExistsError
 from boto3.resources.base import ServiceResource as Boto3ServiceResource
 from boto3.session import Session
 from botocore.client import BaseClient
+from botocore.exceptions import DataNotFoundError
 
+from mypy_boto3_builder.constants import DUMMY_REGION
 from mypy_boto3_builder.service_name import ServiceName
 
+# botocore and boto3 data files that define a service
+SERVICE_MODEL_TYPE_NAMES = ("service-2", "paginators-1", "waiters-2", "resources-1")
+
+# bytes to read from a service model file per attempt to find its metadata
+METADATA_CHUNK_SIZE = 4096
+
+
+def get_boto3_session() -> Session:
+    """
+    Create boto3 session with fake credentials.
+
+    Returns:
+        Boto3 session.
+    """
+    session = Session(region_name=DUMMY_REGION)
+    session._session.set_credentials("access_key", "secret_key", "token")
+    return session
+
 
 def get_boto3_client(session: Session, service_name: ServiceName) -> BaseClient:
     """
@@ -38,3 +64,93 @@ def get_boto3_resource(session: Session, service_name: ServiceName) -> Boto3Serv
         return session.resource(service_name.boto3_name)  # type: ignore
     except ResourceNotExistsError:
         return None
+
+
+def get_service_model_hash(session: Session, service_name: ServiceName) -> str:
+    """
+    Get hash of botocore and boto3 data files for a service.
+
+    Raw file content is hashed, so models are not loaded.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- ServiceName instance.
+
+    Returns:
+        Hex digest of `service-2`, `paginators-1`, `waiters-2` and `resources-1` data files.
+    """
+    loader = session._session.get_component("data_loader")
+    digest = hashlib.sha256()
+    for type_name in SERVICE_MODEL_TYPE_NAMES:
+        try:
+            api_version = loader.determine_latest_version(service_name.boto3_name, type_name)
+        except DataNotFoundError:
+            api_version = None
+        digest.update(f"{type_name}\0{api_version}\n".encode())
+        if api_version is None:
+            continue
+        for search_path in loader.search_paths:
+            model_path = Path(search_path) / service_name.boto3_name / api_version
+            for path in sorted(model_path.glob(f"{type_name}.*")):
+                digest.update(f"{path.name}\0".encode())
+                digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _read_model_metadata(path: Path) -> dict[str, str] | None:
+    """
+    Decode only `metadata` object from the beginning of a service model file.
+    """
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as gzip_stream:
+            return _decode_model_metadata(gzip_stream)
+    with path.open("rb") as stream:
+        return _decode_model_metadata(stream)
+
+
+def _decode_model_metadata(stream: io.BufferedIOBase) -> dict[str, str] | None:
+    decoder = json.JSONDecoder()
+    data = b""
+    while True:
+        chunk = stream.read(METADATA_CHUNK_SIZE)
+        data += chunk
+        text = data.decode("utf-8", "ignore")
+        key_index = text.find('"metadata"')
+        if key_index >= 0:
+            try:
+                metadata: dict[str, str]
+                metadata, _ = decoder.raw_decode(text, text.index("{", key_index))
+            except ValueError:
+                pass
+            else:
+                return metadata
+        if not chunk:
+            return None
+
+
+def get_service_metadata(session: Session, service_name: str) -> dict[str, str]:
+    """
+    Get `metadata` of a service model without loading the whole model.
+
+    Falls back to full model load if metadata cannot be read from the file beginning.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Service name as in `session.get_available_services`.
+
+    Returns:
+        Service model metadata.
+    """
+    botocore_session = session._session
+    loader = botocore_session.get_component("data_loader")
+    api_version = loader.determine_latest_version(service_name, "service-2")
+    for search_path in loader.search_paths:
+        for extension in (".json", ".json.gz"):
+            path = Path(search_path) / service_name / api_version / f"service-2{extension}"
+            if not path.is_file():
+                continue
+            metadata = _read_model_metadata(path)
+            if metadata is not None:
+                return metadata
+
+    return botocore_session.get_service_data(service_name)["metadata"]
@@ -2,10 +2,16 @@
 Boto3 client parser, produces `structures.Client`.
 """
 import inspect
+from collections.abc import Callable
+from typing import Any
 
 from boto3.session import Session
-from botocore.client import ClientMeta
+from botocore import xform_name
+from botocore.client import BaseClient, ClientMeta
+from botocore.docs.docstring import ClientMethodDocstring
 from botocore.errorfactory import ClientExceptionsFactory
+from botocore.hooks import HierarchicalEmitter
+from botocore.model import OperationModel, ServiceModel
 
 from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client
 from mypy_boto3_builder.parsers.helpers import get_public_methods, parse_method
@@ -17,22 +23,96 @@ from mypy_boto3_builder.type_annotations.internal_import import InternalImport
 from mypy_boto3_builder.type_annotations.type import Type
 from mypy_boto3_builder.type_annotations.type_class import TypeClass
 from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_maps.injected_method_map import get_injected_client_methods
 from mypy_boto3_builder.utils.strings import get_short_docstring
 
 
-def parse_client(session: Session, service_name: ServiceName, shape_parser: ShapeParser) -> Client:
+def _get_operation_method(method_name: str, operation_model: OperationModel) -> Callable[..., Any]:
+    """
+    Create a function that looks like a client operation method for introspection.
+
+    Function body is the same as the one botocore creates for client class.
+    Docstring skips request parameters and response, as only its intro is used,
+    so documentation event handlers for these sections are not called.
+    """
+    operation_name = operation_model.name
+
+    def _api_call(self: BaseClient, *args: Any, **kwargs: Any) -> Any:
+        if args:
+            raise TypeError(f"{method_name}() only accepts keyword arguments.")
+        return self._make_api_call(operation_name, kwargs)
+
+    input_shape = operation_model.input_shape
+    _api_call.__name__ = method_name
+    _api_call.__doc__ = ClientMethodDocstring(
+        operation_model=operation_model,
+        method_name=operation_name,
+        event_emitter=HierarchicalEmitter(),
+        method_description=operation_model.documentation,
+        example_prefix=f"response = client.{method_name}",
+        include_signature=False,
+        exclude_input=list(input_shape.members) if input_shape else None,
+        document_output=False,
+    )
+    return _api_call
+
+
+def get_shape_public_methods(
+    service_name: ServiceName, service_model: ServiceModel
+) -> dict[str, Callable[..., Any]]:
+    """
+    Get client public methods from service model and injected methods map.
+
+    Arguments:
+        service_name -- Target service name.
+        service_model -- Botocore service model.
+
+    Returns:
+        A map of method name to function, same as `get_public_methods` for a client.
+    """
+    methods: dict[str, Callable[..., Any]] = {}
+    for operation_name in service_model.operation_names:
+        method_name = xform_name(operation_name)
+        methods[method_name] = _get_operation_method(
+            method_name, service_model.operation_model(operation_name)
+        )
+
+    for method_name, function in get_injected_client_methods(service_name).items():
+        if function is None:
+            methods.pop(method_name, None)
+            continue
+        methods[method_name] = function
+
+    return {name: methods[name] for name in sorted(methods)}
+
+
+def parse_client(
+    session: Session,
+    service_name: ServiceName,
+    shape_parser: ShapeParser,
+    shape_only: bool = False,
+) -> Client:
     """
     Parse boto3 client to a structure.
 
     Arguments:
         session -- boto3 session.
         service_name -- Target service name.
+        shape_parser -- Shape parser for the service.
+        shape_only -- Use service model instead of creating a boto3 client.
 
     Returns:
         Client structure.
     """
-    client = get_boto3_client(session, service_name)
-    public_methods = get_public_methods(client)
+    public_methods: dict[str, Callable[..., Any]]
+    if shape_only:
+        client = None
+        service_model = shape_parser.service_model
+        public_methods = get_shape_public_methods(service_name, service_model)
+    else:
+        client = get_boto3_client(session, service_name)
+        service_model = client.meta.service_model
+        public_methods = {**get_public_methods(client)}
 
     # remove methods that will be overriden
     if "get_paginator" in public_methods:
@@ -57,7 +137,6 @@ def parse_client(session: Session, service_name: ServiceName, shape_parser: Shap
         method.docstring = docstring
         result.methods.append(method)
 
-    service_model = client.meta.service_model
     client_exceptions = ClientExceptionsFactory().create_client_exceptions(service_model)
     for exception_class_name in dir(client_exceptions):
         if exception_class_name.startswith("_"):
@@ -2,7 +2,8 @@
 Converter of function argspec to `Argument` list.
 """
 import inspect
-from types import MethodType
+from collections.abc import Callable
+from typing import Any
 
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.argument import Argument
@@ -23,7 +24,7 @@ class ArgSpecParser:
         self.service_name = service_name
 
     @staticmethod
-    def _get_arguments_from_argspec(func: MethodType) -> list[Argument]:
+    def _get_arguments_from_argspec(func: Callable[..., Any]) -> list[Argument]:
         arguments: list[Argument] = []
         argspec = inspect.getfullargspec(func)
         for argument_name in argspec.args:
@@ -53,7 +54,9 @@ class ArgSpecParser:
             arguments.append(Argument(argspec.varkw, Type.Any, prefix="**"))
         return arguments
 
-    def get_arguments(self, class_name: str, method_name: str, func: MethodType) -> list[Argument]:
+    def get_arguments(
+        self, class_name: str, method_name: str, func: Callable[..., Any]
+    ) -> list[Argument]:
         """
         Get arguments from `class_name.method_name` method `func`.
         """
@@ -5,12 +5,16 @@ import re
 import textwrap
 from re import Pattern
 
-from pyparsing import ParseException
-
 from mypy_boto3_builder.logger import get_logger
-from mypy_boto3_builder.parsers.docstring_parser.syntax_grammar import SyntaxGrammar
-from mypy_boto3_builder.parsers.docstring_parser.type_doc_grammar import TypeDocGrammar
+from mypy_boto3_builder.parsers.docstring_parser.syntax_parser import (
+    SyntaxParser,
+    SyntaxParserError,
+)
 from mypy_boto3_builder.parsers.docstring_parser.type_doc_line import TypeDocLine
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_parser import (
+    TypeDocParser,
+    TypeDocParserError,
+)
 from mypy_boto3_builder.parsers.docstring_parser.type_value import TypeValue
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.argument import Argument
@@ -67,16 +71,14 @@ class DocstringParser:
             request_syntax_index = request_syntax_index - 1
         request_syntax_string = get_line_with_indented(input_string[request_syntax_index:], True)
 
-        SyntaxGrammar.reset()
-        SyntaxGrammar.enable_packrat()
         try:
-            match = SyntaxGrammar.request_syntax.parseString(request_syntax_string)
-        except ParseException as e:
+            match = SyntaxParser(request_syntax_string).parse_request_syntax()
+        except SyntaxParserError as e:
             self.logger.warning(f"Cannot parse request syntax for {self.prefix}")
             self.logger.debug(e)
             return
 
-        argument_groups = match.asDict().get("arguments", [])
+        argument_groups = match.get("arguments", [])
         for argument_dict in argument_groups:
             argument_name = argument_dict["name"]
             argument_prefix = self.prefix + get_class_prefix(argument_name)
@@ -90,16 +92,14 @@ class DocstringParser:
             return
 
         type_strings = [i for i in input_string.split("\n") if i.startswith(":type ")]
-        TypeDocGrammar.reset()
         for type_string in type_strings:
             try:
-                match = TypeDocGrammar.type_definition.parseString(type_string)
-            except ParseException as e:
+                match_dict = TypeDocParser(type_string).parse_type_definition()
+            except TypeDocParserError as e:
                 self.logger.warning(f"Cannot parse type definition {type_string} for {self.prefix}")
                 self.logger.debug(e)
                 continue
 
-            match_dict: dict[str, str] = match.asDict()  # type: ignore
             argument_name = match_dict["name"]
             type_str = match_dict["type_name"]
             argument = self._find_argument_or_append(argument_name)
@@ -119,17 +119,16 @@ class DocstringParser:
             start_index = re_match.start()
             param_string = get_line_with_indented(input_string[start_index + 1 :])
 
-            TypeDocGrammar.reset()
             try:
-                match = TypeDocGrammar.param_definition.parseString(param_string)
-            except ParseException as e:
+                match = TypeDocParser(param_string).parse_param_definition()
+            except TypeDocParserError as e:
                 self.logger.warning(
                     f"Cannot parse param definition {param_string} for {self.prefix}"
                 )
                 self.logger.debug(e)
                 continue
 
-            argument_line = TypeDocLine(**match.asDict())
+            argument_line = TypeDocLine(**match)
             if not argument_line.name:
                 continue
 
@@ -211,15 +210,14 @@ class DocstringParser:
     def _parse_returns(self, input_string: str) -> FakeAnnotation | None:
         if ":return: " not in input_string and ":returns: " not in input_string:
             return None
-        TypeDocGrammar.reset()
         returns_string = input_string[input_string.index(":return") :].split("\n", 1)[0]
         try:
-            match = TypeDocGrammar.returns_definition.parseString(returns_string)
-        except ParseException as e:
+            match = TypeDocParser(returns_string).parse_returns_definition()
+        except TypeDocParserError as e:
             self.logger.warning(f"Cannot parse returns for {self.prefix}: {e}")
             return None
 
-        description = match.asDict()["description"]
+        description = match["description"]
         if description == "None":
             return Type.none
 
@@ -238,16 +236,14 @@ class DocstringParser:
         if ":rtype: " not in input_string:
             return None
 
-        TypeDocGrammar.reset()
         rtype_string = input_string[input_string.index(":rtype: ") :].split("\n", 1)[0]
         try:
-            match = TypeDocGrammar.rtype_definition.parseString(rtype_string)
-        except ParseException as e:
+            match = TypeDocParser(rtype_string).parse_rtype_definition()
+        except TypeDocParserError as e:
             self.logger.warning(f"Cannot parse rtype for {self.prefix}: {e}")
             return None
 
-        match_dict: dict[str, str] = match.asDict()  # type: ignore
-        type_name = match_dict["type_name"]
+        type_name = match["type_name"]
         return get_type_from_docstring(type_name)
 
     def _parse_response_syntax(self, input_string: str) -> FakeAnnotation | None:
@@ -259,17 +255,14 @@ class DocstringParser:
             response_syntax_index -= 1
         response_syntax_string = get_line_with_indented(input_string[response_syntax_index:], True)
 
-        SyntaxGrammar.reset()
-        SyntaxGrammar.enable_packrat()
         try:
-            match = SyntaxGrammar.response_syntax.parseString(response_syntax_string)
-        except ParseException as e:
+            match = SyntaxParser(response_syntax_string).parse_response_syntax()
+        except SyntaxParserError as e:
             self.logger.warning(f"Cannot parse response syntax for {self.prefix}")
             self.logger.debug(e)
             return None
 
-        match_dict: dict[str, dict[str, object]] = match.asDict()  # type: ignore
-        value = match_dict["value"]
+        value = match["value"]
         return TypeValue(self.service_name, f"{self.prefix}Response", value).get_type()
 
     def _parse_response_structure(self, input_string: str) -> TypeDocLine | None:
@@ -285,15 +278,14 @@ class DocstringParser:
         )
         response_structure_string = textwrap.dedent(response_structure_string)
 
-        TypeDocGrammar.reset()
         try:
-            match = TypeDocGrammar.response_structure.parseString(response_structure_string)
-        except ParseException as e:
+            match = TypeDocParser(response_structure_string).parse_response_structure()
+        except TypeDocParserError as e:
             self.logger.warning(f"Cannot parse response structure for {self.prefix}")
             self.logger.debug(e)
             return None
 
-        return TypeDocLine(**match.asDict())
+        return TypeDocLine(**match)
 
     def get_return_type(self, input_string: str) -> FakeAnnotation:
         """
@@ -0,0 +1,347 @@
+"""
+Parser for request and response syntax.
+"""
+import re
+from collections.abc import Callable
+from re import Pattern
+from typing import Any
+
+ParseResult = tuple[Any, int] | None
+
+
+class SyntaxParserError(Exception):
+    """
+    Main error for SyntaxParser.
+    """
+
+
+class SyntaxParser:
+    """
+    Single-pass parser for boto3 request and response syntax.
+
+    Alternatives are tried in grammar order, each value is
+    parsed at most once per position, so parsing takes linear time.
+
+    ellipsis = "..."
+    name_value ::= alphanums + "_-."
+    string_value ::= alphas{0,2} "'"  [^']+  "'"
+    plain_value ::= string_value | name_value
+    literal_item ::= list_value | dict_value | set_value | plain_value
+    literal_value ::= literal_item ("|" literal_item)+
+    any_value ::= literal_value | list_value | dict_value | set_value | union_value | func_call | plain_value
+    empty_list_value ::= "[" [ellipsis] [","] "]"
+    non_empty_list_value ::= "[" any_value ("," any_value)* [","] "]"
+    list_value ::= empty_list_value | non_empty_list_value
+    set_value ::= "{" any_value ("," any_value)* [","] "}"
+    func_call ::= name_value "(" any_value ("," any_value)* [","] ")"
+    empty_dict_value ::= "{" [ellipsis] [","] "}"
+    non_empty_dict_value ::= "{" string_value ":" any_value ("," string_value ":" any_value)* [","] "}"
+    dict_value ::= empty_dict_value | non_empty_dict_value
+    union_item ::= literal_value | list_value | dict_value | set_value | plain_value
+    union_value ::= union_item ("or" union_item)+
+    argument ::= alphanums "=" any_value
+    definition ::= [^']+ "(" argument ("," argument)* [","] ")"
+    request_syntax ::= "**Request Syntax**" "::" definition
+    response_syntax ::= "**Response Syntax**" "::" (list_value | dict_value)
+
+    Arguments:
+        input_string -- Request or response syntax section.
+    """
+
+    REQUEST_SYNTAX = "**Request Syntax**"
+    RESPONSE_SYNTAX = "**Response Syntax**"
+    ELLIPSIS = "..."
+
+    RE_WHITESPACE: Pattern[str] = re.compile(r"[ \n\t\r]*")
+    RE_NAME: Pattern[str] = re.compile(r"[a-zA-Z0-9_\-.]+")
+    RE_ARGUMENT_NAME: Pattern[str] = re.compile(r"[a-zA-Z0-9]+")
+    RE_STRING: Pattern[str] = re.compile(r"[a-zA-Z]{0,2}'[^']*'")
+
+    def __init__(self, input_string: str) -> None:
+        self.input_string = input_string.expandtabs()
+        self._values: dict[int, ParseResult] = {}
+        self._literals: dict[int, ParseResult] = {}
+        self._items: dict[int, ParseResult] = {}
+
+    def parse_request_syntax(self) -> dict[str, Any]:
+        """
+        Parse `**Request Syntax**` section.
+
+        Returns:
+            A dictionary with `arguments` list, if method has arguments.
+
+        Raises:
+            SyntaxParserError -- If input is not a valid request syntax.
+        """
+        position = self._parse_header(self.REQUEST_SYNTAX)
+        call_index = self.input_string.find("(", position)
+        if call_index < 0:
+            raise SyntaxParserError(f"Expected '(' at {position}")
+
+        match = self._parse_delimited(self._parse_argument, call_index + 1, ",")
+        position = call_index + 1
+        result: dict[str, Any] = {}
+        if match:
+            result["arguments"], position = match
+        position = self._skip_literal(position, ",")
+        self._expect(position, ")")
+        return result
+
+    def parse_response_syntax(self) -> dict[str, Any]:
+        """
+        Parse `**Response Syntax**` section.
+
+        Returns:
+            A dictionary with parsed `value`.
+
+        Raises:
+            SyntaxParserError -- If input is not a valid response syntax.
+        """
+        position = self._parse_header(self.RESPONSE_SYNTAX)
+        match = self._parse_list(position) or self._parse_dict(position)
+        if not match:
+            raise SyntaxParserError(f"Expected list or dict at {position}")
+        return {"value": match[0]}
+
+    def _skip(self, position: int) -> int:
+        match = self.RE_WHITESPACE.match(self.input_string, position)
+        return match.end() if match else position
+
+    def _is_next(self, position: int, literal: str) -> bool:
+        return self.input_string.startswith(literal, position)
+
+    def _skip_literal(self, position: int, literal: str) -> int:
+        next_position = self._skip(position)
+        if self._is_next(next_position, literal):
+            return next_position + len(literal)
+        return position
+
+    def _expect(self, position: int, literal: str) -> int:
+        position = self._skip(position)
+        if not self._is_next(position, literal):
+            raise SyntaxParserError(f"Expected {literal!r} at {position}")
+        return position + len(literal)
+
+    def _parse_header(self, header: str) -> int:
+        position = self._expect(0, header)
+        return self._expect(position, "::")
+
+    def _parse_delimited(
+        self, parse: Callable[[int], ParseResult], position: int, delimiter: str
+    ) -> tuple[list[Any], int] | None:
+        match = parse(position)
+        if not match:
+            return None
+
+        item, position = match
+        result = [item]
+        while True:
+            delimiter_position = self._skip(position)
+            if not self._is_next(delimiter_position, delimiter):
+                break
+            match = parse(delimiter_position + len(delimiter))
+            if not match:
+                break
+            item, position = match
+            result.append(item)
+        return result, position
+
+    def _parse_argument(self, position: int) -> ParseResult:
+        position = self._skip(position)
+        name_match = self.RE_ARGUMENT_NAME.match(self.input_string, position)
+        if not name_match:
+            return None
+
+        position = self._skip(name_match.end())
+        if not self._is_next(position, "="):
+            return None
+
+        value_match = self._parse_value(position + 1)
+        if not value_match:
+            return None
+
+        value, position = value_match
+        return {"name": name_match.group(), "value": value}, position
+
+    def _parse_value(self, position: int) -> ParseResult:
+        position = self._skip(position)
+        if position not in self._values:
+            self._values[position] = self._parse_any_value(position)
+        return self._values[position]
+
+    def _parse_any_value(self, position: int) -> ParseResult:
+        match = self._parse_literal(position)
+        if match:
+            return match
+
+        item_match = self._parse_item(position)
+        if item_match and "value" not in item_match[0]:
+            return item_match
+
+        if item_match:
+            match = self._parse_union(item_match)
+            if match:
+                return match
+
+        return self._parse_func_call(position) or item_match
+
+    def _parse_literal(self, position: int) -> ParseResult:
+        position = self._skip(position)
+        if position not in self._literals:
+            self._literals[position] = self._parse_literal_value(position)
+        return self._literals[position]
+
+    def _parse_literal_value(self, position: int) -> ParseResult:
+        first_match = self._parse_item(position)
+        if not first_match:
+            return None
+
+        first_item, position = first_match
+        position = self._skip(position)
+        if not self._is_next(position, "|"):
+            return None
+
+        rest_match = self._parse_delimited(self._parse_item, position + 1, "|")
+        if not rest_match:
+            return None
+
+        rest_items, position = rest_match
+        return {"literal_first_item": first_item, "literal_rest_items": rest_items}, position
+
+    def _parse_union(self, first_match: tuple[Any, int]) -> ParseResult:
+        first_item, position = first_match
+        position = self._skip(position)
+        if not self._is_next(position, "or"):
+            return None
+
+        rest_match = self._parse_delimited(self._parse_union_item, position + 2, "or")
+        if not rest_match:
+            return None
+
+        rest_items, position = rest_match
+        return {"union_first_item": first_item, "union_rest_items": rest_items}, position
+
+    def _parse_union_item(self, position: int) -> ParseResult:
+        return self._parse_literal(position) or self._parse_item(position)
+
+    def _parse_item(self, position: int) -> ParseResult:
+        position = self._skip(position)
+        if position not in self._items:
+            self._items[position] = (
+                self._parse_list(position)
+                or self._parse_dict(position)
+                or self._parse_set(position)
+                or self._parse_plain(position)
+            )
+        return self._items[position]
+
+    def _parse_empty(self, position: int, start: str, end: str) -> ParseResult:
+        tokens = [start]
+        position = self._skip(position + 1)
+        for literal in (self.ELLIPSIS, ","):
+            if self._is_next(position, literal):
+                tokens.append(literal)
+                position = self._skip(position + len(literal))
+        if not self._is_next(position, end):
+            return None
+        tokens.append(end)
+        return tokens, position + 1
+
+    def _parse_items(
+        self, parse: Callable[[int], ParseResult], position: int, end: str
+    ) -> ParseResult:
+        match = self._parse_delimited(parse, position + 1, ",")
+        if not match:
+            return None
+
+        items, position = match
+        position = self._skip(self._skip_literal(position, ","))
+        if not self._is_next(position, end):
+            return None
+        return items, position + 1
+
+    def _parse_list(self, position: int) -> ParseResult:
+        position = self._skip(position)
+        if not self._is_next(position, "["):
+            return None
+
+        match = self._parse_empty(position, "[", "]")
+        if match:
+            return {"empty_list": match[0]}, match[1]
+
+        match = self._parse_items(self._parse_value, position, "]")
+        if match:
+            return {"list_items": match[0]}, match[1]
+
+        return None
+
+    def _parse_dict(self, position: int) -> ParseResult:
+        position = self._skip(position)
+        if not self._is_next(position, "{"):
+            return None
+
+        match = self._parse_empty(position, "{", "}")
+        if match:
+            return {"empty_dict": match[0]}, match[1]
+
+        match = self._parse_items(self._parse_dict_item, position, "}")
+        if match:
+            return {"dict_items": match[0]}, match[1]
+
+        return None
+
+    def _parse_dict_item(self, position: int) -> ParseResult:
+        position = self._skip(position)
+        key_match = self.RE_STRING.match(self.input_string, position)
+        if not key_match:
+            return None
+
+        position = self._skip(key_match.end())
+        if not self._is_next(position, ":"):
+            return None
+
+        value_match = self._parse_value(position + 1)
+        if not value_match:
+            return None
+
+        value, position = value_match
+        return {"key": key_match.group(), "value": value}, position
+
+    def _parse_set(self, position: int) -> ParseResult:
+        position = self._skip(position)
+        if not self._is_next(position, "{"):
+            return None
+
+        match = self._parse_items(self._parse_value, position, "}")
+        if match:
+            return {"set_items": match[0]}, match[1]
+
+        return None
+
+    def _parse_plain(self, position: int) -> ParseResult:
+        position = self._skip(position)
+        match = self.RE_STRING.match(self.input_string, position) or self.RE_NAME.match(
+            self.input_string, position
+        )
+        if not match:
+            return None
+        return {"value": match.group()}, match.end()
+
+    def _parse_func_call(self, position: int) -> ParseResult:
+        name_match = self.RE_NAME.match(self.input_string, position)
+        if not name_match:
+            return None
+
+        position = self._skip(name_match.end())
+        if not self._is_next(position, "("):
+            return None
+
+        func_call: dict[str, Any] = {"name": name_match.group()}
+        position += 1
+        args_match = self._parse_delimited(self._parse_value, position, ",")
+        if args_match:
+            func_call["args"], position = args_match
+        position = self._skip(self._skip_literal(position, ","))
+        if not self._is_next(position, ")"):
+            return None
+        return {"func_call": func_call}, position + 1
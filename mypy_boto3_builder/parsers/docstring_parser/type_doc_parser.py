@@ -0,0 +1,173 @@
+"""
+Parser for argument type doc lines.
+"""
+from typing import Any
+
+
+class TypeDocParserError(Exception):
+    """
+    Main error for TypeDocParser.
+    """
+
+
+class TypeDocParser:
+    r"""
+    Single-pass parser for boto3 docs syntax.
+
+    Nested lines are kept as plain `line` entries.
+
+    EOL ::= ["\r"] "\n"
+    SOL ::= LINE_START
+    line ::= [^EOL]+ EOL
+    word ::= alphanums + "_"
+    indented_block ::= INDENT (line_indented | any_line)
+    line_indented ::= any_line indented_block
+    type_definition ::= ":type" [^:]+ ":" [^EOL]+
+    rtype_definition ::= ":rtype:" [^EOL]+
+    returns_definition ::= (":returns:" | ":return:") [^EOL]+
+    param_definition ::= ":param" [^:]+ ":" [^EOL]+ EOL [indented_block]
+    response_structure ::= "**Response Structure**" line [indented_block]
+    typed_dict_key_line ::= "-" "**" word "**" "*(" word ")" "--*" [^EOL]+ + EOL
+    type_line ::= "-" "*(" word ")" "--*" [^EOL]+ + EOL
+    any_line ::= typed_dict_key_line | type_line | line
+
+    Arguments:
+        input_string -- Definition line with optional indented lines.
+    """
+
+    WHITESPACE = " \n\t\r"
+    LINE_WHITESPACE = " \t\r"
+
+    def __init__(self, input_string: str) -> None:
+        self.input_string = input_string.expandtabs()
+
+    def parse_type_definition(self) -> dict[str, str]:
+        """
+        Parse `:type <name>: <type_name>` line.
+
+        Returns:
+            A dictionary with `name` and `type_name`.
+
+        Raises:
+            TypeDocParserError -- If input is not a valid type definition.
+        """
+        name, position = self._parse_name(":type")
+        return {"name": name, "type_name": self._parse_rest(position)[0]}
+
+    def parse_rtype_definition(self) -> dict[str, str]:
+        """
+        Parse `:rtype: <type_name>` line.
+
+        Returns:
+            A dictionary with `type_name`.
+
+        Raises:
+            TypeDocParserError -- If input is not a valid rtype definition.
+        """
+        position = self._parse_prefix(":rtype:")
+        return {"type_name": self._parse_rest(position)[0]}
+
+    def parse_returns_definition(self) -> dict[str, str]:
+        """
+        Parse `:returns: <description>` or `:return: <description>` line.
+
+        Returns:
+            A dictionary with `description`.
+
+        Raises:
+            TypeDocParserError -- If input is not a valid returns definition.
+        """
+        prefix = ":returns:" if self.input_string.startswith(":returns:") else ":return:"
+        position = self._parse_prefix(prefix)
+        return {"description": self._parse_rest(position)[0]}
+
+    def parse_param_definition(self) -> dict[str, Any]:
+        """
+        Parse `:param <name>: <description>` line with indented lines.
+
+        Returns:
+            A dictionary with `name`, `description` and `indented` lines if any.
+
+        Raises:
+            TypeDocParserError -- If input is not a valid param definition.
+        """
+        name, position = self._parse_name(":param")
+        description, position = self._parse_rest(position)
+        result: dict[str, Any] = {"name": name, "description": description}
+        indented = self._parse_indented(position + 1)
+        if indented:
+            result["indented"] = indented
+        return result
+
+    def parse_response_structure(self) -> dict[str, Any]:
+        """
+        Parse `**Response Structure**` section.
+
+        Returns:
+            A dictionary with first structure `line` and `indented` lines.
+
+        Raises:
+            TypeDocParserError -- If input is not a valid response structure.
+        """
+        position = self._parse_prefix("**Response Structure**")
+        position = self._skip(position, self.WHITESPACE)
+        line, position = self._parse_rest(position)
+        indented = self._parse_indented(position + 1)
+        if not indented:
+            raise TypeDocParserError(f"Expected indented lines at {position}")
+        return {"line": [line], "indented": indented}
+
+    def _skip(self, position: int, whitespace: str) -> int:
+        input_string = self.input_string
+        while position < len(input_string) and input_string[position] in whitespace:
+            position += 1
+        return position
+
+    def _parse_prefix(self, prefix: str) -> int:
+        if not self.input_string.startswith(prefix):
+            raise TypeDocParserError(f"Expected {prefix!r} at 0")
+        return len(prefix)
+
+    def _parse_name(self, prefix: str) -> tuple[str, int]:
+        position = self._skip(self._parse_prefix(prefix), self.WHITESPACE)
+        end = self.input_string.find(":", position)
+        if end < 0:
+            raise TypeDocParserError(f"Expected ':' at {position}")
+        return self.input_string[position:end], end + 1
+
+    def _parse_rest(self, position: int) -> tuple[str, int]:
+        position = self._skip(position, self.LINE_WHITESPACE)
+        end = self.input_string.find("\n", position)
+        if end < 0:
+            end = len(self.input_string)
+        return self.input_string[position:end], end
+
+    def _parse_indented(self, position: int) -> list[dict[str, Any]]:
+        lines: list[tuple[int, str]] = []
+        for line in self.input_string[position:].split("\n"):
+            text = line.lstrip(self.LINE_WHITESPACE)
+            if not text:
+                continue
+            indent = len(line) - len(text)
+            if not indent:
+                break
+            lines.append((indent, text))
+        return self._parse_block(lines, 0, len(lines))
+
+    def _parse_block(
+        self, lines: list[tuple[int, str]], start: int, end: int
+    ) -> list[dict[str, Any]]:
+        result: list[dict[str, Any]] = []
+        index = start
+        while index < end:
+            indent, text = lines[index]
+            block_end = index + 1
+            while block_end < end and lines[block_end][0] > indent:
+                block_end += 1
+            item: dict[str, Any] = {"line": [text]}
+            indented = self._parse_block(lines, index + 1, block_end)
+            if indented:
+                item["indented"] = indented
+            result.append(item)
+            index = block_end
+        return result
@@ -4,8 +4,7 @@ Fake parser that produces `structures.ServiceModule` for master module and stubs
 from boto3.session import Session
 from botocore import xform_name
 
-from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client, get_boto3_resource
-from mypy_boto3_builder.parsers.shape_parser import ShapeParser
+from mypy_boto3_builder.parsers.service_summary import ServiceSummary
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.client import Client
 from mypy_boto3_builder.structures.paginator import Paginator
@@ -19,7 +18,8 @@ def parse_fake_service_package(session: Session, service_name: ServiceName) -> S
     """
     Create fake boto3 service module structure.
 
-    Used by stubs and master package.
+    Used by stubs and master package. Contains only names from `ServiceSummary`,
+    boto3 client and resource are not created.
 
     Arguments:
         session -- boto3 session.
@@ -28,9 +28,7 @@ def parse_fake_service_package(session: Session, service_name: ServiceName) -> S
     Returns:
         ServiceModule structure.
     """
-    shape_parser = ShapeParser(session, service_name)
-    boto3_client = get_boto3_client(session, service_name)
-    boto3_resource = get_boto3_resource(session, service_name)
+    summary = ServiceSummary.get(session, service_name)
 
     result = ServicePackage(
         name=service_name.module_name,
@@ -39,19 +37,16 @@ def parse_fake_service_package(session: Session, service_name: ServiceName) -> S
         client=Client(
             name=Client.get_class_name(service_name),
             service_name=service_name,
-            boto3_client=boto3_client,
         ),
     )
 
-    if boto3_resource is not None:
+    if summary.has_resource:
         result.service_resource = ServiceResource(
             name=ServiceResource.get_class_name(service_name),
             service_name=service_name,
-            boto3_service_resource=boto3_resource,
         )
 
-    waiter_names: list[str] = boto3_client.waiter_names
-    for waiter_name in waiter_names:
+    for waiter_name in summary.waiter_names:
         real_class_name = get_class_prefix(waiter_name)
         waiter_class_name = f"{real_class_name}Waiter"
         result.waiters.append(
@@ -62,7 +57,7 @@ def parse_fake_service_package(session: Session, service_name: ServiceName) -> S
             )
         )
 
-    for paginator_name in shape_parser.get_paginator_names():
+    for paginator_name in summary.paginator_names:
         operation_name = xform_name(paginator_name)
         result.paginators.append(
             Paginator(
@@ -3,7 +3,9 @@ Helpers for parsing methods and attributes.
 """
 import inspect
 import textwrap
+from collections.abc import Callable
 from types import MethodType
+from typing import Any
 
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.parsers.docstring_parser.argspec_parser import ArgSpecParser
@@ -40,14 +42,16 @@ def get_public_methods(inspect_class: object) -> dict[str, MethodType]:
 
 
 def parse_method(
-    parent_name: str, name: str, method: MethodType, service_name: ServiceName
+    parent_name: str, name: str, method: Callable[..., Any], service_name: ServiceName
 ) -> Method:
     """
     Parse method to a structure.
 
     Arguments:
         parent_name -- Parent class name.
+        name -- Method name.
         method -- Inspect method.
+        service_name -- Target service name.
 
     Returns:
         Method structure.
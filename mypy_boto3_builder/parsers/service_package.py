@@ -1,7 +1,6 @@
 """
 Parser that produces `structures.ServiceModule`.
 """
-
 from boto3.session import Session
 from botocore import xform_name
 
@@ -13,26 +12,35 @@ from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.paginator import Paginator
 from mypy_boto3_builder.structures.service_package import ServicePackage
 from mypy_boto3_builder.structures.waiter import Waiter
+from mypy_boto3_builder.utils.profiler import Profiler
 
 
-def parse_service_package(session: Session, service_name: ServiceName) -> ServicePackage:
+def parse_service_package(
+    session: Session, service_name: ServiceName, shape_only: bool = False
+) -> ServicePackage:
     """
     Extract all data from boto3 service package.
 
     Arguments:
         session -- boto3 session.
         service_name -- Target service name.
+        shape_only -- Parse client and resources from service model without creating boto3 objects.
 
     Returns:
         ServiceModule structure.
     """
     logger = get_logger()
     logger.debug("Parsing Shapes")
-    shape_parser = ShapeParser(session, service_name)
+    with Profiler.span("parse_shapes", service=service_name.boto3_name):
+        shape_parser = ShapeParser(session, service_name)
     logger.debug("Parsing Client")
-    client = parse_client(session, service_name, shape_parser)
+    with Profiler.span("parse_client", service=service_name.boto3_name):
+        client = parse_client(session, service_name, shape_parser, shape_only=shape_only)
 
-    service_resource = parse_service_resource(session, service_name, shape_parser)
+    with Profiler.span("parse_service_resource", service=service_name.boto3_name):
+        service_resource = parse_service_resource(
+            session, service_name, shape_parser, shape_only=shape_only
+        )
 
     result = ServicePackage(
         name=service_name.module_name,
@@ -42,34 +50,35 @@ def parse_service_package(session: Session, service_name: ServiceName) -> Servic
         service_resource=service_resource,
     )
 
-    waiter_names: list[str] = client.boto3_client.waiter_names
-    for waiter_name in waiter_names:
-        logger.debug(f"Parsing Waiter {waiter_name}")
-        waiter = client.boto3_client.get_waiter(waiter_name)
-        waiter_record = Waiter(
-            name=f"{waiter.name}Waiter",
-            waiter_name=waiter_name,
-            service_name=service_name,
-        )
-
-        wait_method = shape_parser.get_wait_method(waiter.name)
-        waiter_record.methods.append(wait_method)
-        result.waiters.append(waiter_record)
-
-    for paginator_name in shape_parser.get_paginator_names():
-        logger.debug(f"Parsing Paginator {paginator_name}")
-        operation_name = xform_name(paginator_name)
-        # boto3_paginator = client.boto3_client.get_paginator(operation_name)
-        paginator_record = Paginator(
-            name=f"{paginator_name}Paginator",
-            paginator_name=paginator_name,
-            operation_name=operation_name,
-            service_name=service_name,
-        )
-
-        paginate_method = shape_parser.get_paginate_method(paginator_name)
-        paginator_record.methods.append(paginate_method)
-        result.paginators.append(paginator_record)
+    with Profiler.span("parse_waiters", service=service_name.boto3_name):
+        for waiter_class_name in shape_parser.get_waiter_names():
+            waiter_name = xform_name(waiter_class_name)
+            logger.debug(f"Parsing Waiter {waiter_name}")
+            waiter_record = Waiter(
+                name=f"{waiter_class_name}Waiter",
+                waiter_name=waiter_name,
+                service_name=service_name,
+            )
+
+            wait_method = shape_parser.get_wait_method(waiter_class_name)
+            waiter_record.methods.append(wait_method)
+            result.waiters.append(waiter_record)
+
+    with Profiler.span("parse_paginators", service=service_name.boto3_name):
+        for paginator_name in shape_parser.get_paginator_names():
+            logger.debug(f"Parsing Paginator {paginator_name}")
+            operation_name = xform_name(paginator_name)
+            # boto3_paginator = client.boto3_client.get_paginator(operation_name)
+            paginator_record = Paginator(
+                name=f"{paginator_name}Paginator",
+                paginator_name=paginator_name,
+                operation_name=operation_name,
+                service_name=service_name,
+            )
+
+            paginate_method = shape_parser.get_paginate_method(paginator_name)
+            paginator_record.methods.append(paginate_method)
+            result.paginators.append(paginator_record)
 
     if result.paginators:
         if len(result.paginators) == 1:
@@ -91,8 +100,15 @@ def parse_service_package(session: Session, service_name: ServiceName) -> Servic
                 method = package_waiter.get_client_method()
                 result.client.methods.append(method)
 
-    result.typed_dicts = result.extract_typed_dicts()
-    result.literals = result.extract_literals()
+    logger.debug(
+        f"{service_name.boto3_name} shape cache: {shape_parser.shape_cache_hits} hits,"
+        f" {shape_parser.shape_cache_misses} misses,"
+        f" {shape_parser.get_shape_cache_hit_rate():.0%} hit rate"
+    )
+    with Profiler.span("extract_typed_dicts", service=service_name.boto3_name):
+        result.typed_dicts = result.extract_typed_dicts()
+    with Profiler.span("extract_literals", service=service_name.boto3_name):
+        result.literals = result.extract_literals()
     result.validate()
 
     return result
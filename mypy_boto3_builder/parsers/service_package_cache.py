@@ -0,0 +1,241 @@
+"""
+Per-run and on-disk cache for parsed service packages.
+"""
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO
+
+from boto3 import __version__ as boto3_version
+from boto3.resources.base import ServiceResource as Boto3ServiceResource
+from boto3.session import Session
+from botocore import __version__ as botocore_version
+from botocore.client import BaseClient
+
+from mypy_boto3_builder.constants import SERVICE_PACKAGE_CACHE_MEMORY_SIZE
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.boto3_utils import (
+    get_boto3_client,
+    get_boto3_resource,
+    get_service_model_hash,
+)
+from mypy_boto3_builder.parsers.service_package import parse_service_package
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.utils.build_manifest import get_builder_hash
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+SERVICE_NAME_ID = "service_name"
+CLIENT_ID = "client"
+RESOURCE_ID = "resource"
+
+
+class _PackagePickler(pickle.Pickler):
+    """
+    Pickler that keeps `ServiceName` and boto3 objects out of the pickled data.
+    """
+
+    def __init__(self, file: BinaryIO, service_name: ServiceName) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.service_name = service_name
+        self.external_objects: list[object] = []
+
+    def persistent_id(self, obj: object) -> str | tuple[str, int] | None:
+        if obj is self.service_name:
+            return SERVICE_NAME_ID
+        if isinstance(obj, BaseClient):
+            self.external_objects.append(obj)
+            return CLIENT_ID, len(self.external_objects) - 1
+        if isinstance(obj, Boto3ServiceResource):
+            self.external_objects.append(obj)
+            return RESOURCE_ID, len(self.external_objects) - 1
+        return None
+
+
+class _PackageUnpickler(pickle.Unpickler):
+    """
+    Unpickler that restores objects skipped by `_PackagePickler`.
+
+    If `external_objects` are not available, boto3 objects are created from `session`.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        session: Session,
+        service_name: ServiceName,
+        external_objects: list[object] | None = None,
+    ) -> None:
+        super().__init__(file)
+        self.session = session
+        self.service_name = service_name
+        self.external_objects = external_objects
+        self.created_objects: dict[str, object] = {}
+
+    def persistent_load(self, pid: str | tuple[str, int]) -> object:
+        if pid == SERVICE_NAME_ID:
+            return self.service_name
+        if not isinstance(pid, tuple) or pid[0] not in (CLIENT_ID, RESOURCE_ID):
+            raise pickle.UnpicklingError(f"Unknown persistent id: {pid}")
+
+        kind, index = pid
+        if self.external_objects is not None:
+            return self.external_objects[index]
+        if kind not in self.created_objects:
+            if kind == CLIENT_ID:
+                self.created_objects[kind] = get_boto3_client(self.session, self.service_name)
+            else:
+                self.created_objects[kind] = get_boto3_resource(self.session, self.service_name)
+        return self.created_objects[kind]
+
+
+class ServicePackageCache:
+    """
+    Per-run and on-disk cache for parsed service packages.
+
+    Service is parsed once and shared between all products.
+    Packages are stored pickled, so every call returns an independent copy
+    that can be safely post-processed for a specific product and library.
+    Least recently used packages are evicted from memory when they exceed `max_memory_size`.
+
+    On-disk cache is disabled by default, see `enable_disk_cache`.
+    """
+
+    shape_only = False
+    max_memory_size = SERVICE_PACKAGE_CACHE_MEMORY_SIZE
+
+    _packages: OrderedDict[ServiceName, tuple[bytes, list[object]]] = OrderedDict()
+    _memory_size = 0
+    _disk_path: Path | None = None
+
+    @classmethod
+    def enable_shape_only(cls) -> None:
+        """
+        Parse clients from service models without creating boto3 clients.
+        """
+        cls.shape_only = True
+
+    @classmethod
+    def enable_disk_cache(cls, path: Path) -> None:
+        """
+        Store parsed packages in `path` to reuse them in next runs.
+
+        Cache files are invalidated when builder files, boto3 or botocore change.
+
+        Arguments:
+            path -- Cache directory.
+        """
+        cls._disk_path = path
+
+    @classmethod
+    def disable_disk_cache(cls) -> None:
+        """
+        Keep parsed packages only in memory.
+        """
+        cls._disk_path = None
+
+    @classmethod
+    def get_disk_cache_path(cls) -> Path | None:
+        """
+        Get on-disk cache directory, if enabled.
+        """
+        return cls._disk_path
+
+    @classmethod
+    def get(cls, session: Session, service_name: ServiceName) -> ServicePackage:
+        """
+        Get a copy of parsed service package, parse it on the first call.
+
+        Returned package references `service_name` passed to this call.
+
+        Arguments:
+            session -- boto3 session.
+            service_name -- Target service name.
+
+        Returns:
+            Parsed ServicePackage.
+        """
+        logger = get_logger()
+        if service_name in cls._packages:
+            logger.debug(f"Using parsed {service_name.boto3_name} from cache")
+            cls._packages.move_to_end(service_name)
+            data, external_objects = cls._packages[service_name]
+            unpickler = _PackageUnpickler(io.BytesIO(data), session, service_name, external_objects)
+            result: ServicePackage = unpickler.load()
+            return result
+
+        cache_path = cls._get_cache_file_path(session, service_name)
+        if cache_path is not None:
+            service_package = cls._load(cache_path, session, service_name)
+            if service_package is not None:
+                logger.debug(f"Using parsed {service_name.boto3_name} from {NicePath(cache_path)}")
+                cls._store(service_package, service_name)
+                return service_package
+
+        service_package = parse_service_package(session, service_name, shape_only=cls.shape_only)
+        data = cls._store(service_package, service_name)
+        if cache_path is not None:
+            cls._save(cache_path, data)
+        return service_package
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Remove all parsed packages from memory.
+        """
+        cls._packages.clear()
+        cls._memory_size = 0
+
+    @classmethod
+    def _store(cls, service_package: ServicePackage, service_name: ServiceName) -> bytes:
+        stream = io.BytesIO()
+        pickler = _PackagePickler(stream, service_name)
+        pickler.dump(service_package)
+        data = stream.getvalue()
+        old_entry = cls._packages.pop(service_name, None)
+        if old_entry is not None:
+            cls._memory_size -= len(old_entry[0])
+        cls._packages[service_name] = (data, pickler.external_objects)
+        cls._memory_size += len(data)
+        while cls._memory_size > cls.max_memory_size and len(cls._packages) > 1:
+            _, (evicted_data, _) = cls._packages.popitem(last=False)
+            cls._memory_size -= len(evicted_data)
+        return data
+
+    @classmethod
+    def _get_cache_file_path(cls, session: Session, service_name: ServiceName) -> Path | None:
+        if cls._disk_path is None:
+            return None
+
+        digest = hashlib.sha256()
+        for value in (get_builder_hash(), boto3_version, botocore_version, cls.shape_only):
+            digest.update(f"{value}\n".encode())
+        digest.update(get_service_model_hash(session, service_name).encode())
+
+        return cls._disk_path / f"{service_name.boto3_name}.{digest.hexdigest()}.pickle"
+
+    @staticmethod
+    def _load(path: Path, session: Session, service_name: ServiceName) -> ServicePackage | None:
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as stream:
+                result: ServicePackage = _PackageUnpickler(stream, session, service_name).load()
+        except Exception as e:
+            get_logger().debug(f"Ignoring broken cache file {NicePath(path)}: {e}")
+            return None
+        return result
+
+    @staticmethod
+    def _save(path: Path, data: bytes) -> None:
+        path.parent.mkdir(exist_ok=True, parents=True)
+        for stale_path in path.parent.glob(f"{path.name.split('.')[0]}.*.pickle"):
+            stale_path.unlink(missing_ok=True)
+
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as stream:
+            stream.write(data)
+        os.replace(stream.name, path)
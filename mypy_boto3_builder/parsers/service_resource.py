@@ -5,12 +5,16 @@ import inspect
 
 from boto3.resources.base import ServiceResource as Boto3ServiceResource
 from boto3.session import Session
-from boto3.utils import ServiceContext
+from boto3.utils import LazyLoadedWaiterModel, ServiceContext
+from botocore.client import ClientMeta
+from botocore.config import Config
 from botocore.exceptions import UnknownServiceError
+from botocore.hooks import HierarchicalEmitter
+from botocore.model import ServiceModel
 from botocore.waiter import WaiterModel
 
 from mypy_boto3_builder.logger import get_logger
-from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client, get_boto3_resource
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_resource
 from mypy_boto3_builder.parsers.helpers import get_public_methods, parse_method
 from mypy_boto3_builder.parsers.parse_attributes import parse_attributes
 from mypy_boto3_builder.parsers.parse_collections import parse_collections
@@ -25,8 +29,69 @@ from mypy_boto3_builder.type_annotations.internal_import import InternalImport
 from mypy_boto3_builder.utils.strings import get_short_docstring
 
 
-def parse_service_resource(
+class ShapeClient:
+    """
+    Client stand-in for resources created from service model.
+
+    Resource parsers use only client service model, so real client is not created.
+
+    Arguments:
+        service_model -- Botocore service model.
+    """
+
+    def __init__(self, service_model: ServiceModel) -> None:
+        self.meta = ClientMeta(
+            events=HierarchicalEmitter(),
+            client_config=Config(),
+            endpoint_url="",
+            service_model=service_model,
+            method_to_api_mapping={},
+            partition="aws",
+        )
+
+
+def get_shape_service_resource(
     session: Session, service_name: ServiceName, shape_parser: ShapeParser
+) -> Boto3ServiceResource | None:
+    """
+    Create boto3 ServiceResource from `resources-1` data without creating a client.
+
+    Resource class is created the same way as `Session.resource` does.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+        shape_parser -- Shape parser for the service.
+
+    Returns:
+        Boto3 resource or None.
+    """
+    resources_shape = shape_parser.resources_shape
+    if not resources_shape:
+        return None
+
+    service_model = shape_parser.service_model
+    resource_class = session.resource_factory.load_from_definition(
+        resource_name=service_name.boto3_name,
+        single_resource_json_definition=resources_shape["service"],
+        service_context=ServiceContext(
+            service_name=service_name.boto3_name,
+            service_model=service_model,
+            resource_json_definitions=resources_shape["resources"],
+            service_waiter_model=LazyLoadedWaiterModel(
+                session._session, service_name.boto3_name, service_model.api_version
+            ),
+        ),
+    )
+    result: Boto3ServiceResource = resource_class(client=ShapeClient(service_model))
+    return result
+
+
+def parse_service_resource(
+    session: Session,
+    service_name: ServiceName,
+    shape_parser: ShapeParser,
+    shape_only: bool = False,
 ) -> ServiceResource | None:
     """
     Parse boto3 ServiceResource data.
@@ -34,11 +99,16 @@ def parse_service_resource(
     Arguments:
         session -- boto3 session.
         service_name -- Target service name.
+        shape_parser -- Shape parser for the service.
+        shape_only -- Create resource from `resources-1` data without creating a client.
 
     Returns:
         ServiceResource structure or None if service does not have a resource.
     """
-    service_resource = get_boto3_resource(session, service_name)
+    if shape_only:
+        service_resource = get_shape_service_resource(session, service_name, shape_parser)
+    else:
+        service_resource = get_boto3_resource(session, service_name)
     if service_resource is None:
         return None
 
@@ -47,7 +117,7 @@ def parse_service_resource(
     result = ServiceResource(
         name=ServiceResource.get_class_name(service_name),
         service_name=service_name,
-        boto3_service_resource=service_resource,
+        boto3_service_resource=None if shape_only else service_resource,
     )
 
     public_methods = get_public_methods(service_resource)
@@ -136,6 +206,6 @@ def get_sub_resources(
         )
         identifiers = resource_class.meta.resource_model.identifiers
         args = ["foo"] * len(identifiers)
-        result.append(resource_class(*args, client=get_boto3_client(session, service_name)))
+        result.append(resource_class(*args, client=resource.meta.client))
 
     return result
@@ -0,0 +1,81 @@
+"""
+Compact service description for aggregate packages.
+"""
+from boto3.session import Session
+from botocore import xform_name
+from botocore.exceptions import DataNotFoundError
+from botocore.loaders import Loader
+
+from mypy_boto3_builder.service_name import ServiceName
+
+
+class ServiceSummary:
+    """
+    Compact service description for aggregate packages.
+
+    Master, `boto3-stubs` and `boto3-stubs-lite` packages need only class and method names,
+    so summaries are read from small waiters and paginators data files
+    without creating boto3 clients and resources, and shared for the whole run.
+
+    Arguments:
+        service_name -- Target service name.
+        has_resource -- Whether service has a boto3 resource.
+        waiter_names -- Snake case waiter names as in `client.waiter_names`.
+        paginator_names -- Paginator names as in paginators data.
+    """
+
+    _cache: dict[str, "ServiceSummary"] = {}
+
+    def __init__(
+        self,
+        service_name: ServiceName,
+        has_resource: bool,
+        waiter_names: list[str],
+        paginator_names: list[str],
+    ) -> None:
+        self.service_name = service_name
+        self.has_resource = has_resource
+        self.waiter_names = waiter_names
+        self.paginator_names = paginator_names
+
+    @classmethod
+    def get(cls, session: Session, service_name: ServiceName) -> "ServiceSummary":
+        """
+        Get summary for `service_name`, computed once per run.
+
+        Arguments:
+            session -- boto3 session.
+            service_name -- Target service name.
+        """
+        if service_name.name not in cls._cache:
+            cls._cache[service_name.name] = cls._parse(session, service_name)
+        return cls._cache[service_name.name]
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drop all computed summaries.
+        """
+        cls._cache.clear()
+
+    @classmethod
+    def _parse(cls, session: Session, service_name: ServiceName) -> "ServiceSummary":
+        loader = session._session.get_component("data_loader")
+        waiters = cls._load_section(loader, service_name, "waiters-2", "waiters")
+        paginators = cls._load_section(loader, service_name, "paginators-1", "pagination")
+        return cls(
+            service_name=service_name,
+            has_resource=service_name.boto3_name in session.get_available_resources(),
+            waiter_names=[xform_name(i) for i in sorted(waiters)],
+            paginator_names=sorted(paginators),
+        )
+
+    @staticmethod
+    def _load_section(
+        loader: Loader, service_name: ServiceName, type_name: str, key: str
+    ) -> dict[str, object]:
+        try:
+            model = loader.load_service_model(service_name.boto3_name, type_name)
+        except DataNotFoundError:
+            return {}
+        return model.get(key, {})
@@ -73,6 +73,9 @@ class ShapeParser:
         "blob_streaming": TypeClass(StreamingBody),
     }
 
+    # Model shape classes which parse results are shared between references.
+    SHARED_SHAPE_CLASSES = (StringShape, MapShape, ListShape, StructureShape)
+
     # Alias map fixes added by botocore for documentation build.
     # https://github.com/boto/botocore/blob/develop/botocore/handlers.py#L773
     # https://github.com/boto/botocore/blob/develop/botocore/handlers.py#L1055
@@ -103,6 +106,13 @@ class ShapeParser:
         self.service_name = service_name
         self.service_model = ServiceModel(service_data, service_name.boto3_name)
         self._typed_dict_map: dict[str, TypeTypedDict] = {}
+        self._shape_cache: dict[
+            tuple[str, tuple[str, ...], bool, bool, bool], FakeAnnotation
+        ] = {}
+        self._literals: dict[tuple[str, tuple[str, ...]], TypeLiteral] = {}
+        self._subscripts: dict[tuple[int, ...], TypeSubscript] = {}
+        self.shape_cache_hits = 0
+        self.shape_cache_misses = 0
         self._waiters_shape: Mapping[str, Any] | None = None
         try:
             self._waiters_shape = loader.load_service_model(service_name.boto3_name, "waiters-2")
@@ -136,6 +146,15 @@ class ShapeParser:
         )
         self.proxy_operation_model = OperationModel({}, self.service_model)
 
+    def get_shape_cache_hit_rate(self) -> float:
+        """
+        Get share of `parse_shape` calls for model shapes that reused a parsed annotation.
+        """
+        total = self.shape_cache_hits + self.shape_cache_misses
+        if not total:
+            return 0.0
+        return self.shape_cache_hits / total
+
     def _get_operation(self, name: str) -> OperationModel:
         return self.service_model.operation_model(name)
 
@@ -150,6 +169,13 @@ class ShapeParser:
         except KeyError as e:
             raise ShapeParserError(f"Unknown paginator: {name}") from e
 
+    @property
+    def resources_shape(self) -> Mapping[str, Any] | None:
+        """
+        Boto3 resources model, if service has resources.
+        """
+        return self._resources_shape
+
     def _get_service_resource(self) -> dict[str, Any]:
         if not self._resources_shape:
             raise ShapeParserError("Resource shape not found")
@@ -177,6 +203,20 @@ class ShapeParser:
         result.sort()
         return result
 
+    def get_waiter_names(self) -> list[str]:
+        """
+        Get available waiter names.
+
+        Returns:
+            A list of waiter names.
+        """
+        result: list[str] = []
+        if self._waiters_shape:
+            for name in self._waiters_shape.get("waiters", []):
+                result.append(name)
+        result.sort()
+        return result
+
     def _get_argument_alias(self, operation_name: str, argument_name: str) -> str:
         service_map = self.ARGUMENT_ALIASES.get(self.service_name.boto3_name)
         if not service_map:
@@ -324,7 +364,37 @@ class ShapeParser:
         if literal_type_stub:
             return literal_type_stub
 
-        return TypeLiteral(f"{shape.name}Type", [option for option in shape.enum])
+        return self._get_literal(f"{shape.name}Type", shape.enum)
+
+    def _get_literal(self, name: str, children: Iterable[str]) -> TypeLiteral:
+        """
+        Get a shared `TypeLiteral` with `name` and `children`.
+
+        Shared annotations must not be changed, use `copy` instead.
+        """
+        key = (name, tuple(children))
+        result = self._literals.get(key)
+        if result is None:
+            result = TypeLiteral(*key)
+            self._literals[key] = result
+        return result
+
+    def _get_subscript(
+        self, parent: FakeAnnotation, children: Iterable[FakeAnnotation]
+    ) -> TypeSubscript:
+        """
+        Get a shared `TypeSubscript` with `parent` and `children`.
+
+        Subscripts are shared if they have the same parent and children objects.
+        Shared annotations must not be changed, use `copy` instead.
+        """
+        children = list(children)
+        key = (id(parent), *(id(i) for i in children))
+        result = self._subscripts.get(key)
+        if result is None:
+            result = TypeSubscript(parent, children)
+            self._subscripts[key] = result
+        return result
 
     def _parse_shape_map(
         self,
@@ -332,20 +402,18 @@ class ShapeParser:
         output_child: bool = False,
         is_streaming: bool = False,
     ) -> FakeAnnotation:
-        type_subscript = TypeSubscript(Type.Dict) if output_child else TypeSubscript(Type.Mapping)
+        key_type: FakeAnnotation = Type.str
         if shape.key:
-            type_subscript.add_child(
-                self.parse_shape(shape.key, output_child=output_child, is_streaming=is_streaming)
+            key_type = self.parse_shape(
+                shape.key, output_child=output_child, is_streaming=is_streaming
             )
-        else:
-            type_subscript.add_child(Type.str)
+        value_type: FakeAnnotation = Type.Any
         if shape.value:
-            type_subscript.add_child(
-                self.parse_shape(shape.value, output_child=output_child, is_streaming=is_streaming)
+            value_type = self.parse_shape(
+                shape.value, output_child=output_child, is_streaming=is_streaming
             )
-        else:
-            type_subscript.add_child(Type.Any)
-        return type_subscript
+        parent = Type.Dict if output_child else Type.Mapping
+        return self._get_subscript(parent, [key_type, value_type])
 
     def _parse_shape_structure(
         self,
@@ -407,12 +475,11 @@ class ShapeParser:
             )
 
     def _parse_shape_list(self, shape: ListShape, output_child: bool = False) -> FakeAnnotation:
-        type_subscript = TypeSubscript(Type.List) if output_child else TypeSubscript(Type.Sequence)
+        member_type: FakeAnnotation = Type.Any
         if shape.member:
-            type_subscript.add_child(self.parse_shape(shape.member, output_child=output_child))
-        else:
-            type_subscript.add_child(Type.Any)
-        return type_subscript
+            member_type = self.parse_shape(shape.member, output_child=output_child)
+        parent = Type.List if output_child else Type.Sequence
+        return self._get_subscript(parent, [member_type])
 
     def parse_shape(
         self,
@@ -433,6 +500,28 @@ class ShapeParser:
         Returns:
             TypeAnnotation or similar class.
         """
+        if not isinstance(shape, self.SHARED_SHAPE_CLASSES):
+            return self._parse_shape(shape, output, output_child, is_streaming)
+
+        # member references can override string shape enum
+        enum = tuple(shape.enum) if isinstance(shape, StringShape) else ()
+        key = (shape.name, enum, output, output_child, is_streaming)
+        if key in self._shape_cache:
+            self.shape_cache_hits += 1
+            return self._shape_cache[key]
+
+        self.shape_cache_misses += 1
+        result = self._parse_shape(shape, output, output_child, is_streaming)
+        self._shape_cache[key] = result
+        return result
+
+    def _parse_shape(
+        self,
+        shape: Shape,
+        output: bool,
+        output_child: bool,
+        is_streaming: bool,
+    ) -> FakeAnnotation:
         if not is_streaming:
             is_streaming = "streaming" in shape.serialization and shape.serialization["streaming"]
             if output or output_child:
@@ -562,7 +651,7 @@ class ShapeParser:
             "get_available_subresources": Method(
                 "get_available_subresources",
                 [Argument("self", None)],
-                TypeSubscript(Type.Sequence, [Type.str]),
+                self._get_subscript(Type.Sequence, [Type.str]),
             ),
         }
         service_resource_shape = self._get_service_resource()
@@ -587,7 +676,7 @@ class ShapeParser:
             "get_available_subresources": Method(
                 "get_available_subresources",
                 [Argument("self", None)],
-                TypeSubscript(Type.Sequence, [Type.str]),
+                self._get_subscript(Type.Sequence, [Type.str]),
             ),
             "load": Method("load", [Argument("self", None)], Type.none),
             "reload": Method("reload", [Argument("self", None)], Type.none),
@@ -625,7 +714,7 @@ class ShapeParser:
             )
             path = action_shape["resource"].get("path", "")
             if path.endswith("[]"):
-                return_type = TypeSubscript(Type.List, [return_type])
+                return_type = self._get_subscript(Type.List, [return_type])
 
         operation_shape = None
         if "request" in action_shape:
@@ -730,7 +819,7 @@ class ShapeParser:
                     method.arguments.extend(shape_arguments)
                 if operation_model.output_shape is not None:
                     item_return_type = self.parse_shape(operation_model.output_shape, output=True)
-                    return_type = TypeSubscript(Type.List, [item_return_type])
+                    return_type = self._get_subscript(Type.List, [item_return_type])
                     method.return_type = return_type
 
         return result
@@ -0,0 +1,379 @@
+"""
+Long-running builder server that keeps parsed state between builds.
+"""
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+import sys
+import time
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from boto3.session import Session
+
+from mypy_boto3_builder.cli_parser import Namespace, parse_args
+from mypy_boto3_builder.constants import SERVER_WATCH_INTERVAL
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_session
+from mypy_boto3_builder.parsers.service_package_cache import ServicePackageCache
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+Message = dict[str, Any]
+SendFunc = Callable[[Message], None]
+BuildFunc = Callable[[Namespace, Session, list[ServiceName]], None]
+DiscoverFunc = Callable[[Session], list[ServiceName]]
+
+
+class BuilderServerError(Exception):
+    """
+    Main error for BuilderServer.
+    """
+
+
+def get_data_paths(session: Session) -> list[Path]:
+    """
+    Get botocore and boto3 data directories used by `session`.
+
+    Arguments:
+        session -- Boto3 session.
+
+    Returns:
+        A list of data directories, some of them could not exist.
+    """
+    loader = session._session.get_component("data_loader")
+    return [Path(i) for i in loader.search_paths]
+
+
+def get_data_signature(paths: Iterable[Path]) -> str:
+    """
+    Get signature of all files in data directories.
+
+    Signature changes when a file is added, removed or modified.
+
+    Arguments:
+        paths -- Data directories.
+
+    Returns:
+        Hex digest of file paths, sizes and modification times.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        for root, dir_names, file_names in os.walk(path):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                file_path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                digest.update(f"{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class _MessageLogHandler(logging.Handler):
+    """
+    Logging handler that sends records to a build client.
+    """
+
+    def __init__(self, send: SendFunc) -> None:
+        super().__init__()
+        self.send = send
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Send record fields that are needed to handle it in the client process.
+        """
+        message = record.getMessage()
+        if record.exc_info:
+            message = f"{message}\n{logging.Formatter().formatException(record.exc_info)}"
+        self.send(
+            {
+                "log": {
+                    "name": record.name,
+                    "levelno": record.levelno,
+                    "levelname": record.levelname,
+                    "msg": message,
+                    "created": record.created,
+                }
+            }
+        )
+
+
+class _MessageStream(io.StringIO):
+    """
+    Text stream that sends written text to a build client.
+    """
+
+    def __init__(self, send: SendFunc, name: str) -> None:
+        super().__init__()
+        self.send = send
+        self.stream_name = name
+
+    def write(self, text: str) -> int:
+        """
+        Send text to client.
+        """
+        self.send({self.stream_name: text})
+        return len(text)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handler for a single build request.
+
+    Request is a JSON line with CLI arguments and working directory.
+    Response is a JSON line per log record or printed text, followed by a line with exit status.
+    """
+
+    server: "BuilderServer"
+
+    def setup(self) -> None:
+        super().setup()
+        self.is_connected = True
+
+    def handle(self) -> None:
+        """
+        Run requested build and send its output to client.
+        """
+        try:
+            request = json.loads(self.rfile.readline())
+            argv = [str(i) for i in request["args"]]
+            cwd = Path(request["cwd"])
+        except (ValueError, KeyError, TypeError) as e:
+            self.send({"status": 2, "stderr": f"Invalid request: {e}\n"})
+            return
+        if not cwd.is_dir():
+            self.send({"status": 2, "stderr": f"Invalid request: {cwd} is not a directory\n"})
+            return
+
+        status = self.server.build(argv, cwd, self.send)
+        self.send({"status": status})
+
+    def send(self, message: Message) -> None:
+        """
+        Send message to client, ignore it if client has disconnected.
+        """
+        if not self.is_connected:
+            return
+        try:
+            self.wfile.write(json.dumps(message).encode() + b"\n")
+        except OSError:
+            self.is_connected = False
+
+
+class BuilderServer(socketserver.UnixStreamServer):
+    """
+    Long-running builder server that keeps parsed state between builds.
+
+    Boto3 session, discovered service names, Jinja environment, parsed service packages
+    and formatter results stay in memory, so repeated builds skip
+    startup and parsing of unchanged services. Builds run one at a time in the server process,
+    `build` is expected to reset settings left by a previous build.
+
+    Socket is accessible only by the server user, and on Linux requests from
+    other users are rejected, because builds write files as the server user.
+
+    botocore and boto3 data directories are checked before each build,
+    any change resets session and parsed services. In watch mode directories are also
+    checked every `watch_interval` seconds, and the last successful build is repeated
+    on change. Changes to builder or botocore Python code need a server restart.
+
+    Arguments:
+        socket_path -- Unix socket path.
+        build -- Function that builds packages for parsed CLI arguments.
+        discover -- Function that gets available service names from a session.
+        watch -- Repeat the last build when data files change.
+        watch_interval -- Seconds between data checks in watch mode.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        build: BuildFunc,
+        discover: DiscoverFunc,
+        watch: bool = False,
+        watch_interval: float = SERVER_WATCH_INTERVAL,
+    ) -> None:
+        self.socket_path = socket_path
+        self.build_func = build
+        self.discover_func = discover
+        self.watch = watch
+        self.watch_interval = watch_interval
+        self.logger = get_logger()
+        self.log_level = self.logger.getEffectiveLevel()
+        self.session = get_boto3_session()
+        self.available_service_names = discover(self.session)
+        self.data_signature = get_data_signature(get_data_paths(self.session))
+        self.last_request: tuple[list[str], Path] | None = None
+        self._shape_only = ServicePackageCache.shape_only
+        self._last_check_time = time.monotonic()
+        self._remove_stale_socket()
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def server_bind(self) -> None:
+        """
+        Create socket with `0600` mode.
+        """
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def verify_request(
+        self, request: socket.socket | tuple[bytes, socket.socket], client_address: Any
+    ) -> bool:
+        """
+        Accept requests only from the server user if peer credentials are available.
+        """
+        if not isinstance(request, socket.socket) or not hasattr(socket, "SO_PEERCRED"):
+            return True
+        credentials = request.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+        _pid, uid, _gid = struct.unpack("3i", credentials)
+        if uid == os.getuid():
+            return True
+        self.logger.warning(f"Rejected build request from user {uid}")
+        return False
+
+    def server_close(self) -> None:
+        """
+        Close and remove socket.
+        """
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+    def service_actions(self) -> None:
+        """
+        Check data files in watch mode and repeat the last build on change.
+        """
+        if not self.watch or time.monotonic() - self._last_check_time < self.watch_interval:
+            return
+        if self.check_data() and self.last_request is not None:
+            argv, cwd = self.last_request
+            self.logger.info("Repeating the last build")
+            self.build(argv, cwd)
+
+    def check_data(self) -> bool:
+        """
+        Reset session and parsed services if botocore or boto3 data files have changed.
+
+        Returns:
+            True if data files have changed.
+        """
+        self._last_check_time = time.monotonic()
+        data_signature = get_data_signature(get_data_paths(self.session))
+        if data_signature == self.data_signature:
+            return False
+
+        self.logger.info("botocore data has changed, resetting parsed services")
+        self.session = get_boto3_session()
+        self.available_service_names = self.discover_func(self.session)
+        self.data_signature = data_signature
+        ServicePackageCache.clear()
+        return True
+
+    def build(self, argv: Sequence[str], cwd: Path, send: SendFunc | None = None) -> int:
+        """
+        Build packages for CLI arguments.
+
+        Arguments:
+            argv -- CLI arguments.
+            cwd -- Working directory to resolve relative paths.
+            send -- Callback for log records and printed text, they stay in server if not set.
+
+        Returns:
+            Exit status.
+        """
+        self.check_data()
+        server_cwd = Path.cwd()
+        status = 0
+        with contextlib.ExitStack() as stack:
+            if send is not None:
+                handler = _MessageLogHandler(send)
+                self.logger.addHandler(handler)
+                stack.callback(self.logger.removeHandler, handler)
+                stack.enter_context(contextlib.redirect_stdout(_MessageStream(send, "stdout")))
+                stack.enter_context(contextlib.redirect_stderr(_MessageStream(send, "stderr")))
+            try:
+                os.chdir(cwd)
+                args = parse_args(argv)
+                get_logger(level=args.log_level)
+                self._check_parse_settings(args)
+                self.build_func(args, self.session, self.available_service_names)
+            except SystemExit as e:
+                status = e.code if isinstance(e.code, int) else int(e.code is not None)
+            except Exception:
+                self.logger.exception("Build failed")
+                status = 1
+            finally:
+                os.chdir(server_cwd)
+                get_logger(level=self.log_level)
+
+        if status == 0:
+            self.last_request = (list(argv), cwd)
+        return status
+
+    def _check_parse_settings(self, args: Namespace) -> None:
+        if args.shape_only == self._shape_only:
+            return
+        self.logger.debug("Parse settings have changed, resetting parsed services")
+        ServicePackageCache.clear()
+        self._shape_only = args.shape_only
+
+    def _remove_stale_socket(self) -> None:
+        if not self.socket_path.exists():
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            try:
+                client.connect(str(self.socket_path))
+            except OSError:
+                self.socket_path.unlink()
+                return
+        raise BuilderServerError(f"Server is already running on {NicePath(self.socket_path)}")
+
+
+def send_build_request(socket_path: Path, argv: Sequence[str]) -> int:
+    """
+    Send build request to a running server and replay its output.
+
+    Arguments:
+        socket_path -- Server Unix socket path.
+        argv -- CLI arguments.
+
+    Returns:
+        Build exit status.
+    """
+    logger = get_logger()
+    request = {"args": list(argv), "cwd": Path.cwd().as_posix()}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError as e:
+            raise BuilderServerError(
+                f"Cannot connect to server on {NicePath(socket_path)}: {e}"
+            ) from e
+
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as stream:
+            for line in stream:
+                message: Message = json.loads(line)
+                if "log" in message:
+                    logger.handle(logging.makeLogRecord(message["log"]))
+                if "stdout" in message:
+                    sys.stdout.write(message["stdout"])
+                if "stderr" in message:
+                    sys.stderr.write(message["stderr"])
+                if "status" in message:
+                    return int(message["status"])
+
+    raise BuilderServerError("Server closed connection before build completed")
@@ -52,6 +52,12 @@ class ServiceName:
     def __hash__(self) -> int:
         return hash(self.name)
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ServiceName):
+            return False
+
+        return self.name == other.name
+
     def __str__(self) -> str:
         return f"<ServiceName {self.name} {self.class_name}>"
 
@@ -20,6 +20,8 @@ class Argument:
         prefix -- Used for starargs.
     """
 
+    __slots__ = ("name", "type_annotation", "default", "prefix")
+
     def __init__(
         self,
         name: str,
@@ -16,6 +16,8 @@ class Attribute:
         type_ignore -- Add type: ignore comment.
     """
 
+    __slots__ = ("name", "type_annotation", "value", "type_ignore")
+
     def __init__(
         self,
         name: str,
@@ -25,7 +25,9 @@ class Client(ClassRecord):
 
     _alias_name: str = "Client"
 
-    def __init__(self, name: str, service_name: ServiceName, boto3_client: BaseClient) -> None:
+    def __init__(
+        self, name: str, service_name: ServiceName, boto3_client: BaseClient | None = None
+    ) -> None:
         super().__init__(name=name)
         self.service_name = service_name
         self.boto3_client = boto3_client
@@ -15,6 +15,18 @@ class Function:
     Module-level function.
     """
 
+    __slots__ = (
+        "name",
+        "arguments",
+        "return_type",
+        "docstring",
+        "decorators",
+        "body_lines",
+        "type_ignore",
+        "request_type_annotation",
+        "is_async",
+    )
+
     def __init__(
         self,
         name: str,
@@ -10,6 +10,8 @@ class Method(Function):
     Class method.
     """
 
+    __slots__ = ()
+
     @property
     def call_arguments(self) -> list[Argument]:
         """
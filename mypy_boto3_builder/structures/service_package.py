@@ -101,36 +101,62 @@ class ServicePackage(Package):
         """
         Extract typed dicts from children.
 
-        Attempts to resolve circular typed dicts.
+        Walks typed dicts graph once, marks nested typed dicts as stringified
+        and resolves circular typed dicts.
         """
-        added_hashes: list[int] = []
-        result: list[TypeTypedDict] = []
+        children_map: dict[int, list[TypeTypedDict]] = {}
+        index: dict[int, TypeTypedDict] = {}
         discovered: list[TypeTypedDict] = []
-        typed_dicts = self._get_typed_dicts()
-        for type_annotation in sorted(typed_dicts):
-            if hash(type_annotation) in added_hashes:
+        for typed_dict in sorted(self._get_typed_dicts()):
+            typed_dict_hash = hash(typed_dict)
+            if typed_dict_hash in index:
                 continue
 
-            result.append(type_annotation)
-            added_hashes.append(hash(type_annotation))
-            discovered.append(type_annotation)
+            index[typed_dict_hash] = typed_dict
+            discovered.append(typed_dict)
 
         while discovered:
-            child = discovered.pop()
-            sub_typed_dicts = child.get_children_typed_dicts()
-            for child_typed_dict in sorted(sub_typed_dicts):
+            typed_dict = discovered.pop()
+            for child_typed_dict in self._get_children_typed_dicts(typed_dict, children_map):
                 child_typed_dict.stringify = True
-
-                if hash(child_typed_dict) in added_hashes:
+                child_hash = hash(child_typed_dict)
+                if child_hash in index:
                     continue
 
-                result.append(child_typed_dict)
-                added_hashes.append(hash(child_typed_dict))
+                index[child_hash] = child_typed_dict
                 discovered.append(child_typed_dict)
 
+        result = list(index.values())
         result.sort()
+        self._replace_self_references(result, children_map)
         return result
 
+    @staticmethod
+    def _get_children_typed_dicts(
+        typed_dict: TypeTypedDict, children_map: dict[int, list[TypeTypedDict]]
+    ) -> list[TypeTypedDict]:
+        key = id(typed_dict)
+        if key not in children_map:
+            children_map[key] = sorted(typed_dict.get_children_typed_dicts())
+        return children_map[key]
+
+    def _replace_self_references(
+        self, typed_dicts: Iterable[TypeTypedDict], children_map: dict[int, list[TypeTypedDict]]
+    ) -> None:
+        """
+        Replace self references with `Dict[str, Any]` to avoid circular dependencies.
+        """
+        for typed_dict in typed_dicts:
+            for child in self._get_children_typed_dicts(typed_dict, children_map):
+                if child is typed_dict:
+                    typed_dict.replace_with_dict.add(typed_dict.name)
+                    continue
+                for sub_child in self._get_children_typed_dicts(child, children_map):
+                    if sub_child.replace_with_dict:
+                        continue
+                    if sub_child is typed_dict:
+                        sub_child.replace_with_dict.add(child.name)
+
     def get_types(self) -> set[FakeAnnotation]:
         """
         Extract type annotations from Client, ServiceResource, waiters and paginators.
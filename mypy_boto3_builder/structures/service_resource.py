@@ -28,7 +28,7 @@ class ServiceResource(ClassRecord):
         self,
         name: str,
         service_name: ServiceName,
-        boto3_service_resource: Boto3ServiceResource,
+        boto3_service_resource: Boto3ServiceResource | None = None,
     ):
         self.resource_meta_class = self._get_resource_meta_class(service_name)
         super().__init__(
@@ -16,6 +16,8 @@ class ExternalImport(FakeAnnotation):
         alias -- Import local name.
     """
 
+    __slots__ = ("source", "name", "alias", "import_record")
+
     def __init__(
         self,
         source: ImportString,
@@ -27,7 +29,7 @@ class ExternalImport(FakeAnnotation):
         self.alias: str = alias
         self.import_record: ImportRecord = ImportRecord(source=source, name=name, alias=alias)
 
-    def render(self, parent_name: str = "") -> str:
+    def _render(self, parent_name: str = "") -> str:
         """
         Get string with local name to use.
 
@@ -9,9 +9,66 @@ from mypy_boto3_builder.import_helpers.import_record import ImportRecord
 class FakeAnnotation(ABC):
     """
     Parent class for all type annotation wrappers.
+
+    Local render, sort key and hash are memoized per annotation until
+    `invalidate_cache` is called on its change. Subclasses that render other
+    annotations set `is_memoized` to False, so a child change is always visible.
+    Memoized values are not pickled, as string hashes differ between processes.
     """
 
+    __slots__ = ("_cached_render", "_cached_sort_key", "_cached_hash")
+
+    _cached_render: str | None
+    _cached_sort_key: str
+    _cached_hash: int
+
+    is_memoized = True
+
+    _cache_slot_names = frozenset(__slots__)
+
+    def __new__(cls, *_args: object, **_kwargs: object) -> "FakeAnnotation":
+        result = super().__new__(cls)
+        result._cached_render = None
+        return result
+
+    def __getstate__(self) -> dict[str, object]:
+        state: dict[str, object] = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name in self._cache_slot_names or name in ("__dict__", "__weakref__"):
+                    continue
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._cached_render = None
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop memoized render, sort key and hash of this annotation.
+
+        Has to be called on a change of any field used to render, sort or hash it.
+        """
+        self._cached_render = None
+
+    def _update_cache(self) -> str:
+        result = self._render()
+        self._cached_render = result
+        self._cached_sort_key = self._get_sort_key()
+        self._cached_hash = self._get_hash()
+        return result
+
     def __hash__(self) -> int:
+        if not self.is_memoized:
+            return self._get_hash()
+        if self._cached_render is None:
+            self._update_cache()
+        return self._cached_hash
+
+    def _get_hash(self) -> int:
         return hash(self.render())
 
     def __eq__(self, other: object) -> bool:
@@ -30,21 +87,45 @@ class FakeAnnotation(ABC):
         return self.get_sort_key() > other.get_sort_key()
 
     def __lt__(self, other: "FakeAnnotation") -> bool:
-        return not self > other
+        return not self.get_sort_key() > other.get_sort_key()
 
     def get_sort_key(self) -> str:
         """
         Get string to sort annotations.
         """
-        return str(self)
+        if not self.is_memoized:
+            return self._get_sort_key()
+        if self._cached_render is None:
+            self._update_cache()
+        return self._cached_sort_key
+
+    def _get_sort_key(self) -> str:
+        return self.render()
 
     def __str__(self) -> str:
         return self.render()
 
-    @abstractmethod
     def render(self, parent_name: str = "") -> str:
         """
         Render type annotation to a valid Python code for local usage.
+
+        Arguments:
+            parent_name -- Name of the annotation that renders this one.
+
+        Returns:
+            A string with a valid type annotation.
+        """
+        if parent_name or not self.is_memoized:
+            return self._render(parent_name)
+
+        if self._cached_render is None:
+            return self._update_cache()
+        return self._cached_render
+
+    @abstractmethod
+    def _render(self, parent_name: str = "") -> str:
+        """
+        Render type annotation without cache.
         """
 
     @abstractmethod
@@ -19,6 +19,8 @@ class InternalImport(FakeAnnotation):
         use_alias -- Use name alias.
     """
 
+    __slots__ = ("name", "service_name", "module_name", "_stringify", "_use_alias")
+
     def __init__(
         self,
         name: str,
@@ -30,8 +32,36 @@ class InternalImport(FakeAnnotation):
         self.name: str = name
         self.service_name: ServiceName | None = service_name
         self.module_name: ServiceModuleName = module_name
-        self.stringify: bool = stringify
-        self.use_alias: bool = use_alias
+        self._stringify: bool = stringify
+        self._use_alias: bool = use_alias
+
+    @property
+    def stringify(self) -> bool:
+        """
+        Whether type annotation is rendered as a string.
+        """
+        return self._stringify
+
+    @stringify.setter
+    def stringify(self, value: bool) -> None:
+        if value == self._stringify:
+            return
+        self._stringify = value
+        self.invalidate_cache()
+
+    @property
+    def use_alias(self) -> bool:
+        """
+        Whether type annotation is rendered with an alias.
+        """
+        return self._use_alias
+
+    @use_alias.setter
+    def use_alias(self, value: bool) -> None:
+        if value == self._use_alias:
+            return
+        self._use_alias = value
+        self.invalidate_cache()
 
     @staticmethod
     def get_alias(name: str) -> str:
@@ -46,7 +76,7 @@ class InternalImport(FakeAnnotation):
         """
         return f"_{name}"
 
-    def render(self, parent_name: str = "") -> str:
+    def _render(self, parent_name: str = "") -> str:
         """
         Render type annotation to a valid Python code for local usage.
 
@@ -90,6 +120,8 @@ class AliasInternalImport(InternalImport):
         service_name -- Service that import belongs to.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, service_name: ServiceName | None = None) -> None:
         super().__init__(
             name=name,
@@ -10,7 +10,9 @@ class RemoveArgument(FakeAnnotation):
     Annotation to mark argument for removal.
     """
 
-    def render(self, parent_name: str = "") -> str:
+    __slots__ = ()
+
+    def _render(self, parent_name: str = "") -> str:
         """
         Not used.
         """
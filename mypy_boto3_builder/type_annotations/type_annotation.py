@@ -18,6 +18,8 @@ class TypeAnnotation(FakeAnnotation):
         wrapped_type -- Original type annotation as a string.
     """
 
+    __slots__ = ("_wrapped_type",)
+
     # Set of supported type annotations
     SUPPORTED_TYPES: set[str] = {
         "Union",  # typing.Union
@@ -47,7 +49,7 @@ class TypeAnnotation(FakeAnnotation):
 
         self._wrapped_type: str = wrapped_type
 
-    def render(self, parent_name: str = "") -> str:
+    def _render(self, parent_name: str = "") -> str:
         """
         Render type annotation to a valid Python code for local usage.
 
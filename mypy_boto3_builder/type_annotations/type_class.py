@@ -17,11 +17,13 @@ class TypeClass(FakeAnnotation):
         alias -- Local name.
     """
 
+    __slots__ = ("value", "alias")
+
     def __init__(self, value: type, alias: str = "") -> None:
         self.value: type = value
         self.alias: str = alias
 
-    def render(self, parent_name: str = "") -> str:
+    def _render(self, parent_name: str = "") -> str:
         """
         Render type annotation to a valid Python code for local usage.
 
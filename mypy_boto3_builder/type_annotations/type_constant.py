@@ -13,10 +13,12 @@ class TypeConstant(FakeAnnotation):
         value -- Constant value.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: object) -> None:
         self.value: object = value
 
-    def render(self, parent_name: str = "") -> str:
+    def _render(self, parent_name: str = "") -> str:
         """
         Render type annotation to a valid Python code for local usage.
 
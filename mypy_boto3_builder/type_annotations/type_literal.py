@@ -21,13 +21,39 @@ class TypeLiteral(FakeAnnotation):
         inline -- Render literal inline.
     """
 
+    __slots__ = ("_children", "_name")
+
     def __init__(self, name: str, children: Iterable[str]) -> None:
-        self.children: set[str] = set(children)
-        self.name: str = self._find_name(name)
+        self._children: frozenset[str] = frozenset(children)
+        self._name: str = self._find_name(name)
         if not children:
             raise ValueError("Literal should have children")
 
-    def get_sort_key(self) -> str:
+    @property
+    def children(self) -> frozenset[str]:
+        """
+        Literal values.
+        """
+        return self._children
+
+    @children.setter
+    def children(self, value: Iterable[str]) -> None:
+        self._children = frozenset(value)
+        self.invalidate_cache()
+
+    @property
+    def name(self) -> str:
+        """
+        Literal name.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self.invalidate_cache()
+
+    def _get_sort_key(self) -> str:
         """
         Sort literals by name.
         """
@@ -53,7 +79,7 @@ class TypeLiteral(FakeAnnotation):
             return f"{name}Type"
         return name
 
-    def render(self, parent_name: str = "") -> str:
+    def _render(self, parent_name: str = "") -> str:
         """
         Render type annotation to a valid Python code for local usage.
 
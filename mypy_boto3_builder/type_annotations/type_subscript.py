@@ -16,18 +16,33 @@ class TypeSubscript(FakeAnnotation):
         children -- Children type annotations.
     """
 
+    __slots__ = ("_parent", "children")
+
+    is_memoized = False
+
     def __init__(
         self,
         parent: FakeAnnotation,
         children: Iterable[FakeAnnotation] = (),
     ) -> None:
-        self.parent: FakeAnnotation = parent
+        self._parent: FakeAnnotation = parent
         self.children: list[FakeAnnotation] = list(children)
 
-    def __hash__(self) -> int:
+    @property
+    def parent(self) -> FakeAnnotation:
+        """
+        Parent type annotation.
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: FakeAnnotation) -> None:
+        self._parent = value
+
+    def _get_hash(self) -> int:
         return hash(f"{self.parent}.{self.children}")
 
-    def render(self, parent_name: str = "") -> str:
+    def _render(self, parent_name: str = "") -> str:
         """
         Render type annotation to a valid Python code for local usage.
 
@@ -22,6 +22,8 @@ class TypedDictAttribute:
         required -- Whether the attribute has to be set.
     """
 
+    __slots__ = ("name", "type_annotation", "required")
+
     def __init__(self, name: str, type_annotation: FakeAnnotation, required: bool):
         self.name = name
         self.type_annotation = type_annotation
@@ -49,6 +51,8 @@ class TypeTypedDict(FakeAnnotation):
         replace_with_dict -- Render Dict[str, Any] instead to avoid circular dependencies.
     """
 
+    __slots__ = ("_name", "_children", "docstring", "_stringify", "replace_with_dict")
+
     def __init__(
         self,
         name: str,
@@ -57,19 +61,57 @@ class TypeTypedDict(FakeAnnotation):
         stringify: bool = False,
         replace_with_dict: Iterable[str] = tuple(),
     ) -> None:
-        self.name = name
-        self.children = list(children)
+        self._name = name
+        self._children = tuple(children)
         self.docstring = docstring
-        self.stringify = stringify
+        self._stringify = stringify
         self.replace_with_dict = set(replace_with_dict)
 
-    def get_sort_key(self) -> str:
+    @property
+    def name(self) -> str:
+        """
+        Type name.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self.invalidate_cache()
+
+    @property
+    def children(self) -> tuple[TypedDictAttribute, ...]:
+        """
+        Typed dict attributes.
+        """
+        return self._children
+
+    @children.setter
+    def children(self, value: Iterable[TypedDictAttribute]) -> None:
+        self._children = tuple(value)
+        self.invalidate_cache()
+
+    @property
+    def stringify(self) -> bool:
+        """
+        Whether type annotation is rendered as a string.
+        """
+        return self._stringify
+
+    @stringify.setter
+    def stringify(self, value: bool) -> None:
+        if value == self._stringify:
+            return
+        self._stringify = value
+        self.invalidate_cache()
+
+    def _get_sort_key(self) -> str:
         """
         Sort Typed Dicts by name.
         """
         return self.name
 
-    def __hash__(self) -> int:
+    def _get_hash(self) -> int:
         children = "".join(i.name for i in self.children)
         hash_str = f"{self.name} {children}"
         return hash(hash_str)
@@ -90,7 +132,7 @@ class TypeTypedDict(FakeAnnotation):
 
         raise ValueError(f"No child with name {name}")
 
-    def render(self, parent_name: str = "") -> str:
+    def _render(self, parent_name: str = "") -> str:
         """
         Render type annotation to a valid Python code for local usage.
 
@@ -137,7 +179,7 @@ class TypeTypedDict(FakeAnnotation):
             type_annotation -- Argument type annotation.
             required -- Whether argument has to be set.
         """
-        self.children.append(TypedDictAttribute(name, type_annotation, required))
+        self.children = (*self.children, TypedDictAttribute(name, type_annotation, required))
 
     def is_dict(self) -> bool:
         """
@@ -261,21 +303,6 @@ class TypeTypedDict(FakeAnnotation):
                 result.update(type_annotation.get_children_literals((self, *processed)))
         return result
 
-    def replace_self_references(self) -> None:
-        """
-        Replace self refenrences with `Dict[str, Any]` to avoid circular dependencies.
-        """
-        for child in self.get_children_typed_dicts():
-            if child is self:
-                child.replace_with_dict.add(self.name)
-                continue
-            for sub_child in child.get_children_typed_dicts():
-                if sub_child.replace_with_dict:
-                    continue
-                if sub_child is self:
-                    sub_child.replace_with_dict.add(child.name)
-                    continue
-
     @property
     def requires_safe_render(self) -> bool:
         """
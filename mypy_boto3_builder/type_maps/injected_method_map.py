@@ -0,0 +1,98 @@
+"""
+Map of client methods that boto3 and botocore inject or remove on client class creation.
+
+Used by shape-only parsing to get client public methods without creating a client.
+"""
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+from mypy_boto3_builder.service_name import ServiceName
+
+__all__ = ("get_injected_client_methods",)
+
+
+InjectedMethodMap = dict[str, dict[str, str | None]]
+
+# service name to method name and a dotted path to the function, "*" is for all services
+# None means that botocore removes operation method from client class
+INJECTED_CLIENT_METHOD_MAP: InjectedMethodMap = {
+    "*": {
+        "can_paginate": "botocore.client.BaseClient.can_paginate",
+        "close": "botocore.client.BaseClient.close",
+        "generate_presigned_url": "botocore.signers.generate_presigned_url",
+        "get_paginator": "botocore.client.BaseClient.get_paginator",
+        "get_waiter": "botocore.client.BaseClient.get_waiter",
+    },
+    "s3": {
+        "copy": "boto3.s3.inject.copy",
+        "download_file": "boto3.s3.inject.download_file",
+        "download_fileobj": "boto3.s3.inject.download_fileobj",
+        "generate_presigned_post": "botocore.signers.generate_presigned_post",
+        "upload_file": "boto3.s3.inject.upload_file",
+        "upload_fileobj": "boto3.s3.inject.upload_fileobj",
+    },
+    "rds": {
+        "generate_db_auth_token": "botocore.signers.generate_db_auth_token",
+    },
+    "dsql": {
+        "generate_db_connect_admin_auth_token": (
+            "botocore.signers.dsql_generate_db_connect_admin_auth_token"
+        ),
+        "generate_db_connect_auth_token": "botocore.signers.dsql_generate_db_connect_auth_token",
+    },
+    "bedrock-runtime": {
+        "invoke_model_with_bidirectional_stream": None,
+    },
+    "connecthealth": {
+        "start_medical_scribe_listening_session": None,
+    },
+    "lexv2-runtime": {
+        "start_conversation": None,
+    },
+    "polly": {
+        "start_speech_synthesis_stream": None,
+    },
+    "qbusiness": {
+        "chat": None,
+    },
+}
+
+
+def _import_function(path: str) -> Callable[..., Any] | None:
+    module_name, _, name = path.rpartition(".")
+    parent_name = ""
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        module_name, _, parent_name = module_name.rpartition(".")
+        module = importlib.import_module(module_name)
+
+    parent = getattr(module, parent_name) if parent_name else module
+    return getattr(parent, name, None)
+
+
+def get_injected_client_methods(
+    service_name: ServiceName,
+) -> dict[str, Callable[..., Any] | None]:
+    """
+    Get changes that boto3 and botocore make to `service_name` client public methods.
+
+    Functions missing in installed boto3 and botocore versions are skipped.
+
+    Arguments:
+        service_name -- Target service name.
+
+    Returns:
+        A map of method name to function, or to None if operation method is removed.
+    """
+    result: dict[str, Callable[..., Any] | None] = {}
+    for key in ("*", service_name.boto3_name):
+        for method_name, path in INJECTED_CLIENT_METHOD_MAP.get(key, {}).items():
+            if path is None:
+                result[method_name] = None
+                continue
+            function = _import_function(path)
+            if function is not None:
+                result[method_name] = function
+    return result
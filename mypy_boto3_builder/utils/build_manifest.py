@@ -0,0 +1,151 @@
+"""
+Build manifest for incremental builds.
+"""
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+from boto3.session import Session
+
+from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.boto3_utils import get_service_model_hash
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+# Directory name for build manifest inside output directory
+BUILD_MANIFEST_NAME = ".build_manifest"
+
+BUILDER_PATH = Path(__file__).parent.parent
+
+
+@functools.cache
+def get_builder_hash() -> str:
+    """
+    Get hash of builder source code, templates and static files.
+
+    Returns:
+        Hex digest of all builder files.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(BUILDER_PATH.glob("**/*")):
+        if not path.is_file() or "__pycache__" in path.parts:
+            continue
+        digest.update(path.relative_to(BUILDER_PATH).as_posix().encode())
+        digest.update(b"\n")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_fingerprint(**inputs: object) -> str:
+    """
+    Get fingerprint of build inputs.
+
+    Builder files and scalar Jinja globals, such as builder and library versions,
+    are always included.
+
+    Arguments:
+        inputs -- JSON-serializable values that affect output files.
+
+    Returns:
+        Hex digest of all inputs.
+    """
+    jinja_globals = {
+        key: value
+        for key, value in JinjaManager.get_globals().items()
+        if isinstance(value, (str, int, bool))
+    }
+    data = json.dumps(
+        {"builder_hash": get_builder_hash(), "jinja_globals": jinja_globals, **inputs},
+        sort_keys=True,
+    )
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def get_service_fingerprint(
+    session: Session,
+    service_name: ServiceName,
+    service_names: Iterable[ServiceName],
+    **inputs: object,
+) -> str:
+    """
+    Get fingerprint of service package build inputs.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+        service_names -- List of known service names.
+        inputs -- Other JSON-serializable values that affect output files.
+
+    Returns:
+        Hex digest of all inputs.
+    """
+    return get_fingerprint(
+        model_hash=get_service_model_hash(session, service_name),
+        service_name=service_name.name,
+        class_name=service_name.class_name,
+        service_names=[i.boto3_name for i in service_names],
+        **inputs,
+    )
+
+
+class BuildManifest:
+    """
+    Build manifest that maps generated packages to fingerprints of their inputs.
+
+    Each package entry is stored in a separate file, so worker processes
+    can update entries for different packages at the same time.
+
+    Arguments:
+        output_path -- Output directory.
+    """
+
+    def __init__(self, output_path: Path) -> None:
+        self.output_path = output_path
+        self.path = output_path / BUILD_MANIFEST_NAME
+        self.logger = get_logger()
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def is_up_to_date(self, key: str, fingerprint: str) -> bool:
+        """
+        Check if package was generated from the same inputs and all its files exist.
+
+        Arguments:
+            key -- Package key.
+            fingerprint -- Fingerprint of current inputs.
+        """
+        entry_path = self._get_entry_path(key)
+        if not entry_path.exists():
+            return False
+        try:
+            entry = json.loads(entry_path.read_text())
+        except ValueError:
+            self.logger.debug(f"Ignoring broken manifest entry {NicePath(entry_path)}")
+            return False
+        if entry.get("fingerprint") != fingerprint:
+            return False
+        return all((self.output_path / i).exists() for i in entry.get("files", []))
+
+    def update(self, key: str, fingerprint: str, file_paths: Iterable[Path]) -> None:
+        """
+        Save package fingerprint and generated files.
+
+        Arguments:
+            key -- Package key.
+            fingerprint -- Fingerprint of current inputs.
+            file_paths -- Generated files.
+        """
+        entry = {
+            "fingerprint": fingerprint,
+            "files": sorted(i.relative_to(self.output_path).as_posix() for i in file_paths),
+        }
+        self.path.mkdir(exist_ok=True, parents=True)
+        with tempfile.NamedTemporaryFile("w", dir=self.path, delete=False) as stream:
+            json.dump(entry, stream, indent=2)
+        os.replace(stream.name, self._get_entry_path(key))
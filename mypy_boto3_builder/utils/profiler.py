@@ -0,0 +1,192 @@
+"""
+Timing of build stages.
+"""
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+
+class Span:
+    """
+    Timed build stage.
+
+    Arguments:
+        name -- Stage name.
+        start -- Start time in microseconds since epoch.
+        duration -- Duration in microseconds.
+        service -- Service name, if stage is a part of service build.
+        args -- Extra stage details, like output file path.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        start: int,
+        duration: int,
+        service: str = "",
+        args: dict[str, str] | None = None,
+    ) -> None:
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.service = service
+        self.args = args or {}
+        self.pid = os.getpid()
+        self.tid = threading.get_ident()
+
+    def get_trace_event(self) -> dict[str, Any]:
+        """
+        Get complete event for Chrome trace-event format.
+        """
+        args = dict(self.args)
+        if self.service:
+            args["service"] = self.service
+        return {
+            "name": self.name,
+            "cat": self.service or "build",
+            "ph": "X",
+            "ts": self.start,
+            "dur": self.duration,
+            "pid": self.pid,
+            "tid": self.tid,
+            "args": args,
+        }
+
+
+class Profiler:
+    """
+    Collector of build stage spans.
+
+    Disabled by default, see `enable`. Spans from worker processes are sent
+    to the parent process with `pop_spans` and `add_spans`.
+    """
+
+    REPORT_NAME = "profile.json"
+    TRACE_NAME = "trace.json"
+
+    enabled = False
+
+    _spans: list[Span] = []
+    _services: list[str] = []
+
+    @classmethod
+    def enable(cls) -> None:
+        """
+        Start collecting spans.
+        """
+        cls.enabled = True
+
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, service: str = "", **args: str) -> Iterator[None]:
+        """
+        Time a build stage.
+
+        Nested stages inherit `service` from the outer stage.
+
+        Arguments:
+            name -- Stage name.
+            service -- Service name.
+            args -- Extra stage details.
+        """
+        if not cls.enabled:
+            yield
+            return
+
+        service = service or (cls._services[-1] if cls._services else "")
+        cls._services.append(service)
+        start = time.time_ns()
+        try:
+            yield
+        finally:
+            duration = time.time_ns() - start
+            cls._services.pop()
+            cls._spans.append(Span(name, start // 1000, duration // 1000, service, args))
+
+    @classmethod
+    def pop_spans(cls) -> list[Span]:
+        """
+        Get collected spans and clear the storage.
+        """
+        result = cls._spans
+        cls._spans = []
+        return result
+
+    @classmethod
+    def add_spans(cls, spans: Iterable[Span]) -> None:
+        """
+        Add spans collected in another process.
+        """
+        cls._spans.extend(spans)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Remove all collected spans, including ones inherited by a forked process.
+        """
+        cls._spans.clear()
+        cls._services.clear()
+
+    @classmethod
+    def get_summary(cls) -> dict[str, Any]:
+        """
+        Get total time per stage and per service stage, in seconds.
+
+        Returns:
+            A dictionary with `duration`, `stages` and `services` keys.
+        """
+        stages: dict[str, dict[str, float]] = {}
+        services: dict[str, dict[str, float]] = {}
+        for span in cls._spans:
+            seconds = span.duration / 1_000_000
+            stage = stages.setdefault(span.name, {"count": 0, "total": 0.0, "max": 0.0})
+            stage["count"] += 1
+            stage["total"] += seconds
+            stage["max"] = max(stage["max"], seconds)
+            if span.service:
+                service_stages = services.setdefault(span.service, {})
+                service_stages[span.name] = service_stages.get(span.name, 0.0) + seconds
+
+        duration = 0.0
+        if cls._spans:
+            start = min(i.start for i in cls._spans)
+            end = max(i.start + i.duration for i in cls._spans)
+            duration = (end - start) / 1_000_000
+
+        return {
+            "duration": round(duration, 6),
+            "stages": {
+                name: {key: round(value, 6) for key, value in stage.items()}
+                for name, stage in sorted(stages.items(), key=lambda i: -i[1]["total"])
+            },
+            "services": {
+                name: {key: round(value, 6) for key, value in service_stages.items()}
+                for name, service_stages in sorted(
+                    services.items(), key=lambda i: -sum(i[1].values())
+                )
+            },
+        }
+
+    @classmethod
+    def write_report(cls, path: Path) -> None:
+        """
+        Write JSON summary and Chrome trace-event file.
+
+        Arguments:
+            path -- Directory for `profile.json` and `trace.json`.
+        """
+        path.mkdir(exist_ok=True, parents=True)
+        report_path = path / cls.REPORT_NAME
+        trace_path = path / cls.TRACE_NAME
+        report_path.write_text(json.dumps(cls.get_summary(), indent=2))
+        trace = {"traceEvents": [i.get_trace_event() for i in cls._spans]}
+        trace_path.write_text(json.dumps(trace))
+        get_logger().info(f"Profile saved to {NicePath(report_path)} and {NicePath(trace_path)}")
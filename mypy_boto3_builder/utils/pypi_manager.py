@@ -1,23 +1,71 @@
 """
 Version manager for PyPI packages.
 """
-from functools import cache
+import json
+import os
+import re
+import tempfile
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 from json.decoder import JSONDecodeError
+from pathlib import Path
 
 import requests
 from newversion import Version
 
+from mypy_boto3_builder.constants import (
+    PYPI_CACHE_TTL,
+    PYPI_PREFETCH_JOBS,
+    PYPI_REQUEST_TIMEOUT,
+)
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+
+class _SimpleIndexParser(HTMLParser):
+    """
+    Collect file names from links of a PEP 503 simple index page.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.file_names: list[str] = []
+        self._in_link = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._in_link = tag == "a"
+
+    def handle_endtag(self, tag: str) -> None:
+        self._in_link = False
+
+    def handle_data(self, data: str) -> None:
+        if self._in_link and data.strip():
+            self.file_names.append(data.strip())
+
 
 class PyPIManager:
     """
     Version manager for PyPI packages.
 
+    Released versions are stored in an index shared by all instances.
+    Use `prefetch` to fill it concurrently, `enable_disk_cache` to reuse
+    it between runs and `use_offline_index` to build without network access.
+
     Arguments:
         package -- PyPI package name
     """
 
     JSON_URL = "https://pypi.org/pypi/{}/json"
 
+    cache_ttl = PYPI_CACHE_TTL
+
+    _index: dict[str, set[Version]] = {}
+    _disk_path: Path | None = None
+    _offline = False
+    _session: requests.Session | None = None
+
     def __init__(self, package: str) -> None:
         self.package = package
         self.json_url = self.JSON_URL.format(package)
@@ -44,11 +92,200 @@ class PyPIManager:
             new_version = new_version.bump_postrelease()
         return new_version.dumps()
 
-    @cache
     def _get_versions(self) -> set[Version]:
+        key = self._normalize(self.package)
+        if key not in self._index:
+            self._index[key] = self._load_versions(self.package, self.json_url)
+        return self._index[key]
+
+    @classmethod
+    def enable_disk_cache(cls, path: Path, ttl: int | None = None) -> None:
+        """
+        Store fetched versions in `path` to reuse them in next runs.
+
+        Arguments:
+            path -- Cache directory.
+            ttl -- Seconds to trust cached versions, `PYPI_CACHE_TTL` by default.
+        """
+        cls._disk_path = path
+        if ttl is not None:
+            cls.cache_ttl = ttl
+
+    @classmethod
+    def use_offline_index(cls, path: Path | None = None) -> None:
+        """
+        Read versions from a local index instead of PyPI.
+
+        Packages missing in the index are considered unpublished.
+
+        Arguments:
+            path -- JSON file that maps package names to lists of versions,
+                or a directory with PEP 503 simple index layout.
+                If not set, all packages are considered unpublished.
+        """
+        cls._offline = True
+        if path is None:
+            return
+        if path.is_dir():
+            for package_path in path.iterdir():
+                if package_path.is_dir():
+                    key = cls._normalize(package_path.name)
+                    cls._index[key] = cls._read_simple_index_page(package_path)
+            return
+
+        data: dict[str, list[str]] = json.loads(path.read_text())
+        for package, version_strs in data.items():
+            cls._index[cls._normalize(package)] = {Version(i) for i in version_strs}
+
+    @classmethod
+    def prefetch(cls, packages: Iterable[str], jobs: int = PYPI_PREFETCH_JOBS) -> None:
+        """
+        Fetch versions for all `packages` concurrently over a pooled session.
+
+        Arguments:
+            packages -- PyPI package names.
+            jobs -- Number of concurrent requests.
+        """
+        missing = sorted({i for i in packages if cls._normalize(i) not in cls._index})
+        if not missing:
+            return
+
+        get_logger().debug(f"Fetching {len(missing)} package versions from PyPI")
+        cls._get_session(jobs)
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(
+                lambda package: cls._load_versions(package, cls.JSON_URL.format(package)),
+                missing,
+            )
+            for package, versions in zip(missing, results):
+                cls._index[cls._normalize(package)] = versions
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drop all known versions and disable disk cache and offline index.
+        """
+        cls._index.clear()
+        cls._disk_path = None
+        cls._offline = False
+        cls.cache_ttl = PYPI_CACHE_TTL
+
+    @classmethod
+    def _get_session(cls, jobs: int = PYPI_PREFETCH_JOBS) -> requests.Session:
+        if cls._session is None:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=jobs)
+            cls._session = requests.Session()
+            cls._session.mount("https://", adapter)
+        return cls._session
+
+    @classmethod
+    def _load_versions(cls, package: str, url: str) -> set[Version]:
+        if cls._offline:
+            return set()
+
+        cached = cls._read_disk_cache(package)
+        if cached is not None:
+            return cached
+
+        versions = cls._fetch_versions(url)
+        if versions is None:
+            return set()
+
+        cls._write_disk_cache(package, versions)
+        return versions
+
+    @classmethod
+    def _fetch_versions(cls, url: str) -> set[Version] | None:
+        """
+        Get released versions from PyPI JSON API.
+
+        Returns:
+            A set of versions, empty for unknown package, or None if response is not valid JSON.
+
+        Raises:
+            requests.RequestException -- If PyPI is not reachable or returns an error status.
+        """
+        response = cls._get_session().get(url, timeout=PYPI_REQUEST_TIMEOUT)
+        if response.status_code == 404:
+            return set()
+        response.raise_for_status()
         try:
-            data = requests.get(self.json_url).json()
+            data = response.json()
         except JSONDecodeError:
-            return set()
+            return None
         version_strs = set(data["releases"].keys())
         return {Version(i) for i in version_strs}
+
+    @classmethod
+    def _get_disk_entry_path(cls, package: str) -> Path:
+        assert cls._disk_path is not None
+        return cls._disk_path / f"{package}.json"
+
+    @classmethod
+    def _read_disk_cache(cls, package: str) -> set[Version] | None:
+        if cls._disk_path is None:
+            return None
+
+        path = cls._get_disk_entry_path(package)
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if time.time() - data["timestamp"] > cls.cache_ttl:
+            return None
+        return {Version(i) for i in data["versions"]}
+
+    @classmethod
+    def _write_disk_cache(cls, package: str, versions: set[Version]) -> None:
+        if cls._disk_path is None:
+            return
+
+        path = cls._get_disk_entry_path(package)
+        data = {
+            "timestamp": time.time(),
+            "versions": sorted(i.dumps() for i in versions),
+        }
+        try:
+            path.parent.mkdir(exist_ok=True, parents=True)
+            with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as stream:
+                json.dump(data, stream)
+            os.replace(stream.name, path)
+        except OSError as e:
+            get_logger().debug(f"Cannot write PyPI cache file {NicePath(path)}: {e}")
+
+    @staticmethod
+    def _normalize(package: str) -> str:
+        """
+        Normalize package name as PEP 503 does.
+        """
+        return re.sub(r"[-_.]+", "-", package).lower()
+
+    @classmethod
+    def _read_simple_index_page(cls, path: Path) -> set[Version]:
+        """
+        Get versions from file names listed in `path/index.html`.
+        """
+        index_path = path / "index.html"
+        if not index_path.exists():
+            return set()
+
+        parser = _SimpleIndexParser()
+        parser.feed(index_path.read_text())
+        prefix = cls._normalize(path.name)
+        result: set[Version] = set()
+        for file_name in parser.file_names:
+            stem = re.sub(r"(\.tar\.gz|\.zip|\.whl)$", "", file_name)
+            if file_name.endswith(".whl"):
+                parts = stem.split("-")
+                if len(parts) < 2:
+                    continue
+                version_str = parts[1]
+            else:
+                name, _, version_str = stem.rpartition("-")
+                if cls._normalize(name) != prefix:
+                    continue
+            try:
+                result.add(Version(version_str))
+            except ValueError:
+                continue
+        return result
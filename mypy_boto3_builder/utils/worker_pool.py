@@ -0,0 +1,244 @@
+"""
+Process pool that runs builder tasks in parallel.
+"""
+import logging
+import os
+import traceback
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
+from multiprocessing.pool import Pool
+from pathlib import Path
+from typing import Any
+
+from boto3.session import Session
+
+from mypy_boto3_builder.constants import OutputFormat
+from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_session
+from mypy_boto3_builder.parsers.service_package_cache import ServicePackageCache
+from mypy_boto3_builder.utils.profiler import Profiler, Span
+from mypy_boto3_builder.writers.formatter_cache import FormatterCache
+from mypy_boto3_builder.writers.memory_output import MemoryOutput
+from mypy_boto3_builder.writers.output_index import OutputIndex, OutputIndexPaths
+from mypy_boto3_builder.writers.package_writer import PackageWriter
+
+TaskResult = tuple[
+    list[logging.LogRecord], list[Span], dict[Path, bytes], BaseException | None, str
+]
+
+
+class RemoteTraceback(Exception):
+    """
+    Formatted traceback of an exception raised in a worker process.
+    """
+
+    def __init__(self, formatted_traceback: str) -> None:
+        super().__init__(formatted_traceback)
+        self.formatted_traceback = formatted_traceback
+
+    def __str__(self) -> str:
+        return self.formatted_traceback
+
+
+class LogRecordCollector(logging.Handler):
+    """
+    Logging handler that keeps records to send them to the parent process.
+    """
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Store picklable copy of a log record.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+    def pop_records(self) -> list[logging.LogRecord]:
+        """
+        Get collected records and clear the storage.
+        """
+        result = self.records
+        self.records = []
+        return result
+
+
+class _WorkerState:
+    """
+    Worker process globals.
+    """
+
+    session: Session | None = None
+    collector = LogRecordCollector()
+
+
+def _initialize_worker(
+    jinja_globals: Mapping[str, object],
+    service_package_cache_path: Path | None,
+    formatter_cache_path: Path | None,
+    formatter_memory_size: int,
+    native_format: bool,
+    output_formats: tuple[OutputFormat, ...],
+    shape_only: bool,
+    profile: bool,
+    memory_output: bool,
+    output_index_paths: OutputIndexPaths,
+    log_level: int,
+) -> None:
+    _WorkerState.session = get_boto3_session()
+    JinjaManager.update_globals(**jinja_globals)
+    if service_package_cache_path:
+        ServicePackageCache.enable_disk_cache(service_package_cache_path)
+    if formatter_cache_path:
+        FormatterCache.enable_disk_cache(formatter_cache_path)
+    FormatterCache.max_memory_size = formatter_memory_size
+    if native_format:
+        PackageWriter.enable_native_format()
+    PackageWriter.set_output_formats(output_formats)
+    if shape_only:
+        ServicePackageCache.enable_shape_only()
+    if profile:
+        Profiler.clear()
+        Profiler.enable()
+    MemoryOutput.clear()
+    if memory_output:
+        MemoryOutput.enable()
+    OutputIndex.set_paths(output_index_paths)
+    logger = get_logger()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(_WorkerState.collector)
+    logger.setLevel(log_level)
+
+
+def _run_task(func: Callable[..., object], kwargs: Mapping[str, Any]) -> TaskResult:
+    error: BaseException | None = None
+    error_traceback = ""
+    try:
+        func(session=_WorkerState.session, **kwargs)
+    except Exception as e:
+        error = e
+        error_traceback = traceback.format_exc()
+    return (
+        _WorkerState.collector.pop_records(),
+        Profiler.pop_spans(),
+        MemoryOutput.pop_files(),
+        error,
+        error_traceback,
+    )
+
+
+class WorkerPool:
+    """
+    Process pool that runs builder tasks in parallel.
+
+    Each worker process creates its own boto3 session. Log records, profiler spans
+    and files stored in `MemoryOutput` are sent back to the parent process in task order.
+
+    Arguments:
+        session -- Session to use for in-process tasks.
+        jobs -- Number of worker processes, `1` runs tasks in current process,
+            `0` uses all available CPUs.
+    """
+
+    def __init__(self, session: Session, jobs: int = 1) -> None:
+        self.session = session
+        self.jobs = jobs or os.cpu_count() or 1
+        self.logger = get_logger()
+        self._pool: Pool | None = None
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_args: object) -> None:
+        self.close(terminate=exc_type is not None)
+
+    @property
+    def is_parallel(self) -> bool:
+        """
+        Whether tasks run in worker processes.
+        """
+        return self.jobs > 1
+
+    def _get_pool(self) -> Pool:
+        if self._pool is None:
+            self._pool = Pool(
+                self.jobs,
+                initializer=_initialize_worker,
+                initargs=(
+                    JinjaManager.get_globals(),
+                    ServicePackageCache.get_disk_cache_path(),
+                    FormatterCache.get_disk_cache_path(),
+                    FormatterCache.max_memory_size // self.jobs,
+                    PackageWriter.native_format,
+                    PackageWriter.output_formats,
+                    ServicePackageCache.shape_only,
+                    Profiler.enabled,
+                    MemoryOutput.enabled,
+                    OutputIndex.get_paths(),
+                    self.logger.getEffectiveLevel(),
+                ),
+            )
+        return self._pool
+
+    def run(
+        self, func: Callable[..., object], tasks: Iterable[Mapping[str, Any]]
+    ) -> Iterator[None]:
+        """
+        Call `func` with `session` and task keyword arguments for each task.
+
+        Results are discarded, as parsed structures hold boto3 objects that cannot be pickled.
+        Returned iterator yields once per task in `tasks` order,
+        right after task log records are emitted.
+        In-process tasks are executed lazily on iteration,
+        worker processes start immediately, so the caller can do other work meanwhile.
+
+        Arguments:
+            func -- Picklable function that accepts `session` keyword argument.
+            tasks -- Keyword arguments for each call.
+        """
+        if not self.is_parallel:
+            return self._run_serial(func, tasks)
+
+        results = self._get_pool().imap(partial(_run_task, func), tasks)
+        return self._replay_results(results)
+
+    def _run_serial(
+        self, func: Callable[..., object], tasks: Iterable[Mapping[str, Any]]
+    ) -> Iterator[None]:
+        for kwargs in tasks:
+            func(session=self.session, **kwargs)
+            yield
+
+    def _replay_results(self, results: Iterable[TaskResult]) -> Iterator[None]:
+        for records, spans, files, error, error_traceback in results:
+            for record in records:
+                self.logger.handle(record)
+            Profiler.add_spans(spans)
+            MemoryOutput.add_files(files)
+            if error is not None:
+                raise error from RemoteTraceback(error_traceback)
+            yield
+
+    def close(self, terminate: bool = False) -> None:
+        """
+        Stop worker processes.
+
+        Arguments:
+            terminate -- Do not wait for pending tasks.
+        """
+        if self._pool is None:
+            return
+        if terminate:
+            self._pool.terminate()
+        else:
+            self._pool.close()
+        self._pool.join()
+        self._pool = None
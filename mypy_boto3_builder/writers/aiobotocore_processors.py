@@ -13,12 +13,14 @@ from mypy_boto3_builder.constants import (
 )
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.parsers.aiobotocore_stubs_package import parse_aiobotocore_stubs_package
-from mypy_boto3_builder.parsers.service_package import parse_service_package
+from mypy_boto3_builder.parsers.service_package_cache import ServicePackageCache
 from mypy_boto3_builder.parsers.service_package_postprocessor import ServicePackagePostprocessor
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.aiobotocore_stubs_package import AioBotocoreStubsPackage
 from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.utils.build_manifest import BuildManifest, get_service_fingerprint
 from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.profiler import Profiler
 from mypy_boto3_builder.utils.strings import get_aiobotocore_version
 from mypy_boto3_builder.writers.package_writer import PackageWriter
 
@@ -110,7 +112,8 @@ def process_aiobotocore_service(
     generate_setup: bool,
     service_names: Iterable[ServiceName],
     version: str,
-) -> ServicePackage:
+    incremental: bool = False,
+) -> ServicePackage | None:
     """
     Parse and write service package `types_aiobotocore_*`.
 
@@ -121,13 +124,33 @@ def process_aiobotocore_service(
         generate_setup -- Generate ready-to-install or to-use package
         service_names -- List of known service names
         version -- Package version
+        incremental -- Skip package if its inputs did not change since the last build
 
     Return:
-        Parsed ServicePackage.
+        Parsed ServicePackage or None if package is up to date.
     """
     logger = get_logger()
+    templates_path = TEMPLATES_PATH / "aiobotocore_service"
+    manifest = BuildManifest(output_path)
+    manifest_key = f"{templates_path.name}-{service_name.name}"
+    fingerprint = ""
+    if incremental:
+        fingerprint = get_service_fingerprint(
+            session,
+            service_name,
+            service_names,
+            templates=templates_path.name,
+            generate_setup=generate_setup,
+            version=version,
+            library_version=get_aiobotocore_version(),
+        )
+        if manifest.is_up_to_date(manifest_key, fingerprint):
+            logger.info(f"Skipping {service_name.aiobotocore_module_name} {version}, up to date")
+            return None
+
     logger.debug(f"Parsing {service_name.boto3_name}")
-    service_package = parse_service_package(session, service_name)
+    with Profiler.span("parse", service=service_name.boto3_name):
+        service_package = ServicePackageCache.get(session, service_name)
     service_package.name = service_name.aiobotocore_module_name
     service_package.pypi_name = service_name.aiobotocore_pypi_name
     service_package.version = version
@@ -135,20 +158,22 @@ def process_aiobotocore_service(
     service_package.library_version = get_aiobotocore_version()
     service_package.extend_literals(service_names)
 
-    postprocessor = ServicePackagePostprocessor(service_package)
-    postprocessor.generate_docstrings()
-    postprocessor.make_async()
-    postprocessor.add_contextmanager_methods()
+    with Profiler.span("postprocess", service=service_name.boto3_name):
+        postprocessor = ServicePackagePostprocessor(service_package)
+        postprocessor.generate_docstrings()
+        postprocessor.make_async()
+        postprocessor.add_contextmanager_methods()
 
-    for typed_dict in service_package.typed_dicts:
-        typed_dict.replace_self_references()
     logger.debug(f"Writing {service_name.boto3_name} to {NicePath(output_path)}")
 
-    package_writer = PackageWriter(output_path=output_path, generate_setup=generate_setup)
-    package_writer.write_service_package(
-        service_package,
-        templates_path=TEMPLATES_PATH / "aiobotocore_service",
-    )
+    with Profiler.span("write", service=service_name.boto3_name):
+        package_writer = PackageWriter(output_path=output_path, generate_setup=generate_setup)
+        file_paths = package_writer.write_service_package(
+            service_package,
+            templates_path=templates_path,
+        )
+    if incremental:
+        manifest.update(manifest_key, fingerprint, file_paths)
     return service_package
 
 
@@ -192,7 +217,8 @@ def process_aiobotocore_service_docs(
     service_name: ServiceName,
     output_path: Path,
     service_names: Iterable[ServiceName],
-) -> ServicePackage:
+    incremental: bool = False,
+) -> ServicePackage | None:
     """
     Parse and write service package docs.
 
@@ -201,32 +227,51 @@ def process_aiobotocore_service_docs(
         service_name -- Target service name
         output_path -- Package output path
         service_names -- List of known service names
+        incremental -- Skip docs if their inputs did not change since the last build
 
     Return:
-        Parsed ServicePackage.
+        Parsed ServicePackage or None if docs are up to date.
     """
     logger = get_logger()
+    templates_path = TEMPLATES_PATH / "aiobotocore_service_docs"
+    manifest = BuildManifest(output_path)
+    manifest_key = f"{templates_path.name}-{service_name.name}"
+    fingerprint = ""
+    if incremental:
+        fingerprint = get_service_fingerprint(
+            session,
+            service_name,
+            service_names,
+            templates=templates_path.name,
+            library_version=get_aiobotocore_version(),
+        )
+        if manifest.is_up_to_date(manifest_key, fingerprint):
+            logger.info(f"Skipping {service_name.aiobotocore_module_name} docs, up to date")
+            return None
+
     logger.debug(f"Parsing {service_name.boto3_name}")
-    service_package = parse_service_package(session, service_name)
+    with Profiler.span("parse", service=service_name.boto3_name):
+        service_package = ServicePackageCache.get(session, service_name)
     service_package.name = service_name.aiobotocore_module_name
     service_package.pypi_name = service_name.aiobotocore_pypi_name
     service_package.library_name = "aiobotocore"
     service_package.library_version = get_aiobotocore_version()
     service_package.extend_literals(service_names)
 
-    postprocessor = ServicePackagePostprocessor(service_package)
-    postprocessor.generate_docstrings()
-    postprocessor.make_async()
-    postprocessor.add_contextmanager_methods()
-
-    for typed_dict in service_package.typed_dicts:
-        typed_dict.replace_self_references()
+    with Profiler.span("postprocess", service=service_name.boto3_name):
+        postprocessor = ServicePackagePostprocessor(service_package)
+        postprocessor.generate_docstrings()
+        postprocessor.make_async()
+        postprocessor.add_contextmanager_methods()
 
     logger.debug(f"Writing {service_name.boto3_name} to {NicePath(output_path)}")
 
-    package_writer = PackageWriter(output_path=output_path)
-    package_writer.write_service_docs(
-        service_package,
-        templates_path=TEMPLATES_PATH / "aiobotocore_service_docs",
-    )
+    with Profiler.span("write", service=service_name.boto3_name):
+        package_writer = PackageWriter(output_path=output_path)
+        file_paths = package_writer.write_service_docs(
+            service_package,
+            templates_path=templates_path,
+        )
+    if incremental:
+        manifest.update(manifest_key, fingerprint, file_paths)
     return service_package
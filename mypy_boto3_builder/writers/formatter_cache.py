@@ -0,0 +1,196 @@
+"""
+Cache for formatters output.
+"""
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+from mypy_boto3_builder.constants import FORMATTER_CACHE_DISK_SIZE, FORMATTER_CACHE_MEMORY_SIZE
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+
+class FormatterCache:
+    """
+    Cache for formatters output, keyed by unformatted content and formatter config.
+
+    Results are kept in memory and, if enabled, on disk to reuse them in next runs.
+    Both storages evict least recently used results when they exceed their size limit.
+    Disk usage is counted on the first write, so runs that only read results
+    do not scan the cache directory.
+    """
+
+    max_memory_size = FORMATTER_CACHE_MEMORY_SIZE
+    max_disk_size = FORMATTER_CACHE_DISK_SIZE
+
+    _memory: OrderedDict[str, str] = OrderedDict()
+    _memory_size = 0
+    _disk_path: Path | None = None
+    _disk_size: int | None = None
+
+    @staticmethod
+    def get_key(content: str, *config: object) -> str:
+        """
+        Get cache key for `content` formatted with `config`.
+
+        Arguments:
+            content -- Unformatted content.
+            config -- Formatter name, version and settings.
+
+        Returns:
+            Hex digest.
+        """
+        digest = hashlib.sha256()
+        digest.update(repr(config).encode())
+        digest.update(b"\n")
+        digest.update(content.encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def enable_disk_cache(cls, path: Path) -> None:
+        """
+        Store formatted content in `path` to reuse it in next runs.
+
+        Arguments:
+            path -- Cache directory.
+        """
+        cls._disk_path = path
+        cls._disk_size = None
+
+    @classmethod
+    def disable_disk_cache(cls) -> None:
+        """
+        Keep formatted content only in memory.
+        """
+        cls._disk_path = None
+        cls._disk_size = None
+
+    @classmethod
+    def get_disk_cache_path(cls) -> Path | None:
+        """
+        Get on-disk cache directory, if enabled.
+        """
+        return cls._disk_path
+
+    @classmethod
+    def get(cls, key: str) -> str | None:
+        """
+        Get formatted content.
+
+        Arguments:
+            key -- Cache key from `get_key`.
+
+        Returns:
+            Formatted content or None if it is not cached.
+        """
+        if key in cls._memory:
+            cls._memory.move_to_end(key)
+            return cls._memory[key]
+
+        if cls._disk_path is None:
+            return None
+
+        path = cls._get_disk_entry_path(key)
+        try:
+            value = path.read_bytes().decode()
+        except OSError:
+            return None
+        except ValueError:
+            get_logger().debug(f"Removing corrupted formatter cache file {NicePath(path)}")
+            path.unlink(missing_ok=True)
+            cls._disk_size = None
+            return None
+        os.utime(path)
+        cls._set_memory(key, value)
+        return value
+
+    @classmethod
+    def set(cls, key: str, value: str) -> None:
+        """
+        Store formatted content.
+
+        Arguments:
+            key -- Cache key from `get_key`.
+            value -- Formatted content.
+        """
+        cls._set_memory(key, value)
+        if cls._disk_path is not None:
+            cls._set_disk(key, value)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Remove all results from memory.
+        """
+        cls._memory.clear()
+        cls._memory_size = 0
+
+    @classmethod
+    def _set_memory(cls, key: str, value: str) -> None:
+        if key in cls._memory:
+            return
+        cls._memory[key] = value
+        cls._memory_size += len(value)
+        while cls._memory_size > cls.max_memory_size and cls._memory:
+            _, evicted = cls._memory.popitem(last=False)
+            cls._memory_size -= len(evicted)
+
+    @classmethod
+    def _get_disk_entry_path(cls, key: str) -> Path:
+        assert cls._disk_path is not None
+        return cls._disk_path / key[:2] / key
+
+    @classmethod
+    def _set_disk(cls, key: str, value: str) -> None:
+        path = cls._get_disk_entry_path(key)
+        data = value.encode()
+        try:
+            path.parent.mkdir(exist_ok=True, parents=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as stream:
+                stream.write(data)
+            os.replace(stream.name, path)
+        except OSError as e:
+            get_logger().debug(f"Cannot write formatter cache file {NicePath(path)}: {e}")
+            return
+        if cls._disk_size is None:
+            cls._disk_size = sum(size for _, size, _ in cls._get_disk_entries())
+        else:
+            cls._disk_size += len(data)
+        if cls._disk_size > cls.max_disk_size:
+            cls._evict_disk()
+
+    @classmethod
+    def _evict_disk(cls) -> None:
+        """
+        Remove least recently used files until cache takes 80% of its size limit.
+        """
+        assert cls._disk_path is not None
+        entries = sorted(cls._get_disk_entries())
+        cls._disk_size = sum(i[1] for i in entries)
+        removed = 0
+        for _, size, path in entries:
+            if cls._disk_size <= cls.max_disk_size * 0.8:
+                break
+            path.unlink(missing_ok=True)
+            cls._disk_size -= size
+            removed += 1
+        get_logger().debug(
+            f"Removed {removed} formatter cache files from {NicePath(cls._disk_path)}"
+        )
+
+    @classmethod
+    def _get_disk_entries(cls) -> list[tuple[float, int, Path]]:
+        """
+        Get modification time, size and path of each cache file.
+        """
+        assert cls._disk_path is not None
+        result = []
+        for path in cls._disk_path.glob("*/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            result.append((stat.st_mtime, stat.st_size, path))
+        return result
@@ -0,0 +1,68 @@
+"""
+In-memory storage for generated files.
+"""
+from collections.abc import Mapping
+from pathlib import Path
+
+
+class MemoryOutput:
+    """
+    In-memory storage for generated files.
+
+    Disabled by default, see `enable`. When enabled, `PackageWriter` stores files here
+    instead of writing them to disk. Files from worker processes are sent
+    to the parent process with `pop_files` and `add_files`.
+    """
+
+    enabled = False
+
+    _files: dict[Path, bytes] = {}
+
+    @classmethod
+    def enable(cls) -> None:
+        """
+        Store generated files in memory instead of writing them to disk.
+        """
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Write generated files to disk and drop stored files.
+        """
+        cls.enabled = False
+        cls.clear()
+
+    @classmethod
+    def add(cls, file_path: Path, data: bytes) -> None:
+        """
+        Store file content.
+
+        Arguments:
+            file_path -- Absolute path inside output directory.
+            data -- File content.
+        """
+        cls._files[file_path] = data
+
+    @classmethod
+    def add_files(cls, files: Mapping[Path, bytes]) -> None:
+        """
+        Store files collected in another process.
+        """
+        cls._files.update(files)
+
+    @classmethod
+    def pop_files(cls) -> dict[Path, bytes]:
+        """
+        Get stored files and clear the storage.
+        """
+        result = cls._files
+        cls._files = {}
+        return result
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Remove all stored files, including ones inherited by a forked process.
+        """
+        cls._files.clear()
@@ -0,0 +1,3 @@
+"""
+Native formatter for generated service stubs.
+"""
@@ -0,0 +1,199 @@
+"""
+Bracket tracking for native formatter.
+
+Port of `black.brackets` for the syntax subset supported by the parser.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+
+from mypy_boto3_builder.writers.native_formatter.nodes import (
+    AT,
+    BRACKET,
+    CLOSING_BRACKETS,
+    COMMA,
+    COMMENT,
+    COMPARATORS,
+    DOT,
+    DOUBLESTAR,
+    LN,
+    LPAR,
+    MATH_OPERATORS,
+    OPENING_BRACKETS,
+    RPAR,
+    STAR,
+    STRING,
+    UNPACKING_PARENTS,
+    VARARGS_PARENTS,
+    Leaf,
+    Node,
+    atom,
+    dotted_name,
+    is_vararg,
+)
+
+COMMA_PRIORITY = 18
+STRING_PRIORITY = 12
+COMPARATOR_PRIORITY = 10
+MATH_PRIORITIES = {STAR: 4, AT: 4, DOUBLESTAR: 2}
+DOT_PRIORITY = 1
+
+
+class BracketTracker:
+    """
+    Keep track of brackets and delimiters on a line.
+    """
+
+    __slots__ = ("depth", "bracket_match", "delimiters", "previous", "invisible")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.bracket_match: dict[tuple[int, int], Leaf] = {}
+        self.delimiters: dict[int, int] = {}
+        self.previous: Leaf | None = None
+        self.invisible: list[Leaf] = []
+
+    def mark(self, leaf: Leaf) -> None:
+        """
+        Set bracket depth and opening bracket of `leaf` and record delimiters.
+        """
+        leaf_type = leaf.type
+        if leaf_type == COMMENT:
+            return
+
+        if self.depth == 0 and leaf_type in CLOSING_BRACKETS:
+            if (self.depth, leaf_type) not in self.bracket_match:
+                return
+
+        if leaf_type in CLOSING_BRACKETS:
+            self.depth -= 1
+            opening_bracket = self.bracket_match.pop((self.depth, leaf_type))
+            leaf.opening_bracket = opening_bracket
+            if not leaf.value:
+                self.invisible.append(leaf)
+        leaf.bracket_depth = self.depth
+        if self.depth == 0:
+            delimiter = is_split_before_delimiter(leaf, self.previous)
+            if delimiter and self.previous is not None:
+                self.delimiters[id(self.previous)] = delimiter
+            elif leaf_type == COMMA:
+                self.delimiters[id(leaf)] = COMMA_PRIORITY
+        if leaf_type in OPENING_BRACKETS:
+            self.bracket_match[self.depth, BRACKET[leaf_type]] = leaf
+            self.depth += 1
+            if not leaf.value:
+                self.invisible.append(leaf)
+        self.previous = leaf
+
+    def any_open_brackets(self) -> bool:
+        """
+        Whether there is a yet unmatched open bracket on the line.
+        """
+        return bool(self.bracket_match)
+
+    def max_delimiter_priority(self, exclude: Iterable[int] = ()) -> int:
+        """
+        Get the highest priority of a delimiter found on the line.
+
+        Raises:
+            ValueError -- If there are no delimiters.
+        """
+        return max(v for k, v in self.delimiters.items() if k not in exclude)
+
+    def delimiter_count_with_priority(self, priority: int = 0) -> int:
+        """
+        Get the number of delimiters with the given `priority`.
+        """
+        if not self.delimiters:
+            return 0
+        priority = priority or self.max_delimiter_priority()
+        return sum(1 for p in self.delimiters.values() if p == priority)
+
+
+def is_split_before_delimiter(leaf: Leaf, previous: Leaf | None = None) -> int:
+    """
+    Get the priority of the `leaf` delimiter, given a line break before it.
+    """
+    leaf_type = leaf.type
+    if is_vararg(leaf, within=VARARGS_PARENTS | UNPACKING_PARENTS):
+        return 0
+    if (
+        leaf_type == DOT
+        and leaf.parent
+        and leaf.parent.type != dotted_name
+        and (previous is None or previous.type in CLOSING_BRACKETS)
+    ):
+        return DOT_PRIORITY
+    if leaf_type in MATH_OPERATORS and leaf.parent:
+        return MATH_PRIORITIES[leaf_type]
+    if leaf_type in COMPARATORS:
+        return COMPARATOR_PRIORITY
+    if leaf_type == STRING and previous is not None and previous.type == STRING:
+        return STRING_PRIORITY
+    return 0
+
+
+def max_delimiter_priority_in_atom(node: LN) -> int:
+    """
+    Get maximum delimiter priority inside parenthesized atom `node`.
+    """
+    if not isinstance(node, Node) or node.type != atom:
+        return 0
+
+    first = node.children[0]
+    last = node.children[-1]
+    if not (first.type == LPAR and last.type == RPAR):
+        return 0
+
+    tracker = BracketTracker()
+    for leaf in _top_level_leaves(node.children[1:-1]):
+        tracker.mark(leaf)
+    try:
+        return tracker.max_delimiter_priority()
+    except ValueError:
+        return 0
+
+
+def _top_level_leaves(children: Iterable[LN]) -> Iterator[Leaf]:
+    for child in children:
+        if isinstance(child, Leaf):
+            yield child
+            continue
+        if not child.children:
+            continue
+        first = child.children[0]
+        last = child.children[-1]
+        if (
+            isinstance(first, Leaf)
+            and isinstance(last, Leaf)
+            and first.type in OPENING_BRACKETS
+            and last.type in CLOSING_BRACKETS
+        ):
+            yield first
+            yield last
+        else:
+            yield from _top_level_leaves(child.children)
+
+
+def get_leaves_inside_matching_brackets(leaves: Sequence[Leaf]) -> set[int]:
+    """
+    Get IDs of leaves that are inside matching brackets, including the brackets.
+    """
+    start_index = next((i for i, leaf in enumerate(leaves) if leaf.type in OPENING_BRACKETS), None)
+    if start_index is None:
+        return set()
+
+    ids: set[int] = set()
+    bracket_stack: list[tuple[int, list[int]]] = []
+    for leaf in leaves[start_index:]:
+        if leaf.type in OPENING_BRACKETS:
+            bracket_stack.append((BRACKET[leaf.type], [id(leaf)]))
+        elif leaf.type in CLOSING_BRACKETS:
+            if bracket_stack and leaf.type == bracket_stack[-1][0]:
+                _, level_ids = bracket_stack.pop()
+                level_ids.append(id(leaf))
+                ids.update(level_ids)
+            else:
+                break
+        elif bracket_stack:
+            bracket_stack[-1][1].append(id(leaf))
+    return ids
@@ -0,0 +1,11 @@
+"""
+Native formatter errors.
+"""
+
+
+class UnsupportedSyntaxError(Exception):
+    """
+    Content uses syntax that native formatter does not handle.
+
+    Caller should fall back to `isort` and `black`.
+    """
@@ -0,0 +1,61 @@
+"""
+Native formatter entry points.
+"""
+
+from collections.abc import Iterable
+
+from mypy_boto3_builder.constants import LINE_LENGTH
+from mypy_boto3_builder.writers.native_formatter.imports import sort_imports
+from mypy_boto3_builder.writers.native_formatter.linegen import Feature, format_tree
+from mypy_boto3_builder.writers.native_formatter.lines import Mode
+from mypy_boto3_builder.writers.native_formatter.parser import parse
+
+
+def format_code(content: str, is_pyi: bool = False) -> str:
+    """
+    Format `content` the same way as `black` with `LINE_LENGTH` does.
+
+    Arguments:
+        content -- Python code with sorted imports.
+        is_pyi -- Whether `content` is a stub file.
+
+    Returns:
+        Formatted python code.
+
+    Raises:
+        UnsupportedSyntaxError -- If `content` uses syntax that native formatter does not handle.
+    """
+    mode = Mode(line_length=LINE_LENGTH, is_pyi=is_pyi)
+    root, has_trailing_comma_in_def, has_trailing_comma_in_call = parse(content.lstrip())
+    features: set[Feature] = set()
+    if has_trailing_comma_in_def:
+        features = {Feature.TRAILING_COMMA_IN_CALL, Feature.TRAILING_COMMA_IN_DEF}
+    elif has_trailing_comma_in_call:
+        features = {Feature.TRAILING_COMMA_IN_CALL}
+
+    result = format_tree(root, mode, features)
+    if not result:
+        return "\n" if "\n" in content else ""
+    return result
+
+
+def format_stub(
+    content: str, module_name: str, extension: str = "pyi", third_party: Iterable[str] = ()
+) -> str:
+    """
+    Sort imports and format rendered service module without `isort` and `black`.
+
+    Arguments:
+        content -- Rendered module content.
+        module_name -- Current module name.
+        extension -- py or pyi
+        third_party -- List of module names to be marked as third-party.
+
+    Returns:
+        Formatted python code.
+
+    Raises:
+        UnsupportedSyntaxError -- If `content` uses syntax that native formatter does not handle.
+    """
+    content = sort_imports(content, module_name, extension=extension, third_party=third_party)
+    return format_code(content, is_pyi=extension == "pyi")
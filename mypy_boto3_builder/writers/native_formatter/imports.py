@@ -0,0 +1,414 @@
+"""
+Import sorter for native formatter.
+
+Reproduces `isort` output with `black` profile for import blocks of generated stubs.
+"""
+
+import importlib.machinery
+import re
+import textwrap
+from collections.abc import Iterable
+from pathlib import Path
+
+from isort.stdlibs.py3 import stdlib
+
+from mypy_boto3_builder.constants import LINE_LENGTH
+from mypy_boto3_builder.writers.native_formatter.errors import UnsupportedSyntaxError
+
+FUTURE = "FUTURE"
+STDLIB = "STDLIB"
+THIRDPARTY = "THIRDPARTY"
+FIRSTPARTY = "FIRSTPARTY"
+LOCALFOLDER = "LOCALFOLDER"
+SECTIONS = (FUTURE, STDLIB, THIRDPARTY, FIRSTPARTY, LOCALFOLDER)
+
+UNSUPPORTED_IMPORT_STARTS = (
+    "from.",
+    "import*",
+    "lazy from ",
+    "lazy import ",
+    "cimport ",
+    "cimport*",
+)
+STATEMENT_DECLARATIONS = ("def ", "cdef ", "cpdef ", "class ", "@", "async def")
+
+_FROM_IMPORT_RE = re.compile(r"^from ([\w.]+) import ([\w, ]+)$")
+_STRAIGHT_IMPORT_RE = re.compile(r"^import ([\w.]+)(?: as (\w+))?$")
+_NAME_RE = re.compile(r"^(\w+)(?: as (\w+))?$")
+_DIGITS_RE = re.compile(r"(\d+)")
+_RELATIVE_RE = re.compile(r"^(\.+)\s*(.*)")
+_QUOTE_SCAN_RE = re.compile(r"[\\'\"#]")
+
+
+def _natural_key(text: str) -> list[int | str]:
+    return [int(i) if i.isdigit() else i for i in _DIGITS_RE.split(text)]
+
+
+def _module_key(name: str) -> list[int | str]:
+    match = _RELATIVE_RE.match(name)
+    if match:
+        name = "_".join(match.groups())
+    return _natural_key(f"B{name.lower()}")
+
+
+def _name_key(name: str) -> list[int | str]:
+    if name.isupper() and len(name) > 1:
+        prefix = "A"
+    elif name[:1].isupper():
+        prefix = "B"
+    else:
+        prefix = "C"
+    return _natural_key(f"B{prefix}{name.lower()}")
+
+
+def _scan_quotes(line: str, stripped_line: str, in_quote: str) -> str:
+    if not (((not stripped_line.startswith("#") or in_quote) and '"' in line) or "'" in line):
+        return in_quote
+
+    match = _QUOTE_SCAN_RE.search(line)
+    while match:
+        index = match.start()
+        char = line[index]
+        if char == "\\":
+            index += 1
+        elif in_quote:
+            if line.startswith(in_quote, index):
+                in_quote = ""
+        elif char != "#":
+            long_quote = line[index : index + 3]
+            if long_quote in ('"""', "'''"):
+                in_quote = long_quote
+                index += 2
+            else:
+                in_quote = char
+        else:
+            break
+        match = _QUOTE_SCAN_RE.search(line, index + 1)
+    return in_quote
+
+
+def _get_indent(line: str) -> str:
+    return line[: len(line) - len(line.lstrip())]
+
+
+class _ImportBlock:
+    """
+    Parsed contiguous import block.
+    """
+
+    def __init__(self) -> None:
+        self.straight: dict[str, dict[str, bool]] = {i: {} for i in SECTIONS}
+        self.from_imports: dict[str, dict[str, dict[str, bool]]] = {i: {} for i in SECTIONS}
+        self.straight_aliases: dict[str, list[str]] = {}
+        self.from_aliases: dict[str, list[str]] = {}
+
+
+def _add_import_line(
+    import_section: str, indent: str, line: str, contains_imports: bool
+) -> tuple[str, str]:
+    new_indent = _get_indent(line)
+    if new_indent == indent:
+        return import_section + line, indent
+    if not import_section:
+        return line, new_indent
+    if not contains_imports or len(new_indent) < len(indent):
+        raise UnsupportedSyntaxError("Adjacent import blocks")
+    return import_section + indent + line.lstrip(), indent
+
+
+class ImportSorter:
+    """
+    Sort imports the same way as `isort` with `black` profile does.
+
+    Only a subset of `isort` features is supported: one import per line,
+    no comments, no continuation lines, no `__future__` imports.
+    Any other input raises `UnsupportedSyntaxError`.
+
+    Arguments:
+        module_name -- Current module name, placed to first-party section.
+        third_party -- Module names to be marked as third-party.
+        extension -- py or pyi
+    """
+
+    def __init__(self, module_name: str, third_party: Iterable[str], extension: str = "py") -> None:
+        self.first_party = {module_name}
+        self.third_party = set(third_party) - self.first_party
+        self.extension = extension
+        self._sections: dict[str, str] = {}
+
+    def _place_module(self, name: str) -> str:
+        if name in self._sections:
+            return self._sections[name]
+
+        if name.startswith("."):
+            return LOCALFOLDER
+
+        parts = name.split(".")
+        for index in range(len(parts), 0, -1):
+            prefix = ".".join(parts[:index])
+            if prefix in self.first_party:
+                result = FIRSTPARTY
+                break
+            if prefix in self.third_party:
+                result = THIRDPARTY
+                break
+            if prefix == "__future__":
+                raise UnsupportedSyntaxError("__future__ imports are not supported")
+            if prefix in stdlib:
+                result = STDLIB
+                break
+        else:
+            if self._is_local_module(parts[0]):
+                raise UnsupportedSyntaxError(f"Module {name} placement depends on current path")
+            result = THIRDPARTY
+
+        self._sections[name] = result
+        return result
+
+    @staticmethod
+    def _is_local_module(name: str) -> bool:
+        """
+        Check if `isort` would find module in default `src_paths`.
+        """
+        cwd = Path.cwd()
+        for src_path in (cwd / "src", cwd):
+            if src_path.name == name:
+                return True
+            module_path = src_path / name
+            if module_path.is_dir():
+                return True
+            for suffix in (".py", *importlib.machinery.EXTENSION_SUFFIXES):
+                if module_path.with_name(f"{name}{suffix}").exists():
+                    return True
+        return False
+
+    def sort(self, content: str) -> str:
+        """
+        Sort all import blocks in `content`.
+
+        Arguments:
+            content -- File content.
+
+        Returns:
+            New file content.
+        """
+        if not content:
+            return ""
+        if "\r" in content or "isort:" in content:
+            raise UnsupportedSyntaxError("Line endings or isort directives are not supported")
+
+        result: list[str] = []
+        import_section = ""
+        indent = ""
+        in_quote = ""
+        contains_imports = False
+        first_import_section = True
+        for line in content.splitlines(keepends=True):
+            stripped_line = line.strip()
+            was_in_quote = bool(in_quote)
+            in_quote = _scan_quotes(line, stripped_line, in_quote)
+            not_imports = bool(in_quote) or was_in_quote
+            if not not_imports:
+                if stripped_line.startswith("#"):
+                    raise UnsupportedSyntaxError("Standalone comments are not supported")
+                if not (stripped_line or contains_imports):
+                    not_imports = True
+                elif not stripped_line:
+                    import_section += line
+                elif stripped_line.startswith(("from ", "import ")):
+                    import_section, indent = _add_import_line(
+                        import_section, indent, line, contains_imports
+                    )
+                    contains_imports = True
+                elif stripped_line.startswith(UNSUPPORTED_IMPORT_STARTS):
+                    raise UnsupportedSyntaxError(f"Unsupported import: {stripped_line}")
+                else:
+                    not_imports = True
+
+            if not not_imports:
+                continue
+
+            if not import_section:
+                result.append(line)
+                continue
+
+            result.append(
+                self._sort_import_section(import_section, indent, line, first_import_section)
+            )
+            first_import_section = False
+            contains_imports = False
+            import_section = ""
+            indent = ""
+
+        if import_section:
+            result.append(
+                self._sort_import_section(import_section, indent, "", first_import_section)
+            )
+
+        return "".join(result)
+
+    def _sort_import_section(
+        self, import_section: str, indent: str, next_line: str, is_first: bool
+    ) -> str:
+        if not indent:
+            import_section += next_line
+        leading_whitespace = import_section[: len(import_section) - len(import_section.lstrip())]
+        trailing_whitespace = import_section[len(import_section.rstrip()) :]
+        if is_first:
+            import_section = import_section.lstrip("\n")
+        if not indent:
+            return self._sort_section(import_section, LINE_LENGTH, None)
+
+        import_section = "".join(
+            i[len(indent) :] if i.startswith(indent) else i
+            for i in import_section.splitlines(keepends=True)
+        )
+        sorted_section = self._sort_section(import_section, LINE_LENGTH - len(indent), 1)
+        return (
+            leading_whitespace
+            + textwrap.indent(sorted_section, indent).strip()
+            + trailing_whitespace
+            + next_line
+        )
+
+    def _parse_section(self, lines: Iterable[str]) -> _ImportBlock:
+        block = _ImportBlock()
+        for line in lines:
+            if ";" in line or "\\" in line or "(" in line:
+                raise UnsupportedSyntaxError(f"Unsupported import: {line}")
+
+            match = _STRAIGHT_IMPORT_RE.match(line)
+            if match:
+                module, alias = match.groups()
+                section = self._place_module(module)
+                if alias:
+                    aliases = block.straight_aliases.setdefault(module, [])
+                    if alias not in aliases:
+                        aliases.append(alias)
+                    block.straight[section].setdefault(module, False)
+                else:
+                    block.straight[section][module] = True
+                continue
+
+            match = _FROM_IMPORT_RE.match(line)
+            if not match:
+                raise UnsupportedSyntaxError(f"Unsupported import: {line}")
+            module, names_str = match.groups()
+            section = self._place_module(module)
+            names = block.from_imports[section].setdefault(module, {})
+            for name_str in names_str.split(", "):
+                name_match = _NAME_RE.match(name_str)
+                if not name_match:
+                    raise UnsupportedSyntaxError(f"Unsupported import: {line}")
+                name, alias = name_match.groups()
+                if alias:
+                    aliases = block.from_aliases.setdefault(f"{module}.{name}", [])
+                    if alias not in aliases:
+                        aliases.append(alias)
+                    names.setdefault(name, False)
+                else:
+                    names[name] = True
+        return block
+
+    def _sort_section(self, text: str, line_length: int, lines_after_imports: int | None) -> str:
+        lines = text.split("\n")
+        import_lines: list[str] = []
+        tail: list[str] = []
+        for line in lines:
+            if line.startswith(("from ", "import ")) and not tail:
+                import_lines.append(line)
+            elif line.startswith(("from ", "import ")):
+                raise UnsupportedSyntaxError("Blank lines between imports are not supported")
+            elif line or tail:
+                tail.append(line)
+        block = self._parse_section(import_lines)
+
+        output: list[str] = []
+        for section in SECTIONS:
+            section_output = [
+                *self._render_straight(block, section),
+                *self._render_from(block, section, line_length),
+            ]
+            if section_output:
+                output.append("")
+                output.extend(section_output)
+        while output and not output[0]:
+            output.pop(0)
+
+        while tail and not tail[-1].strip():
+            tail.pop()
+        if tail:
+            if lines_after_imports is None:
+                lines_after_imports = 1
+                if self.extension != "pyi" and tail[0].startswith(STATEMENT_DECLARATIONS):
+                    lines_after_imports = 2
+            output.extend([""] * lines_after_imports)
+            output.extend(tail)
+        output.append("")
+        return "\n".join(output)
+
+    def _render_straight(self, block: _ImportBlock, section: str) -> list[str]:
+        result: list[str] = []
+        modules = sorted(block.straight[section], key=_module_key)
+        for module in modules:
+            if module not in block.straight_aliases:
+                result.append(f"import {module}")
+                continue
+            if block.straight[section][module]:
+                result.append(f"import {module}")
+            result.extend(f"import {module} as {i}" for i in block.straight_aliases[module])
+        return result
+
+    def _render_from(self, block: _ImportBlock, section: str, line_length: int) -> list[str]:
+        result: list[str] = []
+        modules = sorted(block.from_imports[section], key=_module_key)
+        for module in modules:
+            import_start = f"from {module} import "
+            module_names = block.from_imports[section][module]
+            names = sorted(module_names, key=_name_key)
+            aliased = {i for i in names if f"{module}.{i}" in block.from_aliases}
+            while names:
+                while names and names[0] in aliased:
+                    name = names.pop(0)
+                    if module_names[name]:
+                        result.append(f"{import_start}{name}")
+                    for alias in sorted(
+                        (f"{name} as {i}" for i in block.from_aliases[f"{module}.{name}"]),
+                        key=_natural_key,
+                    ):
+                        line = f"{import_start}{alias}"
+                        if len(line) > line_length:
+                            raise UnsupportedSyntaxError(f"Import is too long: {line}")
+                        result.append(line)
+
+                group: list[str] = []
+                while names and names[0] not in aliased:
+                    group.append(names.pop(0))
+                if not group:
+                    continue
+                line = f"{import_start}{', '.join(group)}"
+                if len(line) <= line_length:
+                    result.append(line)
+                    continue
+                result.append(f"{import_start}(")
+                result.extend(f"    {i}," for i in group)
+                result.append(")")
+        return result
+
+
+def sort_imports(
+    content: str, module_name: str, extension: str = "py", third_party: Iterable[str] = ()
+) -> str:
+    """
+    Sort imports without calling `isort`.
+
+    Arguments:
+        content -- File content.
+        module_name -- Current module name.
+        extension -- py or pyi
+        third_party -- List of module names to be marked as third-party.
+
+    Returns:
+        New file content.
+    """
+    return ImportSorter(module_name, third_party, extension).sort(content)
@@ -0,0 +1,1286 @@
+"""
+Line generation and splitting for native formatter.
+
+Port of `black.linegen` stable style for the syntax subset supported by the parser.
+"""
+
+import sys
+from collections.abc import Callable, Collection, Iterator
+from enum import Enum
+from functools import wraps
+from typing import Any
+
+from mypy_boto3_builder.writers.native_formatter.brackets import (
+    COMMA_PRIORITY,
+    DOT_PRIORITY,
+    STRING_PRIORITY,
+    get_leaves_inside_matching_brackets,
+    max_delimiter_priority_in_atom,
+)
+from mypy_boto3_builder.writers.native_formatter.lines import (
+    EmptyLineTracker,
+    Line,
+    LinesBlock,
+    Mode,
+    RHSResult,
+    append_leaves,
+    can_be_split,
+    can_omit_invisible_parens,
+    is_line_short_enough,
+    line_to_string,
+    str_width,
+)
+from mypy_boto3_builder.writers.native_formatter.nodes import (
+    ASSIGNMENTS,
+    BRACKETS,
+    CLOSING_BRACKETS,
+    COLON,
+    COMMA,
+    COMMENT,
+    DEDENT,
+    DOT,
+    ENDMARKER,
+    EQUAL,
+    INDENT,
+    LBRACE,
+    LN,
+    LPAR,
+    LSQB,
+    NAME,
+    OPENING_BRACKETS,
+    RARROW,
+    RBRACE,
+    RPAR,
+    RSQB,
+    STANDALONE_COMMENT,
+    STATEMENT,
+    STRING,
+    WHITESPACE,
+    Leaf,
+    Node,
+    annassign,
+    arglist,
+    argument,
+    atom,
+    classdef,
+    decorated,
+    decorators,
+    expr_stmt,
+    funcdef,
+    get_annotation_type,
+    if_stmt,
+    is_atom_with_invisible_parens,
+    is_docstring,
+    is_empty_tuple,
+    is_multiline_string,
+    is_one_sequence_between,
+    is_one_tuple,
+    is_parent_function_or_class,
+    is_part_of_annotation,
+    is_stub_body,
+    is_stub_suite,
+    is_type_ignore_comment,
+    is_vararg,
+    simple_stmt,
+    suite,
+    tname,
+    typedargslist,
+    wrap_in_parentheses,
+)
+
+MIGRATE_COMMENT_DELIMITERS = {STRING_PRIORITY, COMMA_PRIORITY}
+
+
+class Feature(Enum):
+    """
+    Syntax features that affect line splitting.
+    """
+
+    TRAILING_COMMA_IN_CALL = "trailing_comma_in_call"
+    TRAILING_COMMA_IN_DEF = "trailing_comma_in_def"
+    FORCE_OPTIONAL_PARENTHESES = "force_optional_parentheses"
+
+
+class CannotTransform(Exception):
+    """
+    Transformer could not be applied to the line.
+    """
+
+
+class CannotSplit(CannotTransform):
+    """
+    Split could not be applied to the line.
+    """
+
+
+Transformer = Callable[[Line, Collection[Feature], Mode], Iterator[Line]]
+
+
+def generate_comments(leaf: Leaf) -> Iterator[Leaf]:
+    """
+    Generate comment leaves from the prefix of `leaf` and clean the prefix.
+
+    Comment on the first prefix line is a trailing comment, other ones are standalone.
+    """
+    prefix = leaf.prefix
+    if "#" not in prefix:
+        leaf.prefix = "\n" * prefix.count("\n")
+        return
+
+    consumed = 0
+    newlines = 0
+    for index, line in enumerate(prefix.split("\n")):
+        consumed += len(line) + 1
+        line = line.strip()
+        if not line:
+            newlines += 1
+        if not line.startswith("#"):
+            continue
+        comment_type = COMMENT if index == 0 and leaf.type != ENDMARKER else STANDALONE_COMMENT
+        yield Leaf(comment_type, line, prefix="\n" * newlines)
+        newlines = 0
+        remainder = prefix[consumed:]
+        leaf.prefix = "\n" * remainder.count("\n")
+
+
+class LineGenerator:
+    """
+    Generate unsplit `Line` objects from a syntax tree.
+
+    Note: mutates leaf prefixes of the tree it visits.
+
+    Arguments:
+        mode -- Formatting mode.
+        features -- Syntax features that can be used in output.
+    """
+
+    def __init__(self, mode: Mode, features: Collection[Feature]) -> None:
+        self.mode = mode
+        self.features = features
+        self.current_line = Line()
+        self._visitors: dict[int, Callable[[Any], Iterator[Line]]] = {
+            INDENT: self.visit_INDENT,
+            DEDENT: self.visit_DEDENT,
+            STRING: self.visit_STRING,
+            ENDMARKER: self.visit_ENDMARKER,
+            if_stmt: self.visit_if_stmt,
+            classdef: self.visit_classdef,
+            expr_stmt: self.visit_expr_stmt,
+            decorated: self.visit_decorators,
+            decorators: self.visit_decorators,
+            funcdef: self.visit_funcdef,
+            suite: self.visit_suite,
+            simple_stmt: self.visit_simple_stmt,
+            tname: self.visit_tname,
+            atom: self.visit_atom,
+        }
+
+    def visit(self, node: LN) -> Iterator[Line]:
+        """
+        Visit `node` with a type-specific visitor.
+        """
+        visitor = self._visitors.get(node.type)
+        if visitor is not None:
+            yield from visitor(node)
+        else:
+            yield from self.visit_default(node)
+
+    def line(self, indent: int = 0) -> Iterator[Line]:
+        """
+        Yield the current line if it is not empty and start a new one.
+        """
+        if not self.current_line:
+            self.current_line.depth += indent
+            return
+
+        complete_line = self.current_line
+        self.current_line = Line(depth=complete_line.depth + indent)
+        yield complete_line
+
+    def visit_default(self, node: LN) -> Iterator[Line]:
+        """
+        Append leaves with their comments, recurse into nodes.
+        """
+        if isinstance(node, Node):
+            for child in node.children:
+                yield from self.visit(child)
+            return
+
+        any_open_brackets = self.current_line.bracket_tracker.any_open_brackets()
+        for comment in generate_comments(node):
+            if any_open_brackets:
+                self.current_line.append(comment)
+            elif comment.type == COMMENT:
+                self.current_line.append(comment)
+                yield from self.line()
+            else:
+                yield from self.line()
+                self.current_line.append(comment)
+                yield from self.line()
+
+        if any_open_brackets:
+            node.prefix = ""
+        if node.type not in WHITESPACE:
+            self.current_line.append(node)
+
+    def visit_INDENT(self, node: Leaf) -> Iterator[Line]:
+        """
+        Increase indentation level.
+        """
+        yield from self.line(+1)
+        yield from self.visit_default(node)
+
+    def visit_DEDENT(self, node: Leaf) -> Iterator[Line]:
+        """
+        Decrease indentation level.
+        """
+        yield from self.line()
+        yield from self.visit_default(node)
+        yield from self.line(-1)
+
+    def visit_stmt(self, node: Node, keywords: set[str], parens: set[str]) -> Iterator[Line]:
+        """
+        Visit a statement, put `keywords` on separate lines.
+
+        Arguments:
+            node -- Statement node.
+            keywords -- Keywords that start a new line.
+            parens -- Leaf values after which invisible parentheses are added.
+        """
+        normalize_invisible_parens(node, parens_after=parens)
+        for child in node.children:
+            if isinstance(child, Leaf) and child.type == NAME and child.value in keywords:
+                yield from self.line()
+
+            yield from self.visit(child)
+
+    def visit_if_stmt(self, node: Node) -> Iterator[Line]:
+        """
+        Visit `if` statement.
+        """
+        yield from self.visit_stmt(node, keywords={"if", "else", "elif"}, parens={"if", "elif"})
+
+    def visit_classdef(self, node: Node) -> Iterator[Line]:
+        """
+        Visit class definition.
+        """
+        yield from self.visit_stmt(node, keywords={"class"}, parens=set())
+
+    def visit_expr_stmt(self, node: Node) -> Iterator[Line]:
+        """
+        Visit assignment.
+        """
+        yield from self.visit_stmt(node, keywords=set(), parens=ASSIGNMENTS)
+
+    def visit_funcdef(self, node: Node) -> Iterator[Line]:
+        """
+        Visit function definition, make return annotation parentheses invisible.
+        """
+        yield from self.line()
+
+        is_return_annotation = False
+        for child in list(node.children):
+            if child.type == RARROW:
+                is_return_annotation = True
+            elif is_return_annotation:
+                if (
+                    isinstance(child, Node)
+                    and child.type == atom
+                    and child.children[0].type == LPAR
+                ):
+                    if maybe_make_parens_invisible_in_atom(child, parent=node):
+                        wrap_in_parentheses(node, child, visible=False)
+                else:
+                    wrap_in_parentheses(node, child, visible=False)
+                is_return_annotation = False
+
+        for child in node.children:
+            yield from self.visit(child)
+
+    def visit_suite(self, node: Node) -> Iterator[Line]:
+        """
+        Visit a suite, stub suites stay on the same line.
+        """
+        if is_stub_suite(node):
+            yield from self.visit(node.children[2])
+        else:
+            yield from self.visit_default(node)
+
+    def visit_simple_stmt(self, node: Node) -> Iterator[Line]:
+        """
+        Visit a statement without nested statements.
+        """
+        if node.parent and node.parent.type in STATEMENT:
+            if is_parent_function_or_class(node) and is_stub_body(node):
+                yield from self.visit_default(node)
+            else:
+                yield from self.line(+1)
+                yield from self.visit_default(node)
+                yield from self.line(-1)
+            return
+
+        if node.parent and is_stub_suite(node.parent):
+            node.prefix = ""
+            yield from self.visit_default(node)
+            return
+        yield from self.line()
+        yield from self.visit_default(node)
+
+    def visit_decorators(self, node: Node) -> Iterator[Line]:
+        """
+        Visit decorators.
+        """
+        for child in node.children:
+            yield from self.line()
+            yield from self.visit(child)
+
+    def visit_ENDMARKER(self, leaf: Leaf) -> Iterator[Line]:
+        """
+        Process outstanding comments and end the last line.
+        """
+        yield from self.visit_default(leaf)
+        yield from self.line()
+
+    def visit_tname(self, node: Node) -> Iterator[Line]:
+        """
+        Add invisible parentheses around parameter annotations.
+        """
+        if len(node.children) == 3 and maybe_make_parens_invisible_in_atom(
+            node.children[2], parent=node
+        ):
+            wrap_in_parentheses(node, node.children[2], visible=False)
+
+        yield from self.visit_default(node)
+
+    def visit_atom(self, node: Node) -> Iterator[Line]:
+        """
+        Remove redundant parentheses in lists or sets of one item.
+        """
+        if len(node.children) == 3:
+            first = node.children[0]
+            last = node.children[-1]
+            if (first.type == LSQB and last.type == RSQB) or (
+                first.type == LBRACE and last.type == RBRACE
+            ):
+                maybe_make_parens_invisible_in_atom(node.children[1], parent=node)
+
+        yield from self.visit_default(node)
+
+    def visit_STRING(self, leaf: Leaf) -> Iterator[Line]:
+        """
+        Normalize docstring indentation and string quotes.
+        """
+        if is_docstring(leaf):
+            self._normalize_docstring(leaf)
+
+        leaf.value = normalize_string_quotes(leaf.value)
+        yield from self.visit_default(leaf)
+
+    def _normalize_docstring(self, leaf: Leaf) -> None:
+        docstring = normalize_string_quotes(leaf.value)
+        quote_char = docstring[0]
+        quote_len = 1 if docstring[1] != quote_char else 3
+        docstring = docstring[quote_len:-quote_len]
+        docstring_started_empty = not docstring
+        indent = " " * 4 * self.current_line.depth
+
+        if is_multiline_string(leaf):
+            docstring = fix_multiline_docstring(docstring, indent)
+        else:
+            docstring = docstring.strip()
+
+        has_trailing_backslash = False
+        if docstring:
+            if docstring[0] == quote_char:
+                docstring = " " + docstring
+            if docstring[-1] == quote_char:
+                docstring += " "
+            if docstring[-1] == "\\":
+                backslash_count = len(docstring) - len(docstring.rstrip("\\"))
+                if backslash_count % 2:
+                    docstring += " "
+                    has_trailing_backslash = True
+        elif not docstring_started_empty:
+            docstring = " "
+
+        quote = quote_char * quote_len
+        if quote_len != 3:
+            leaf.value = quote + docstring + quote
+            return
+
+        lines = docstring.splitlines()
+        last_line_length = len(lines[-1]) if docstring and not docstring.endswith("\n") else 0
+        if (
+            len(lines) > 1
+            and last_line_length + quote_len > self.mode.line_length
+            and len(indent) + quote_len <= self.mode.line_length
+            and not has_trailing_backslash
+        ):
+            if leaf.value[-1 - quote_len] == "\n":
+                leaf.value = quote + docstring + quote
+            else:
+                leaf.value = quote + docstring + "\n" + indent + quote
+        else:
+            leaf.value = quote + docstring + quote
+
+
+def fix_multiline_docstring(docstring: str, prefix: str) -> str:
+    """
+    Remove common indentation from docstring lines and indent them with `prefix`.
+    """
+    lines = docstring.split("\n")
+    indent = sys.maxsize
+    for line in lines[1:]:
+        stripped = line.lstrip()
+        if stripped:
+            indent = min(indent, len(line) - len(stripped))
+
+    trimmed = [lines[0].strip()]
+    if indent < sys.maxsize:
+        last_line_index = len(lines) - 2
+        for index, line in enumerate(lines[1:]):
+            stripped_line = line[indent:].rstrip()
+            if stripped_line or index == last_line_index:
+                trimmed.append(prefix + stripped_line)
+            else:
+                trimmed.append("")
+    return "\n".join(trimmed)
+
+
+def normalize_string_quotes(value: str) -> str:
+    """
+    Prefer double quotes unless it results in more escapes.
+
+    Only strings without escapes are produced by the parser.
+    """
+    if value[:3] in {'"""', "'''"} or value[0] == '"':
+        return value
+    body = value[1:-1]
+    if '"' in body:
+        return value
+    return f'"{body}"'
+
+
+def normalize_invisible_parens(node: Node, parens_after: set[str]) -> None:
+    """
+    Make existing optional parentheses invisible or create new ones.
+
+    Arguments:
+        node -- Statement node.
+        parens_after -- Leaf values after which parentheses are added.
+    """
+    check_lpar = False
+    for index, child in enumerate(list(node.children)):
+        if isinstance(child, Node) and child.type == annassign:
+            normalize_invisible_parens(child, parens_after=parens_after)
+
+        if (
+            index == 0
+            and isinstance(child, Node)
+            and child.type == atom
+            and node.type == expr_stmt
+            and not is_one_tuple(child)
+            and not _is_atom_multiline(child)
+        ):
+            if _is_parenthesized_annotation_target(node, child):
+                inner = child.children[1]
+                if isinstance(inner, Node) and inner.type == atom:
+                    maybe_make_parens_invisible_in_atom(inner, parent=child)
+            elif maybe_make_parens_invisible_in_atom(
+                child, parent=node, remove_brackets_around_comma=True
+            ):
+                wrap_in_parentheses(node, child, visible=False)
+
+        if check_lpar:
+            if child.type == atom:
+                if maybe_make_parens_invisible_in_atom(child, parent=node):
+                    wrap_in_parentheses(node, child, visible=False)
+            elif is_one_tuple(child):
+                wrap_in_parentheses(node, child, visible=True)
+            elif not is_multiline_string(child):
+                wrap_in_parentheses(node, child, visible=False)
+
+        check_lpar = isinstance(child, Leaf) and (
+            child.value in parens_after or child.type == COMMA
+        )
+
+
+def _is_parenthesized_annotation_target(node: Node, child: Node) -> bool:
+    if len(node.children) < 2:
+        return False
+
+    annassign_node = node.children[1]
+    if not isinstance(annassign_node, Node) or annassign_node.type != annassign:
+        return False
+
+    target: LN = child
+    while isinstance(target, Node) and target.type == atom and len(target.children) == 3:
+        target = target.children[1]
+
+    return isinstance(target, Leaf) and target.type == NAME
+
+
+def _is_atom_multiline(node: LN) -> bool:
+    if not isinstance(node, Node) or len(node.children) < 3:
+        return False
+
+    middle = node.children[1]
+    if isinstance(middle, Leaf):
+        return "\n" in middle.prefix
+    return any("\n" in leaf.prefix for leaf in middle.leaves())
+
+
+def maybe_make_parens_invisible_in_atom(
+    node: LN, parent: LN, remove_brackets_around_comma: bool = False
+) -> bool:
+    """
+    Make parentheses in the atom `node` invisible if it is safe, recursively.
+
+    Returns:
+        Whether the node should be wrapped in invisible parentheses.
+    """
+    if (
+        not isinstance(node, Node)
+        or node.type != atom
+        or is_empty_tuple(node)
+        or is_one_tuple(node)
+        or (
+            not remove_brackets_around_comma
+            and max_delimiter_priority_in_atom(node) >= COMMA_PRIORITY
+        )
+    ):
+        return False
+
+    first = node.children[0]
+    last = node.children[-1]
+    if not (isinstance(first, Leaf) and first.type == LPAR and last.type == RPAR):
+        return True
+
+    middle = node.children[1]
+    if not _is_type_ignore_comment_string(middle.prefix.strip()):
+        first.value = ""
+        if isinstance(last, Leaf):
+            last.value = ""
+    maybe_make_parens_invisible_in_atom(
+        middle, parent=parent, remove_brackets_around_comma=remove_brackets_around_comma
+    )
+
+    if isinstance(middle, Node) and is_atom_with_invisible_parens(middle):
+        middle.replace(middle.children[1])
+        if middle.children[0].prefix.strip():
+            middle.children[1].prefix = middle.children[0].prefix + middle.children[1].prefix
+        if middle.children[-1].prefix.strip():
+            last.prefix = middle.children[-1].prefix + last.prefix
+
+    return False
+
+
+def _is_type_ignore_comment_string(value: str) -> bool:
+    return value.startswith("#") and value[1:].lstrip().startswith("type: ignore")
+
+
+def transform_line(line: Line, mode: Mode, features: Collection[Feature] = ()) -> Iterator[Line]:
+    """
+    Split `line` into lines that fit into line length, if possible.
+    """
+    if line.is_comment or line.is_import:
+        yield line
+        return
+
+    line_str = line_to_string(line)
+
+    transformers: list[Transformer]
+    if (
+        not line.contains_uncollapsable_type_comments()
+        and not line.should_split_rhs
+        and not line.magic_trailing_comma
+        and (is_line_short_enough(line, mode, line_str) or line.contains_unsplittable_type_ignore())
+        and not (line.inside_brackets and line.contains_standalone_comments())
+    ):
+        transformers = []
+    elif line.is_def and not should_split_funcdef_with_rhs(line, mode):
+        transformers = [left_hand_split]
+    elif line.inside_brackets:
+        transformers = [
+            delimiter_split,
+            type_ignore_comment_split,
+            standalone_comment_split,
+            right_hand_split_with_omits,
+        ]
+    else:
+        transformers = [right_hand_split_with_omits]
+
+    for transform in transformers:
+        try:
+            result = run_transformer(line, transform, mode, features, line_str=line_str)
+        except CannotTransform:
+            continue
+        else:
+            yield from result
+            return
+
+    yield line
+
+
+def should_split_funcdef_with_rhs(line: Line, mode: Mode) -> bool:
+    """
+    Whether function definition has a magic trailing comma in return type.
+    """
+    return_type_leaves: list[Leaf] = []
+    in_return_type = False
+
+    for leaf in line.leaves:
+        if leaf.type == COLON:
+            in_return_type = False
+        if in_return_type:
+            return_type_leaves.append(leaf)
+        if leaf.type == RARROW:
+            in_return_type = True
+
+    result = Line(depth=line.depth)
+    leaves_to_track = get_leaves_inside_matching_brackets(return_type_leaves)
+    for leaf in return_type_leaves:
+        result.append(leaf, preformatted=True, track_bracket=id(leaf) in leaves_to_track)
+
+    first_visible_return_leaf = next((leaf for leaf in return_type_leaves if leaf.value), None)
+    return result.magic_trailing_comma is not None or (
+        first_visible_return_leaf is not None
+        and first_visible_return_leaf.type == STRING
+        and not is_line_short_enough(result, mode)
+    )
+
+
+class _BracketSplitComponent(Enum):
+    head = "head"
+    body = "body"
+    tail = "tail"
+
+
+def left_hand_split(line: Line, _features: Collection[Feature], mode: Mode) -> Iterator[Line]:
+    """
+    Split line into many lines, starting with the first matching bracket pair.
+    """
+    for leaf_type in [LPAR, LSQB]:
+        tail_leaves: list[Leaf] = []
+        body_leaves: list[Leaf] = []
+        head_leaves: list[Leaf] = []
+        current_leaves = head_leaves
+        matching_bracket: Leaf | None = None
+        for leaf in line.leaves:
+            if (
+                current_leaves is body_leaves
+                and leaf.type in CLOSING_BRACKETS
+                and leaf.opening_bracket is matching_bracket
+                and isinstance(matching_bracket, Leaf)
+            ):
+                ensure_visible(leaf)
+                ensure_visible(matching_bracket)
+                current_leaves = tail_leaves if body_leaves else head_leaves
+            current_leaves.append(leaf)
+            if current_leaves is head_leaves and leaf.type == leaf_type:
+                matching_bracket = leaf
+                current_leaves = body_leaves
+        if matching_bracket and tail_leaves:
+            break
+    if not matching_bracket or not tail_leaves:
+        raise CannotSplit("No brackets found")
+
+    head = bracket_split_build_line(
+        head_leaves, line, matching_bracket, _BracketSplitComponent.head
+    )
+    body = bracket_split_build_line(
+        body_leaves, line, matching_bracket, _BracketSplitComponent.body
+    )
+    tail = bracket_split_build_line(
+        tail_leaves, line, matching_bracket, _BracketSplitComponent.tail
+    )
+    bracket_split_succeeded_or_raise(head, body, tail)
+    for result in (head, body, tail):
+        if result:
+            yield result
+
+
+def ensure_visible(leaf: Leaf) -> None:
+    """
+    Make invisible parentheses visible.
+    """
+    if leaf.type == LPAR:
+        leaf.value = "("
+    elif leaf.type == RPAR:
+        leaf.value = ")"
+
+
+def right_hand_split(
+    line: Line, mode: Mode, features: Collection[Feature] = (), omit: Collection[int] = ()
+) -> Iterator[Line]:
+    """
+    Split line into many lines, starting with the last matching bracket pair.
+
+    If the split was by optional parentheses, attempt splitting without them, too.
+    """
+    rhs = _first_right_hand_split(line, omit=omit)
+    yield from _maybe_split_omitting_optional_parens(rhs, line, mode, features=features, omit=omit)
+
+
+def right_hand_split_with_omits(
+    line: Line, features: Collection[Feature], mode: Mode
+) -> Iterator[Line]:
+    """
+    Split line with `right_hand_split`, omitting increasing number of trailers.
+    """
+    first_lines: list[Line] | None = None
+
+    prefix_lengths: dict[int, int] = {}
+    current_length = 4 * line.depth
+    for leaf in line.leaves:
+        prefix_lengths[id(leaf)] = current_length
+        current_length += len(leaf.prefix) + len(leaf.value)
+
+    for omit in generate_trailers_to_omit(line, mode.line_length):
+        if omit:
+            target_opening: Leaf | None = None
+            for leaf in reversed(line.leaves):
+                if leaf.type in CLOSING_BRACKETS and id(leaf) not in omit:
+                    target_opening = leaf.opening_bracket
+                    break
+            if (
+                target_opening is not None
+                and target_opening.value
+                and prefix_lengths.get(id(target_opening), 0) > mode.line_length
+            ):
+                continue
+
+        lines = list(right_hand_split(line, mode, features, omit=omit))
+        if first_lines is None and not omit:
+            first_lines = lines
+        if is_line_short_enough(lines[0], mode) or (
+            omit and _over_length_only_due_to_subscript_comment(lines[0], mode)
+        ):
+            yield from lines
+            return
+
+    if first_lines is not None:
+        yield from first_lines
+    else:
+        yield from right_hand_split(line, mode, features=features)
+
+
+def _first_right_hand_split(line: Line, omit: Collection[int] = ()) -> RHSResult:
+    tail_leaves: list[Leaf] = []
+    body_leaves: list[Leaf] = []
+    head_leaves: list[Leaf] = []
+    current_leaves = tail_leaves
+    opening_bracket: Leaf | None = None
+    closing_bracket: Leaf | None = None
+    for leaf in reversed(line.leaves):
+        if current_leaves is body_leaves and leaf is opening_bracket:
+            current_leaves = head_leaves if body_leaves else tail_leaves
+        current_leaves.append(leaf)
+        if current_leaves is tail_leaves:
+            if leaf.type in CLOSING_BRACKETS and id(leaf) not in omit:
+                opening_bracket = leaf.opening_bracket
+                closing_bracket = leaf
+                current_leaves = body_leaves
+    if not (opening_bracket and closing_bracket and head_leaves):
+        raise CannotSplit("No brackets found")
+
+    tail_leaves.reverse()
+    body_leaves.reverse()
+    head_leaves.reverse()
+
+    head = bracket_split_build_line(head_leaves, line, opening_bracket, _BracketSplitComponent.head)
+    body = bracket_split_build_line(body_leaves, line, opening_bracket, _BracketSplitComponent.body)
+    tail = bracket_split_build_line(tail_leaves, line, opening_bracket, _BracketSplitComponent.tail)
+    bracket_split_succeeded_or_raise(head, body, tail)
+    return RHSResult(head, body, tail, opening_bracket, closing_bracket)
+
+
+def _maybe_split_omitting_optional_parens(
+    rhs: RHSResult,
+    line: Line,
+    mode: Mode,
+    features: Collection[Feature] = (),
+    omit: Collection[int] = (),
+) -> Iterator[Line]:
+    if (
+        Feature.FORCE_OPTIONAL_PARENTHESES not in features
+        and rhs.opening_bracket.type == LPAR
+        and not rhs.opening_bracket.value
+        and rhs.closing_bracket.type == RPAR
+        and not rhs.closing_bracket.value
+        and not line.is_import
+        and can_omit_invisible_parens(rhs, mode.line_length)
+    ):
+        omit = {id(rhs.closing_bracket), *omit}
+        try:
+            rhs_oop = _first_right_hand_split(line, omit=omit)
+            if _prefer_split_rhs_oop_over_rhs(rhs_oop, rhs, mode):
+                yield from _maybe_split_omitting_optional_parens(
+                    rhs_oop, line, mode, features=features, omit=omit
+                )
+                return
+        except CannotSplit as e:
+            if line.is_chained_assignment:
+                pass
+            elif not can_be_split(rhs.body) and not is_line_short_enough(rhs.body, mode):
+                raise CannotSplit("Splitting failed, body is still too long") from e
+            elif rhs.head.contains_multiline_strings() or rhs.tail.contains_multiline_strings():
+                raise CannotSplit("Head or tail contains multiline strings") from e
+
+    ensure_visible(rhs.opening_bracket)
+    ensure_visible(rhs.closing_bracket)
+    for result in (rhs.head, rhs.body, rhs.tail):
+        if result:
+            yield result
+
+
+def _prefer_split_rhs_oop_over_rhs(rhs_oop: RHSResult, rhs: RHSResult, mode: Mode) -> bool:
+    if (
+        rhs_oop.head.contains_unsplittable_type_ignore()
+        or rhs_oop.body.contains_unsplittable_type_ignore()
+        or rhs_oop.tail.contains_unsplittable_type_ignore()
+    ):
+        return True
+
+    if not (len(rhs.head.leaves) >= 2 and rhs.head.leaves[-2].type == EQUAL):
+        return True
+
+    if not any(leaf.type in BRACKETS for leaf in rhs.head.leaves[:-1]):
+        return True
+
+    if not is_line_short_enough(rhs.head, mode._replace(line_length=mode.line_length - 1)):
+        return True
+
+    if rhs.head.magic_trailing_comma is not None:
+        return True
+
+    rhs_head_equal_count = [leaf.type for leaf in rhs.head.leaves].count(EQUAL)
+    rhs_oop_head_equal_count = [leaf.type for leaf in rhs_oop.head.leaves].count(EQUAL)
+    if rhs_head_equal_count > 1 and rhs_head_equal_count > rhs_oop_head_equal_count:
+        return False
+
+    has_closing_bracket_after_assign = False
+    for leaf in reversed(rhs_oop.head.leaves):
+        if leaf.type == EQUAL:
+            break
+        if leaf.type in CLOSING_BRACKETS:
+            has_closing_bracket_after_assign = True
+            break
+    return has_closing_bracket_after_assign or (
+        any(leaf.type == EQUAL for leaf in rhs_oop.head.leaves)
+        and is_line_short_enough(rhs_oop.head, mode)
+    )
+
+
+def bracket_split_succeeded_or_raise(head: Line, body: Line, tail: Line) -> None:
+    """
+    Raise `CannotSplit` if the last left- or right-hand split failed.
+    """
+    tail_len = len(str(tail).strip())
+    if not body:
+        if tail_len == 0:
+            raise CannotSplit("Splitting brackets produced the same line")
+        if tail_len < 3:
+            raise CannotSplit(f"Splitting brackets on an empty body to save {tail_len} characters")
+
+
+def _ensure_trailing_comma(leaves: list[Leaf], original: Line, opening_bracket: Leaf) -> bool:
+    if not leaves:
+        return False
+    if original.is_import:
+        return True
+    if not original.is_def:
+        return False
+    if opening_bracket.value != "(":
+        return False
+    if any(leaf.type == COMMA and not is_part_of_annotation(leaf) for leaf in leaves):
+        return False
+
+    leaf_with_parent = next((leaf for leaf in leaves if leaf.parent), None)
+    if leaf_with_parent is None:
+        return True
+    return get_annotation_type(leaf_with_parent) != "return"
+
+
+def bracket_split_build_line(
+    leaves: list[Leaf],
+    original: Line,
+    opening_bracket: Leaf,
+    component: _BracketSplitComponent,
+) -> Line:
+    """
+    Build a new line from `leaves` and their comments from `original`.
+
+    Body component is indented, gets a trailing comma when expected and
+    is marked for delimiter split if it has many comma-separated items.
+    """
+    result = Line(depth=original.depth)
+    if component is _BracketSplitComponent.body:
+        result.inside_brackets = True
+        result.depth += 1
+        if _ensure_trailing_comma(leaves, original, opening_bracket):
+            for index in range(len(leaves) - 1, -1, -1):
+                if leaves[index].type == STANDALONE_COMMENT:
+                    continue
+
+                if leaves[index].type != COMMA:
+                    leaves.insert(index + 1, Leaf(COMMA, ","))
+                break
+
+    leaves_to_track: set[int] = set()
+    if component is _BracketSplitComponent.head:
+        leaves_to_track = get_leaves_inside_matching_brackets(leaves)
+    for leaf in leaves:
+        result.append(leaf, preformatted=True, track_bracket=id(leaf) in leaves_to_track)
+        for comment_after in original.comments_after(leaf):
+            result.append(comment_after, preformatted=True)
+    if component is _BracketSplitComponent.body and should_split_line(result, opening_bracket):
+        result.should_split_rhs = True
+    return result
+
+
+def dont_increase_indentation(split_func: Transformer) -> Transformer:
+    """
+    Normalize prefix of the first leaf in every line returned by `split_func`.
+    """
+
+    @wraps(split_func)
+    def split_wrapper(line: Line, features: Collection[Feature], mode: Mode) -> Iterator[Line]:
+        for split_line in split_func(line, features, mode):
+            split_line.leaves[0].prefix = ""
+            yield split_line
+
+    return split_wrapper
+
+
+def _get_last_non_comment_leaf(line: Line) -> int | None:
+    for leaf_index in range(len(line.leaves) - 1, 0, -1):
+        if line.leaves[leaf_index].type != STANDALONE_COMMENT:
+            return leaf_index
+    return None
+
+
+def _can_add_trailing_comma(leaf: Leaf, features: Collection[Feature]) -> bool:
+    if is_vararg(leaf, within={typedargslist}):
+        return Feature.TRAILING_COMMA_IN_DEF in features
+    if is_vararg(leaf, within={arglist, argument}):
+        return Feature.TRAILING_COMMA_IN_CALL in features
+    return True
+
+
+def _safe_add_trailing_comma(safe: bool, delimiter_priority: int, line: Line) -> Line:
+    if (
+        safe
+        and delimiter_priority == COMMA_PRIORITY
+        and line.leaves[-1].type != COMMA
+        and line.leaves[-1].type != STANDALONE_COMMENT
+    ):
+        line.append(Leaf(COMMA, ","))
+    return line
+
+
+def _get_split_delimiter_priority(line: Line) -> int:
+    if not line.leaves:
+        raise CannotSplit("Line empty")
+
+    bt = line.bracket_tracker
+    try:
+        delimiter_priority = bt.max_delimiter_priority(exclude={id(line.leaves[-1])})
+    except ValueError:
+        raise CannotSplit("No delimiters found") from None
+
+    if (
+        delimiter_priority == DOT_PRIORITY
+        and bt.delimiter_count_with_priority(delimiter_priority) == 1
+    ):
+        raise CannotSplit("Splitting a single attribute from its owner looks wrong")
+    return delimiter_priority
+
+
+@dont_increase_indentation
+def delimiter_split(line: Line, features: Collection[Feature], mode: Mode) -> Iterator[Line]:
+    """
+    Split according to delimiters of the highest priority.
+    """
+    delimiter_priority = _get_split_delimiter_priority(line)
+    last_leaf = line.leaves[-1]
+    bt = line.bracket_tracker
+    current_line = Line(depth=line.depth, inside_brackets=line.inside_brackets)
+    lowest_depth = sys.maxsize
+    trailing_comma_safe = True
+
+    def append_to_line(leaf: Leaf) -> Iterator[Line]:
+        nonlocal current_line
+        try:
+            current_line.append_safe(leaf, preformatted=True)
+        except ValueError:
+            yield current_line
+
+            current_line = Line(depth=line.depth, inside_brackets=line.inside_brackets)
+            current_line.append(leaf)
+
+    def append_comments(leaf: Leaf) -> Iterator[Line]:
+        for comment_after in line.comments_after(leaf):
+            yield from append_to_line(comment_after)
+
+    last_non_comment_leaf = _get_last_non_comment_leaf(line)
+    for leaf_index, leaf in enumerate(line.leaves):
+        yield from append_to_line(leaf)
+
+        previous_priority = leaf_index > 0 and bt.delimiters.get(id(line.leaves[leaf_index - 1]))
+        if (
+            previous_priority != delimiter_priority
+            or delimiter_priority in MIGRATE_COMMENT_DELIMITERS
+        ):
+            yield from append_comments(leaf)
+
+        lowest_depth = min(lowest_depth, leaf.bracket_depth)
+        if trailing_comma_safe and leaf.bracket_depth == lowest_depth:
+            trailing_comma_safe = _can_add_trailing_comma(leaf, features)
+
+        if last_leaf.type == STANDALONE_COMMENT and leaf_index == last_non_comment_leaf:
+            current_line = _safe_add_trailing_comma(
+                trailing_comma_safe, delimiter_priority, current_line
+            )
+
+        leaf_priority = bt.delimiters.get(id(leaf))
+        if leaf_priority == delimiter_priority:
+            if (
+                leaf_index + 1 < len(line.leaves)
+                and delimiter_priority not in MIGRATE_COMMENT_DELIMITERS
+            ):
+                yield from append_comments(line.leaves[leaf_index + 1])
+
+            yield current_line
+            current_line = Line(depth=line.depth, inside_brackets=line.inside_brackets)
+
+    if current_line:
+        current_line = _safe_add_trailing_comma(
+            trailing_comma_safe, delimiter_priority, current_line
+        )
+        yield current_line
+
+
+@dont_increase_indentation
+def standalone_comment_split(
+    line: Line, _features: Collection[Feature], _mode: Mode
+) -> Iterator[Line]:
+    """
+    Split standalone comments from the rest of the line.
+    """
+    if not line.contains_standalone_comments():
+        raise CannotSplit("Line does not have any standalone comments")
+
+    current_line = Line(depth=line.depth, inside_brackets=line.inside_brackets)
+
+    def append_to_line(leaf: Leaf) -> Iterator[Line]:
+        nonlocal current_line
+        try:
+            current_line.append_safe(leaf, preformatted=True)
+        except ValueError:
+            yield current_line
+
+            current_line = Line(depth=line.depth, inside_brackets=line.inside_brackets)
+            current_line.append(leaf)
+
+    for leaf in line.leaves:
+        yield from append_to_line(leaf)
+        for comment_after in line.comments_after(leaf):
+            yield from append_to_line(comment_after)
+
+    if current_line:
+        yield current_line
+
+
+@dont_increase_indentation
+def type_ignore_comment_split(
+    line: Line, _features: Collection[Feature], _mode: Mode
+) -> Iterator[Line]:
+    """
+    Keep multiple type ignores on their original physical lines.
+    """
+    if not line.contains_multiple_type_ignores_at_current_depth() or not any(
+        leaf.type == DOT for leaf in line.leaves
+    ):
+        raise CannotSplit("Line does not have multiple type ignore comments")
+
+    current_line = Line(depth=line.depth, inside_brackets=line.inside_brackets)
+    for leaf in line.leaves:
+        current_line.append(leaf, preformatted=True)
+        comments = line.comments_after(leaf)
+        for comment in comments:
+            current_line.append(comment, preformatted=True)
+        if any(is_type_ignore_comment(comment) for comment in comments):
+            yield current_line
+            current_line = Line(depth=line.depth, inside_brackets=line.inside_brackets)
+
+    if current_line:
+        yield current_line
+
+
+def should_split_line(line: Line, opening_bracket: Leaf) -> bool:
+    """
+    Whether `line` should be split with `delimiter_split` after RHS.
+    """
+    if not (opening_bracket.parent and opening_bracket.value in "[{("):
+        return False
+
+    exclude = set()
+    trailing_comma = False
+    try:
+        last_leaf = line.leaves[-1]
+        if last_leaf.type == COMMA:
+            trailing_comma = True
+            exclude.add(id(last_leaf))
+        max_priority = line.bracket_tracker.max_delimiter_priority(exclude=exclude)
+    except (IndexError, ValueError):
+        return False
+
+    return max_priority == COMMA_PRIORITY and (
+        trailing_comma or opening_bracket.parent.type == atom
+    )
+
+
+def generate_trailers_to_omit(line: Line, line_length: int) -> Iterator[set[int]]:
+    """
+    Generate sets of closing bracket IDs that should be omitted in a RHS.
+
+    Yielded sets are cumulative.
+    """
+    omit: set[int] = set()
+    if not line.magic_trailing_comma:
+        yield omit
+
+    length = 4 * line.depth
+    opening_bracket: Leaf | None = None
+    closing_bracket: Leaf | None = None
+    inner_brackets: set[int] = set()
+    for index, leaf, leaf_length in line.enumerate_with_length(is_reversed=True):
+        length += leaf_length
+        if length > line_length:
+            break
+
+        has_inline_comment = leaf_length > len(leaf.value) + len(leaf.prefix)
+        if leaf.type == STANDALONE_COMMENT or has_inline_comment:
+            break
+
+        if opening_bracket:
+            if leaf is opening_bracket:
+                opening_bracket = None
+            elif leaf.type in CLOSING_BRACKETS:
+                prev = line.leaves[index - 1] if index > 0 else None
+                if (
+                    prev
+                    and prev.type == COMMA
+                    and leaf.opening_bracket is not None
+                    and not is_one_sequence_between(leaf.opening_bracket, leaf, line.leaves)
+                ):
+                    break
+
+                inner_brackets.add(id(leaf))
+        elif leaf.type in CLOSING_BRACKETS:
+            prev = line.leaves[index - 1] if index > 0 else None
+            if prev and prev.type in OPENING_BRACKETS:
+                inner_brackets.add(id(leaf))
+                continue
+
+            if closing_bracket:
+                omit.add(id(closing_bracket))
+                omit.update(inner_brackets)
+                inner_brackets.clear()
+                yield omit
+
+            if (
+                prev
+                and prev.type == COMMA
+                and leaf.opening_bracket is not None
+                and not is_one_sequence_between(leaf.opening_bracket, leaf, line.leaves)
+            ):
+                break
+
+            if leaf.value:
+                opening_bracket = leaf.opening_bracket
+                closing_bracket = leaf
+
+
+def _over_length_only_due_to_subscript_comment(line: Line, mode: Mode) -> bool:
+    if not line.leaves:
+        return False
+    indent = "    " * line.depth
+    first, *rest = line.leaves
+    text_without_comments = f"{first.prefix}{indent}{first.value}"
+    text_without_comments += "".join(str(leaf) for leaf in rest)
+    if str_width(text_without_comments) > mode.line_length:
+        return False
+    for leaf_id, comments in line.comments.items():
+        if not comments:
+            continue
+        leaf = next((i for i in line.leaves if id(i) == leaf_id), None)
+        if leaf is None or leaf.type != LSQB:
+            return False
+    return True
+
+
+def run_transformer(
+    line: Line,
+    transform: Transformer,
+    mode: Mode,
+    features: Collection[Feature],
+    line_str: str = "",
+) -> list[Line]:
+    """
+    Apply `transform` to `line` and split the results recursively.
+
+    Raises:
+        CannotTransform -- If transform did not change the line.
+    """
+    if not line_str:
+        line_str = line_to_string(line)
+    optional_parens = [
+        bracket for bracket in line.bracket_tracker.invisible if bracket.bracket_depth == 0
+    ]
+    result: list[Line] = []
+    for transformed_line in transform(line, features, mode):
+        if str(transformed_line).strip("\n") == line_str:
+            raise CannotTransform("Line transformer returned an unchanged result")
+
+        result.extend(transform_line(transformed_line, mode=mode, features=features))
+
+    if (
+        Feature.FORCE_OPTIONAL_PARENTHESES in features
+        or transform is not right_hand_split_with_omits
+        or not line.bracket_tracker.invisible
+        or any(bracket.value for bracket in optional_parens)
+        or line.contains_multiline_strings()
+        or result[0].contains_uncollapsable_type_comments()
+        or result[0].contains_unsplittable_type_ignore()
+        or is_line_short_enough(result[0], mode)
+        or _over_length_only_due_to_subscript_comment(result[0], mode)
+        or any(leaf.parent is None for leaf in line.leaves)
+    ):
+        return result
+
+    line_copy = line.clone()
+    append_leaves(line_copy, line, line.leaves)
+    features_fop = {*features, Feature.FORCE_OPTIONAL_PARENTHESES}
+    second_opinion = run_transformer(line_copy, transform, mode, features_fop, line_str=line_str)
+    if all(is_line_short_enough(i, mode) for i in second_opinion):
+        result = second_opinion
+    return result
+
+
+def format_tree(root: Node, mode: Mode, features: Collection[Feature]) -> str:
+    """
+    Render syntax tree `root` to formatted source code.
+    """
+    line_generator = LineGenerator(mode=mode, features=features)
+    tracker = EmptyLineTracker(mode=mode)
+    blocks: list[LinesBlock] = []
+    for current_line in line_generator.visit(root):
+        block = tracker.maybe_empty_lines(current_line)
+        blocks.append(block)
+        for line in transform_line(current_line, mode=mode, features=features):
+            block.content_lines.append(str(line))
+    if blocks:
+        blocks[-1].after = 0
+    return "".join(line for block in blocks for line in block.all_lines())
@@ -0,0 +1,920 @@
+"""
+Lines and empty lines tracking for native formatter.
+
+Port of `black.lines` with stable style, magic trailing commas and string normalization.
+"""
+
+import unicodedata
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from mypy_boto3_builder.writers.native_formatter.brackets import DOT_PRIORITY, BracketTracker
+from mypy_boto3_builder.writers.native_formatter.nodes import (
+    AT,
+    BRACKETS,
+    CLOSING_BRACKETS,
+    COLON,
+    COMMA,
+    COMMENT,
+    DOT,
+    EQUAL,
+    IMPORT,
+    LN,
+    LPAR,
+    LSQB,
+    NAME,
+    OPENING_BRACKETS,
+    RBRACE,
+    RPAR,
+    RSQB,
+    STANDALONE_COMMENT,
+    STRING,
+    Leaf,
+    dictsetmaker,
+    first_leaf,
+    is_docstring,
+    is_multiline_string,
+    is_one_sequence_between,
+    is_type_comment,
+    is_type_ignore_comment,
+    last_leaf,
+    trailer,
+    whitespace,
+)
+
+
+class Mode(NamedTuple):
+    """
+    Formatting mode.
+    """
+
+    line_length: int
+    is_pyi: bool
+
+
+class Line:
+    """
+    Leaves and comments of one logical line, can be printed with `str(line)`.
+
+    Arguments:
+        depth -- Indentation level.
+        inside_brackets -- Whether line is a part of a bracket split.
+        should_split_rhs -- Whether line should be split by delimiters after RHS.
+        magic_trailing_comma -- Closing bracket with a magic trailing comma before it.
+    """
+
+    __slots__ = (
+        "depth",
+        "leaves",
+        "comments",
+        "bracket_tracker",
+        "inside_brackets",
+        "should_split_rhs",
+        "magic_trailing_comma",
+    )
+
+    def __init__(
+        self,
+        depth: int = 0,
+        inside_brackets: bool = False,
+        should_split_rhs: bool = False,
+        magic_trailing_comma: Leaf | None = None,
+    ) -> None:
+        self.depth = depth
+        self.leaves: list[Leaf] = []
+        self.comments: dict[int, list[Leaf]] = {}
+        self.bracket_tracker = BracketTracker()
+        self.inside_brackets = inside_brackets
+        self.should_split_rhs = should_split_rhs
+        self.magic_trailing_comma = magic_trailing_comma
+
+    def append(self, leaf: Leaf, preformatted: bool = False, track_bracket: bool = False) -> None:
+        """
+        Add a new `leaf` to the end of the line.
+
+        Unless `preformatted` is True, `leaf` receives a whitespace prefix and
+        bracket metadata. Inline comments are put aside.
+        """
+        if leaf.type not in BRACKETS and not leaf.value.strip():
+            return
+
+        if leaf.type == COLON and self.is_class_paren_empty:
+            del self.leaves[-2:]
+        if self.leaves and not preformatted:
+            leaf.prefix += whitespace(leaf)
+        if self.inside_brackets or not preformatted or track_bracket:
+            self.bracket_tracker.mark(leaf)
+            if self.has_magic_trailing_comma(leaf):
+                self.magic_trailing_comma = leaf
+        if not self.append_comment(leaf):
+            self.leaves.append(leaf)
+
+    def append_safe(self, leaf: Leaf, preformatted: bool = False) -> None:
+        """
+        Like `append`, but disallow invalid standalone comment structure.
+
+        Raises:
+            ValueError -- If `leaf` cannot be added after a standalone comment.
+        """
+        if self.bracket_tracker.depth == 0:
+            if self.is_comment:
+                raise ValueError("cannot append to standalone comments")
+            if self.leaves and leaf.type == STANDALONE_COMMENT:
+                raise ValueError("cannot append standalone comments to a populated line")
+        self.append(leaf, preformatted=preformatted)
+
+    @property
+    def is_comment(self) -> bool:
+        """
+        Whether line is a standalone comment.
+        """
+        return len(self.leaves) == 1 and self.leaves[0].type == STANDALONE_COMMENT
+
+    @property
+    def is_decorator(self) -> bool:
+        """
+        Whether line is a decorator.
+        """
+        return bool(self) and self.leaves[0].type == AT
+
+    @property
+    def is_import(self) -> bool:
+        """
+        Whether line is an import statement.
+        """
+        return bool(self) and self.leaves[0].type == IMPORT
+
+    @property
+    def is_class(self) -> bool:
+        """
+        Whether line is a class definition.
+        """
+        return bool(self) and self.leaves[0].type == NAME and self.leaves[0].value == "class"
+
+    @property
+    def is_stub_class(self) -> bool:
+        """
+        Whether line is a class definition with `...` body.
+        """
+        return self.is_class and _is_ellipsis(self.leaves[-3:])
+
+    @property
+    def is_def(self) -> bool:
+        """
+        Whether line is a function definition.
+        """
+        return bool(self.leaves) and self.leaves[0].type == NAME and self.leaves[0].value == "def"
+
+    @property
+    def is_stub_def(self) -> bool:
+        """
+        Whether line is a function definition with `...` body.
+        """
+        return (
+            self.is_def
+            and len(self.leaves) >= 4
+            and self.leaves[-4].type == COLON
+            and self.leaves[-4].value == ":"
+            and _is_ellipsis(self.leaves[-3:])
+        )
+
+    @property
+    def is_class_paren_empty(self) -> bool:
+        """
+        Whether line is a class definition with empty parentheses.
+        """
+        return (
+            len(self.leaves) == 4
+            and self.is_class
+            and self.leaves[2].type == LPAR
+            and self.leaves[2].value == "("
+            and self.leaves[3].type == RPAR
+            and self.leaves[3].value == ")"
+        )
+
+    @property
+    def is_docstring(self) -> bool:
+        """
+        Whether line is a docstring.
+        """
+        return bool(self.leaves) and is_docstring(self.leaves[0])
+
+    @property
+    def is_chained_assignment(self) -> bool:
+        """
+        Whether line is a chained assignment.
+        """
+        return [leaf.type for leaf in self.leaves].count(EQUAL) > 1
+
+    @property
+    def opens_block(self) -> bool:
+        """
+        Whether line opens a new level of indentation.
+        """
+        return bool(self.leaves) and self.leaves[-1].type == COLON
+
+    def contains_standalone_comments(self) -> bool:
+        """
+        Whether line has standalone comments and should be split.
+        """
+        return any(leaf.type == STANDALONE_COMMENT for leaf in self.leaves)
+
+    def contains_uncollapsable_type_comments(self) -> bool:
+        """
+        Whether line has type comments that cannot be moved to the end of the line.
+        """
+        if not self.leaves:
+            return False
+        last = self.leaves[-1]
+        ignored_ids = {id(last)}
+        if last.type == COMMA or (last.type == RPAR and not last.value):
+            if len(self.leaves) < 2:
+                return False
+            ignored_ids.add(id(self.leaves[-2]))
+
+        comment_seen = False
+        for leaf_id, comments in self.comments.items():
+            for comment in comments:
+                if is_type_comment(comment):
+                    if comment_seen or (
+                        not is_type_ignore_comment(comment) and leaf_id not in ignored_ids
+                    ):
+                        return True
+                comment_seen = True
+        return False
+
+    def contains_multiple_type_ignores_at_current_depth(self) -> bool:
+        """
+        Whether line has more than one `type: ignore` comment outside brackets.
+        """
+        count = 0
+        for leaf in self.leaves:
+            if leaf.bracket_depth != 0:
+                continue
+            for comment in self.comments_after(leaf):
+                if is_type_ignore_comment(comment):
+                    count += 1
+                    if count > 1:
+                        return True
+        return False
+
+    def contains_unsplittable_type_ignore(self) -> bool:
+        """
+        Whether line was one line in the source and ends with `type: ignore`.
+        """
+        if not self.leaves:
+            return False
+
+        first_line = next((leaf.lineno for leaf in self.leaves if leaf.lineno != 0), 0)
+        last_line = next((leaf.lineno for leaf in reversed(self.leaves) if leaf.lineno != 0), 0)
+        if first_line == last_line and first_line != 0:
+            for leaf in self.leaves[-2:]:
+                for comment in self.comments.get(id(leaf), []):
+                    if is_type_ignore_comment(comment):
+                        return True
+        return False
+
+    def contains_multiline_strings(self) -> bool:
+        """
+        Whether line has triple-quoted strings that span many lines.
+        """
+        return any(is_multiline_string(leaf) for leaf in self.leaves)
+
+    def has_magic_trailing_comma(self, closing: Leaf) -> bool:
+        """
+        Whether `closing` bracket follows a magic trailing comma.
+
+        Trailing commas of single-element subscripts and one-tuples are not magic.
+        """
+        if not (closing.type in CLOSING_BRACKETS and self.leaves and self.leaves[-1].type == COMMA):
+            return False
+
+        if closing.type == RBRACE:
+            return True
+
+        if closing.type == RSQB:
+            return not (
+                closing.parent is not None
+                and closing.parent.type == trailer
+                and closing.opening_bracket is not None
+                and is_one_sequence_between(
+                    closing.opening_bracket, closing, self.leaves, brackets=(LSQB, RSQB)
+                )
+            )
+
+        if self.is_import:
+            return True
+
+        return closing.opening_bracket is not None and not is_one_sequence_between(
+            closing.opening_bracket, closing, self.leaves
+        )
+
+    def append_comment(self, comment: Leaf) -> bool:
+        """
+        Add an inline or standalone comment to the line.
+
+        Returns:
+            True if `comment` was attached to the last leaf.
+        """
+        if comment.type == STANDALONE_COMMENT and self.bracket_tracker.any_open_brackets():
+            comment.prefix = ""
+            return False
+
+        if comment.type != COMMENT:
+            return False
+
+        if not self.leaves:
+            comment.type = STANDALONE_COMMENT
+            comment.prefix = ""
+            return False
+
+        last = self.leaves[-1]
+        if (
+            last.type == RPAR
+            and not last.value
+            and last.parent
+            and len(list(last.parent.leaves())) <= 3
+            and not is_type_comment(comment)
+            and not self.contains_standalone_comments()
+        ):
+            if len(self.leaves) >= 2:
+                last = self.leaves[-2]
+        self.comments.setdefault(id(last), []).append(comment)
+        return True
+
+    def comments_after(self, leaf: Leaf) -> list[Leaf]:
+        """
+        Get comments that should appear directly after `leaf`.
+        """
+        return self.comments.get(id(leaf), [])
+
+    def remove_trailing_comma(self) -> None:
+        """
+        Remove the trailing comma and move comments attached to it.
+        """
+        trailing_comma = self.leaves.pop()
+        trailing_comma_comments = self.comments.pop(id(trailing_comma), [])
+        self.comments.setdefault(id(self.leaves[-1]), []).extend(trailing_comma_comments)
+
+    def enumerate_with_length(self, is_reversed: bool = False) -> Iterator[tuple[int, Leaf, int]]:
+        """
+        Iterate over leaves with their indexes and lengths, including comments.
+
+        Stops on multiline strings.
+        """
+        if is_reversed:
+            indexes = range(len(self.leaves) - 1, -1, -1)
+        else:
+            indexes = range(len(self.leaves))
+        for index in indexes:
+            leaf = self.leaves[index]
+            if "\n" in leaf.value:
+                return
+            length = len(leaf.prefix) + len(leaf.value)
+            for comment in self.comments_after(leaf):
+                length += len(comment.value)
+            yield index, leaf, length
+
+    def clone(self) -> "Line":
+        """
+        Create an empty line with the same settings.
+        """
+        return Line(
+            depth=self.depth,
+            inside_brackets=self.inside_brackets,
+            should_split_rhs=self.should_split_rhs,
+            magic_trailing_comma=self.magic_trailing_comma,
+        )
+
+    def __str__(self) -> str:
+        if not self:
+            return "\n"
+
+        first = self.leaves[0]
+        result = [first.prefix, "    " * self.depth, first.value]
+        result.extend(str(leaf) for leaf in self.leaves[1:])
+        for comments in self.comments.values():
+            result.extend(str(comment) for comment in comments)
+        result.append("\n")
+        return "".join(result)
+
+    def __bool__(self) -> bool:
+        return bool(self.leaves or self.comments)
+
+
+class RHSResult(NamedTuple):
+    """
+    Intermediate result of a right hand split.
+    """
+
+    head: Line
+    body: Line
+    tail: Line
+    opening_bracket: Leaf
+    closing_bracket: Leaf
+
+
+class LinesBlock:
+    """
+    Formatted lines of one logical line with empty lines around them.
+
+    Arguments:
+        previous_block -- Previous block.
+        original_line -- Logical line before splitting.
+        before -- Empty lines before.
+        after -- Empty lines after.
+    """
+
+    __slots__ = ("previous_block", "original_line", "before", "content_lines", "after")
+
+    def __init__(
+        self,
+        previous_block: "LinesBlock | None",
+        original_line: Line,
+        before: int = 0,
+        after: int = 0,
+    ) -> None:
+        self.previous_block = previous_block
+        self.original_line = original_line
+        self.before = before
+        self.content_lines: list[str] = []
+        self.after = after
+
+    def all_lines(self) -> list[str]:
+        """
+        Get formatted lines with empty lines around them.
+        """
+        return ["\n" * self.before, *self.content_lines, "\n" * self.after]
+
+
+class EmptyLineTracker:
+    """
+    Compute the number of empty lines before and after each line.
+
+    Arguments:
+        mode -- Formatting mode.
+    """
+
+    def __init__(self, mode: Mode) -> None:
+        self.mode = mode
+        self.previous_line: Line | None = None
+        self.previous_block: LinesBlock | None = None
+        self.previous_defs: list[Line] = []
+        self.semantic_leading_comment: LinesBlock | None = None
+
+    def maybe_empty_lines(self, current_line: Line) -> LinesBlock:
+        """
+        Get a block for `current_line` with empty lines before and after it.
+        """
+        before, after = self._maybe_empty_lines(current_line)
+        previous_after = self.previous_block.after if self.previous_block else 0
+        before = max(0, before - previous_after)
+        if self._line_is_module_docstring(current_line):
+            before = 1
+
+        block = LinesBlock(
+            previous_block=self.previous_block,
+            original_line=current_line,
+            before=before,
+            after=after,
+        )
+        if current_line.is_comment:
+            if self.previous_line is None or (
+                not self.previous_line.is_decorator
+                and (not self.previous_line.is_comment or before)
+                and (self.semantic_leading_comment is None or before)
+            ):
+                self.semantic_leading_comment = block
+        elif not current_line.is_decorator or before:
+            self.semantic_leading_comment = None
+
+        self.previous_line = current_line
+        self.previous_block = block
+        return block
+
+    def _line_is_module_docstring(self, current_line: Line) -> bool:
+        previous_block = self.previous_block
+        if not previous_block:
+            return False
+        if (
+            len(previous_block.original_line.leaves) != 1
+            or not previous_block.original_line.is_docstring
+            or previous_block.original_line.depth != 0
+            or current_line.is_class
+            or current_line.is_def
+        ):
+            return False
+        comment_block = previous_block.previous_block
+        while comment_block is not None:
+            if not comment_block.original_line.is_comment:
+                return False
+            comment_block = comment_block.previous_block
+        return True
+
+    def _maybe_empty_lines(self, current_line: Line) -> tuple[int, int]:
+        max_allowed = 1
+        if current_line.depth == 0:
+            max_allowed = 1 if self.mode.is_pyi else 2
+        if current_line.leaves:
+            first = current_line.leaves[0]
+            before = min(first.prefix.count("\n"), max_allowed)
+            first.prefix = ""
+        else:
+            before = 0
+
+        user_had_newline = bool(before)
+        depth = current_line.depth
+        previous_def = None
+        while self.previous_defs and self.previous_defs[-1].depth >= depth:
+            previous_def = self.previous_defs.pop()
+        if current_line.is_def or current_line.is_class:
+            self.previous_defs.append(current_line)
+
+        previous_line = self.previous_line
+        if previous_line is None:
+            return 0, 0
+
+        if current_line.is_docstring:
+            if previous_line.is_class:
+                return 0, 1
+            if previous_line.opens_block and previous_line.is_def:
+                return 0, 0
+
+        if previous_def is not None:
+            before = self._lines_after_previous_def(
+                current_line, previous_line, previous_def, user_had_newline
+            )
+
+        if current_line.is_decorator or current_line.is_def or current_line.is_class:
+            return self._maybe_empty_lines_for_class_or_def(current_line, before, user_had_newline)
+
+        if previous_line.is_import and not current_line.is_import:
+            if previous_line.depth == 0 and current_line.depth == 0:
+                return 1, 0
+            if depth == previous_line.depth:
+                return (before or 1), 0
+
+        return before, 0
+
+    def _lines_after_previous_def(
+        self, current_line: Line, previous_line: Line, previous_def: Line, user_had_newline: bool
+    ) -> int:
+        depth = current_line.depth
+        if self.mode.is_pyi:
+            if previous_def.is_class and not previous_def.is_stub_class:
+                return 1
+            if depth and not current_line.is_def and previous_line.is_def:
+                return 1 if user_had_newline else 0
+            return 0 if depth else 1
+        if depth:
+            return 1
+        if (
+            previous_def.depth
+            and current_line.leaves[-1].type == COLON
+            and current_line.leaves[0].value not in ("with", "try", "for", "while", "if", "match")
+        ):
+            return 1
+        return 2
+
+    def _maybe_empty_lines_for_class_or_def(
+        self, current_line: Line, before: int, user_had_newline: bool
+    ) -> tuple[int, int]:
+        previous_line = self.previous_line
+        assert previous_line is not None
+
+        if previous_line.is_decorator:
+            if self.mode.is_pyi and current_line.is_stub_class:
+                return 0, 1
+            return 0, 0
+
+        if previous_line.depth < current_line.depth and (
+            previous_line.is_class or previous_line.is_def
+        ):
+            if self.mode.is_pyi:
+                return 0, 0
+            return (1 if user_had_newline else 0), 0
+
+        comment_to_add_newlines: LinesBlock | None = None
+        if previous_line.is_comment and previous_line.depth == current_line.depth and before == 0:
+            slc = self.semantic_leading_comment
+            if (
+                slc is not None
+                and slc.previous_block is not None
+                and not slc.previous_block.original_line.is_class
+                and not slc.previous_block.original_line.opens_block
+                and slc.before <= 1
+            ):
+                comment_to_add_newlines = slc
+            else:
+                return 0, 0
+
+        if self.mode.is_pyi:
+            newlines = self._pyi_lines_before_class_or_def(current_line, previous_line, before)
+        else:
+            newlines = 1 if current_line.depth else 2
+            if previous_line.is_stub_def and not user_had_newline:
+                newlines = 0
+        if comment_to_add_newlines is not None:
+            previous_block = comment_to_add_newlines.previous_block
+            if previous_block is not None:
+                comment_to_add_newlines.before = (
+                    max(comment_to_add_newlines.before, newlines) - previous_block.after
+                )
+                newlines = 0
+        return newlines, 0
+
+    @staticmethod
+    def _pyi_lines_before_class_or_def(current_line: Line, previous_line: Line, before: int) -> int:
+        if current_line.is_class or previous_line.is_class:
+            if previous_line.depth < current_line.depth:
+                return 0
+            if previous_line.depth > current_line.depth:
+                return 1
+            if current_line.is_stub_class and previous_line.is_stub_class:
+                return 0
+            return 1
+        if previous_line.depth > current_line.depth:
+            return 1
+        if (current_line.is_def or current_line.is_decorator) and not previous_line.is_def:
+            return min(1, before) if current_line.depth else 1
+        return 0
+
+
+def _is_ellipsis(leaves: list[Leaf]) -> bool:
+    return len(leaves) == 3 and all(leaf.type == DOT and leaf.value == "." for leaf in leaves)
+
+
+def append_leaves(
+    new_line: Line, old_line: Line, leaves: list[Leaf], preformatted: bool = False
+) -> None:
+    """
+    Append copies of `leaves` from `old_line` to `new_line` with their comments.
+
+    Copies replace original leaves in the syntax tree.
+    """
+    for old_leaf in leaves:
+        new_leaf = Leaf(old_leaf.type, old_leaf.value, lineno=old_leaf.lineno)
+        parent = old_leaf.parent
+        if parent is not None:
+            parent.set_child(parent.get_index(old_leaf), new_leaf)
+        new_line.append(new_leaf, preformatted=preformatted)
+        for comment_leaf in old_line.comments_after(old_leaf):
+            new_line.append(comment_leaf, preformatted=True)
+
+
+def str_width(line_str: str) -> int:
+    """
+    Get the width of `line_str` as it would be displayed in a terminal.
+
+    East Asian wide characters take two columns, combining characters take none.
+    """
+    if line_str.isascii():
+        return len(line_str)
+    return sum(_char_width(char) for char in line_str)
+
+
+def _char_width(char: str) -> int:
+    if unicodedata.combining(char):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+def is_line_short_enough(line: Line, mode: Mode, line_str: str = "") -> bool:
+    """
+    Whether `line` fits into line length.
+
+    For multiline strings looks at the context around them.
+    """
+    if not line_str:
+        line_str = line_to_string(line)
+
+    if line.contains_standalone_comments():
+        return False
+    if "\n" not in line_str:
+        return str_width(line_str) <= mode.line_length
+
+    first, *_, last = line_str.split("\n")
+    if str_width(first) > mode.line_length or str_width(last) > mode.line_length:
+        return False
+
+    return _has_no_commas_around_multiline_string(line)
+
+
+def _has_no_commas_around_multiline_string(line: Line) -> bool:
+    commas: list[int] = []
+    multiline_string: Leaf | None = None
+    multiline_string_contexts: list[LN] = []
+    line_leaf_ids = {id(leaf) for leaf in line.leaves}
+    max_level_to_update: float = float("inf")
+    for index, leaf in enumerate(line.leaves):
+        if max_level_to_update == float("inf"):
+            had_comma: int | None = None
+            if leaf.bracket_depth + 1 > len(commas):
+                commas.append(0)
+            elif leaf.bracket_depth + 1 < len(commas):
+                had_comma = commas.pop()
+            if (
+                had_comma is not None
+                and multiline_string is not None
+                and multiline_string.bracket_depth == leaf.bracket_depth + 1
+            ):
+                max_level_to_update = leaf.bracket_depth
+                if had_comma > 0:
+                    return False
+
+        if leaf.bracket_depth <= max_level_to_update and leaf.type == COMMA:
+            ignore_ctxs: list[object] = [None, *multiline_string_contexts]
+            if (line.inside_brackets or leaf.bracket_depth > 0) and (
+                index != len(line.leaves) - 1 or leaf.prev_sibling not in ignore_ctxs
+            ):
+                commas[leaf.bracket_depth] += 1
+        if max_level_to_update != float("inf"):
+            max_level_to_update = min(max_level_to_update, leaf.bracket_depth)
+
+        if is_multiline_string(leaf):
+            if leaf.parent and leaf.parent.parent and leaf.parent.parent.type == dictsetmaker:
+                return False
+            if multiline_string_contexts:
+                return False
+            multiline_string = leaf
+            multiline_string_contexts = _get_contexts_inside_line(leaf, line_leaf_ids)
+
+    if not multiline_string_contexts:
+        return True
+
+    return all(val == 0 for val in commas)
+
+
+def _get_contexts_inside_line(leaf: Leaf, line_leaf_ids: set[int]) -> list[LN]:
+    result: list[LN] = []
+    ctx: LN = leaf
+    while id(first_leaf(ctx)) in line_leaf_ids and id(last_leaf(ctx)) in line_leaf_ids:
+        result.append(ctx)
+        if ctx.parent is None:
+            break
+        ctx = ctx.parent
+    return result
+
+
+def can_be_split(line: Line) -> bool:
+    """
+    Whether `line` can possibly be split.
+    """
+    leaves = line.leaves
+    if len(leaves) < 2:
+        return False
+
+    if leaves[0].type == STRING and leaves[1].type == DOT:
+        call_count = 0
+        dot_count = 0
+        next_leaf = leaves[-1]
+        for leaf in leaves[-2::-1]:
+            if leaf.type in OPENING_BRACKETS:
+                if next_leaf.type not in CLOSING_BRACKETS:
+                    return False
+                call_count += 1
+            elif leaf.type == DOT:
+                dot_count += 1
+            elif leaf.type == NAME:
+                if not (next_leaf.type == DOT or next_leaf.type in OPENING_BRACKETS):
+                    return False
+            elif leaf.type not in CLOSING_BRACKETS:
+                return False
+
+            if dot_count > 1 and call_count > 1:
+                return False
+
+    return True
+
+
+def can_omit_invisible_parens(rhs: RHSResult, line_length: int) -> bool:
+    """
+    Whether `rhs.body` is safe to format without optional parentheses around it.
+    """
+    line = rhs.body
+
+    if (
+        line.contains_multiple_type_ignores_at_current_depth()
+        and not line.bracket_tracker.delimiters
+        and any(leaf.type == DOT for leaf in line.leaves)
+    ):
+        return False
+
+    if rhs.opening_bracket.type == LPAR and not rhs.opening_bracket.value:
+        if rhs.head.comments.get(id(rhs.opening_bracket)):
+            return False
+
+    if _has_mixed_comments(rhs) or _has_standalone_comment_outside_brackets(line):
+        return False
+
+    tracker = line.bracket_tracker
+    if not tracker.delimiters:
+        return True
+
+    max_priority = tracker.max_delimiter_priority()
+    if tracker.delimiter_count_with_priority(max_priority) > 1:
+        return False
+
+    if max_priority == DOT_PRIORITY:
+        return True
+
+    first = line.leaves[0]
+    second = line.leaves[1]
+    if first.type in OPENING_BRACKETS and second.type not in CLOSING_BRACKETS:
+        if _can_omit_opening_paren(line, first=first, line_length=line_length):
+            return True
+
+    penultimate = line.leaves[-2]
+    last = line.leaves[-1]
+    if (
+        last.type == RPAR
+        or last.type == RBRACE
+        or (last.type == RSQB and last.parent and last.parent.type != trailer)
+    ):
+        if penultimate.type in OPENING_BRACKETS:
+            return False
+        if is_multiline_string(first):
+            return True
+        if _can_omit_closing_paren(line, last=last, line_length=line_length):
+            return True
+
+    return False
+
+
+def _can_omit_opening_paren(line: Line, first: Leaf, line_length: int) -> bool:
+    remainder = False
+    length = 4 * line.depth
+    index = -1
+    for index, leaf, leaf_length in line.enumerate_with_length():
+        if leaf.type in CLOSING_BRACKETS and leaf.opening_bracket is first:
+            remainder = True
+        if remainder:
+            length += leaf_length
+            if length > line_length:
+                break
+            if leaf.type in OPENING_BRACKETS:
+                remainder = False
+    else:
+        if len(line.leaves) == index + 1:
+            return True
+    return False
+
+
+def _can_omit_closing_paren(line: Line, last: Leaf, line_length: int) -> bool:
+    length = 4 * line.depth
+    seen_other_brackets = False
+    for _index, leaf, leaf_length in line.enumerate_with_length():
+        length += leaf_length
+        if leaf is last.opening_bracket:
+            if seen_other_brackets or length <= line_length:
+                return True
+        elif leaf.type in OPENING_BRACKETS:
+            seen_other_brackets = True
+    return False
+
+
+def line_to_string(line: Line) -> str:
+    """
+    Render `line` without the trailing newline.
+    """
+    return str(line).strip("\n")
+
+
+def _has_mixed_comments(rhs: RHSResult) -> bool:
+    if not rhs.head.leaves:
+        return False
+    head_comments = rhs.head.comments.get(id(rhs.head.leaves[-1]), [])
+    if not head_comments:
+        return False
+    has_type_ignore_in_head = any(is_type_ignore_comment(i) for i in head_comments)
+    has_other_comment_in_head = any(not is_type_ignore_comment(i) for i in head_comments)
+    has_type_ignore_in_body = False
+    has_other_comment_in_body = False
+    for leaf in rhs.body.leaves:
+        for comment in rhs.body.comments.get(id(leaf), []):
+            if is_type_ignore_comment(comment):
+                has_type_ignore_in_body = True
+            else:
+                has_other_comment_in_body = True
+    return (has_type_ignore_in_head and has_other_comment_in_body) or (
+        has_other_comment_in_head and has_type_ignore_in_body
+    )
+
+
+def _has_standalone_comment_outside_brackets(line: Line) -> bool:
+    closing_bracket: Leaf | None = None
+    for leaf in reversed(line.leaves):
+        if closing_bracket and leaf is closing_bracket.opening_bracket:
+            closing_bracket = None
+        if leaf.type == STANDALONE_COMMENT and not closing_bracket:
+            return True
+        if (
+            not closing_bracket
+            and leaf.type in CLOSING_BRACKETS
+            and leaf.opening_bracket in line.leaves
+            and leaf.value
+        ):
+            closing_bracket = leaf
+    return False
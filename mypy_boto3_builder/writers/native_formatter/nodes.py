@@ -0,0 +1,758 @@
+"""
+Syntax tree for native formatter.
+
+Tree shape, node types and helpers follow `blib2to3` and `black.nodes`,
+so layout decisions match `black` output.
+"""
+
+from collections.abc import Callable, Iterator
+
+# Token types
+NAME = 1
+NUMBER = 2
+STRING = 3
+NEWLINE = 4
+INDENT = 5
+DEDENT = 6
+LPAR = 7
+RPAR = 8
+LSQB = 9
+RSQB = 10
+LBRACE = 11
+RBRACE = 12
+COLON = 13
+COMMA = 14
+DOT = 15
+EQUAL = 16
+STAR = 17
+DOUBLESTAR = 18
+AT = 19
+RARROW = 20
+LESS = 21
+GREATER = 22
+EQEQUAL = 23
+NOTEQUAL = 24
+LESSEQUAL = 25
+GREATEREQUAL = 26
+COMMENT = 27
+ENDMARKER = 28
+STANDALONE_COMMENT = 29
+IMPORT = 30
+
+# Node types
+file_input = 256
+simple_stmt = 257
+expr_stmt = 258
+annassign = 259
+suite = 260
+if_stmt = 261
+classdef = 262
+funcdef = 263
+parameters = 264
+typedargslist = 265
+tname = 266
+decorator = 267
+decorators = 268
+decorated = 269
+power = 270
+trailer = 271
+atom = 272
+arglist = 273
+argument = 274
+subscriptlist = 275
+testlist_gexp = 276
+listmaker = 277
+dictsetmaker = 278
+comparison = 279
+dotted_name = 280
+pass_stmt = 281
+
+OPERATORS = {
+    "(": LPAR,
+    ")": RPAR,
+    "[": LSQB,
+    "]": RSQB,
+    "{": LBRACE,
+    "}": RBRACE,
+    ":": COLON,
+    ",": COMMA,
+    ".": DOT,
+    "=": EQUAL,
+    "*": STAR,
+    "**": DOUBLESTAR,
+    "@": AT,
+    "->": RARROW,
+    "<": LESS,
+    ">": GREATER,
+    "==": EQEQUAL,
+    "!=": NOTEQUAL,
+    "<=": LESSEQUAL,
+    ">=": GREATEREQUAL,
+}
+
+COMPARATORS = {LESS, GREATER, EQEQUAL, NOTEQUAL, LESSEQUAL, GREATEREQUAL}
+MATH_OPERATORS = {STAR, DOUBLESTAR, AT}
+VARARGS_SPECIALS = {STAR, DOUBLESTAR}
+VARARGS_PARENTS = {arglist, argument, trailer, typedargslist}
+UNPACKING_PARENTS = {atom, dictsetmaker, listmaker, testlist_gexp}
+TEST_DESCENDANTS = {comparison, trailer, power}
+STATEMENT = {if_stmt, funcdef, classdef}
+ASSIGNMENTS = {"=", ":"}
+BRACKET = {LPAR: RPAR, LSQB: RSQB, LBRACE: RBRACE}
+OPENING_BRACKETS = set(BRACKET.keys())
+CLOSING_BRACKETS = set(BRACKET.values())
+BRACKETS = OPENING_BRACKETS | CLOSING_BRACKETS
+ALWAYS_NO_SPACE = CLOSING_BRACKETS | {COMMA, STANDALONE_COMMENT}
+WHITESPACE = {DEDENT, INDENT, NEWLINE}
+NO_SPACE = ""
+SPACE = " "
+
+
+class Leaf:
+    """
+    Token with its whitespace prefix and line metadata.
+    """
+
+    __slots__ = (
+        "type",
+        "value",
+        "prefix",
+        "parent",
+        "lineno",
+        "bracket_depth",
+        "opening_bracket",
+    )
+
+    def __init__(self, type: int, value: str, prefix: str = "", lineno: int = 0) -> None:
+        self.type = type
+        self.value = value
+        self.prefix = prefix
+        self.parent: Node | None = None
+        self.lineno = lineno
+        self.bracket_depth = 0
+        self.opening_bracket: Leaf | None = None
+
+    def __str__(self) -> str:
+        return self.prefix + self.value
+
+    def __repr__(self) -> str:
+        return f"Leaf({self.type}, {self.value!r})"
+
+    @property
+    def prev_sibling(self) -> "Leaf | Node | None":
+        """
+        Previous child of the parent node.
+        """
+        return get_sibling(self, -1)
+
+    @property
+    def next_sibling(self) -> "Leaf | Node | None":
+        """
+        Next child of the parent node.
+        """
+        return get_sibling(self, 1)
+
+    def leaves(self) -> Iterator["Leaf"]:
+        """
+        Iterate over leaves, which is the leaf itself.
+        """
+        yield self
+
+    def remove(self) -> int | None:
+        """
+        Remove leaf from its parent.
+
+        Returns:
+            Former child index.
+        """
+        return remove_child(self)
+
+
+class Node:
+    """
+    Syntax tree node with children.
+    """
+
+    __slots__ = ("type", "children", "parent", "_indexes")
+
+    def __init__(self, type: int, children: list["Leaf | Node"]) -> None:
+        self.type = type
+        self.children = children
+        self.parent: Node | None = None
+        self._indexes: dict[int, int] | None = None
+        for child in children:
+            child.parent = self
+
+    def __str__(self) -> str:
+        return "".join(str(i) for i in self.children)
+
+    def __repr__(self) -> str:
+        return f"Node({self.type}, {self.children!r})"
+
+    @property
+    def prefix(self) -> str:
+        """
+        Prefix of the first leaf.
+        """
+        return self.children[0].prefix if self.children else ""
+
+    @prefix.setter
+    def prefix(self, value: str) -> None:
+        if self.children:
+            self.children[0].prefix = value
+
+    @property
+    def prev_sibling(self) -> "Leaf | Node | None":
+        """
+        Previous child of the parent node.
+        """
+        return get_sibling(self, -1)
+
+    @property
+    def next_sibling(self) -> "Leaf | Node | None":
+        """
+        Next child of the parent node.
+        """
+        return get_sibling(self, 1)
+
+    def leaves(self) -> Iterator[Leaf]:
+        """
+        Iterate over all leaves in order.
+        """
+        for child in self.children:
+            yield from child.leaves()
+
+    def pre_order(self) -> Iterator["Leaf | Node"]:
+        """
+        Iterate over the node and all its descendants.
+        """
+        yield self
+        for child in self.children:
+            if isinstance(child, Node):
+                yield from child.pre_order()
+            else:
+                yield child
+
+    def get_index(self, child: "Leaf | Node") -> int:
+        """
+        Get index of `child` in children.
+        """
+        if self._indexes is None:
+            self._indexes = {id(i): index for index, i in enumerate(self.children)}
+        return self._indexes[id(child)]
+
+    def set_child(self, index: int, child: "Leaf | Node") -> None:
+        """
+        Replace child at `index`.
+        """
+        self.children[index].parent = None
+        child.parent = self
+        self.children[index] = child
+        self._indexes = None
+
+    def insert_child(self, index: int, child: "Leaf | Node") -> None:
+        """
+        Insert `child` at `index`.
+        """
+        child.parent = self
+        self.children.insert(index, child)
+        self._indexes = None
+
+    def append_child(self, child: "Leaf | Node") -> None:
+        """
+        Add `child` to the end.
+        """
+        child.parent = self
+        self.children.append(child)
+        self._indexes = None
+
+    def remove(self) -> int | None:
+        """
+        Remove node from its parent.
+
+        Returns:
+            Former child index.
+        """
+        return remove_child(self)
+
+    def replace(self, new: "Leaf | Node") -> None:
+        """
+        Replace node with `new` in its parent.
+        """
+        assert self.parent is not None
+        self.parent.set_child(self.parent.get_index(self), new)
+
+
+LN = Leaf | Node
+
+
+def get_sibling(node: LN, offset: int) -> LN | None:
+    """
+    Get sibling of `node` at `offset` from it.
+    """
+    parent = node.parent
+    if parent is None:
+        return None
+    index = parent.get_index(node) + offset
+    if 0 <= index < len(parent.children):
+        return parent.children[index]
+    return None
+
+
+def remove_child(node: LN) -> int | None:
+    """
+    Remove `node` from its parent.
+
+    Returns:
+        Former child index.
+    """
+    parent = node.parent
+    if parent is None:
+        return None
+    index = parent.get_index(node)
+    del parent.children[index]
+    parent._indexes = None
+    node.parent = None
+    return index
+
+
+def preceding_leaf(node: LN | None) -> Leaf | None:
+    """
+    Get the first leaf that precedes `node`.
+    """
+    while node:
+        res = node.prev_sibling
+        if res:
+            if isinstance(res, Leaf):
+                return res
+            return last_leaf(res)
+        node = node.parent
+    return None
+
+
+def parent_type(node: LN | None) -> int | None:
+    """
+    Get type of `node` parent.
+    """
+    if node is None or node.parent is None:
+        return None
+    return node.parent.type
+
+
+def first_leaf(node: LN) -> Leaf | None:
+    """
+    Get the first leaf of `node`.
+    """
+    while isinstance(node, Node):
+        if not node.children:
+            return None
+        node = node.children[0]
+    return node
+
+
+def last_leaf(node: LN) -> Leaf | None:
+    """
+    Get the last leaf of `node`.
+    """
+    while isinstance(node, Node):
+        if not node.children:
+            return None
+        node = node.children[-1]
+    return node
+
+
+def whitespace(leaf: Leaf) -> str:
+    """
+    Get whitespace prefix for `leaf`.
+
+    Handles a subset of `black.nodes.whitespace` cases, as subscripts with slices,
+    unary operators and lambdas are not supported by the parser.
+    """
+    t = leaf.type
+    if t in ALWAYS_NO_SPACE:
+        return NO_SPACE
+    if t == COMMENT:
+        return "  "
+    parent = leaf.parent
+    assert parent is not None
+    if t == COLON:
+        return NO_SPACE
+
+    prev = leaf.prev_sibling
+    if not prev:
+        result = _whitespace_after_preceding_leaf(parent)
+        if result is not None:
+            return result
+    elif prev.type in OPENING_BRACKETS:
+        return NO_SPACE
+
+    get_parent_whitespace = _PARENT_WHITESPACE.get(parent.type)
+    if get_parent_whitespace is None:
+        return SPACE
+    return get_parent_whitespace(leaf, parent, prev)
+
+
+def _whitespace_after_preceding_leaf(parent: Node) -> str | None:
+    prevp = preceding_leaf(parent)
+    if not prevp or prevp.type in OPENING_BRACKETS:
+        return NO_SPACE
+    if prevp.type == EQUAL and prevp.parent:
+        if prevp.parent.type in {arglist, argument, parameters}:
+            return NO_SPACE
+        if prevp.parent.type == typedargslist:
+            return prevp.prefix
+    if prevp.type in VARARGS_SPECIALS and is_vararg(
+        prevp, within=VARARGS_PARENTS | UNPACKING_PARENTS
+    ):
+        return NO_SPACE
+    if prevp.type == AT and parent.parent and parent.parent.type == decorator:
+        return NO_SPACE
+    return None
+
+
+def _whitespace_in_arglist(leaf: Leaf, parent: Node, prev: LN | None) -> str:
+    if not prev or prev.type != COMMA:
+        return NO_SPACE
+    return SPACE
+
+
+def _whitespace_in_typedargslist(leaf: Leaf, parent: Node, prev: LN | None) -> str:
+    if not prev:
+        return NO_SPACE
+    if leaf.type == EQUAL:
+        return SPACE if prev.type == tname else NO_SPACE
+    if prev.type == EQUAL:
+        return prev.prefix
+    return SPACE if prev.type == COMMA else NO_SPACE
+
+
+def _whitespace_in_tname(leaf: Leaf, parent: Node, prev: LN | None) -> str:
+    if not prev:
+        prevp = preceding_leaf(parent)
+        if not prevp or prevp.type != COMMA:
+            return NO_SPACE
+    return SPACE
+
+
+def _whitespace_in_trailer(leaf: Leaf, parent: Node, prev: LN | None) -> str:
+    if leaf.type in (LPAR, RPAR):
+        return NO_SPACE
+    if not prev:
+        return NO_SPACE if leaf.type in (DOT, LSQB) else SPACE
+    return SPACE if prev.type == COMMA else NO_SPACE
+
+
+def _whitespace_in_argument(leaf: Leaf, parent: Node, prev: LN | None) -> str:
+    if leaf.type == EQUAL:
+        return NO_SPACE
+    if not prev:
+        prevp = preceding_leaf(parent)
+        if not prevp or prevp.type == LPAR:
+            return NO_SPACE
+        return SPACE
+    if prev.type == EQUAL or prev.type in VARARGS_SPECIALS:
+        return NO_SPACE
+    return SPACE
+
+
+def _whitespace_in_decorator(leaf: Leaf, parent: Node, prev: LN | None) -> str:
+    return NO_SPACE
+
+
+def _whitespace_in_dotted_name(leaf: Leaf, parent: Node, prev: LN | None) -> str:
+    if prev:
+        return NO_SPACE
+    prevp = preceding_leaf(parent)
+    if not prevp or prevp.type in (AT, DOT):
+        return NO_SPACE
+    return SPACE
+
+
+def _whitespace_in_classdef(leaf: Leaf, parent: Node, prev: LN | None) -> str:
+    if leaf.type == LPAR or (prev and prev.type == LPAR):
+        return NO_SPACE
+    return SPACE
+
+
+def _whitespace_in_atom(leaf: Leaf, parent: Node, prev: LN | None) -> str:
+    if prev and leaf.type == DOT:
+        return NO_SPACE
+    return SPACE
+
+
+def _whitespace_in_dictsetmaker(leaf: Leaf, parent: Node, prev: LN | None) -> str:
+    if prev and prev.type == DOUBLESTAR:
+        return NO_SPACE
+    return SPACE
+
+
+_PARENT_WHITESPACE: dict[int, Callable[[Leaf, Node, LN | None], str]] = {
+    parameters: _whitespace_in_arglist,
+    arglist: _whitespace_in_arglist,
+    typedargslist: _whitespace_in_typedargslist,
+    tname: _whitespace_in_tname,
+    trailer: _whitespace_in_trailer,
+    argument: _whitespace_in_argument,
+    decorator: _whitespace_in_decorator,
+    dotted_name: _whitespace_in_dotted_name,
+    classdef: _whitespace_in_classdef,
+    atom: _whitespace_in_atom,
+    dictsetmaker: _whitespace_in_dictsetmaker,
+}
+
+
+def is_vararg(leaf: Leaf, within: set[int]) -> bool:
+    """
+    Whether `leaf` is a star or double star in a vararg or kwarg.
+    """
+    if leaf.type not in VARARGS_SPECIALS or not leaf.parent:
+        return False
+    return leaf.parent.type in within
+
+
+def prev_siblings_are(node: LN | None, tokens: list[int | None]) -> bool:
+    """
+    Whether `node` and its previous siblings match `tokens` types.
+
+    The last type in `tokens` is matched against `node`, `None` as the first type
+    anchors the list at the start of parent children.
+    """
+    if not tokens:
+        return True
+    if tokens[-1] is None:
+        return node is None
+    if not node:
+        return False
+    if node.type != tokens[-1]:
+        return False
+    return prev_siblings_are(node.prev_sibling, tokens[:-1])
+
+
+def is_docstring(leaf: Leaf) -> bool:
+    """
+    Whether `leaf` is a module, class or function docstring.
+    """
+    if leaf.type != STRING:
+        return False
+    parent = leaf.parent
+    if (
+        parent
+        and parent.type == simple_stmt
+        and not parent.prev_sibling
+        and parent.parent
+        and parent.parent.type == file_input
+    ):
+        return True
+    if prev_siblings_are(parent, [None, NEWLINE, INDENT, simple_stmt]):
+        return True
+    return prev_siblings_are(parent, [parameters, COLON, simple_stmt])
+
+
+def is_one_tuple(node: LN) -> bool:
+    """
+    Whether `node` is a tuple with one element.
+    """
+    if node.type != atom:
+        return False
+    gexp = unwrap_singleton_parenthesis(node)
+    if not isinstance(gexp, Node) or gexp.type != testlist_gexp:
+        return False
+    return len(gexp.children) == 2 and gexp.children[1].type == COMMA
+
+
+def is_empty_tuple(node: LN) -> bool:
+    """
+    Whether `node` is an empty tuple.
+    """
+    return (
+        isinstance(node, Node)
+        and node.type == atom
+        and len(node.children) == 2
+        and node.children[0].type == LPAR
+        and node.children[1].type == RPAR
+    )
+
+
+def is_one_sequence_between(
+    opening: Leaf,
+    closing: Leaf,
+    leaves: list[Leaf],
+    brackets: tuple[int, int] = (LPAR, RPAR),
+) -> bool:
+    """
+    Whether content between `opening` and `closing` is a one-sequence.
+    """
+    if (opening.type, closing.type) != brackets:
+        return False
+
+    depth = closing.bracket_depth + 1
+    for opening_index, leaf in enumerate(leaves):
+        if leaf is opening:
+            break
+    else:
+        return False
+
+    commas = 0
+    for leaf in leaves[opening_index + 1 :]:
+        if leaf is closing:
+            break
+        if leaf.bracket_depth == depth and leaf.type == COMMA:
+            commas += 1
+            if leaf.parent and leaf.parent.type in {arglist, typedargslist}:
+                commas += 1
+                break
+
+    return commas < 2
+
+
+def is_multiline_string(leaf: LN) -> bool:
+    """
+    Whether `leaf` is a triple-quoted string that spans many lines.
+    """
+    return isinstance(leaf, Leaf) and leaf.value[:3] in {'"""', "'''"} and "\n" in leaf.value
+
+
+def is_tuple(node: LN) -> bool:
+    """
+    Whether `node` holds a tuple.
+    """
+    if node.type != atom:
+        return False
+    gexp = unwrap_singleton_parenthesis(node)
+    return gexp is not None and gexp.type == testlist_gexp
+
+
+def is_parent_function_or_class(node: Node) -> bool:
+    """
+    Whether `node` is a suite or a statement of a function or class.
+    """
+    return node.parent is not None and node.parent.type in {funcdef, classdef}
+
+
+def is_stub_suite(node: Node) -> bool:
+    """
+    Whether `node` is a suite with a stub body.
+    """
+    if node.parent is not None and not is_parent_function_or_class(node):
+        return False
+    if node.prefix.strip():
+        return False
+    children = node.children
+    if (
+        len(children) != 4
+        or children[0].type != NEWLINE
+        or children[1].type != INDENT
+        or children[3].type != DEDENT
+    ):
+        return False
+    if children[3].prefix.strip():
+        return False
+    return is_stub_body(children[2])
+
+
+def is_stub_body(node: LN) -> bool:
+    """
+    Whether `node` is a simple statement containing an ellipsis.
+    """
+    if not isinstance(node, Node) or node.type != simple_stmt or len(node.children) != 2:
+        return False
+    child = node.children[0]
+    return (
+        isinstance(child, Node)
+        and not child.prefix.strip()
+        and child.type == atom
+        and len(child.children) == 3
+        and all(isinstance(i, Leaf) and i.type == DOT and i.value == "." for i in child.children)
+    )
+
+
+def is_atom_with_invisible_parens(node: LN) -> bool:
+    """
+    Whether `node` is an atom wrapped in invisible parentheses.
+    """
+    if isinstance(node, Leaf) or node.type != atom:
+        return False
+    first, last = node.children[0], node.children[-1]
+    return (
+        isinstance(first, Leaf)
+        and first.type == LPAR
+        and first.value == ""
+        and isinstance(last, Leaf)
+        and last.type == RPAR
+        and last.value == ""
+    )
+
+
+def is_type_comment(leaf: Leaf) -> bool:
+    """
+    Whether `leaf` is a type comment.
+    """
+    value = leaf.value
+    return leaf.type in {COMMENT, STANDALONE_COMMENT} and value[1:].lstrip().startswith("type:")
+
+
+def is_type_ignore_comment(leaf: Leaf) -> bool:
+    """
+    Whether `leaf` is a `type: ignore` comment.
+    """
+    return is_type_comment(leaf) and leaf.value.split(":", 1)[1].lstrip().startswith("ignore")
+
+
+def unwrap_singleton_parenthesis(node: LN) -> LN | None:
+    """
+    Get `wrapped` if `node` has the shape `( wrapped )`.
+    """
+    if isinstance(node, Leaf) or len(node.children) != 3:
+        return None
+    lpar, wrapped, rpar = node.children
+    if not (lpar.type == LPAR and rpar.type == RPAR):
+        return None
+    return wrapped
+
+
+def wrap_in_parentheses(parent: Node, child: LN, visible: bool = True) -> None:
+    """
+    Replace `child` with an atom that holds it wrapped in parentheses.
+    """
+    lpar = Leaf(LPAR, "(" if visible else "")
+    rpar = Leaf(RPAR, ")" if visible else "")
+    index = parent.get_index(child)
+    prefix = child.prefix
+    child.prefix = ""
+    child.parent = None
+    new_child = Node(atom, [lpar, child, rpar])
+    new_child.prefix = prefix
+    parent.set_child(index, new_child)
+    child.parent = new_child
+
+
+def ensure_visible(leaf: Leaf) -> None:
+    """
+    Make sure parentheses are visible.
+    """
+    if leaf.type == LPAR:
+        leaf.value = "("
+    elif leaf.type == RPAR:
+        leaf.value = ")"
+
+
+def get_annotation_type(leaf: Leaf) -> str | None:
+    """
+    Get the type of annotation `leaf` is part of: `return`, `param` or None.
+    """
+    ancestor = leaf.parent
+    while ancestor is not None:
+        prev = ancestor.prev_sibling
+        if prev and prev.type == RARROW:
+            return "return"
+        if ancestor.parent and ancestor.parent.type == tname:
+            return "param"
+        ancestor = ancestor.parent
+    return None
+
+
+def is_part_of_annotation(leaf: Leaf) -> bool:
+    """
+    Whether `leaf` is part of a type annotation.
+    """
+    return get_annotation_type(leaf) is not None
@@ -0,0 +1,602 @@
+"""
+Tokenizer and parser for native formatter.
+
+Produces `blib2to3`-shaped syntax trees for the subset of Python syntax
+used in generated stubs. Import statements are kept verbatim, as they are
+already sorted and formatted.
+"""
+
+import re
+from collections.abc import Iterator
+
+from mypy_boto3_builder.writers.native_formatter.errors import UnsupportedSyntaxError
+from mypy_boto3_builder.writers.native_formatter.nodes import (
+    AT,
+    COLON,
+    COMMA,
+    COMPARATORS,
+    DEDENT,
+    DOT,
+    DOUBLESTAR,
+    ENDMARKER,
+    EQUAL,
+    IMPORT,
+    INDENT,
+    LBRACE,
+    LN,
+    LPAR,
+    LSQB,
+    NAME,
+    NEWLINE,
+    NUMBER,
+    OPERATORS,
+    RARROW,
+    RBRACE,
+    RPAR,
+    RSQB,
+    STAR,
+    STRING,
+    VARARGS_SPECIALS,
+    Leaf,
+    Node,
+    annassign,
+    arglist,
+    argument,
+    atom,
+    classdef,
+    comparison,
+    decorated,
+    decorator,
+    decorators,
+    dictsetmaker,
+    expr_stmt,
+    file_input,
+    funcdef,
+    if_stmt,
+    listmaker,
+    parameters,
+    power,
+    simple_stmt,
+    subscriptlist,
+    suite,
+    testlist_gexp,
+    tname,
+    trailer,
+    typedargslist,
+)
+
+KEYWORDS = {
+    "and",
+    "as",
+    "assert",
+    "async",
+    "await",
+    "break",
+    "continue",
+    "del",
+    "elif",
+    "else",
+    "except",
+    "finally",
+    "for",
+    "from",
+    "global",
+    "import",
+    "in",
+    "is",
+    "lambda",
+    "nonlocal",
+    "not",
+    "or",
+    "raise",
+    "return",
+    "try",
+    "while",
+    "with",
+    "yield",
+}
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<number>[0-9]+)
+    |(?P<string>"(?:[^"\\\n])*"|'(?:[^'\\\n])*')
+    |(?P<op>\.\.\.|->|\*\*|==|!=|<=|>=|[()\[\]{}:,.=*@<>])
+    """,
+    re.VERBOSE,
+)
+_IMPORT_RE = re.compile(
+    r"(?:from [\w.]+ import (?:\w+(?: as \w+)?(?:, \w+(?: as \w+)?)*"
+    r"|\(\n(?:    \w+(?: as \w+)?,\n)+\))"
+    r"|import [\w.]+(?: as \w+)?)\n"
+)
+_INDENT_RE = re.compile(r" *")
+_SPACES_RE = re.compile(r"[ \t]*")
+_UNSAFE_ESCAPES = set("\n\r\\\"'uUxN")
+_BACKSLASH_NEWLINE_RE = re.compile(r"\\\s*\n")
+
+
+def _skip(pattern: re.Pattern[str], source: str, pos: int) -> int:
+    match = pattern.match(source, pos)
+    return match.end() if match else pos
+
+
+class Tokenizer:
+    """
+    Split source into leaves with `blib2to3` prefixes.
+
+    Only trailing comments are supported, they are stored in the prefix
+    of the next leaf as `# comment\\n`.
+
+    Arguments:
+        source -- Python source code.
+    """
+
+    def __init__(self, source: str) -> None:
+        if "\r" in source or "\t" in source or "\f" in source:
+            raise UnsupportedSyntaxError("Tabs and carriage returns are not supported")
+        if source and not source.endswith("\n"):
+            source += "\n"
+        self.source = source
+        self.pos = 0
+        self.lineno = 1
+        self.depth = 0
+        self.indents = [0]
+        self.newlines = 0
+        self.comment = ""
+        self.last_lineno = 0
+        self.has_future_import = False
+
+    def _make(self, type: int, value: str) -> Leaf:
+        prefix = self.comment + "\n" * self.newlines
+        self.comment = ""
+        self.newlines = 0
+        self.last_lineno = self.lineno
+        return Leaf(type, value, prefix, self.lineno)
+
+    def tokenize(self) -> Iterator[Leaf]:
+        """
+        Iterate over leaves.
+        """
+        source = self.source
+        at_line_start = True
+        while True:
+            if at_line_start:
+                at_line_start = False
+                indent_end = _skip(_INDENT_RE, source, self.pos)
+                if indent_end == len(source):
+                    self.pos = indent_end
+                    break
+                char = source[indent_end]
+                if char == "\n":
+                    self.newlines += 1
+                    self.lineno += 1
+                    self.pos = indent_end + 1
+                    at_line_start = True
+                    continue
+                if char == "#":
+                    raise UnsupportedSyntaxError(f"Standalone comment on line {self.lineno}")
+                yield from self._indent(indent_end - self.pos)
+                self.pos = indent_end
+                if source.startswith(("from ", "import "), self.pos):
+                    yield self._import()
+                    yield self._make(NEWLINE, "\n")
+                    self.pos += 1
+                    self.lineno += 1
+                    at_line_start = True
+                    continue
+
+            self.pos = _skip(_SPACES_RE, source, self.pos)
+            if self.pos >= len(source):
+                break
+            char = source[self.pos]
+            if char == "\n":
+                yield from self._newline()
+                at_line_start = not self.depth
+                continue
+            if char == "#":
+                comment = self._comment()
+                self.comment = f"{comment}\n" if self.depth else comment
+                continue
+            if source.startswith('"""', self.pos):
+                yield self._docstring()
+                continue
+            yield from self._token()
+
+        if self.depth:
+            raise UnsupportedSyntaxError("Unclosed bracket")
+        for _ in self.indents[1:]:
+            yield Leaf(DEDENT, "", "", self.lineno)
+        yield self._make(ENDMARKER, "")
+
+    def _newline(self) -> Iterator[Leaf]:
+        self.pos += 1
+        if self.depth:
+            self.newlines += 1
+        else:
+            yield self._make(NEWLINE, "\n")
+        self.lineno += 1
+
+    def _token(self) -> Iterator[Leaf]:
+        match = _TOKEN_RE.match(self.source, self.pos)
+        if not match:
+            raise UnsupportedSyntaxError(
+                f"Unsupported character {self.source[self.pos]!r} on line {self.lineno}"
+            )
+        self.pos = match.end()
+        value = match.group()
+        if match.lastgroup == "name":
+            yield self._make(NAME, value)
+        elif match.lastgroup == "number":
+            yield self._make(NUMBER, value)
+        elif match.lastgroup == "string":
+            yield self._make(STRING, value)
+        elif value == "...":
+            for _ in range(3):
+                yield self._make(DOT, ".")
+        else:
+            if value in "([{":
+                self.depth += 1
+            elif value in ")]}":
+                self.depth -= 1
+            yield self._make(OPERATORS[value], value)
+
+    def _indent(self, column: int) -> Iterator[Leaf]:
+        if column > self.indents[-1]:
+            self.indents.append(column)
+            yield Leaf(INDENT, "", "", self.lineno)
+            return
+        while column < self.indents[-1]:
+            self.indents.pop()
+            yield Leaf(DEDENT, "", "", self.lineno)
+        if column != self.indents[-1]:
+            raise UnsupportedSyntaxError(f"Inconsistent dedent on line {self.lineno}")
+
+    def _import(self) -> Leaf:
+        match = _IMPORT_RE.match(self.source, self.pos)
+        if not match:
+            raise UnsupportedSyntaxError(f"Unsupported import on line {self.lineno}")
+        value = match.group()[:-1]
+        if value.startswith("from __future__ "):
+            self.has_future_import = True
+        leaf = self._make(IMPORT, value)
+        self.lineno += value.count("\n")
+        self.pos = match.end() - 1
+        return leaf
+
+    def _comment(self) -> str:
+        if self.last_lineno != self.lineno or self.comment:
+            raise UnsupportedSyntaxError(f"Standalone comment on line {self.lineno}")
+        end = self.source.find("\n", self.pos)
+        content = self.source[self.pos : end].rstrip()
+        self.pos = end
+        if (
+            not content.startswith("# ")
+            or "\N{NO-BREAK SPACE}" in content
+            or "fmt:" in content
+            or "yapf:" in content
+        ):
+            raise UnsupportedSyntaxError(f"Unsupported comment on line {self.lineno}")
+        if content[1:].lstrip().startswith("type:"):
+            type_part, value_part = content[1:].split(":", 1)
+            content = f"# {type_part.strip()}: {value_part.strip()}"
+        return content
+
+    def _docstring(self) -> Leaf:
+        source = self.source
+        index = self.pos + 3
+        while True:
+            end = source.find('"""', index)
+            slash = source.find("\\", index, end)
+            if end == -1:
+                raise UnsupportedSyntaxError("Unterminated string")
+            if slash == -1:
+                break
+            if source[slash + 1] in _UNSAFE_ESCAPES:
+                raise UnsupportedSyntaxError(f"Unsupported escape on line {self.lineno}")
+            index = slash + 2
+        value = source[self.pos : end + 3]
+        if _BACKSLASH_NEWLINE_RE.search(value):
+            raise UnsupportedSyntaxError(f"Unsupported escape on line {self.lineno}")
+        leaf = self._make(STRING, value)
+        self.lineno += value.count("\n")
+        self.pos = end + 3
+        return leaf
+
+
+class Parser:
+    """
+    Recursive descent parser that builds `blib2to3`-shaped trees.
+
+    Nodes with a single child are collapsed, as `blib2to3` does.
+
+    Arguments:
+        source -- Python source code.
+    """
+
+    def __init__(self, source: str) -> None:
+        tokenizer = Tokenizer(source)
+        self.leaves = list(tokenizer.tokenize())
+        self.index = 0
+        self.has_trailing_comma_in_def = False
+        self.has_trailing_comma_in_call = False
+        if tokenizer.has_future_import:
+            raise UnsupportedSyntaxError("__future__ imports are not supported")
+
+    @property
+    def _current(self) -> Leaf:
+        return self.leaves[self.index]
+
+    def _is(self, type: int, value: str | None = None) -> bool:
+        leaf = self.leaves[self.index]
+        return leaf.type == type and (value is None or leaf.value == value)
+
+    def _take(self, type: int, value: str | None = None) -> Leaf:
+        leaf = self.leaves[self.index]
+        if leaf.type != type or (value is not None and leaf.value != value):
+            raise UnsupportedSyntaxError(f"Unexpected {leaf.value!r} on line {leaf.lineno}")
+        self.index += 1
+        return leaf
+
+    def parse(self) -> Node:
+        """
+        Parse source to `file_input` node.
+        """
+        children: list[LN] = []
+        while not self._is(ENDMARKER):
+            if self._is(NEWLINE):
+                raise UnsupportedSyntaxError("Unexpected empty statement")
+            children.append(self._statement())
+        children.append(self._take(ENDMARKER))
+        return Node(file_input, children)
+
+    def _statement(self) -> LN:
+        leaf = self._current
+        if leaf.type == NAME:
+            if leaf.value == "if":
+                return self._if_stmt()
+            if leaf.value == "class":
+                return self._classdef()
+            if leaf.value == "def":
+                return self._funcdef()
+        if leaf.type == AT:
+            return self._decorated()
+        return self._simple_stmt()
+
+    def _simple_stmt(self) -> Node:
+        if self._is(IMPORT) or self._is(NAME, "pass"):
+            statement: LN = self._take(self._current.type)
+        else:
+            statement = self._expr_stmt()
+        return Node(simple_stmt, [statement, self._take(NEWLINE)])
+
+    def _expr_stmt(self) -> LN:
+        target = self._test()
+        if self._is(COLON):
+            children: list[LN] = [self._take(COLON), self._test()]
+            if self._is(EQUAL):
+                children.extend((self._take(EQUAL), self._test()))
+            return Node(expr_stmt, [target, Node(annassign, children)])
+        if not self._is(EQUAL):
+            return target
+        children = [target]
+        while self._is(EQUAL):
+            children.extend((self._take(EQUAL), self._test()))
+        return Node(expr_stmt, children)
+
+    def _suite(self) -> LN:
+        if not self._is(NEWLINE):
+            return self._simple_stmt()
+        children: list[LN] = [self._take(NEWLINE), self._take(INDENT)]
+        while not self._is(DEDENT):
+            children.append(self._statement())
+        children.append(self._take(DEDENT))
+        return Node(suite, children)
+
+    def _if_stmt(self) -> Node:
+        children: list[LN] = [self._take(NAME, "if"), self._test(), self._take(COLON)]
+        children.append(self._suite())
+        while self._is(NAME, "elif"):
+            children.extend((self._take(NAME), self._test(), self._take(COLON), self._suite()))
+        if self._is(NAME, "else"):
+            children.extend((self._take(NAME), self._take(COLON), self._suite()))
+        return Node(if_stmt, children)
+
+    def _classdef(self) -> Node:
+        children: list[LN] = [self._take(NAME, "class"), self._name()]
+        if self._is(LPAR):
+            children.append(self._take(LPAR))
+            if not self._is(RPAR):
+                children.append(self._arglist())
+            children.append(self._take(RPAR))
+        children.extend((self._take(COLON), self._suite()))
+        return Node(classdef, children)
+
+    def _funcdef(self) -> Node:
+        children: list[LN] = [self._take(NAME, "def"), self._name(), self._parameters()]
+        if self._is(RARROW):
+            children.extend((self._take(RARROW), self._test()))
+        children.extend((self._take(COLON), self._suite()))
+        return Node(funcdef, children)
+
+    def _decorated(self) -> Node:
+        items: list[LN] = []
+        while self._is(AT):
+            at = self._take(AT)
+            expression = self._test()
+            if not _is_simple_decorator(expression):
+                raise UnsupportedSyntaxError(f"Relaxed decorator on line {at.lineno}")
+            items.append(Node(decorator, [at, expression, self._take(NEWLINE)]))
+        if not self._is(NAME, "def") and not self._is(NAME, "class"):
+            raise UnsupportedSyntaxError(f"Unexpected decorated {self._current.value!r}")
+        target = self._funcdef() if self._current.value == "def" else self._classdef()
+        decorators_node = items[0] if len(items) == 1 else Node(decorators, items)
+        return Node(decorated, [decorators_node, target])
+
+    def _parameters(self) -> Node:
+        lpar = self._take(LPAR)
+        children: list[LN] = []
+        while not self._is(RPAR):
+            if self._is(STAR) or self._is(DOUBLESTAR):
+                children.append(self._take(self._current.type))
+                if not self._is(COMMA) and not self._is(RPAR):
+                    children.append(self._tname())
+            else:
+                children.append(self._tname())
+                if self._is(EQUAL):
+                    children.extend((self._take(EQUAL), self._test()))
+            if self._is(RPAR):
+                break
+            children.append(self._take(COMMA))
+        rpar = self._take(RPAR)
+        if not children:
+            return Node(parameters, [lpar, rpar])
+        if len(children) == 1:
+            return Node(parameters, [lpar, children[0], rpar])
+        if children[-1].type == COMMA and any(i.type in VARARGS_SPECIALS for i in children):
+            self.has_trailing_comma_in_def = True
+        return Node(parameters, [lpar, Node(typedargslist, children), rpar])
+
+    def _tname(self) -> LN:
+        name = self._name()
+        if not self._is(COLON):
+            return name
+        return Node(tname, [name, self._take(COLON), self._test()])
+
+    def _name(self) -> Leaf:
+        leaf = self._take(NAME)
+        if leaf.value in KEYWORDS or leaf.value in {"if", "def", "class", "pass"}:
+            raise UnsupportedSyntaxError(f"Unexpected keyword {leaf.value!r}")
+        return leaf
+
+    def _test(self) -> LN:
+        left = self._power()
+        if self._current.type not in COMPARATORS:
+            return left
+        children = [left]
+        while self._current.type in COMPARATORS:
+            children.extend((self._take(self._current.type), self._power()))
+        return Node(comparison, children)
+
+    def _power(self) -> LN:
+        children = [self._atom()]
+        while True:
+            if self._is(DOT):
+                children.append(Node(trailer, [self._take(DOT), self._name()]))
+            elif self._is(LPAR):
+                lpar = self._take(LPAR)
+                if self._is(RPAR):
+                    children.append(Node(trailer, [lpar, self._take(RPAR)]))
+                else:
+                    children.append(Node(trailer, [lpar, self._arglist(), self._take(RPAR)]))
+            elif self._is(LSQB):
+                lsqb = self._take(LSQB)
+                items = self._sequence(RSQB, subscriptlist)
+                children.append(Node(trailer, [lsqb, items, self._take(RSQB)]))
+            else:
+                break
+        if len(children) == 1:
+            return children[0]
+        return Node(power, children)
+
+    def _arglist(self) -> LN:
+        children: list[LN] = []
+        while True:
+            children.append(self._argument())
+            if not self._is(COMMA):
+                break
+            children.append(self._take(COMMA))
+            if self._is(RPAR):
+                break
+        if len(children) == 1:
+            return children[0]
+        if children[-1].type == COMMA and any(
+            isinstance(i, Node) and i.type == argument and i.children[0].type in VARARGS_SPECIALS
+            for i in children
+        ):
+            self.has_trailing_comma_in_call = True
+        return Node(arglist, children)
+
+    def _argument(self) -> LN:
+        if self._is(STAR) or self._is(DOUBLESTAR):
+            return Node(argument, [self._take(self._current.type), self._test()])
+        value = self._test()
+        if not self._is(EQUAL):
+            return value
+        if value.type != NAME:
+            raise UnsupportedSyntaxError(f"Unexpected '=' on line {self._current.lineno}")
+        return Node(argument, [value, self._take(EQUAL), self._test()])
+
+    def _sequence(self, closing: int, node_type: int) -> LN:
+        children: list[LN] = []
+        while True:
+            children.append(self._test())
+            if node_type == dictsetmaker and self._is(COLON):
+                children.extend((self._take(COLON), self._test()))
+            if not self._is(COMMA):
+                break
+            children.append(self._take(COMMA))
+            if self._is(closing):
+                break
+        if len(children) == 1:
+            return children[0]
+        return Node(node_type, children)
+
+    def _atom(self) -> LN:
+        leaf = self._current
+        if leaf.type == NAME:
+            return self._name()
+        if leaf.type == NUMBER:
+            return self._take(NUMBER)
+        if leaf.type == STRING:
+            self._take(STRING)
+            if self._is(STRING):
+                raise UnsupportedSyntaxError(f"Implicit concatenation on line {leaf.lineno}")
+            return leaf
+        if leaf.type == DOT:
+            return Node(atom, [self._take(DOT), self._take(DOT), self._take(DOT)])
+        brackets = {
+            LPAR: (RPAR, testlist_gexp),
+            LSQB: (RSQB, listmaker),
+            LBRACE: (RBRACE, dictsetmaker),
+        }
+        if leaf.type not in brackets:
+            raise UnsupportedSyntaxError(f"Unexpected {leaf.value!r} on line {leaf.lineno}")
+        closing, node_type = brackets[leaf.type]
+        opening = self._take(leaf.type)
+        if self._is(closing):
+            return Node(atom, [opening, self._take(closing)])
+        items = self._sequence(closing, node_type)
+        return Node(atom, [opening, items, self._take(closing)])
+
+
+def _is_simple_decorator(node: LN) -> bool:
+    if node.type == NAME:
+        return True
+    if node.type != power or not isinstance(node, Node) or node.children[0].type != NAME:
+        return False
+    trailers = node.children[1:]
+    for index, child in enumerate(trailers):
+        if not isinstance(child, Node) or child.type != trailer:
+            return False
+        if child.children[0].type == DOT:
+            continue
+        if child.children[0].type != LPAR or index != len(trailers) - 1:
+            return False
+    return True
+
+
+def parse(source: str) -> tuple[Node, bool, bool]:
+    """
+    Parse `source` code.
+
+    Arguments:
+        source -- Python source code.
+
+    Returns:
+        A tuple of tree root, whether function definitions and calls
+        use trailing commas after `*args` and `**kwargs`.
+    """
+    parser = Parser(source)
+    root = parser.parse()
+    return root, parser.has_trailing_comma_in_def, parser.has_trailing_comma_in_call
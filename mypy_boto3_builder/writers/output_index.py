@@ -0,0 +1,84 @@
+"""
+Index of files that exist in output directory before the build.
+"""
+import os
+from pathlib import Path
+
+OutputIndexPaths = dict[Path, dict[str, tuple[Path, ...]]]
+
+
+class OutputIndex:
+    """
+    Index of files that exist in output directory before the build.
+
+    Output directory is scanned once per run and the index is shared by all
+    package writers, worker processes get a copy on start.
+    Files are grouped by top-level directory, so a package gets its files
+    without walking its tree. Files written during the run are not indexed.
+    """
+
+    _paths: OutputIndexPaths = {}
+
+    @classmethod
+    def scan(cls, path: Path) -> None:
+        """
+        Replace index with files from `path`.
+
+        Arguments:
+            path -- Output directory.
+        """
+        groups: dict[str, list[Path]] = {}
+        for dir_path, _dir_names, file_names in os.walk(path):
+            relative_parts = Path(dir_path).relative_to(path).parts
+            group = relative_parts[0] if relative_parts else ""
+            groups.setdefault(group, []).extend(Path(dir_path) / i for i in file_names)
+        cls._paths = {path: {key: tuple(value) for key, value in groups.items()}}
+
+    @classmethod
+    def get_paths(cls) -> OutputIndexPaths:
+        """
+        Get index data to pass to worker processes.
+        """
+        return cls._paths
+
+    @classmethod
+    def set_paths(cls, paths: OutputIndexPaths) -> None:
+        """
+        Set index data from parent process.
+
+        Arguments:
+            paths -- Result of `get_paths`.
+        """
+        cls._paths = paths
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drop index.
+        """
+        cls._paths = {}
+
+    @classmethod
+    def get_files(cls, path: Path) -> list[Path]:
+        """
+        Get files inside `path`.
+
+        If `path` is not in the index, its tree is walked.
+
+        Arguments:
+            path -- Package output directory.
+
+        Returns:
+            File paths.
+        """
+        for root_path, groups in cls._paths.items():
+            if path == root_path:
+                return [i for group_paths in groups.values() for i in group_paths]
+            if path.is_relative_to(root_path):
+                group = path.relative_to(root_path).parts[0]
+                return [i for i in groups.get(group, ()) if i.is_relative_to(path)]
+
+        result: list[Path] = []
+        for dir_path, _dir_names, file_names in os.walk(path):
+            result.extend(Path(dir_path) / i for i in file_names)
+        return result
@@ -0,0 +1,167 @@
+"""
+Manifest of files written to an output directory.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+ManifestEntry = dict[str, Any]
+
+
+class OutputManifest:
+    """
+    Manifest of files written to an output directory.
+
+    Keeps size, modification time and content hash of every written file,
+    so unchanged files are skipped without reading them back.
+    File stat is a sanity check: a file changed outside of the builder
+    is compared by content instead.
+
+    Copied files also keep size and modification time of their source,
+    so they are read and copied only when their source changes.
+
+    Manifest file is kept outside of output directory, so it never gets
+    into generated packages.
+
+    Arguments:
+        path -- Output directory.
+        manifest_path -- Manifest file path, if not set only written files are tracked.
+    """
+
+    def __init__(self, path: Path, manifest_path: Path | None = None) -> None:
+        self.path = path
+        self.manifest_path = manifest_path
+        entries = self._load()
+        self.is_loaded = entries is not None
+        self._entries = entries or {}
+        self._written: dict[str, ManifestEntry] = {}
+
+    @staticmethod
+    def get_hash(content: str) -> str:
+        """
+        Get content hash.
+
+        Arguments:
+            content -- File content.
+
+        Returns:
+            Hex digest.
+        """
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def write_text(self, file_path: Path, content: str, source_path: Path | None = None) -> bool:
+        """
+        Write `content` to `file_path` if file content is different.
+
+        Arguments:
+            file_path -- Path to a file inside output directory.
+            content -- File content.
+            source_path -- Path to a source file, if `content` is its copy.
+
+        Returns:
+            True if file has been written.
+        """
+        key = self._get_key(file_path)
+        content_hash = self.get_hash(content)
+        entry = self._get_valid_entry(key, file_path)
+        if entry is not None:
+            is_changed = entry["hash"] != content_hash
+        else:
+            is_changed = not file_path.exists() or file_path.read_text() != content
+
+        if is_changed:
+            file_path.parent.mkdir(exist_ok=True, parents=True)
+            file_path.write_text(content)
+
+        entry = {"hash": content_hash, "stat": self._get_stat(file_path)}
+        if source_path is not None:
+            entry["source_stat"] = self._get_stat(source_path)
+        self._written[key] = entry
+        return is_changed
+
+    def copy_file(self, file_path: Path, source_path: Path) -> bool:
+        """
+        Copy `source_path` to `file_path` if source has been changed since the last copy.
+
+        Arguments:
+            file_path -- Path to a file inside output directory.
+            source_path -- Path to a source file.
+
+        Returns:
+            True if file has been written.
+        """
+        key = self._get_key(file_path)
+        entry = self._get_valid_entry(key, file_path)
+        if entry is not None and entry.get("source_stat") == self._get_stat(source_path):
+            self._written[key] = entry
+            return False
+
+        return self.write_text(file_path, source_path.read_text(), source_path)
+
+    def get_stale_paths(self) -> list[Path]:
+        """
+        Get files from manifest that have not been written since it was loaded.
+        """
+        return [self.path / key for key in self._entries if key not in self._written]
+
+    def save(self) -> None:
+        """
+        Save written files to manifest, if they are changed.
+        """
+        if not self.manifest_path:
+            return
+        if self.is_loaded and self._written == self._entries:
+            return
+
+        data = {"files": dict(sorted(self._written.items()))}
+        try:
+            self.manifest_path.parent.mkdir(exist_ok=True, parents=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.manifest_path.parent, delete=False
+            ) as stream:
+                json.dump(data, stream)
+            os.replace(stream.name, self.manifest_path)
+        except OSError as e:
+            get_logger().debug(f"Cannot write manifest {NicePath(self.manifest_path)}: {e}")
+            return
+
+        self._entries = self._written.copy()
+        self.is_loaded = True
+
+    def _load(self) -> dict[str, ManifestEntry] | None:
+        if not self.manifest_path:
+            return None
+        try:
+            data = json.loads(self.manifest_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("files"), dict):
+            return None
+        result: dict[str, ManifestEntry] = data["files"]
+        return result
+
+    def _get_key(self, file_path: Path) -> str:
+        return file_path.relative_to(self.path).as_posix()
+
+    @staticmethod
+    def _get_stat(path: Path) -> list[int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _get_valid_entry(self, key: str, file_path: Path) -> ManifestEntry | None:
+        entry = self._entries.get(key)
+        if not isinstance(entry, dict) or "hash" not in entry:
+            return None
+        stat = entry.get("stat")
+        if stat is None or stat != self._get_stat(file_path):
+            return None
+        return entry
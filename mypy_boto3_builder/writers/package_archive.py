@@ -0,0 +1,251 @@
+"""
+Reproducible wheel and sdist archives for generated packages.
+"""
+import ast
+import base64
+import gzip
+import hashlib
+import io
+import os
+import re
+import stat
+import tarfile
+import time
+import zipfile
+from collections.abc import Iterator, Mapping
+from fnmatch import fnmatchcase
+from typing import IO, Any, cast
+
+from mypy_boto3_builder.constants import ARCHIVE_TIMESTAMP, PACKAGE_NAME
+
+
+class PackageArchiveError(Exception):
+    """
+    Main error for PackageArchive.
+    """
+
+
+class PackageArchive:
+    """
+    Reproducible wheel and sdist archives for a generated package.
+
+    Package metadata is read from rendered `setup.py` keyword arguments,
+    so archives are built in memory without running `setup.py`.
+    All archive entries have the same timestamp, taken from `SOURCE_DATE_EPOCH`
+    environment variable if it is set.
+
+    Arguments:
+        files -- Map of a file path relative to `setup.py` directory to file content.
+    """
+
+    SETUP_FILE_NAME = "setup.py"
+    README_FILE_NAME = "README.md"
+    WHEEL_TAG = "py3-none-any"
+    FILE_MODE = 0o644
+    LICENSE_FILE_PATTERNS = ("LICEN[CS]E*", "COPYING*", "NOTICE*", "AUTHORS*")
+
+    def __init__(self, files: Mapping[str, str]) -> None:
+        self.files = {key: files[key].encode() for key in sorted(files)}
+        self.setup_kwargs = self._parse_setup_kwargs(
+            files[self.SETUP_FILE_NAME], files.get(self.README_FILE_NAME, "")
+        )
+        self.name: str = self.setup_kwargs["name"]
+        self.version: str = self.setup_kwargs["version"]
+        self.timestamp = self._get_timestamp()
+
+    @property
+    def safe_name(self) -> str:
+        """
+        Distribution name for archive file names.
+        """
+        return re.sub(r"[-_.]+", "_", self.name).lower()
+
+    @property
+    def wheel_file_name(self) -> str:
+        """
+        Wheel archive file name.
+        """
+        return f"{self.safe_name}-{self.version}-{self.WHEEL_TAG}.whl"
+
+    @property
+    def sdist_file_name(self) -> str:
+        """
+        Source distribution archive file name.
+        """
+        return f"{self.safe_name}-{self.version}.tar.gz"
+
+    @property
+    def license_file_names(self) -> list[str]:
+        """
+        License files in `setup.py` directory, matched the same way as `setuptools` does.
+        """
+        return [
+            path
+            for path in self.files
+            if "/" not in path
+            and any(fnmatchcase(path, pattern) for pattern in self.LICENSE_FILE_PATTERNS)
+        ]
+
+    def get_metadata(self) -> str:
+        """
+        Get core metadata for `METADATA` and `PKG-INFO` files.
+        """
+        kwargs = self.setup_kwargs
+        lines = [
+            "Metadata-Version: 2.1",
+            f"Name: {self.name}",
+            f"Version: {self.version}",
+        ]
+        fields = (
+            ("Summary", "description"),
+            ("Home-page", "url"),
+            ("Author", "author"),
+            ("Author-email", "author_email"),
+            ("License", "license"),
+        )
+        lines.extend(f"{field}: {kwargs[key]}" for field, key in fields if key in kwargs)
+        lines.extend(f"Project-URL: {k}, {v}" for k, v in kwargs.get("project_urls", {}).items())
+        if "keywords" in kwargs:
+            lines.append(f"Keywords: {kwargs['keywords']}")
+        lines.extend(f"Classifier: {i}" for i in kwargs.get("classifiers", []))
+        if "python_requires" in kwargs:
+            lines.append(f"Requires-Python: {kwargs['python_requires']}")
+        if "long_description_content_type" in kwargs:
+            lines.append(f"Description-Content-Type: {kwargs['long_description_content_type']}")
+        lines.extend(f"Requires-Dist: {i}" for i in kwargs.get("install_requires", []))
+        for extra, requirements in kwargs.get("extras_require", {}).items():
+            lines.append(f"Provides-Extra: {extra}")
+            lines.extend(f"Requires-Dist: {self._add_extra_marker(i, extra)}" for i in requirements)
+        lines.extend(f"License-File: {i}" for i in self.license_file_names)
+
+        return "\n".join((*lines, "", kwargs.get("long_description", "")))
+
+    def build_wheel(self) -> bytes:
+        """
+        Build wheel archive with package files and `.dist-info` directory with license files.
+
+        Returns:
+            Archive content.
+        """
+        dist_info_path = f"{self.safe_name}-{self.version}.dist-info"
+        entries = dict(self._iterate_wheel_files())
+        for license_file_name in self.license_file_names:
+            entries[f"{dist_info_path}/{license_file_name}"] = self.files[license_file_name]
+        entries[f"{dist_info_path}/METADATA"] = self.get_metadata().encode()
+        entries[f"{dist_info_path}/WHEEL"] = "\n".join(
+            (
+                "Wheel-Version: 1.0",
+                f"Generator: {PACKAGE_NAME}",
+                "Root-Is-Purelib: true",
+                f"Tag: {self.WHEEL_TAG}",
+                "",
+            )
+        ).encode()
+        entries[f"{dist_info_path}/top_level.txt"] = "".join(
+            f"{i}\n" for i in self.setup_kwargs.get("packages", [])
+        ).encode()
+        record_path = f"{dist_info_path}/RECORD"
+        record_lines = [
+            f"{path},{self._get_record_hash(data)},{len(data)}" for path, data in entries.items()
+        ]
+        record_lines.append(f"{record_path},,")
+        entries[record_path] = "".join(f"{i}\n" for i in record_lines).encode()
+
+        stream = io.BytesIO()
+        date_time = time.gmtime(self.timestamp)[:6]
+        with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for path, data in entries.items():
+                zip_info = zipfile.ZipInfo(path, date_time=date_time)
+                zip_info.create_system = 3
+                zip_info.external_attr = (stat.S_IFREG | self.FILE_MODE) << 16
+                zip_info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(zip_info, data)
+        return stream.getvalue()
+
+    def build_sdist(self) -> bytes:
+        """
+        Build source distribution archive with all package files and `PKG-INFO`.
+
+        Returns:
+            Archive content.
+        """
+        root_path = f"{self.safe_name}-{self.version}"
+        entries = {**self.files, "PKG-INFO": self.get_metadata().encode()}
+
+        stream = io.BytesIO()
+        with gzip.GzipFile(filename="", mode="wb", fileobj=stream, mtime=self.timestamp) as gz:
+            with tarfile.open(
+                fileobj=cast(IO[bytes], gz), mode="w", format=tarfile.PAX_FORMAT
+            ) as archive:
+                for path in sorted(entries):
+                    data = entries[path]
+                    tar_info = tarfile.TarInfo(f"{root_path}/{path}")
+                    tar_info.size = len(data)
+                    tar_info.mtime = self.timestamp
+                    tar_info.mode = self.FILE_MODE
+                    archive.addfile(tar_info, io.BytesIO(data))
+        return stream.getvalue()
+
+    def _iterate_wheel_files(self) -> Iterator[tuple[str, bytes]]:
+        packages: list[str] = self.setup_kwargs.get("packages", [])
+        package_data: dict[str, list[str]] = self.setup_kwargs.get("package_data", {})
+        for path, data in self.files.items():
+            for package in packages:
+                prefix = f"{package.replace('.', '/')}/"
+                if not path.startswith(prefix):
+                    continue
+                relative_path = path[len(prefix) :]
+                patterns = ["*.py", *package_data.get(package, [])]
+                if any(self._match(relative_path, pattern) for pattern in patterns):
+                    yield path, data
+                    break
+
+    @staticmethod
+    def _match(path: str, pattern: str) -> bool:
+        path_parts = path.split("/")
+        pattern_parts = pattern.split("/")
+        if len(path_parts) != len(pattern_parts):
+            return False
+        return all(fnmatchcase(i, j) for i, j in zip(path_parts, pattern_parts))
+
+    @staticmethod
+    def _add_extra_marker(requirement: str, extra: str) -> str:
+        requirement, _, marker = requirement.partition(";")
+        extra_marker = f'extra == "{extra}"'
+        if marker.strip():
+            extra_marker = f"({marker.strip()}) and {extra_marker}"
+        return f"{requirement.strip()}; {extra_marker}"
+
+    @staticmethod
+    def _get_record_hash(data: bytes) -> str:
+        digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest())
+        return f"sha256={digest.rstrip(b'=').decode()}"
+
+    @staticmethod
+    def _get_timestamp() -> int:
+        source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        if not source_date_epoch:
+            return ARCHIVE_TIMESTAMP
+        return max(int(source_date_epoch), ARCHIVE_TIMESTAMP)
+
+    @staticmethod
+    def _parse_setup_kwargs(setup_content: str, long_description: str) -> dict[str, Any]:
+        for node in ast.walk(ast.parse(setup_content)):
+            if not isinstance(node, ast.Call):
+                continue
+            if not isinstance(node.func, ast.Name) or node.func.id != "setup":
+                continue
+
+            result: dict[str, Any] = {"long_description": long_description}
+            for keyword in node.keywords:
+                if keyword.arg is None or keyword.arg == "long_description":
+                    continue
+                try:
+                    result[keyword.arg] = ast.literal_eval(keyword.value)
+                except ValueError as e:
+                    raise PackageArchiveError(f"Unsupported setup argument {keyword.arg}") from e
+            if "name" not in result or "version" not in result:
+                raise PackageArchiveError("setup call has no name or version")
+            return result
+
+        raise PackageArchiveError("setup call not found")
@@ -1,16 +1,32 @@
 """
 Writer for package static and template files.
 """
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 from typing import Sequence
 
+from mypy_boto3_builder.constants import (
+    ARCHIVES_DIR_NAME,
+    OUTPUT_MANIFEST_DIR_NAME,
+    OutputFormat,
+)
 from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.package import Package
 from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.utils.build_manifest import BUILD_MANIFEST_NAME, get_builder_hash
 from mypy_boto3_builder.utils.markdown import fix_pypi_headers
 from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.profiler import Profiler
+from mypy_boto3_builder.writers.formatter_cache import FormatterCache
+from mypy_boto3_builder.writers.memory_output import MemoryOutput
+from mypy_boto3_builder.writers.native_formatter.errors import UnsupportedSyntaxError
+from mypy_boto3_builder.writers.native_formatter.formatter import format_code
+from mypy_boto3_builder.writers.native_formatter.imports import sort_imports as native_sort_imports
+from mypy_boto3_builder.writers.output_index import OutputIndex
+from mypy_boto3_builder.writers.output_manifest import OutputManifest
+from mypy_boto3_builder.writers.package_archive import PackageArchive
 from mypy_boto3_builder.writers.utils import (
     blackify,
     format_md,
@@ -24,15 +40,27 @@ class PackageWriter:
     """
     Writer for package static and template files.
 
+    Packages with setup files are written as source trees, wheel and sdist archives,
+    depending on `output_formats`. Archives are built in memory and saved to `dist` directory.
+    If `MemoryOutput` is enabled, files are stored there instead of being written to disk.
+
     Arguments:
         output_path -- Output path
         generate_setup -- Whether to generate setup files
     """
 
+    native_format = False
+    native_format_template_names = frozenset(i.template_name for i in ServiceModuleName)
+    output_formats: tuple[OutputFormat, ...] = (OutputFormat.source,)
+
     def __init__(self, output_path: Path, generate_setup: bool = True) -> None:
         self.output_path = output_path
         self.generate_setup = generate_setup
         self.logger = get_logger()
+        self.write_source = not generate_setup or OutputFormat.source in self.output_formats
+        self.archive_formats = [
+            i for i in self.output_formats if generate_setup and i != OutputFormat.source
+        ]
 
     def _get_package_path(self, package: Package) -> Path:
         if self.generate_setup:
@@ -49,19 +77,80 @@ class PackageWriter:
     def _get_setup_path(self, package: Package) -> Path:
         return self.output_path / package.directory_name
 
-    def _write_static_paths(self, static_files_path: Path | None, package_path: Path) -> list[Path]:
+    def _get_manifest_path(self, path: Path) -> Path:
+        name = ".".join(path.relative_to(self.output_path).parts) or "__root__"
+        return self.output_path / BUILD_MANIFEST_NAME / OUTPUT_MANIFEST_DIR_NAME / f"{name}.json"
+
+    @staticmethod
+    def _get_static_paths(static_files_path: Path | None, package_path: Path) -> dict[Path, Path]:
         if not static_files_path:
-            return []
-        result: list[Path] = []
+            return {}
+        result: dict[Path, Path] = {}
         for static_path in static_files_path.glob("**/*.pyi"):
             relative_output_path = static_path.relative_to(static_files_path)
-            file_path = package_path / relative_output_path
-            result.append(file_path)
-            file_path.parent.mkdir(exist_ok=True, parents=True)
-            content = static_path.read_text()
-            if not file_path.exists() or file_path.read_text() != content:
-                file_path.write_text(content)
+            result[package_path / relative_output_path] = static_path
+        return result
+
+    def _write_static_paths(
+        self, static_paths: Mapping[Path, Path], manifest: OutputManifest
+    ) -> None:
+        for file_path, static_path in static_paths.items():
+            if manifest.copy_file(file_path, static_path):
                 self.logger.debug(f"Updated {NicePath(file_path)}")
+
+    def _write_tree(
+        self,
+        output_path: Path,
+        files: Mapping[Path, str],
+        static_paths: Mapping[Path, Path] | None = None,
+    ) -> None:
+        static_paths = static_paths or {}
+        if MemoryOutput.enabled:
+            for file_path, static_path in static_paths.items():
+                MemoryOutput.add(file_path, static_path.read_bytes())
+            for file_path, content in files.items():
+                MemoryOutput.add(file_path, content.encode())
+            return
+
+        manifest = OutputManifest(output_path, self._get_manifest_path(output_path))
+        self._write_static_paths(static_paths, manifest)
+        self._write_files(files, manifest)
+        self._cleanup((*files, *static_paths), manifest)
+        manifest.save()
+
+    def _write_files(self, files: Mapping[Path, str], manifest: OutputManifest) -> None:
+        for file_path, content in files.items():
+            with Profiler.span("write_file", file=str(NicePath(file_path))):
+                if manifest.write_text(file_path, content):
+                    self.logger.debug(f"Rendered {NicePath(file_path)}")
+
+    def _write_archives(self, package: Package, files: Mapping[Path, str]) -> list[Path]:
+        if not self.archive_formats:
+            return []
+
+        setup_path = self._get_setup_path(package)
+        archive = PackageArchive(
+            {path.relative_to(setup_path).as_posix(): content for path, content in files.items()}
+        )
+        archives_path = self.output_path / ARCHIVES_DIR_NAME
+        result: list[Path] = []
+        for output_format in self.archive_formats:
+            with Profiler.span(output_format.value, package=package.pypi_name):
+                if output_format == OutputFormat.wheel:
+                    file_path = archives_path / archive.wheel_file_name
+                    data = archive.build_wheel()
+                else:
+                    file_path = archives_path / archive.sdist_file_name
+                    data = archive.build_sdist()
+            result.append(file_path)
+            if MemoryOutput.enabled:
+                MemoryOutput.add(file_path, data)
+                continue
+            if file_path.exists() and file_path.read_bytes() == data:
+                continue
+            archives_path.mkdir(exist_ok=True, parents=True)
+            file_path.write_bytes(data)
+            self.logger.debug(f"Built {NicePath(file_path)}")
         return result
 
     def _get_setup_template_paths(
@@ -100,42 +189,104 @@ class PackageWriter:
         package: Package,
         file_paths: list[tuple[Path, Path]],
         service_name: ServiceName | None = None,
-    ) -> None:
+    ) -> dict[Path, str]:
+        result: dict[Path, str] = {}
         for file_path, template_path in file_paths:
+            with Profiler.span("render", file=str(NicePath(file_path))):
+                result[file_path] = self._render_template(
+                    package, file_path, template_path, service_name
+                )
+        return result
+
+    def _render_template(
+        self,
+        package: Package,
+        file_path: Path,
+        template_path: Path,
+        service_name: ServiceName | None,
+    ) -> str:
+        with Profiler.span("jinja"):
             content = render_jinja2_template(
                 template_path,
                 package=package,
                 service_name=service_name,
             )
-            if file_path.suffix in [".py", ".pyi"]:
-                content = sort_imports(
-                    content,
-                    package.name,
-                    extension="pyi",
-                    third_party=[
-                        "boto3",
-                        "botocore",
-                        "aiobotocore",
-                        *(
-                            [i.module_name for i in package.service_names]
-                            if not service_name
-                            else [service_name.module_name]
-                        ),
-                    ],
-                )
-                content = blackify(content, file_path)
-            if file_path.suffix == ".md":
+        if file_path.suffix in [".py", ".pyi"]:
+            third_party = [
+                "boto3",
+                "botocore",
+                "aiobotocore",
+                *(
+                    [i.module_name for i in package.service_names]
+                    if not service_name
+                    else [service_name.module_name]
+                ),
+            ]
+            content = self._format_python(
+                content, file_path, template_path, package.name, third_party
+            )
+        if file_path.suffix == ".md":
+            with Profiler.span("format_md"):
                 content = insert_md_toc(content)
                 content = fix_pypi_headers(content)
                 content = format_md(content)
-            if not file_path.parent.exists():
-                file_path.parent.mkdir(exist_ok=True, parents=True)
-            if not file_path.exists() or file_path.read_text() != content:
-                file_path.write_text(content)
-                self.logger.debug(f"Rendered {NicePath(file_path)}")
-
-    def _cleanup(self, valid_paths: Sequence[Path], output_path: Path) -> None:
-        for unknown_path in NicePath(output_path).walk(valid_paths):
+        return content
+
+    @classmethod
+    def enable_native_format(cls) -> None:
+        """
+        Format service modules with native formatter instead of `isort` and `black`.
+        """
+        cls.native_format = True
+
+    @classmethod
+    def set_output_formats(cls, output_formats: Iterable[OutputFormat]) -> None:
+        """
+        Select output formats for packages with setup files.
+
+        Arguments:
+            output_formats -- Source tree, wheel or sdist archive.
+        """
+        cls.output_formats = tuple(output_formats)
+
+    def _format_python(
+        self,
+        content: str,
+        file_path: Path,
+        template_path: Path,
+        module_name: str,
+        third_party: list[str],
+    ) -> str:
+        if self.native_format and template_path.name in self.native_format_template_names:
+            is_pyi = file_path.suffix == ".pyi"
+            cache_key = FormatterCache.get_key(
+                content, "native", get_builder_hash(), module_name, third_party, is_pyi
+            )
+            cached_content = FormatterCache.get(cache_key)
+            if cached_content is not None:
+                return cached_content
+            try:
+                with Profiler.span("native_format"):
+                    content = native_sort_imports(
+                        content, module_name, extension="pyi", third_party=third_party
+                    )
+                    result = format_code(content, is_pyi=is_pyi)
+                FormatterCache.set(cache_key, result)
+                return result
+            except UnsupportedSyntaxError as e:
+                self.logger.debug(f"Native formatter skipped {NicePath(file_path)}: {e}")
+
+        with Profiler.span("isort"):
+            content = sort_imports(content, module_name, extension="pyi", third_party=third_party)
+        with Profiler.span("black"):
+            return blackify(content, file_path)
+
+    def _cleanup(self, valid_paths: Iterable[Path], manifest: OutputManifest) -> None:
+        valid_path_strs = {i.as_posix() for i in valid_paths}
+        candidates = {*OutputIndex.get_files(manifest.path), *manifest.get_stale_paths()}
+        for unknown_path in sorted(candidates):
+            if unknown_path.as_posix() in valid_path_strs or not unknown_path.exists():
+                continue
             unknown_path.unlink()
             self.logger.debug(f"Deleted {NicePath(unknown_path)}")
 
@@ -156,24 +307,27 @@ class PackageWriter:
             exclude_template_names -- Do not render templates with these names
         """
         package_path = self._get_package_path(package)
-
-        static_paths = self._write_static_paths(static_files_path, package_path)
+        static_paths = self._get_static_paths(static_files_path, package_path)
         file_paths: list[tuple[Path, Path]] = [
             *self._get_setup_template_paths(package, templates_path),
             *self._get_package_template_paths(package, templates_path),
         ]
         file_paths = [i for i in file_paths if i[1].name not in exclude_template_names]
-        self._render_templates(package, file_paths)
+        files = self._render_templates(package, file_paths)
+
+        if self.write_source:
+            output_path = self._get_setup_path(package) if self.generate_setup else package_path
+            self._write_tree(output_path, files, static_paths)
 
-        valid_paths = (*dict(file_paths).keys(), *static_paths)
-        output_path = self._get_setup_path(package) if self.generate_setup else package_path
-        self._cleanup(valid_paths, output_path)
+        if self.archive_formats:
+            static_files = {path: i.read_text() for path, i in static_paths.items()}
+            self._write_archives(package, {**files, **static_files})
 
     def write_docs(self, package: Package, templates_path: Path) -> None:
         """
         Generate docs for a package.
         """
-        self.output_path.mkdir(exist_ok=True, parents=True)
+        manifest = OutputManifest(self.output_path, self._get_manifest_path(self.output_path))
         file_paths = []
         for template_path in templates_path.glob("**/*.jinja2"):
             file_name = template_path.name.rsplit(".", 1)[0]
@@ -186,9 +340,13 @@ class PackageWriter:
             )
             content = insert_md_toc(content)
             content = format_md(content)
-            if not file_path.exists() or file_path.read_text() != content:
-                file_path.write_text(content)
+            if MemoryOutput.enabled:
+                MemoryOutput.add(file_path, content.encode())
+                continue
+            if manifest.write_text(file_path, content):
                 self.logger.debug(f"Updated {NicePath(file_path)}")
+        if not MemoryOutput.enabled:
+            manifest.save()
 
     def _get_service_package_template_paths(
         self, package: ServicePackage, templates_path: Path
@@ -278,37 +436,47 @@ class PackageWriter:
             )
         return file_paths
 
-    def write_service_package(self, package: ServicePackage, templates_path: Path) -> None:
+    def write_service_package(self, package: ServicePackage, templates_path: Path) -> list[Path]:
         """
         Create stubs files for service.
 
         Arguments:
             package -- Service package.
+
+        Returns:
+            Generated file paths.
         """
         file_paths: list[tuple[Path, Path]] = [
             *self._get_setup_template_paths(package, templates_path),
             *self._get_service_package_template_paths(package, templates_path),
         ]
-        self._render_templates(package, file_paths, service_name=package.service_name)
+        files = self._render_templates(package, file_paths, service_name=package.service_name)
 
-        valid_paths = list(dict(file_paths).keys())
-        output_path = (
-            self._get_setup_path(package)
-            if self.generate_setup
-            else self._get_service_package_path(package)
-        )
-        self._cleanup(valid_paths, output_path)
+        result: list[Path] = []
+        if self.write_source:
+            output_path = (
+                self._get_setup_path(package)
+                if self.generate_setup
+                else self._get_service_package_path(package)
+            )
+            self._write_tree(output_path, files)
+            result.extend(files)
 
-    def write_service_docs(self, package: ServicePackage, templates_path: Path) -> None:
+        result.extend(self._write_archives(package, files))
+        return result
+
+    def write_service_docs(self, package: ServicePackage, templates_path: Path) -> list[Path]:
         """
         Create service docs files.
 
         Arguments:
             package -- Service package.
             output_path -- Path to output folder.
+
+        Returns:
+            Generated file paths.
         """
         docs_path = self.output_path / f"{package.name}"
-        docs_path.mkdir(exist_ok=True, parents=True)
         file_paths = [
             (docs_path / "README.md", templates_path / "README.md.jinja2"),
             (docs_path / "client.md", templates_path / "client.md.jinja2"),
@@ -333,6 +501,6 @@ class PackageWriter:
                 (docs_path / "service_resource.md", templates_path / "service_resource.md.jinja2")
             )
 
-        self._render_templates(package, file_paths, service_name=package.service_name)
-        valid_paths = list(dict(file_paths).keys())
-        self._cleanup(valid_paths, docs_path)
+        files = self._render_templates(package, file_paths, service_name=package.service_name)
+        self._write_tree(docs_path, files)
+        return list(files)
@@ -15,14 +15,16 @@ from mypy_boto3_builder.constants import (
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.parsers.boto3_stubs_package import parse_boto3_stubs_package
 from mypy_boto3_builder.parsers.master_package import parse_master_package
-from mypy_boto3_builder.parsers.service_package import parse_service_package
+from mypy_boto3_builder.parsers.service_package_cache import ServicePackageCache
 from mypy_boto3_builder.parsers.service_package_postprocessor import ServicePackagePostprocessor
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
 from mypy_boto3_builder.structures.botocore_stubs_package import BotocoreStubsPackage
 from mypy_boto3_builder.structures.master_package import MasterPackage
 from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.utils.build_manifest import BuildManifest, get_service_fingerprint
 from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.profiler import Profiler
 from mypy_boto3_builder.writers.package_writer import PackageWriter
 
 
@@ -171,7 +173,8 @@ def process_service(
     generate_setup: bool,
     service_names: Iterable[ServiceName],
     version: str,
-) -> ServicePackage:
+    incremental: bool = False,
+) -> ServicePackage | None:
     """
     Parse and write service package `mypy_boto3_*`.
 
@@ -182,28 +185,49 @@ def process_service(
         generate_setup -- Generate ready-to-install or to-use package
         service_names -- List of known service names
         version -- Package version
+        incremental -- Skip package if its inputs did not change since the last build
 
     Return:
-        Parsed ServicePackage.
+        Parsed ServicePackage or None if package is up to date.
     """
     logger = get_logger()
+    templates_path = TEMPLATES_PATH / "boto3_service"
+    manifest = BuildManifest(output_path)
+    manifest_key = f"{templates_path.name}-{service_name.name}"
+    fingerprint = ""
+    if incremental:
+        fingerprint = get_service_fingerprint(
+            session,
+            service_name,
+            service_names,
+            templates=templates_path.name,
+            generate_setup=generate_setup,
+            version=version,
+        )
+        if manifest.is_up_to_date(manifest_key, fingerprint):
+            logger.info(f"Skipping {service_name.module_name} {version}, up to date")
+            return None
+
     logger.debug(f"Parsing {service_name.boto3_name}")
-    service_package = parse_service_package(session, service_name)
+    with Profiler.span("parse", service=service_name.boto3_name):
+        service_package = ServicePackageCache.get(session, service_name)
     service_package.version = version
     service_package.extend_literals(service_names)
 
-    postprocessor = ServicePackagePostprocessor(service_package)
-    postprocessor.generate_docstrings()
+    with Profiler.span("postprocess", service=service_name.boto3_name):
+        postprocessor = ServicePackagePostprocessor(service_package)
+        postprocessor.generate_docstrings()
 
-    for typed_dict in service_package.typed_dicts:
-        typed_dict.replace_self_references()
     logger.debug(f"Writing {service_name.boto3_name} to {NicePath(output_path)}")
 
-    package_writer = PackageWriter(output_path=output_path, generate_setup=generate_setup)
-    package_writer.write_service_package(
-        service_package,
-        templates_path=TEMPLATES_PATH / "boto3_service",
-    )
+    with Profiler.span("write", service=service_name.boto3_name):
+        package_writer = PackageWriter(output_path=output_path, generate_setup=generate_setup)
+        file_paths = package_writer.write_service_package(
+            service_package,
+            templates_path=templates_path,
+        )
+    if incremental:
+        manifest.update(manifest_key, fingerprint, file_paths)
     return service_package
 
 
@@ -212,7 +236,8 @@ def process_service_docs(
     service_name: ServiceName,
     output_path: Path,
     service_names: Iterable[ServiceName],
-) -> ServicePackage:
+    incremental: bool = False,
+) -> ServicePackage | None:
     """
     Parse and write service package docs.
 
@@ -221,28 +246,46 @@ def process_service_docs(
         service_name -- Target service name
         output_path -- Package output path
         service_names -- List of known service names
+        incremental -- Skip docs if their inputs did not change since the last build
 
     Return:
-        Parsed ServicePackage.
+        Parsed ServicePackage or None if docs are up to date.
     """
     logger = get_logger()
+    templates_path = TEMPLATES_PATH / "boto3_service_docs"
+    manifest = BuildManifest(output_path)
+    manifest_key = f"{templates_path.name}-{service_name.name}"
+    fingerprint = ""
+    if incremental:
+        fingerprint = get_service_fingerprint(
+            session,
+            service_name,
+            service_names,
+            templates=templates_path.name,
+        )
+        if manifest.is_up_to_date(manifest_key, fingerprint):
+            logger.info(f"Skipping {service_name.module_name} docs, up to date")
+            return None
+
     logger.debug(f"Parsing {service_name.boto3_name}")
-    service_package = parse_service_package(session, service_name)
+    with Profiler.span("parse", service=service_name.boto3_name):
+        service_package = ServicePackageCache.get(session, service_name)
     service_package.extend_literals(service_names)
 
-    postprocessor = ServicePackagePostprocessor(service_package)
-    postprocessor.generate_docstrings()
-
-    for typed_dict in service_package.typed_dicts:
-        typed_dict.replace_self_references()
+    with Profiler.span("postprocess", service=service_name.boto3_name):
+        postprocessor = ServicePackagePostprocessor(service_package)
+        postprocessor.generate_docstrings()
 
     logger.debug(f"Writing {service_name.boto3_name} to {NicePath(output_path)}")
 
-    package_writer = PackageWriter(output_path=output_path)
-    package_writer.write_service_docs(
-        service_package,
-        templates_path=TEMPLATES_PATH / "boto3_service_docs",
-    )
+    with Profiler.span("write", service=service_name.boto3_name):
+        package_writer = PackageWriter(output_path=output_path)
+        file_paths = package_writer.write_service_docs(
+            service_package,
+            templates_path=templates_path,
+        )
+    if incremental:
+        manifest.update(manifest_key, fingerprint, file_paths)
     return service_package
 
 
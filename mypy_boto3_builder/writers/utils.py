@@ -6,8 +6,10 @@ from pathlib import Path
 
 import black
 import mdformat
+from black import __version__ as black_version
 from black.parsing import InvalidInput
 from black.report import NothingChanged
+from isort import __version__ as isort_version
 from isort.api import sort_code_string
 from isort.settings import Config
 
@@ -16,6 +18,7 @@ from mypy_boto3_builder.jinja_manager import JinjaManager
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.package import Package
 from mypy_boto3_builder.utils.markdown import TableOfContents
+from mypy_boto3_builder.writers.formatter_cache import FormatterCache
 
 
 def blackify(content: str, file_path: Path) -> str:
@@ -23,6 +26,7 @@ def blackify(content: str, file_path: Path) -> str:
     Format `content` with `black` if `file_path` is `*.py` or `*.pyi`.
 
     On error writes invalid `content` to `file_path` to check for errors.
+    Results are cached in `FormatterCache`.
 
     Arguments:
         content -- Python code to format.
@@ -37,7 +41,13 @@ def blackify(content: str, file_path: Path) -> str:
     if file_path.suffix not in (".py", ".pyi"):
         return content
 
-    file_mode = black.FileMode(is_pyi=file_path.suffix == ".pyi", line_length=LINE_LENGTH)
+    is_pyi = file_path.suffix == ".pyi"
+    cache_key = FormatterCache.get_key(content, "black", black_version, is_pyi, LINE_LENGTH)
+    cached_content = FormatterCache.get(cache_key)
+    if cached_content is not None:
+        return cached_content
+
+    file_mode = black.FileMode(is_pyi=is_pyi, line_length=LINE_LENGTH)
     try:
         content = black.format_file_contents(content, fast=True, mode=file_mode)
     except NothingChanged:
@@ -48,6 +58,7 @@ def blackify(content: str, file_path: Path) -> str:
         file_path.write_text(content)
         raise ValueError(f"Cannot parse {file_path}: {e}") from e
 
+    FormatterCache.set(cache_key, content)
     return content
 
 
@@ -57,6 +68,8 @@ def sort_imports(
     """
     Sort imports with `isort`.
 
+    Results are cached in `FormatterCache`.
+
     Arguments:
         content -- File content.
         module_name -- Current module name.
@@ -76,6 +89,13 @@ def sort_imports(
     if module_name in known_third_party:
         known_third_party.remove(module_name)
 
+    cache_key = FormatterCache.get_key(
+        content, "isort", isort_version, module_name, extension, known_third_party, LINE_LENGTH
+    )
+    cached_content = FormatterCache.get(cache_key)
+    if cached_content is not None:
+        return cached_content
+
     result = sort_code_string(
         code=content,
         extension=extension,
@@ -86,7 +106,9 @@ def sort_imports(
             line_length=LINE_LENGTH,
         ),
     )
-    return result or ""
+    result = result or ""
+    FormatterCache.set(cache_key, result)
+    return result
 
 
 def render_jinja2_template(
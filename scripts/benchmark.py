@@ -0,0 +1,457 @@
+#!/usr/bin/env python
+"""
+Builder performance benchmarks.
+
+Runs offline on installed `boto3` and `botocore` service models.
+
+- [x] shapes: parse client, paginator and waiter methods from service model
+- [x] parse: parse service package from scratch
+- [x] docstrings: parse client methods from docstrings, up to 50 per service
+- [x] typed_dicts: walk typed dicts graph of a parsed service
+- [x] annotations: sort, hash and render type annotations of a parsed service
+- [x] render: render service module templates
+- [x] format: sort imports and format service modules with `isort` and `black`
+- [x] native_format: format service modules with native formatter
+- [x] write: write service package with `PackageWriter`
+- [x] end_to_end: parse, postprocess and write service package
+
+Compare results with a baseline saved by a previous run:
+
+    python scripts/benchmark.py --save-baseline baseline.json
+    python scripts/benchmark.py --baseline baseline.json --threshold 0.2
+
+Run times depend on the machine, so no baseline is committed: save it from the base
+branch on the same machine right before the comparison. CI does this for pull requests
+in `.github/workflows/benchmark.yml`, the baseline is saved from the base commit
+to a temporary file and read back by `--baseline`.
+"""
+import argparse
+import inspect
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import MethodType
+
+from boto3 import __version__ as boto3_version
+from boto3.session import Session
+from botocore import __version__ as botocore_version
+
+from mypy_boto3_builder.constants import BOTO3_STUBS_NAME, MODULE_NAME, PYPI_NAME, TEMPLATES_PATH
+from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
+from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.main import get_available_service_names
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client, get_boto3_session
+from mypy_boto3_builder.parsers.helpers import get_public_methods, parse_method
+from mypy_boto3_builder.parsers.service_package import parse_service_package
+from mypy_boto3_builder.parsers.service_package_cache import ServicePackageCache
+from mypy_boto3_builder.parsers.service_package_postprocessor import ServicePackagePostprocessor
+from mypy_boto3_builder.parsers.shape_parser import ShapeParser
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.utils.strings import get_anchor_link, get_min_build_version
+from mypy_boto3_builder.writers.formatter_cache import FormatterCache
+from mypy_boto3_builder.writers.native_formatter.formatter import format_code
+from mypy_boto3_builder.writers.native_formatter.imports import sort_imports as native_sort_imports
+from mypy_boto3_builder.writers.package_writer import PackageWriter
+from mypy_boto3_builder.writers.processors import process_service
+from mypy_boto3_builder.writers.utils import blackify, render_jinja2_template, sort_imports
+
+LOGGER_NAME = "benchmark"
+SERVICES = ["s3", "ec2", "dynamodb", "sagemaker", "sqs"]
+TEMPLATES = TEMPLATES_PATH / "boto3_service"
+THIRD_PARTY = ["boto3", "botocore", "aiobotocore"]
+DOCSTRINGS_LIMIT = 50
+
+
+def setup_logging(level: int = 0) -> logging.Logger:
+    """
+    Get Logger instance.
+
+    Arguments:
+        level -- Log level.
+
+    Returns:
+        Overriden Logger.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    stream_handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(levelname)s %(message)s", datefmt="%H:%M:%S")
+    stream_handler.setFormatter(formatter)
+    stream_handler.setLevel(level)
+    logger.addHandler(stream_handler)
+    logger.setLevel(level)
+    return logger
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Setup CLI parser.
+    """
+    parser = argparse.ArgumentParser(__file__)
+    parser.add_argument(
+        "-s",
+        "--services",
+        nargs="+",
+        default=SERVICES,
+        help=f"Services to benchmark, default: {' '.join(SERVICES)}",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Number of timed runs")
+    parser.add_argument(
+        "--save-baseline",
+        type=Path,
+        metavar="PATH",
+        help="Save median run times to a JSON file",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        metavar="PATH",
+        help="Compare median run times with a JSON file saved by --save-baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Fail if a median run time is slower than baseline by this ratio, default: 0.2",
+    )
+    parser.add_argument("cases", nargs="*", help="Benchmark cases to run, all by default")
+    return parser.parse_args()
+
+
+class BenchmarkContext:
+    """
+    Service data shared by benchmark cases.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+        output_path -- Directory for generated files.
+    """
+
+    def __init__(self, session: Session, service_name: ServiceName, output_path: Path) -> None:
+        self.session = session
+        self.service_name = service_name
+        self.output_path = output_path
+        self.package = self._get_package()
+        self._client_methods: dict[str, MethodType] | None = None
+        self._modules: dict[Path, str] | None = None
+
+    def _get_package(self) -> ServicePackage:
+        package = parse_service_package(self.session, self.service_name)
+        package.extend_literals([self.service_name])
+        ServicePackagePostprocessor(package).generate_docstrings()
+        return package
+
+    @property
+    def client_methods(self) -> dict[str, MethodType]:
+        """
+        First `DOCSTRINGS_LIMIT` client public methods with pre-generated docstrings.
+        """
+        if self._client_methods is None:
+            client = get_boto3_client(self.session, self.service_name)
+            public_methods = get_public_methods(client)
+            public_methods.pop("get_paginator", None)
+            public_methods.pop("get_waiter", None)
+            self._client_methods = dict(sorted(public_methods.items())[:DOCSTRINGS_LIMIT])
+            for method in self._client_methods.values():
+                inspect.getdoc(method)
+        return self._client_methods
+
+    @property
+    def template_paths(self) -> dict[Path, Path]:
+        """
+        Service module paths with their templates.
+        """
+        modules = [
+            ServiceModuleName.client,
+            ServiceModuleName.literals,
+            ServiceModuleName.type_defs,
+        ]
+        if self.package.service_resource:
+            modules.append(ServiceModuleName.service_resource)
+        if self.package.paginators:
+            modules.append(ServiceModuleName.paginator)
+        if self.package.waiters:
+            modules.append(ServiceModuleName.waiter)
+        return {Path(i.stub_file_name): TEMPLATES / "service" / i.template_name for i in modules}
+
+    @property
+    def modules(self) -> dict[Path, str]:
+        """
+        Rendered service modules.
+        """
+        if self._modules is None:
+            self._modules = bench_render(self)
+        return self._modules
+
+
+def bench_shapes(context: BenchmarkContext) -> None:
+    """
+    Parse client, paginator and waiter methods from service model.
+    """
+    shape_parser = ShapeParser(context.session, context.service_name)
+    shape_parser.get_client_method_map()
+    for paginator_name in shape_parser.get_paginator_names():
+        shape_parser.get_paginate_method(paginator_name)
+    for waiter_name in shape_parser.get_waiter_names():
+        shape_parser.get_wait_method(waiter_name)
+
+
+def bench_parse(context: BenchmarkContext) -> None:
+    """
+    Parse service package from scratch.
+    """
+    parse_service_package(context.session, context.service_name)
+
+
+def bench_docstrings(context: BenchmarkContext) -> None:
+    """
+    Parse client methods from docstrings.
+    """
+    for name, method in context.client_methods.items():
+        parse_method("Client", name, method, context.service_name)
+
+
+def bench_typed_dicts(context: BenchmarkContext) -> None:
+    """
+    Extract typed dicts from service package.
+    """
+    context.package.extract_typed_dicts()
+
+
+def bench_annotations(context: BenchmarkContext) -> None:
+    """
+    Sort, hash and render all type annotations of service package.
+    """
+    package = context.package
+    package.extract_typed_dicts()
+    package.extract_literals()
+    for type_annotation in sorted(package.get_types()):
+        type_annotation.render()
+    for typed_dict in package.typed_dicts:
+        for attribute in typed_dict.children:
+            attribute.type_annotation.render(typed_dict.name)
+
+
+def bench_render(context: BenchmarkContext) -> dict[Path, str]:
+    """
+    Render service module templates.
+    """
+    return {
+        path: render_jinja2_template(
+            template_path, package=context.package, service_name=context.service_name
+        )
+        for path, template_path in context.template_paths.items()
+    }
+
+
+def bench_format(context: BenchmarkContext) -> None:
+    """
+    Sort imports and format service modules with `isort` and `black`.
+    """
+    module_name = context.package.name
+    third_party = [*THIRD_PARTY, context.service_name.module_name]
+    for path, content in context.modules.items():
+        content = sort_imports(content, module_name, extension="pyi", third_party=third_party)
+        blackify(content, path)
+
+
+def bench_native_format(context: BenchmarkContext) -> None:
+    """
+    Format service modules with native formatter.
+    """
+    module_name = context.package.name
+    third_party = [*THIRD_PARTY, context.service_name.module_name]
+    for content in context.modules.values():
+        content = native_sort_imports(
+            content, module_name, extension="pyi", third_party=third_party
+        )
+        format_code(content, is_pyi=True)
+
+
+def bench_write(context: BenchmarkContext) -> None:
+    """
+    Write service package to an empty directory.
+    """
+    output_path = Path(tempfile.mkdtemp(dir=context.output_path))
+    package_writer = PackageWriter(output_path=output_path)
+    package_writer.write_service_package(context.package, templates_path=TEMPLATES)
+
+
+def bench_end_to_end(context: BenchmarkContext) -> None:
+    """
+    Parse, postprocess and write service package to an empty directory.
+    """
+    ServicePackageCache.clear()
+    process_service(
+        session=context.session,
+        service_name=context.service_name,
+        output_path=Path(tempfile.mkdtemp(dir=context.output_path)),
+        generate_setup=True,
+        service_names=[context.service_name],
+        version=boto3_version,
+    )
+
+
+CASES: dict[str, Callable[[BenchmarkContext], object]] = {
+    "shapes": bench_shapes,
+    "parse": bench_parse,
+    "docstrings": bench_docstrings,
+    "typed_dicts": bench_typed_dicts,
+    "annotations": bench_annotations,
+    "render": bench_render,
+    "format": bench_format,
+    "native_format": bench_native_format,
+    "write": bench_write,
+    "end_to_end": bench_end_to_end,
+}
+
+
+def run_case(
+    func: Callable[[BenchmarkContext], object], context: BenchmarkContext, repeat: int
+) -> list[float]:
+    """
+    Run benchmark case `repeat` times.
+
+    Annotation and formatter caches are reset before each run.
+
+    Returns:
+        Run times in seconds.
+    """
+    times: list[float] = []
+    for _ in range(repeat):
+        for type_annotation in context.package.get_types():
+            type_annotation.invalidate_cache()
+        FormatterCache.clear()
+        start = time.perf_counter()
+        func(context)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def get_report(times: list[float]) -> str:
+    """
+    Get report line with the first, the best and the median run time.
+    """
+    return (
+        f"first {times[0] * 1000:.1f}ms"
+        f" min {min(times) * 1000:.1f}ms"
+        f" median {statistics.median(times) * 1000:.1f}ms"
+    )
+
+
+def compare_baseline(
+    results: dict[str, dict[str, float]], baseline_path: Path, threshold: float
+) -> bool:
+    """
+    Compare median run times with a saved baseline.
+
+    Arguments:
+        results -- Median run times per service and case.
+        baseline_path -- Baseline JSON file path.
+        threshold -- Allowed slowdown ratio.
+
+    Returns:
+        True if no case is slower than allowed.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    baseline = json.loads(baseline_path.read_text())
+    if baseline["versions"] != get_versions():
+        logger.warning(f"Baseline versions differ: {baseline['versions']}")
+
+    success = True
+    for service, cases in results.items():
+        for case_name, median in cases.items():
+            old_median = baseline["results"].get(service, {}).get(case_name)
+            if not old_median:
+                logger.warning(f"{service} {case_name}: not found in baseline")
+                continue
+            change = median / old_median - 1
+            message = (
+                f"{service} {case_name}: {old_median * 1000:.1f}ms -> {median * 1000:.1f}ms"
+                f" ({change:+.0%})"
+            )
+            if change > threshold:
+                logger.error(f"{message}, slower than {threshold:.0%} threshold")
+                success = False
+                continue
+            logger.info(message)
+    return success
+
+
+def get_versions() -> dict[str, str]:
+    """
+    Get versions that affect run times.
+    """
+    return {
+        "python": platform.python_version(),
+        "boto3": boto3_version,
+        "botocore": botocore_version,
+    }
+
+
+def main() -> None:
+    """
+    Main CLI entrypoint.
+    """
+    args = parse_args()
+    setup_logging(logging.INFO)
+    logger = logging.getLogger(LOGGER_NAME)
+    case_names = args.cases or list(CASES)
+    for case_name in case_names:
+        if case_name not in CASES:
+            logger.error(f"Unknown case {case_name}, choose from {', '.join(CASES)}")
+            sys.exit(1)
+
+    session = get_boto3_session()
+    available_service_names = {i.name: i for i in get_available_service_names(session)}
+    for name in args.services:
+        if name not in available_service_names:
+            logger.error(f"Unknown service {name}")
+            sys.exit(1)
+
+    JinjaManager.update_globals(
+        master_pypi_name=PYPI_NAME,
+        master_module_name=MODULE_NAME,
+        boto3_stubs_name=BOTO3_STUBS_NAME,
+        boto3_version=boto3_version,
+        botocore_version=botocore_version,
+        build_version=boto3_version,
+        min_build_version=get_min_build_version(boto3_version),
+        builder_version="0.0.0",
+        get_anchor_link=get_anchor_link,
+        render_docstrings=True,
+        hasattr=hasattr,
+    )
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for name in args.services:
+            service_name = available_service_names[name]
+            logger.info(f"Parsing {service_name.boto3_name} ...")
+            start = time.perf_counter()
+            context = BenchmarkContext(session, service_name, Path(output_dir))
+            logger.info(f"Parsed in {time.perf_counter() - start:.2f}s")
+            for case_name in case_names:
+                times = run_case(CASES[case_name], context, args.repeat)
+                results.setdefault(name, {})[case_name] = statistics.median(times)
+                logger.info(f"{service_name.boto3_name} {case_name}: {get_report(times)}")
+
+    if args.save_baseline:
+        args.save_baseline.write_text(
+            json.dumps({"versions": get_versions(), "results": results}, indent=2)
+        )
+        logger.info(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline and not compare_baseline(results, args.baseline, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,8 @@ class SyntaxGrammar:
     """
     Grammar to parse boto3 request/response syntax.
 
+    Reference for `SyntaxParser` output in parser equivalence tests.
+
     ellipsis = "..."
     name_value ::= alphanums + "_-."
     string_value ::= alphas{0,2} "'"  [^']+  "'"
@@ -0,0 +1,139 @@
+import inspect
+import os
+import re
+import textwrap
+import warnings
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from boto3.session import Session
+from pyparsing import ParseException
+
+from mypy_boto3_builder.parsers.docstring_parser.syntax_parser import (
+    SyntaxParser,
+    SyntaxParserError,
+)
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_line import TypeDocLine
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_parser import (
+    TypeDocParser,
+    TypeDocParserError,
+)
+from mypy_boto3_builder.parsers.helpers import get_public_methods
+from mypy_boto3_builder.utils.strings import get_line_with_indented
+from tests.parsers.docstring_parser.syntax_grammar import SyntaxGrammar
+from tests.parsers.docstring_parser.type_doc_grammar import TypeDocGrammar
+
+# Comma-separated service names to compare parsers on, `all` for all installed services
+CORPUS_ENV = "DOCSTRING_CORPUS"
+CORPUS_DEFAULT = "sqs,sts"
+
+RE_PARAM = re.compile("\n:param ")
+
+PARSERS = {
+    "request_syntax": (SyntaxGrammar.request_syntax, SyntaxParser.parse_request_syntax),
+    "response_syntax": (SyntaxGrammar.response_syntax, SyntaxParser.parse_response_syntax),
+    "type_definition": (TypeDocGrammar.type_definition, TypeDocParser.parse_type_definition),
+    "rtype_definition": (TypeDocGrammar.rtype_definition, TypeDocParser.parse_rtype_definition),
+    "returns_definition": (
+        TypeDocGrammar.returns_definition,
+        TypeDocParser.parse_returns_definition,
+    ),
+    "param_definition": (TypeDocGrammar.param_definition, TypeDocParser.parse_param_definition),
+    "response_structure": (
+        TypeDocGrammar.response_structure,
+        TypeDocParser.parse_response_structure,
+    ),
+}
+
+
+def get_corpus_service_names() -> list[str]:
+    corpus = os.environ.get(CORPUS_ENV, CORPUS_DEFAULT)
+    if corpus == "all":
+        return Session().get_available_services()
+    return corpus.split(",")
+
+
+def get_section(docstring: str, header: str) -> str:
+    index = docstring.index(header)
+    while index > 0 and docstring[index - 1] == " ":
+        index -= 1
+    return get_line_with_indented(docstring[index:], True)
+
+
+def iterate_inputs(docstring: str) -> Iterator[tuple[str, str]]:
+    if "**Request Syntax**" in docstring:
+        yield "request_syntax", get_section(docstring, "**Request Syntax**")
+    if "**Response Syntax**" in docstring:
+        yield "response_syntax", get_section(docstring, "**Response Syntax**")
+    if "**Response Structure**" in docstring:
+        section = get_section(docstring, "**Response Structure**")
+        yield "response_structure", textwrap.dedent(section)
+    for line in docstring.split("\n"):
+        if line.startswith(":type "):
+            yield "type_definition", line
+    for match in RE_PARAM.finditer(docstring):
+        yield "param_definition", get_line_with_indented(docstring[match.start() + 1 :])
+    if ":rtype: " in docstring:
+        yield "rtype_definition", docstring[docstring.index(":rtype: ") :].split("\n", 1)[0]
+    if ":return" in docstring:
+        yield "returns_definition", docstring[docstring.index(":return") :].split("\n", 1)[0]
+
+
+def parse_grammar(kind: str, input_string: str) -> dict[str, Any] | None:
+    grammar, _ = PARSERS[kind]
+    if kind.endswith("_syntax"):
+        SyntaxGrammar.reset()
+        SyntaxGrammar.enable_packrat()
+    else:
+        TypeDocGrammar.reset()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return grammar.parseString(input_string).asDict()
+    except ParseException:
+        return None
+
+
+def parse(kind: str, input_string: str) -> dict[str, Any] | None:
+    _, parser_method = PARSERS[kind]
+    parser_class = SyntaxParser if kind.endswith("_syntax") else TypeDocParser
+    try:
+        return parser_method(parser_class(input_string))
+    except (SyntaxParserError, TypeDocParserError):
+        return None
+
+
+def get_nested_keys(line: TypeDocLine) -> set[tuple[str, str]]:
+    result: set[tuple[str, str]] = set()
+    for indented_line in line.indented:
+        result.add((indented_line.name, indented_line.type_name))
+        result.update(get_nested_keys(indented_line))
+    return result
+
+
+def get_type_doc_line_keys(data: dict[str, Any]) -> tuple[object, ...]:
+    line = TypeDocLine(**data)
+    # grammar matches nested lines as plain lines, so they never fix TypedDict keys
+    assert get_nested_keys(line) <= {("", "")}
+    return (line.name, line.type_name, line.description, line.line, bool(line.indented))
+
+
+class TestParserEquivalence:
+    @pytest.mark.parametrize("service_name", get_corpus_service_names())
+    def test_service_docstrings(self, service_name: str) -> None:
+        client = Session(region_name="us-east-1").client(service_name)  # type: ignore
+        for method_name, method in get_public_methods(client).items():
+            docstring = textwrap.dedent(inspect.getdoc(method) or "")
+            for kind, input_string in iterate_inputs(docstring):
+                try:
+                    expected = parse_grammar(kind, input_string)
+                except RecursionError:
+                    # grammar fails on deeply nested syntax, nothing to compare with
+                    continue
+                result = parse(kind, input_string)
+                message = f"{service_name}.{method_name} {kind}:\n{input_string}"
+                if expected and result and kind in ("param_definition", "response_structure"):
+                    expected = get_type_doc_line_keys(expected)
+                    result = get_type_doc_line_keys(result)
+                assert result == expected, message
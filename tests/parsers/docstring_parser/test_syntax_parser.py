@@ -0,0 +1,119 @@
+import pytest
+
+from mypy_boto3_builder.parsers.docstring_parser.syntax_parser import (
+    SyntaxParser,
+    SyntaxParserError,
+)
+
+
+def parse_value(value: str) -> object:
+    request_syntax = f"**Request Syntax**::\n  client.method(Value={value})"
+    return SyntaxParser(request_syntax).parse_request_syntax()["arguments"][0]["value"]
+
+
+class TestSyntaxParser:
+    def test_parse_request_syntax(self) -> None:
+        result = SyntaxParser(
+            """  **Request Syntax**
+            ::
+
+              response = client.put_bucket_tagging(
+                  Bucket='string',
+                  Tagging={
+                      'TagSet': [
+                          {
+                              'Key': 'string',
+                          },
+                      ]
+                  },
+              )
+            """
+        ).parse_request_syntax()
+        assert result == {
+            "arguments": [
+                {"name": "Bucket", "value": {"value": "'string'"}},
+                {
+                    "name": "Tagging",
+                    "value": {
+                        "dict_items": [
+                            {
+                                "key": "'TagSet'",
+                                "value": {
+                                    "list_items": [
+                                        {
+                                            "dict_items": [
+                                                {"key": "'Key'", "value": {"value": "'string'"}}
+                                            ]
+                                        }
+                                    ]
+                                },
+                            }
+                        ]
+                    },
+                },
+            ]
+        }
+        assert SyntaxParser("**Request Syntax**::\n  client.method()").parse_request_syntax() == {}
+        assert SyntaxParser("**Request Syntax**::\n  client.method(,)").parse_request_syntax() == {}
+
+    def test_parse_values(self) -> None:
+        assert parse_value("b'bytes'") == {"value": "b'bytes'"}
+        assert parse_value("-1.5e3") == {"value": "-1.5e3"}
+        assert parse_value("[ ... ]") == {"empty_list": ["[", "...", "]"]}
+        assert parse_value("{...,}") == {"empty_dict": ["{", "...", ",", "}"]}
+        assert parse_value("[1 , 2 ,]") == {"list_items": [{"value": "1"}, {"value": "2"}]}
+        assert parse_value("{'a'}") == {"set_items": [{"value": "'a'"}]}
+        assert parse_value("'a' |'b'") == {
+            "literal_first_item": {"value": "'a'"},
+            "literal_rest_items": [{"value": "'b'"}],
+        }
+        assert parse_value("{'a'}|{'b'}") == {
+            "literal_first_item": {"set_items": [{"value": "'a'"}]},
+            "literal_rest_items": [{"set_items": [{"value": "'b'"}]}],
+        }
+        assert parse_value("1 or 'a'|'b' or [1]") == {
+            "union_first_item": {"value": "1"},
+            "union_rest_items": [
+                {
+                    "literal_first_item": {"value": "'a'"},
+                    "literal_rest_items": [{"value": "'b'"}],
+                },
+                {"list_items": [{"value": "1"}]},
+            ],
+        }
+        assert parse_value("datetime( 2015, 1 )") == {
+            "func_call": {"name": "datetime", "args": [{"value": "2015"}, {"value": "1"}]}
+        }
+        assert parse_value("StreamingBody()") == {"func_call": {"name": "StreamingBody"}}
+
+    def test_parse_invalid_values(self) -> None:
+        for value in ("'a'|'b' or 1", "f(1) or 1", "abc'x'", "[1,,]", "'a'|", "{'a' 'b'}"):
+            with pytest.raises(SyntaxParserError):
+                parse_value(value)
+
+    def test_parse_response_syntax(self) -> None:
+        result = SyntaxParser(
+            "**Response Syntax**::\n  {'a': EventStream({'x': 1})} trailing"
+        ).parse_response_syntax()
+        assert result == {
+            "value": {
+                "dict_items": [
+                    {
+                        "key": "'a'",
+                        "value": {
+                            "func_call": {
+                                "name": "EventStream",
+                                "args": [{"dict_items": [{"key": "'x'", "value": {"value": "1"}}]}],
+                            }
+                        },
+                    }
+                ]
+            }
+        }
+        assert SyntaxParser("**Response Syntax** :: []").parse_response_syntax() == {
+            "value": {"empty_list": ["[", "]"]}
+        }
+        with pytest.raises(SyntaxParserError):
+            SyntaxParser("**Response Syntax**::\n  'string'").parse_response_syntax()
+        with pytest.raises(SyntaxParserError):
+            SyntaxParser("**Request Syntax**::\n  {}").parse_response_syntax()
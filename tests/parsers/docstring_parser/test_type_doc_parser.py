@@ -0,0 +1,73 @@
+import pytest
+
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_parser import (
+    TypeDocParser,
+    TypeDocParserError,
+)
+
+
+class TestTypeDocParser:
+    def test_parse_type_definition(self) -> None:
+        assert TypeDocParser(":type Bucket: string  ").parse_type_definition() == {
+            "name": "Bucket",
+            "type_name": "string  ",
+        }
+        with pytest.raises(TypeDocParserError):
+            TypeDocParser(":type Bucket string").parse_type_definition()
+
+    def test_parse_rtype_definition(self) -> None:
+        assert TypeDocParser(":rtype:  dict").parse_rtype_definition() == {"type_name": "dict"}
+        with pytest.raises(TypeDocParserError):
+            TypeDocParser(":returns: dict").parse_rtype_definition()
+
+    def test_parse_returns_definition(self) -> None:
+        assert TypeDocParser(":returns: None").parse_returns_definition() == {"description": "None"}
+        assert TypeDocParser(":return:").parse_returns_definition() == {"description": ""}
+        with pytest.raises(TypeDocParserError):
+            TypeDocParser(":returninvalid").parse_returns_definition()
+
+    def test_parse_param_definition(self) -> None:
+        result = TypeDocParser(
+            ":param Tagging: **[REQUIRED]** \n\n"
+            "  Container for the tag set.\n\n\n"
+            "  - **TagSet** *(list) --* \n\n"
+            "    - *(dict) --* \n\n"
+            "      - **Key** *(string) --* \n\n"
+            "      - **Value** *(string) --* \n"
+        ).parse_param_definition()
+        assert result == {
+            "name": "Tagging",
+            "description": "**[REQUIRED]** ",
+            "indented": [
+                {"line": ["Container for the tag set."]},
+                {
+                    "line": ["- **TagSet** *(list) --* "],
+                    "indented": [
+                        {
+                            "line": ["- *(dict) --* "],
+                            "indented": [
+                                {"line": ["- **Key** *(string) --* "]},
+                                {"line": ["- **Value** *(string) --* "]},
+                            ],
+                        }
+                    ],
+                },
+            ],
+        }
+        assert TypeDocParser(":param Bucket:").parse_param_definition() == {
+            "name": "Bucket",
+            "description": "",
+        }
+        with pytest.raises(TypeDocParserError):
+            TypeDocParser(":param Bucket").parse_param_definition()
+
+    def test_parse_response_structure(self) -> None:
+        result = TypeDocParser(
+            "**Response Structure**\n\n  - *(dict) --* \n\n    - **Key** *(string) --* \n"
+        ).parse_response_structure()
+        assert result == {
+            "line": ["- *(dict) --* "],
+            "indented": [{"line": ["- **Key** *(string) --* "]}],
+        }
+        with pytest.raises(TypeDocParserError):
+            TypeDocParser("**Response Structure**\n\n  - *(dict) --* \n").parse_response_structure()
@@ -20,6 +20,8 @@ class TypeDocGrammar:
     r"""
     Grammar to parse boto3 docs syntax.
 
+    Reference for `TypeDocParser` output in parser equivalence tests.
+
     EOL ::= ["\r"] "\n"
     SOL ::= LINE_START
     line ::= [^EOL]+ EOL
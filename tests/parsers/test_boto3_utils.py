@@ -0,0 +1,54 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from botocore.exceptions import DataNotFoundError
+
+from mypy_boto3_builder.parsers.boto3_utils import (
+    get_boto3_session,
+    get_service_metadata,
+    get_service_model_hash,
+)
+from mypy_boto3_builder.service_name import ServiceName
+
+
+class TestBoto3Utils:
+    def test_get_service_metadata(self) -> None:
+        session = get_boto3_session()
+        for name in ("s3", "ec2", "sagemaker"):
+            assert (
+                get_service_metadata(session, name)
+                == session._session.get_service_data(name)["metadata"]
+            )
+
+        session_mock = MagicMock()
+        session_mock._session.get_component().search_paths = []
+        session_mock._session.get_service_data.return_value = {"metadata": {"serviceId": "S3"}}
+        assert get_service_metadata(session_mock, "s3") == {"serviceId": "S3"}
+
+    def test_get_service_model_hash(self) -> None:
+        def determine_latest_version(service_name: str, type_name: str) -> str:
+            if type_name != "service-2":
+                raise DataNotFoundError(data_path=service_name)
+            return "2020-01-01"
+
+        service_name = ServiceName("sqs", "SQS")
+        with tempfile.TemporaryDirectory() as data_dir:
+            model_path = Path(data_dir) / "sqs" / "2020-01-01"
+            model_path.mkdir(parents=True)
+            (model_path / "service-2.json").write_text("{}")
+            session_mock = MagicMock()
+            loader_mock = session_mock._session.get_component()
+            loader_mock.search_paths = [data_dir]
+            loader_mock.determine_latest_version.side_effect = determine_latest_version
+
+            result = get_service_model_hash(session_mock, service_name)
+            assert get_service_model_hash(session_mock, service_name) == result
+            loader_mock.load_service_model.assert_not_called()
+
+            (model_path / "service-2.json").write_text("{ }")
+            new_result = get_service_model_hash(session_mock, service_name)
+            assert new_result != result
+
+            (model_path / "service-2.sdk-extras.json").write_text("{}")
+            assert get_service_model_hash(session_mock, service_name) != new_result
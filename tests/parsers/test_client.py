@@ -0,0 +1,47 @@
+import inspect
+from unittest.mock import MagicMock
+
+import pytest
+
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_session
+from mypy_boto3_builder.parsers.client import get_shape_public_methods, parse_client
+from mypy_boto3_builder.parsers.helpers import get_public_methods
+from mypy_boto3_builder.parsers.shape_parser import ShapeParser
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+from mypy_boto3_builder.utils.strings import get_short_docstring
+
+
+class TestClient:
+    def test_get_shape_public_methods(self) -> None:
+        session = get_boto3_session()
+        for service_name in (ServiceNameCatalog.s3, ServiceNameCatalog.logs):
+            client = session.client(service_name.boto3_name)  # type: ignore
+            shape_parser = ShapeParser(session, service_name)
+            public_methods = get_public_methods(client)
+            result = get_shape_public_methods(service_name, shape_parser.service_model)
+            assert list(result) == list(public_methods)
+            for name, method in public_methods.items():
+                assert get_short_docstring(inspect.getdoc(result[name]) or "") == (
+                    get_short_docstring(inspect.getdoc(method) or "")
+                )
+
+        client_mock = MagicMock()
+        result["describe_log_groups"](client_mock, limit=1)
+        client_mock._make_api_call.assert_called_once_with("DescribeLogGroups", {"limit": 1})
+        with pytest.raises(TypeError):
+            result["describe_log_groups"](client_mock, 1)
+
+    def test_parse_client(self) -> None:
+        session = get_boto3_session()
+        service_name = ServiceNameCatalog.logs
+        shape_parser = ShapeParser(session, service_name)
+        client = parse_client(session, service_name, shape_parser)
+        result = parse_client(session, service_name, shape_parser, shape_only=True)
+        assert result.boto3_client is None
+        assert [(i.name, i.docstring) for i in result.methods] == [
+            (i.name, i.docstring) for i in client.methods
+        ]
+        assert result.get_types() == client.get_types()
+        assert [i.name for i in result.exceptions_class.attributes] == [
+            i.name for i in client.exceptions_class.attributes
+        ]
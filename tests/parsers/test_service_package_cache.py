@@ -0,0 +1,111 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mypy_boto3_builder.constants import SERVICE_PACKAGE_CACHE_MEMORY_SIZE
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_session
+from mypy_boto3_builder.parsers.service_package_cache import ServicePackageCache
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.service_package import ServicePackage
+
+
+class TestServicePackageCache:
+    def setup_method(self) -> None:
+        ServicePackageCache.clear()
+
+    def teardown_method(self) -> None:
+        ServicePackageCache.clear()
+        ServicePackageCache.disable_disk_cache()
+        ServicePackageCache.shape_only = False
+        ServicePackageCache.max_memory_size = SERVICE_PACKAGE_CACHE_MEMORY_SIZE
+
+    @patch("mypy_boto3_builder.parsers.service_package_cache.parse_service_package")
+    def test_get(self, parse_service_package_mock: MagicMock) -> None:
+        session = get_boto3_session()
+        boto3_client = session.client("s3")
+        service_name = ServiceName("s3", "S3")
+        parse_service_package_mock.return_value = ServicePackage(
+            name="mypy_boto3_s3",
+            pypi_name="mypy-boto3-s3",
+            service_name=service_name,
+            client=Client("S3Client", service_name, boto3_client),
+        )
+
+        result = ServicePackageCache.get(session, service_name)
+        assert result is parse_service_package_mock.return_value
+        parse_service_package_mock.assert_called_once_with(session, service_name, shape_only=False)
+
+        other_service_name = ServiceName("s3", "S3")
+        cached = ServicePackageCache.get(session, other_service_name)
+        parse_service_package_mock.assert_called_once()
+        assert cached is not result
+        assert cached.name == "mypy_boto3_s3"
+        assert cached.service_name is other_service_name
+        assert cached.client.service_name is other_service_name
+        assert cached.client.boto3_client is boto3_client
+
+        cached.name = "types_aiobotocore_s3"
+        assert ServicePackageCache.get(session, service_name).name == "mypy_boto3_s3"
+
+    @patch("mypy_boto3_builder.parsers.service_package_cache.parse_service_package")
+    def test_get_disk_cache(self, parse_service_package_mock: MagicMock) -> None:
+        session = get_boto3_session()
+        service_name = ServiceName("s3", "S3")
+        parse_service_package_mock.return_value = ServicePackage(
+            name="mypy_boto3_s3",
+            pypi_name="mypy-boto3-s3",
+            service_name=service_name,
+            client=Client("S3Client", service_name, session.client("s3")),
+        )
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = Path(cache_dir)
+            ServicePackageCache.enable_disk_cache(cache_path)
+            ServicePackageCache.get(session, service_name)
+            assert len(list(cache_path.glob("s3.*.pickle"))) == 1
+
+            ServicePackageCache.clear()
+            result = ServicePackageCache.get(session, service_name)
+            parse_service_package_mock.assert_called_once()
+            assert result.name == "mypy_boto3_s3"
+            assert result.service_name is service_name
+            assert result.client.boto3_client.meta.service_model.service_name == "s3"
+
+            ServicePackageCache.clear()
+            with patch(
+                "mypy_boto3_builder.parsers.service_package_cache.get_builder_hash",
+                return_value="new_hash",
+            ):
+                ServicePackageCache.get(session, service_name)
+            assert parse_service_package_mock.call_count == 2
+            assert len(list(cache_path.glob("s3.*.pickle"))) == 1
+
+            ServicePackageCache.clear()
+            ServicePackageCache.enable_shape_only()
+            ServicePackageCache.get(session, service_name)
+            assert parse_service_package_mock.call_count == 3
+
+    @patch("mypy_boto3_builder.parsers.service_package_cache.parse_service_package")
+    def test_get_memory_limit(self, parse_service_package_mock: MagicMock) -> None:
+        session = get_boto3_session()
+        parse_service_package_mock.side_effect = lambda _session, service_name, **_kwargs: (
+            ServicePackage(
+                name=f"mypy_boto3_{service_name.underscore_name}",
+                pypi_name=f"mypy-boto3-{service_name.name}",
+                service_name=service_name,
+                client=Client(
+                    f"{service_name.class_name}Client",
+                    service_name,
+                    session.client(service_name.boto3_name),
+                ),
+            )
+        )
+        ServicePackageCache.max_memory_size = 1
+        s3_service_name = ServiceName("s3", "S3")
+        sqs_service_name = ServiceName("sqs", "SQS")
+        ServicePackageCache.get(session, s3_service_name)
+        ServicePackageCache.get(session, sqs_service_name)
+        ServicePackageCache.get(session, sqs_service_name)
+        assert parse_service_package_mock.call_count == 2
+        ServicePackageCache.get(session, s3_service_name)
+        assert parse_service_package_mock.call_count == 3
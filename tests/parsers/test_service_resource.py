@@ -0,0 +1,59 @@
+import inspect
+from unittest.mock import patch
+
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_session
+from mypy_boto3_builder.parsers.service_resource import (
+    get_shape_service_resource,
+    parse_service_resource,
+)
+from mypy_boto3_builder.parsers.shape_parser import ShapeParser
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+from mypy_boto3_builder.structures.service_resource import ServiceResource
+
+
+class TestServiceResource:
+    @staticmethod
+    def _get_data(service_resource: ServiceResource | None) -> object:
+        assert service_resource is not None
+        return (
+            [(i.name, i.docstring, i.get_types()) for i in service_resource.methods],
+            [(i.name, i.type_annotation) for i in service_resource.attributes],
+            [(i.name, [j.name for j in i.methods]) for i in service_resource.collections],
+            [
+                (
+                    i.name,
+                    [(j.name, j.docstring) for j in i.methods],
+                    [(j.name, j.type_annotation) for j in i.attributes],
+                    [k.name for k in i.collections],
+                )
+                for i in service_resource.sub_resources
+            ],
+        )
+
+    def test_parse_service_resource_shape_only(self) -> None:
+        session = get_boto3_session()
+        for service_name in (ServiceNameCatalog.s3, ServiceNameCatalog.sqs):
+            shape_parser = ShapeParser(session, service_name)
+            service_resource = parse_service_resource(session, service_name, shape_parser)
+            with patch.object(session, "client") as client_mock:
+                result = parse_service_resource(
+                    session, service_name, shape_parser, shape_only=True
+                )
+                client_mock.assert_not_called()
+            assert result is not None
+            assert result.boto3_service_resource is None
+            assert self._get_data(result) == self._get_data(service_resource)
+            assert result.get_types() == service_resource.get_types()  # type: ignore
+
+    def test_get_shape_service_resource(self) -> None:
+        session = get_boto3_session()
+        shape_parser = ShapeParser(session, ServiceNameCatalog.sqs)
+        result = get_shape_service_resource(session, ServiceNameCatalog.sqs, shape_parser)
+        assert result is not None
+        resource = session.resource("sqs")  # type: ignore
+        assert result.meta.resource_model.name == resource.meta.resource_model.name
+        assert inspect.getdoc(result.create_queue) == inspect.getdoc(resource.create_queue)
+        assert result.meta.client.meta.service_model is shape_parser.service_model
+
+        shape_parser = ShapeParser(session, ServiceNameCatalog.logs)
+        assert get_shape_service_resource(session, ServiceNameCatalog.logs, shape_parser) is None
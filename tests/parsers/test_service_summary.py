@@ -0,0 +1,25 @@
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_session
+from mypy_boto3_builder.parsers.service_summary import ServiceSummary
+from mypy_boto3_builder.parsers.shape_parser import ShapeParser
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+
+
+class TestServiceSummary:
+    def setup_method(self) -> None:
+        ServiceSummary.clear()
+
+    def test_get(self) -> None:
+        session = get_boto3_session()
+        for service_name in (ServiceNameCatalog.ec2, ServiceNameCatalog.s3):
+            summary = ServiceSummary.get(session, service_name)
+            client = session.client(service_name.boto3_name)  # type: ignore
+            assert summary.waiter_names == client.waiter_names
+            assert (
+                summary.paginator_names == ShapeParser(session, service_name).get_paginator_names()
+            )
+            assert summary.has_resource
+            assert ServiceSummary.get(session, service_name) is summary
+
+        summary = ServiceSummary.get(session, ServiceNameCatalog.add("xray", "XRay"))
+        assert not summary.has_resource
+        assert not summary.waiter_names
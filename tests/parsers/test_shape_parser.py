@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, patch
 
 from botocore.exceptions import UnknownServiceError
+from botocore.model import ShapeResolver
 
 from mypy_boto3_builder.parsers.shape_parser import ShapeParser
 
@@ -118,3 +119,50 @@ class TestShapeParser:
         assert result.arguments[1].is_kwflag()
         assert result.arguments[2].name == "optional_arg"
         assert result.arguments[3].name == "InputToken"
+
+    def test_parse_shape(self) -> None:
+        session_mock = MagicMock()
+        service_name_mock = MagicMock()
+        shape_resolver = ShapeResolver(
+            {
+                "MyString": {"type": "string", "enum": ["a", "b"]},
+                "MyList": {"type": "list", "member": {"shape": "MyString"}},
+            }
+        )
+        shape = shape_resolver.get_shape_by_name("MyList")
+        shape_parser = ShapeParser(session_mock, service_name_mock)
+        result = shape_parser.parse_shape(shape)
+        assert result.render() == "Sequence[MyStringType]"
+        assert shape_parser.parse_shape(shape) is result
+        assert shape_parser.parse_shape(shape, output=True).render() == "List[MyStringType]"
+        assert shape_parser.shape_cache_hits == 1
+        assert shape_parser.shape_cache_misses == 4
+        assert shape_parser.get_shape_cache_hit_rate() == 0.2
+
+    def test_parse_shape_interned(self) -> None:
+        session_mock = MagicMock()
+        service_name_mock = MagicMock()
+        shape_resolver = ShapeResolver(
+            {
+                "MyString": {"type": "string", "enum": ["a", "b"]},
+                "MyList": {"type": "list", "member": {"shape": "MyString"}},
+                "OtherList": {"type": "list", "member": {"shape": "MyString"}},
+                "MyMap": {"type": "map", "key": {"shape": "Key"}, "value": {"shape": "Key"}},
+                "OtherMap": {"type": "map", "key": {"shape": "Key"}, "value": {"shape": "Key"}},
+                "Key": {"type": "string"},
+            }
+        )
+        shape_parser = ShapeParser(session_mock, service_name_mock)
+        my_list = shape_parser.parse_shape(shape_resolver.get_shape_by_name("MyList"))
+        other_list = shape_parser.parse_shape(shape_resolver.get_shape_by_name("OtherList"))
+        assert other_list is my_list
+        output_list = shape_parser.parse_shape(
+            shape_resolver.get_shape_by_name("OtherList"), output=True
+        )
+        assert output_list.render() == "List[MyStringType]"
+        assert output_list.children[0] is my_list.children[0]  # type: ignore
+
+        my_map = shape_parser.parse_shape(shape_resolver.get_shape_by_name("MyMap"))
+        other_map = shape_parser.parse_shape(shape_resolver.get_shape_by_name("OtherMap"))
+        assert my_map.render() == "Mapping[str, str]"
+        assert other_map is my_map
@@ -1,3 +1,5 @@
+import pytest
+
 from mypy_boto3_builder.structures.argument import Argument
 from mypy_boto3_builder.structures.method import Method
 from mypy_boto3_builder.type_annotations.type import Type
@@ -24,3 +26,10 @@ class TestMethod:
             Type.none,
         )
         assert len(method.call_arguments) == 2
+
+    def test_slots(self) -> None:
+        method = Method("my_method", [Argument("self", None)], Type.none)
+        assert not hasattr(method, "__dict__")
+        assert not hasattr(method.arguments[0], "__dict__")
+        with pytest.raises(AttributeError):
+            method.unknown = True  # type: ignore
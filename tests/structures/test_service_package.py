@@ -1,12 +1,16 @@
 import pytest
 
 from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.argument import Argument
 from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.method import Method
 from mypy_boto3_builder.structures.paginator import Paginator
 from mypy_boto3_builder.structures.service_package import ServicePackage
 from mypy_boto3_builder.structures.service_resource import ServiceResource
 from mypy_boto3_builder.structures.waiter import Waiter
+from mypy_boto3_builder.type_annotations.type import Type
 from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
 from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
 
 
@@ -36,6 +40,25 @@ class TestServicePackage:
     def test_extract_typed_dicts(self) -> None:
         assert self.service_package.extract_typed_dicts() == []
 
+        service_package = self.service_package
+        parent = TypeTypedDict("Parent")
+        child = TypeTypedDict("Child")
+        recursive = TypeTypedDict("Recursive")
+        parent.add_attribute("child", child, True)
+        child.add_attribute("parent", parent, False)
+        child.add_attribute("recursive", TypeSubscript(Type.List, [recursive]), False)
+        recursive.add_attribute("recursive", recursive, False)
+        service_package.client.methods.append(
+            Method("method", [Argument("self", None), Argument("Data", parent)], Type.none)
+        )
+        result = service_package.extract_typed_dicts()
+        assert [i.name for i in result] == ["Child", "Parent", "Recursive"]
+        assert child.stringify
+        assert recursive.stringify
+        assert parent.replace_with_dict == {"Child"}
+        assert child.replace_with_dict == {"Parent"}
+        assert recursive.replace_with_dict == {"Recursive"}
+
     def test_get_init_import_records(self) -> None:
         assert len(self.service_package.get_init_import_records()) == 4
 
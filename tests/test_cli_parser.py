@@ -1,6 +1,15 @@
+import argparse
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from mypy_boto3_builder.cli_parser import get_absolute_path, parse_args
+import pytest
+
+from mypy_boto3_builder.cli_parser import (
+    get_absolute_path,
+    get_jobs_count,
+    parse_args,
+    parse_serve_args,
+)
 
 
 class TestCLIParser:
@@ -9,8 +18,23 @@ class TestCLIParser:
         result = parse_args([])
         assert result
 
+    def test_parse_serve_args(self) -> None:
+        result = parse_serve_args(["/tmp/builder.sock", "--watch"])
+        assert result.socket_path == Path("/tmp/builder.sock")
+        assert result.watch
+
     @patch("mypy_boto3_builder.cli_parser.Path")
     def test_get_absolute_path(self, PathMock: MagicMock) -> None:
         result = get_absolute_path("test/output")
         PathMock.assert_called_with("test/output")
         assert result == PathMock().absolute()
+
+    def test_get_jobs_count(self) -> None:
+        assert get_jobs_count("0") == 0
+        assert get_jobs_count("4") == 4
+        with pytest.raises(argparse.ArgumentTypeError):
+            get_jobs_count("-1")
+        with pytest.raises(argparse.ArgumentTypeError):
+            get_jobs_count("many")
+        with pytest.raises(SystemExit):
+            parse_args(["output", "-j", "-1"])
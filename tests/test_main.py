@@ -4,9 +4,16 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from mypy_boto3_builder.cli_parser import Namespace
-from mypy_boto3_builder.main import get_available_service_names, get_selected_service_names, main
+from mypy_boto3_builder.constants import MEMORY_OUTPUT_PATH, Product
+from mypy_boto3_builder.main import (
+    build,
+    get_available_service_names,
+    get_selected_service_names,
+    main,
+)
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.utils.boto3_changelog import Boto3Changelog
+from mypy_boto3_builder.writers.memory_output import MemoryOutput
 
 
 class TestMain:
@@ -51,3 +58,21 @@ class TestMain:
         main()
         Boto3GeneratorMock().generate_stubs.assert_called()
         Boto3GeneratorMock().generate_service_stubs.assert_called()
+
+    @patch("mypy_boto3_builder.main.get_available_service_names")
+    @patch("mypy_boto3_builder.main.Boto3Generator")
+    def test_build(self, Boto3GeneratorMock: MagicMock, _get_available_mock: MagicMock) -> None:
+        Boto3GeneratorMock().generate_service_stubs.side_effect = lambda: MemoryOutput.add(
+            MEMORY_OUTPUT_PATH / "package" / "module.pyi", b"content"
+        )
+        result = build(["s3"], [Product.boto3_services], "1.2.3", session=MagicMock())
+        assert result == {Path("package/module.pyi"): b"content"}
+        assert Boto3GeneratorMock.call_args.kwargs["version"] == "1.2.3"
+        assert not MemoryOutput.enabled
+        assert not MEMORY_OUTPUT_PATH.exists()
+
+    @patch("requests.Session.request")
+    def test_build_offline(self, request_mock: MagicMock) -> None:
+        result = build(["sqs"], [Product.boto3_services])
+        request_mock.assert_not_called()
+        assert Path("mypy_boto3_sqs_package/mypy_boto3_sqs/client.pyi") in result
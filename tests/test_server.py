@@ -0,0 +1,127 @@
+import os
+import socket
+import stat
+import struct
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from boto3.session import Session
+
+from mypy_boto3_builder.cli_parser import Namespace
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.server import (
+    BuilderServer,
+    BuilderServerError,
+    get_data_signature,
+    send_build_request,
+)
+from mypy_boto3_builder.service_name import ServiceName
+
+
+class TestServer:
+    def test_get_data_signature(self) -> None:
+        with tempfile.TemporaryDirectory() as data_dir:
+            data_path = Path(data_dir)
+            signature = get_data_signature([data_path, data_path / "missing"])
+            assert get_data_signature([data_path]) == signature
+            (data_path / "service-2.json").write_text("{}")
+            new_signature = get_data_signature([data_path])
+            assert new_signature != signature
+            (data_path / "service-2.json").write_text("{ }")
+            assert get_data_signature([data_path]) != new_signature
+
+    @contextmanager
+    def _serve(self, build: MagicMock, socket_path: Path) -> Iterator[BuilderServer]:
+        discover = MagicMock(return_value=[ServiceName("sqs", "SQS")])
+        with patch("mypy_boto3_builder.server.get_data_paths", return_value=[]):
+            with BuilderServer(socket_path, build=build, discover=discover) as server:
+                thread = threading.Thread(target=server.serve_forever, args=(0.01,))
+                thread.start()
+                try:
+                    yield server
+                finally:
+                    server.shutdown()
+                    thread.join()
+        assert not socket_path.exists()
+
+    def test_send_build_request(self) -> None:
+        def build(args: Namespace, session: Session, service_names: list[ServiceName]) -> None:
+            get_logger().info(f"Building {service_names[0].name} in {args.output_path}")
+
+        build_mock = MagicMock(side_effect=build)
+        with tempfile.TemporaryDirectory() as socket_dir, self._serve(
+            build_mock, Path(socket_dir) / "builder.sock"
+        ) as server, patch.object(get_logger(), "handle") as handle_mock:
+            assert send_build_request(server.socket_path, ["output", "-s", "sqs"]) == 0
+            args = build_mock.call_args[0][0]
+            assert args.output_path == Path.cwd() / "output"
+            assert args.service_names == ["sqs"]
+            assert handle_mock.call_args[0][0].getMessage() == (
+                f"Building sqs in {Path.cwd() / 'output'}"
+            )
+            assert server.last_request == (["output", "-s", "sqs"], Path.cwd())
+
+            build_mock.side_effect = ValueError("broken")
+            assert send_build_request(server.socket_path, ["other"]) == 1
+            assert server.last_request == (["output", "-s", "sqs"], Path.cwd())
+
+            missing_path = Path(socket_dir) / "missing"
+            with patch("mypy_boto3_builder.server.Path.cwd", return_value=missing_path):
+                assert send_build_request(server.socket_path, ["output"]) == 2
+            assert build_mock.call_count == 2
+
+            with pytest.raises(BuilderServerError):
+                BuilderServer(server.socket_path, build=build_mock, discover=MagicMock())
+
+    def test_access(self) -> None:
+        with tempfile.TemporaryDirectory() as socket_dir, self._serve(
+            MagicMock(), Path(socket_dir) / "builder.sock"
+        ) as server:
+            assert stat.S_IMODE(server.socket_path.stat().st_mode) == 0o600
+
+            request_mock = MagicMock(spec=socket.socket)
+            request_mock.getsockopt.return_value = struct.pack("3i", 1, os.getuid(), 0)
+            assert server.verify_request(request_mock, "")
+            request_mock.getsockopt.return_value = struct.pack("3i", 1, os.getuid() + 1, 0)
+            assert not server.verify_request(request_mock, "")
+
+    def test_send_build_request_no_server(self) -> None:
+        with tempfile.TemporaryDirectory() as data_dir:
+            with pytest.raises(BuilderServerError):
+                send_build_request(Path(data_dir) / "builder.sock", ["output"])
+
+    def test_service_actions(self) -> None:
+        build_mock = MagicMock()
+        discover_mock = MagicMock(return_value=[])
+        with tempfile.TemporaryDirectory() as data_dir, tempfile.TemporaryDirectory() as socket_dir:
+            data_path = Path(data_dir)
+            with patch("mypy_boto3_builder.server.get_data_paths", return_value=[data_path]):
+                server = BuilderServer(
+                    Path(socket_dir) / "builder.sock",
+                    build=build_mock,
+                    discover=discover_mock,
+                    watch=True,
+                    watch_interval=0,
+                )
+                try:
+                    server.service_actions()
+                    build_mock.assert_not_called()
+
+                    assert server.build(["output"], data_path) == 0
+                    assert build_mock.call_count == 1
+                    assert discover_mock.call_count == 1
+
+                    (data_path / "service-2.json").write_text("{}")
+                    with patch("mypy_boto3_builder.server.ServicePackageCache.clear") as clear_mock:
+                        server.service_actions()
+                        clear_mock.assert_called()
+                    assert build_mock.call_count == 2
+                    assert discover_mock.call_count == 2
+                    assert build_mock.call_args[0][0].output_path == data_path / "output"
+                finally:
+                    server.server_close()
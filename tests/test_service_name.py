@@ -27,6 +27,12 @@ class TestServiceName:
         assert not ServiceName("my-service", "MyService").is_essential()
         assert ServiceName("lambda", "MyService").is_essential()
 
+    def test_eq(self) -> None:
+        assert ServiceName("my-service", "MyService") == ServiceName("my-service", "Other")
+        assert ServiceName("my-service", "MyService") != ServiceName("other", "MyService")
+        assert ServiceName("my-service", "MyService") != "my-service"
+        assert {ServiceName("my-service", "MyService"): 1}[ServiceName("my-service", "Other")] == 1
+
 
 class TestServiceNameCatalog:
     def test_add(self) -> None:
@@ -0,0 +1,48 @@
+import os
+import pickle
+import subprocess
+import sys
+
+from mypy_boto3_builder.type_annotations.internal_import import InternalImport
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+
+CHECK_SCRIPT = """
+import pickle
+import sys
+
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+
+annotation = pickle.loads(sys.stdin.buffer.read())
+expected = TypeLiteral("StatusType", ["active", "inactive"])
+assert annotation == expected
+assert hash(annotation) == hash(expected)
+assert annotation in {expected}
+"""
+
+
+class TestFakeAnnotation:
+    def test_pickle(self) -> None:
+        annotation = TypeLiteral("StatusType", ["active", "inactive"])
+        assert hash(annotation)
+        data = pickle.dumps(annotation)
+        loaded = pickle.loads(data)
+        assert loaded == annotation
+        assert hash(loaded) == hash(annotation)
+        assert loaded.render() == annotation.render()
+
+        for hash_seed in ("1", "2"):
+            subprocess.run(
+                [sys.executable, "-c", CHECK_SCRIPT],
+                input=data,
+                env={**os.environ, "PYTHONHASHSEED": hash_seed},
+                check=True,
+            )
+
+    def test_invalidate_cache(self) -> None:
+        annotation = InternalImport("Name", stringify=False)
+        other = InternalImport("Other", stringify=False)
+        assert annotation.render() == "Name"
+        assert other.render() == "Other"
+        other.stringify = True
+        assert other.render() == '"Other"'
+        assert annotation._cached_render == "Name"
@@ -51,3 +51,14 @@ class TestTypeLiteral:
     def test_is_same(self) -> None:
         assert self.result.is_same(TypeLiteral("other", ["a", "b"]))
         assert not self.result.is_same(TypeLiteral("other", ["a", "b", "c"]))
+
+    def test_cache(self) -> None:
+        result = TypeLiteral("test", ["a"])
+        assert result.render() == "Literal['a']"
+        with pytest.raises(AttributeError):
+            result.children.add("b")  # type: ignore
+        result.children = {"a", "b"}
+        assert result.render() == "test"
+        result.name = "other"
+        assert result.render() == "other"
+        assert result.get_sort_key() == "other"
@@ -1,5 +1,6 @@
 from mypy_boto3_builder.type_annotations.type import Type
 from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
 
 
 class TestTypeSubscript:
@@ -27,6 +28,17 @@ class TestTypeSubscript:
         self.result.add_child(Type.bool)
         assert len(self.result.children) == 3
         assert self.result.children[-1] == Type.bool
+        assert self.result.render() == "Dict[str, int, bool]"
+
+    def test_cache(self) -> None:
+        typed_dict = TypeTypedDict("MyDict")
+        result = TypeSubscript(Type.List, [typed_dict])
+        assert result.render() == "List[MyDict]"
+        typed_dict.stringify = True
+        assert result.render() == 'List["MyDict"]'
+        assert result.get_sort_key() == 'List["MyDict"]'
+        result.parent = Type.Sequence
+        assert str(result) == 'Sequence["MyDict"]'
 
     def test_is_dict(self) -> None:
         assert self.result.is_dict()
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from mypy_boto3_builder.type_annotations.type import Type
@@ -60,8 +62,40 @@ class TestTypeTypedDict:
         assert self.result.get_types() == {self.result}
 
     def test_add_attribute(self) -> None:
+        old_hash = hash(self.result)
         self.result.add_attribute("third", Type.int, False)
         assert len(self.result.children) == 3
+        assert hash(self.result) != old_hash
+
+    def test_cache(self) -> None:
+        assert self.result.render() == "MyDict"
+        self.result.stringify = True
+        assert self.result.render() == '"MyDict"'
+        self.result.name = "NewDict"
+        assert self.result.render() == '"NewDict"'
+        assert self.result.get_sort_key() == "NewDict"
+
+        old_hash = hash(self.result)
+        self.result.children = self.result.children[:1]
+        assert hash(self.result) != old_hash
+
+        self.result.replace_with_dict.add("Parent")
+        assert self.result.render("Parent") == "Dict[str, Any]"
+        assert self.result.render() == '"NewDict"'
+
+        old_hash = hash(self.result)
+        self.result.children[0].type_annotation = Type.str
+        assert self.result.render_class() == "class NewDict:\n    required: str"
+        assert hash(self.result) == old_hash
+
+    def test_slots(self) -> None:
+        assert not hasattr(self.result, "__dict__")
+        assert not hasattr(self.result.children[0], "__dict__")
+        self.result.render()
+        result = pickle.loads(pickle.dumps(self.result))
+        assert result.render() == "MyDict"
+        assert result.children[0].render() == "required: bool"
+        assert TypeTypedDict("Empty").render() == "Empty"
 
     def test_is_dict(self) -> None:
         assert self.result.is_dict()
@@ -148,6 +182,3 @@ class TestTypeTypedDict:
     def test_get_children_literals(self) -> None:
         assert len(self.result.get_children_literals()) == 0
         assert len(self.result.get_children_literals([self.result])) == 0
-
-    def test_replace_self_references(self) -> None:
-        self.result.replace_self_references()
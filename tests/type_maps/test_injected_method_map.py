@@ -0,0 +1,41 @@
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_session
+from mypy_boto3_builder.parsers.client import get_shape_public_methods
+from mypy_boto3_builder.parsers.helpers import get_public_methods
+from mypy_boto3_builder.parsers.shape_parser import ShapeParser
+from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
+from mypy_boto3_builder.type_maps.injected_method_map import (
+    INJECTED_CLIENT_METHOD_MAP,
+    get_injected_client_methods,
+)
+
+
+class TestInjectedMethodMap:
+    def test_get_injected_client_methods(self) -> None:
+        result = get_injected_client_methods(ServiceNameCatalog.s3)
+        assert result["upload_file"].__module__ == "boto3.s3.inject"  # type: ignore
+        assert "close" in result
+        assert get_injected_client_methods(ServiceName("qbusiness", "QBusiness"))["chat"] is None
+
+    def test_map(self) -> None:
+        session = get_boto3_session()
+        for service_name in INJECTED_CLIENT_METHOD_MAP:
+            if service_name == "*":
+                continue
+            client_class = type(session.client(service_name))  # type: ignore
+            for method_name, path in INJECTED_CLIENT_METHOD_MAP[service_name].items():
+                assert hasattr(client_class, method_name) == (path is not None), method_name
+
+    def test_live_client(self) -> None:
+        session = get_boto3_session()
+        for service_name in (
+            ServiceNameCatalog.s3,
+            ServiceNameCatalog.ec2,
+            ServiceName("rds", "RDS"),
+            ServiceNameCatalog.dynamodb,
+            ServiceName("dsql", "DSQL"),
+            ServiceName("qbusiness", "QBusiness"),
+        ):
+            client = session.client(service_name.boto3_name)  # type: ignore
+            shape_parser = ShapeParser(session, service_name)
+            result = get_shape_public_methods(service_name, shape_parser.service_model)
+            assert list(result) == list(get_public_methods(client)), service_name.boto3_name
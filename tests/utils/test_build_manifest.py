@@ -0,0 +1,50 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.utils.build_manifest import (
+    BuildManifest,
+    get_builder_hash,
+    get_fingerprint,
+    get_service_fingerprint,
+)
+
+
+class TestBuildManifest:
+    def test_get_fingerprint(self) -> None:
+        assert len(get_builder_hash()) == 64
+        assert get_fingerprint(version="1.2.3") == get_fingerprint(version="1.2.3")
+        assert get_fingerprint(version="1.2.3") != get_fingerprint(version="1.2.4")
+
+    @patch("mypy_boto3_builder.utils.build_manifest.get_service_model_hash")
+    def test_get_service_fingerprint(self, get_service_model_hash_mock: MagicMock) -> None:
+        session_mock = MagicMock()
+        service_name = ServiceName("s3", "S3")
+        get_service_model_hash_mock.return_value = "hash"
+        fingerprint = get_service_fingerprint(session_mock, service_name, [service_name])
+        get_service_model_hash_mock.assert_called_with(session_mock, service_name)
+        assert fingerprint == get_service_fingerprint(session_mock, service_name, [service_name])
+        assert fingerprint != get_service_fingerprint(session_mock, service_name, [])
+        get_service_model_hash_mock.return_value = "new_hash"
+        assert fingerprint != get_service_fingerprint(session_mock, service_name, [service_name])
+
+    def test_is_up_to_date(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            file_path = output_path / "package" / "file.pyi"
+            file_path.parent.mkdir()
+            file_path.write_text("content")
+            manifest = BuildManifest(output_path)
+            assert not manifest.is_up_to_date("key", "fingerprint")
+
+            manifest.update("key", "fingerprint", [file_path])
+            assert manifest.is_up_to_date("key", "fingerprint")
+            assert not manifest.is_up_to_date("key", "other")
+            assert not manifest.is_up_to_date("other", "fingerprint")
+
+            file_path.unlink()
+            assert not manifest.is_up_to_date("key", "fingerprint")
+
+            (manifest.path / "key.json").write_text("broken")
+            assert not manifest.is_up_to_date("key", "fingerprint")
@@ -0,0 +1,71 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mypy_boto3_builder.utils.profiler import Profiler, Span
+
+
+class TestProfiler:
+    def setup_method(self) -> None:
+        Profiler.clear()
+
+    def teardown_method(self) -> None:
+        Profiler.clear()
+
+    def test_span_disabled(self) -> None:
+        with Profiler.span("parse", service="s3"):
+            pass
+        assert Profiler.pop_spans() == []
+
+    @patch.object(Profiler, "enabled", True)
+    def test_span(self) -> None:
+        with Profiler.span("parse", service="s3"):
+            with Profiler.span("render", file="client.pyi"):
+                pass
+        with pytest.raises(ValueError):
+            with Profiler.span("write"):
+                raise ValueError("error")
+
+        render, parse, write = Profiler.pop_spans()
+        assert render.name == "render"
+        assert render.service == "s3"
+        assert render.args == {"file": "client.pyi"}
+        assert parse.name == "parse"
+        assert parse.start <= render.start
+        assert parse.duration >= render.duration
+        assert write.service == ""
+        assert Profiler.pop_spans() == []
+
+    def test_get_summary(self) -> None:
+        Profiler.add_spans(
+            [
+                Span("parse", 1_000_000, 2_000_000, "s3"),
+                Span("parse", 2_000_000, 1_000_000, "ec2"),
+                Span("write", 3_000_000, 500_000, "s3"),
+            ]
+        )
+        summary = Profiler.get_summary()
+        assert summary["duration"] == 2.5
+        assert summary["stages"] == {
+            "parse": {"count": 2, "total": 3.0, "max": 2.0},
+            "write": {"count": 1, "total": 0.5, "max": 0.5},
+        }
+        assert list(summary["services"]) == ["s3", "ec2"]
+        assert summary["services"]["s3"] == {"parse": 2.0, "write": 0.5}
+
+    def test_write_report(self) -> None:
+        Profiler.add_spans([Span("render", 10, 5, "s3", {"file": "client.pyi"})])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "profile"
+            Profiler.write_report(path)
+            report = json.loads((path / Profiler.REPORT_NAME).read_text())
+            trace = json.loads((path / Profiler.TRACE_NAME).read_text())
+        assert report["stages"]["render"]["count"] == 1
+        event = trace["traceEvents"][0]
+        assert event["ph"] == "X"
+        assert event["ts"] == 10
+        assert event["dur"] == 5
+        assert event["args"] == {"file": "client.pyi", "service": "s3"}
@@ -0,0 +1,97 @@
+import json
+import tempfile
+from json.decoder import JSONDecodeError
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mypy_boto3_builder.constants import PYPI_REQUEST_TIMEOUT
+from mypy_boto3_builder.utils.pypi_manager import PyPIManager
+
+
+class TestPyPIManager:
+    def setup_method(self) -> None:
+        PyPIManager.clear()
+
+    def teardown_method(self) -> None:
+        PyPIManager.clear()
+
+    @patch.object(PyPIManager, "_get_session")
+    def test_get_next_version(self, get_session_mock: MagicMock) -> None:
+        get_session_mock().get().status_code = 200
+        get_session_mock().get().json.return_value = {"releases": {"1.2.3": [], "1.2.3.post1": []}}
+        manager = PyPIManager("my-package")
+        assert manager.has_version("1.2.3")
+        assert not manager.has_version("1.2.4")
+        assert manager.get_next_version("1.2.3") == "1.2.3.post2"
+        assert manager.get_next_version("1.2.4") == "1.2.4"
+        get_session_mock().get.assert_called_with(
+            "https://pypi.org/pypi/my-package/json", timeout=PYPI_REQUEST_TIMEOUT
+        )
+        get_session_mock().get().raise_for_status.assert_called_with()
+
+    @patch.object(PyPIManager, "_get_session")
+    def test_prefetch(self, get_session_mock: MagicMock) -> None:
+        get_session_mock().get().status_code = 404
+        get_session_mock().get.reset_mock()
+        PyPIManager.prefetch(["package-a", "package_b", "package-a"])
+        assert get_session_mock().get.call_count == 2
+        assert not PyPIManager("Package-B").has_version("1.0.0")
+        assert get_session_mock().get.call_count == 2
+
+    @patch.object(PyPIManager, "_get_session")
+    def test_disk_cache(self, get_session_mock: MagicMock) -> None:
+        get_session_mock().get().status_code = 200
+        get_session_mock().get().json.return_value = {"releases": {"1.0.0": []}}
+        get_session_mock().get.reset_mock()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            PyPIManager.enable_disk_cache(Path(temp_dir))
+            assert PyPIManager("package").has_version("1.0.0")
+            assert json.loads((Path(temp_dir) / "package.json").read_text())["versions"] == [
+                "1.0.0"
+            ]
+
+            PyPIManager.clear()
+            PyPIManager.enable_disk_cache(Path(temp_dir))
+            assert PyPIManager("package").has_version("1.0.0")
+            assert get_session_mock().get.call_count == 1
+
+            PyPIManager.clear()
+            PyPIManager.enable_disk_cache(Path(temp_dir), ttl=-1)
+            assert PyPIManager("package").has_version("1.0.0")
+            assert get_session_mock().get.call_count == 2
+
+            PyPIManager.clear()
+            PyPIManager.enable_disk_cache(Path(temp_dir), ttl=-1)
+            get_session_mock().get().json.side_effect = JSONDecodeError("error", "", 0)
+            assert not PyPIManager("package").has_version("1.0.0")
+            assert json.loads((Path(temp_dir) / "package.json").read_text())["versions"] == [
+                "1.0.0"
+            ]
+
+    @patch.object(PyPIManager, "_get_session")
+    def test_use_offline_index(self, get_session_mock: MagicMock) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index_path = Path(temp_dir) / "index.json"
+            index_path.write_text(json.dumps({"My_Package": ["1.0.0"]}))
+            PyPIManager.use_offline_index(index_path)
+            assert PyPIManager("my-package").has_version("1.0.0")
+            assert not PyPIManager("other-package").has_version("1.0.0")
+            PyPIManager.prefetch(["other-package"])
+
+            PyPIManager.clear()
+            package_path = Path(temp_dir) / "simple" / "my-package"
+            package_path.mkdir(parents=True)
+            (package_path / "index.html").write_text(
+                "<html><body>"
+                '<a href="my_package-1.0.0-py3-none-any.whl">my_package-1.0.0-py3-none-any.whl</a>'
+                '<a href="my-package-1.1.0.tar.gz">my-package-1.1.0.tar.gz</a>'
+                "</body></html>"
+            )
+            PyPIManager.use_offline_index(package_path.parent)
+            assert PyPIManager("my_package").has_version("1.0.0")
+            assert PyPIManager("my_package").get_next_version("1.1.0") == "1.1.0.post1"
+
+        PyPIManager.clear()
+        PyPIManager.use_offline_index()
+        assert not PyPIManager("my-package").has_version("1.0.0")
+        get_session_mock.assert_not_called()
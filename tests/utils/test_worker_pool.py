@@ -0,0 +1,78 @@
+import logging
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mypy_boto3_builder.utils.worker_pool import LogRecordCollector, WorkerPool, _run_task
+from mypy_boto3_builder.writers.memory_output import MemoryOutput
+
+
+def _task(session: object, name: str) -> None:
+    if name == "error":
+        raise ValueError(name)
+    logging.getLogger("test_worker_pool").info("task %s", name)
+
+
+class TestLogRecordCollector:
+    def test_emit(self) -> None:
+        collector = LogRecordCollector()
+        record = logging.LogRecord("test", logging.INFO, "path", 1, "msg %s", ("arg",), None)
+        collector.emit(record)
+        records = collector.pop_records()
+        assert len(records) == 1
+        assert records[0].msg == "msg arg"
+        assert records[0].args is None
+        assert collector.pop_records() == []
+
+
+class TestWorkerPool:
+    def test_init(self) -> None:
+        session = MagicMock()
+        assert WorkerPool(session).jobs == 1
+        assert not WorkerPool(session).is_parallel
+        assert WorkerPool(session, jobs=4).is_parallel
+        with patch("mypy_boto3_builder.utils.worker_pool.os.cpu_count", return_value=3):
+            assert WorkerPool(session, jobs=0).jobs == 3
+
+    def test_run_serial(self) -> None:
+        session = MagicMock()
+        func = MagicMock()
+        with WorkerPool(session) as pool:
+            jobs = pool.run(func, [{"name": "a"}, {"name": "b"}])
+            func.assert_not_called()
+            next(jobs)
+            func.assert_called_once_with(session=session, name="a")
+            assert len(list(jobs)) == 1
+            func.assert_called_with(session=session, name="b")
+
+    def test_run_parallel(self) -> None:
+        pool_mock = MagicMock()
+        records = [logging.LogRecord("test", logging.INFO, "path", 1, "msg", None, None)]
+        files = {Path("/output/module.pyi"): b"content"}
+        pool_mock.imap.return_value = [
+            (records, [], files, None, ""),
+            ([], [], {}, ValueError("error"), "tb"),
+        ]
+        worker_pool = WorkerPool(MagicMock(), jobs=2)
+        worker_pool.logger = MagicMock()
+        with patch("mypy_boto3_builder.utils.worker_pool.Pool", return_value=pool_mock):
+            jobs = worker_pool.run(_task, [{"name": "a"}, {"name": "error"}])
+            pool_mock.imap.assert_called_once()
+            next(jobs)
+            worker_pool.logger.handle.assert_called_once_with(records[0])
+            assert MemoryOutput.pop_files() == files
+            with pytest.raises(ValueError) as exc_info:
+                next(jobs)
+            assert str(exc_info.value.__cause__) == "tb"
+            worker_pool.close(terminate=True)
+        pool_mock.terminate.assert_called_once_with()
+        pool_mock.join.assert_called_once_with()
+
+    def test_run_task(self) -> None:
+        records, _spans, _files, error, error_traceback = _run_task(_task, {"name": "a"})
+        assert error is None
+        assert error_traceback == ""
+        records, _spans, _files, error, error_traceback = _run_task(_task, {"name": "error"})
+        assert isinstance(error, ValueError)
+        assert "ValueError" in error_traceback
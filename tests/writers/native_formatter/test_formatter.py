@@ -0,0 +1,232 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mypy_boto3_builder.constants import Product
+from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
+from mypy_boto3_builder.main import build
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_session
+from mypy_boto3_builder.writers.formatter_cache import FormatterCache
+from mypy_boto3_builder.writers.native_formatter.errors import UnsupportedSyntaxError
+from mypy_boto3_builder.writers.native_formatter.formatter import format_code, format_stub
+from mypy_boto3_builder.writers.utils import blackify, sort_imports
+
+MODULE_NAME = "mypy_boto3_s3"
+THIRD_PARTY = ["boto3", "botocore", "aiobotocore", MODULE_NAME]
+
+CLIENT_STUB = '''"""
+Type annotations for s3 service client.
+
+Usage::
+
+    ```python
+    from mypy_boto3_s3.client import S3Client
+    ```
+"""
+from .literals import BucketCannedACLType
+from .paginator import ListObjectsV2Paginator
+from .paginator import ListBucketsPaginator
+from datetime import datetime
+import sys
+from typing import Any
+from typing import Dict
+from typing import Mapping
+from typing import Type
+from typing import Union
+from typing import overload
+from botocore.client import BaseClient
+from botocore.client import ClientMeta
+from .type_defs import AbortMultipartUploadOutputTypeDef
+if sys.version_info >= (3, 9):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+
+__all__ = (
+"S3Client",
+
+)
+
+class BotocoreClientError(BaseException):
+    MSG_TEMPLATE: str
+
+    def __init__(
+        self,
+        error_response: Mapping[str, Any],
+        operation_name: str
+    ) -> None:
+        self.response: Dict[str, Any]
+        self.operation_name: str
+class Exceptions:
+    ClientError: Type[BotocoreClientError]
+    NoSuchBucket: Type[BotocoreClientError]
+
+
+
+class S3Client(BaseClient):
+    """
+    [Show boto3 documentation](https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client)
+    """
+    meta: ClientMeta
+
+    @property
+    def exceptions(
+        self
+    ) -> Exceptions:
+        """
+        S3Client exceptions.
+        """
+
+
+    def abort_multipart_upload(
+        self,
+        *,
+        Bucket: str,
+        Key: str,
+        UploadId: str,
+        RequestPayer: Literal['requester'] = ...,
+        ExpectedBucketOwner: str = ...,
+        IfMatchInitiatedTime: Union[datetime, str] = ...
+    ) -> AbortMultipartUploadOutputTypeDef:
+        """
+        This operation aborts a multipart upload.
+        """
+
+
+    def can_paginate(
+        self,
+        operation_name: str
+    ) -> bool:
+        """
+        Check if an operation can be paginated.
+        """
+
+
+    @overload
+    def get_paginator(
+        self,
+        operation_name: Literal['list_buckets']
+    ) -> ListBucketsPaginator:
+        """
+        [Show boto3 documentation](https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.get_paginator)
+        """
+
+
+    @overload
+    def get_paginator(
+        self,
+        operation_name: Literal['list_objects_v2']
+    ) -> ListObjectsV2Paginator:
+        """
+        [Show boto3 documentation](https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.get_paginator)
+        """
+'''
+
+TYPE_DEFS_STUB = '''"""
+Type annotations for s3 service type definitions.
+"""
+from .literals import BucketAbacStatusType
+from .literals import ChecksumAlgorithmType
+import sys
+from datetime import datetime
+from typing import List
+from typing import Sequence
+from typing import Union
+from botocore.response import StreamingBody
+if sys.version_info >= (3, 9):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+if sys.version_info >= (3, 9):
+    from typing import TypedDict
+else:
+    from typing_extensions import TypedDict
+
+
+__all__ = (
+    "AbacStatusTypeDef",
+    "AbortMultipartUploadRequestRequestTypeDef",
+    "GetObjectOutputTypeDef",
+)
+
+AbacStatusTypeDef = TypedDict("AbacStatusTypeDef", {"Status": BucketAbacStatusType, }, total=False)
+
+_RequiredAbortMultipartUploadRequestRequestTypeDef = TypedDict("_RequiredAbortMultipartUploadRequestRequestTypeDef", {"Bucket": str, "Key": str, "UploadId": str, })
+_OptionalAbortMultipartUploadRequestRequestTypeDef = TypedDict("_OptionalAbortMultipartUploadRequestRequestTypeDef", {"RequestPayer": Literal['requester'], "ExpectedBucketOwner": str, "IfMatchInitiatedTime": Union[datetime, str], }, total=False)
+class AbortMultipartUploadRequestRequestTypeDef(_RequiredAbortMultipartUploadRequestRequestTypeDef, _OptionalAbortMultipartUploadRequestRequestTypeDef):
+    pass
+
+GetObjectOutputTypeDef = TypedDict("GetObjectOutputTypeDef", {"Body": StreamingBody, "ChecksumAlgorithm": List[ChecksumAlgorithmType], "Tags": Sequence["TagTypeDef"], "LastModified": datetime, })
+'''
+
+LITERALS_STUB = '''"""
+Type annotations for s3 service literal definitions.
+"""
+import sys
+if sys.version_info >= (3, 9):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+
+__all__ = (
+    "BucketCannedACLType",
+    "StorageClassType",
+)
+
+BucketCannedACLType = Literal['authenticated-read', 'private', 'public-read', 'public-read-write']
+StorageClassType = Literal['DEEP_ARCHIVE', 'EXPRESS_ONEZONE', 'GLACIER', 'GLACIER_IR', 'INTELLIGENT_TIERING', 'ONEZONE_IA', 'OUTPOSTS', 'REDUCED_REDUNDANCY', 'SNOW', 'STANDARD', 'STANDARD_IA']
+S3ServiceName = Literal['s3']
+'''
+
+
+def _black_reference(content: str, suffix: str) -> str:
+    content = sort_imports(content, MODULE_NAME, extension="pyi", third_party=THIRD_PARTY)
+    return blackify(content, Path(f"module{suffix}"))
+
+
+class TestFormatter:
+    def setup_method(self) -> None:
+        FormatterCache.clear()
+
+    @pytest.mark.parametrize("content", [CLIENT_STUB, TYPE_DEFS_STUB, LITERALS_STUB])
+    @pytest.mark.parametrize("extension", ["pyi", "py"])
+    def test_format_stub(self, content: str, extension: str) -> None:
+        result = format_stub(content, MODULE_NAME, extension=extension, third_party=THIRD_PARTY)
+        assert result == _black_reference(content, f".{extension}")
+
+    def test_format_code(self) -> None:
+        assert format_code("") == ""
+        assert format_code("\n\n") == "\n"
+        assert format_code("a = 1\n") == "a = 1\n"
+        assert format_code("x = ['a', 'b',]\n") == 'x = [\n    "a",\n    "b",\n]\n'
+        assert format_code("class A:\n    pass\nclass B: ...\n", is_pyi=True) == (
+            "class A:\n    pass\n\nclass B: ...\n"
+        )
+
+    def test_unsupported(self) -> None:
+        with pytest.raises(UnsupportedSyntaxError):
+            format_code("from __future__ import annotations\n")
+        with pytest.raises(UnsupportedSyntaxError):
+            format_code("a = 1  # fmt: skip\n")
+
+    @patch("requests.Session.request")
+    def test_generated_corpus(self, _request_mock: MagicMock) -> None:
+        service_names = ["sqs", "dynamodb"]
+        products = [Product.boto3_services, Product.aiobotocore_services]
+        session = get_boto3_session()
+        expected = build(service_names, products, session=session)
+        result = build(service_names, products, native_format=True, session=session)
+        assert list(result) == list(expected)
+        module_names = {i.value for i in ServiceModuleName}
+        for path, content in result.items():
+            assert content == expected[path], path
+            if path.stem not in module_names:
+                continue
+            text = content.decode()
+            try:
+                assert format_code(text, is_pyi=path.suffix == ".pyi") == text, path
+            except UnsupportedSyntaxError:
+                continue
@@ -0,0 +1,50 @@
+import pytest
+
+from mypy_boto3_builder.writers.formatter_cache import FormatterCache
+from mypy_boto3_builder.writers.native_formatter.errors import UnsupportedSyntaxError
+from mypy_boto3_builder.writers.native_formatter.imports import sort_imports
+from mypy_boto3_builder.writers.utils import sort_imports as isort_sort_imports
+
+IMPORTS = """\"\"\"
+Module docstring.
+\"\"\"
+from .type_defs import TagTypeDef
+from .literals import EventType
+from mypy_boto3_s3.client import S3Client
+from datetime import datetime
+import sys
+from typing import Sequence
+from typing import IO
+from typing import overload
+from boto3.resources.base import ServiceResource as Boto3ServiceResource
+from boto3.resources.collection import ResourceCollection
+from botocore.client import BaseClient
+from typing_extensions import Literal
+if sys.version_info >= (3, 9):
+    from typing import TypedDict
+else:
+    from typing_extensions import TypedDict
+
+
+__all__ = ("S3Client",)
+"""
+
+
+class TestImports:
+    def setup_method(self) -> None:
+        FormatterCache.clear()
+
+    @pytest.mark.parametrize("extension", ["pyi", "py"])
+    def test_sort_imports(self, extension: str) -> None:
+        third_party = ["boto3", "botocore", "aiobotocore", "mypy_boto3_s3"]
+        for module_name in ("mypy_boto3_s3", "boto3"):
+            assert sort_imports(
+                IMPORTS, module_name, extension=extension, third_party=third_party
+            ) == isort_sort_imports(
+                IMPORTS, module_name, extension=extension, third_party=third_party
+            )
+        assert sort_imports("", "mypy_boto3_s3") == isort_sort_imports("", "mypy_boto3_s3")
+
+    def test_unsupported(self) -> None:
+        with pytest.raises(UnsupportedSyntaxError):
+            sort_imports("from . import *\n", "mypy_boto3_s3")
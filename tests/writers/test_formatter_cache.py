@@ -0,0 +1,70 @@
+import tempfile
+from pathlib import Path
+
+from mypy_boto3_builder.writers.formatter_cache import FormatterCache
+
+
+class TestFormatterCache:
+    def setup_method(self) -> None:
+        FormatterCache.clear()
+
+    def teardown_method(self) -> None:
+        FormatterCache.clear()
+        FormatterCache._disk_path = None
+
+    def test_get_key(self) -> None:
+        key = FormatterCache.get_key("content", "black", True)
+        assert key == FormatterCache.get_key("content", "black", True)
+        assert key != FormatterCache.get_key("content", "black", False)
+        assert key != FormatterCache.get_key("other", "black", True)
+
+    def test_get(self) -> None:
+        assert FormatterCache.get("key") is None
+        FormatterCache.set("key", "value")
+        assert FormatterCache.get("key") == "value"
+        FormatterCache.clear()
+        assert FormatterCache.get("key") is None
+
+    def test_memory_eviction(self) -> None:
+        max_memory_size = FormatterCache.max_memory_size
+        FormatterCache.max_memory_size = 10
+        try:
+            FormatterCache.set("key1", "12345")
+            FormatterCache.set("key2", "12345")
+            assert FormatterCache.get("key1") == "12345"
+            FormatterCache.set("key3", "12345")
+            assert FormatterCache.get("key1") == "12345"
+            assert FormatterCache.get("key2") is None
+            assert FormatterCache.get("key3") == "12345"
+        finally:
+            FormatterCache.max_memory_size = max_memory_size
+
+    def test_disk_cache(self) -> None:
+        max_disk_size = FormatterCache.max_disk_size
+        with tempfile.TemporaryDirectory() as cache_dir:
+            FormatterCache.enable_disk_cache(Path(cache_dir))
+            assert FormatterCache.get_disk_cache_path() == Path(cache_dir)
+            assert FormatterCache._disk_size is None
+            FormatterCache.set("key1", "value")
+            assert FormatterCache._disk_size == 5
+            FormatterCache.clear()
+            assert FormatterCache.get("key1") == "value"
+
+            FormatterCache.max_disk_size = 10
+            try:
+                FormatterCache.set("key2", "value")
+                FormatterCache.set("key3", "value")
+            finally:
+                FormatterCache.max_disk_size = max_disk_size
+            assert len(list(Path(cache_dir).glob("*/*"))) == 1
+
+    def test_disk_cache_corrupted(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            FormatterCache.enable_disk_cache(Path(cache_dir))
+            FormatterCache.set("key1", "value")
+            FormatterCache.clear()
+            entry_path = FormatterCache._get_disk_entry_path("key1")
+            entry_path.write_bytes(b"valu\xe2\x82")
+            assert FormatterCache.get("key1") is None
+            assert not entry_path.exists()
+            assert FormatterCache._disk_size is None
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+from mypy_boto3_builder.writers.memory_output import MemoryOutput
+
+
+class TestMemoryOutput:
+    def test_add(self) -> None:
+        MemoryOutput.enable()
+        try:
+            MemoryOutput.add(Path("/output/module.pyi"), b"module")
+            MemoryOutput.add_files({Path("/output/other.pyi"): b"other"})
+            assert MemoryOutput.pop_files() == {
+                Path("/output/module.pyi"): b"module",
+                Path("/output/other.pyi"): b"other",
+            }
+            assert MemoryOutput.pop_files() == {}
+            MemoryOutput.add(Path("/output/module.pyi"), b"module")
+        finally:
+            MemoryOutput.disable()
+        assert not MemoryOutput.enabled
+        assert MemoryOutput.pop_files() == {}
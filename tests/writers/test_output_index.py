@@ -0,0 +1,48 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from mypy_boto3_builder.writers.output_index import OutputIndex
+
+
+class TestOutputIndex:
+    def test_get_files(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            (output_path / "package" / "module").mkdir(parents=True)
+            (output_path / "package" / "module" / "old.pyi").write_text("old")
+            (output_path / "package_docs").mkdir()
+            (output_path / "package_docs" / "README.md").write_text("docs")
+            (output_path / "README.md").write_text("readme")
+            OutputIndex.scan(output_path)
+            try:
+                (output_path / "package" / "new.pyi").write_text("new")
+                with patch("mypy_boto3_builder.writers.output_index.os.walk") as walk_mock:
+                    assert OutputIndex.get_files(output_path / "package") == [
+                        output_path / "package" / "module" / "old.pyi"
+                    ]
+                    assert OutputIndex.get_files(output_path / "package" / "module") == [
+                        output_path / "package" / "module" / "old.pyi"
+                    ]
+                    assert OutputIndex.get_files(output_path / "unknown") == []
+                    assert len(OutputIndex.get_files(output_path)) == 3
+                    walk_mock.assert_not_called()
+            finally:
+                OutputIndex.clear()
+
+            assert OutputIndex.get_paths() == {}
+            assert sorted(OutputIndex.get_files(output_path / "package")) == [
+                output_path / "package" / "module" / "old.pyi",
+                output_path / "package" / "new.pyi",
+            ]
+
+    def test_set_paths(self) -> None:
+        paths = {Path("output"): {"package": (Path("output/package/module.pyi"),)}}
+        OutputIndex.set_paths(paths)
+        try:
+            assert OutputIndex.get_paths() == paths
+            assert OutputIndex.get_files(Path("output/package")) == [
+                Path("output/package/module.pyi")
+            ]
+        finally:
+            OutputIndex.clear()
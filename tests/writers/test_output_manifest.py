@@ -0,0 +1,124 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from mypy_boto3_builder.writers.output_manifest import OutputManifest
+
+
+class TestOutputManifest:
+    def test_write_text(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir) / "output"
+            manifest_path = Path(output_dir) / "manifest.json"
+            file_path = output_path / "package" / "module.pyi"
+            manifest = OutputManifest(output_path, manifest_path)
+            assert manifest.write_text(file_path, "content")
+            assert file_path.read_text() == "content"
+            assert not manifest.write_text(file_path, "content")
+            manifest.save()
+            assert manifest.manifest_path.exists()
+
+            manifest = OutputManifest(output_path, manifest_path)
+            with patch.object(Path, "read_text") as read_text_mock:
+                assert not manifest.write_text(file_path, "content")
+                read_text_mock.assert_not_called()
+            assert manifest.write_text(file_path, "new content")
+            assert file_path.read_text() == "new content"
+            manifest.save()
+
+            file_path.write_text("changed")
+            os.utime(file_path, ns=(0, 0))
+            manifest = OutputManifest(output_path, manifest_path)
+            assert manifest.write_text(file_path, "new content")
+            assert file_path.read_text() == "new content"
+
+    def test_write_text_no_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir) / "output"
+            manifest_path = Path(output_dir) / "manifest.json"
+            file_path = output_path / "module.pyi"
+            output_path.mkdir()
+            file_path.write_text("content")
+            mtime = file_path.stat().st_mtime_ns
+            manifest = OutputManifest(output_path, manifest_path)
+            assert not manifest.write_text(file_path, "content")
+            assert file_path.stat().st_mtime_ns == mtime
+
+            manifest_path.write_text("broken")
+            manifest = OutputManifest(output_path, manifest_path)
+            assert not manifest.write_text(file_path, "content")
+
+    def test_copy_file(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir, tempfile.TemporaryDirectory() as source_dir:
+            output_path = Path(output_dir) / "output"
+            manifest_path = Path(output_dir) / "manifest.json"
+            source_path = Path(source_dir) / "static.pyi"
+            source_path.write_text("static")
+            file_path = output_path / "static.pyi"
+            manifest = OutputManifest(output_path, manifest_path)
+            assert manifest.copy_file(file_path, source_path)
+            assert file_path.read_text() == "static"
+            manifest.save()
+
+            manifest = OutputManifest(output_path, manifest_path)
+            with patch.object(Path, "read_text") as read_text_mock:
+                assert not manifest.copy_file(file_path, source_path)
+                read_text_mock.assert_not_called()
+            manifest.save()
+
+            os.utime(source_path, ns=(0, 0))
+            manifest = OutputManifest(output_path, manifest_path)
+            assert not manifest.copy_file(file_path, source_path)
+            manifest.save()
+
+            source_path.write_text("updated")
+            manifest = OutputManifest(output_path, manifest_path)
+            assert manifest.copy_file(file_path, source_path)
+            assert file_path.read_text() == "updated"
+
+    def test_save(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir) / "output"
+            manifest_path = Path(output_dir) / "manifest.json"
+            manifest = OutputManifest(output_path, manifest_path)
+            manifest.write_text(output_path / "old.pyi", "old")
+            manifest.save()
+            mtime = manifest.manifest_path.stat().st_mtime_ns
+
+            manifest = OutputManifest(output_path, manifest_path)
+            manifest.write_text(output_path / "old.pyi", "old")
+            manifest.save()
+            assert manifest.manifest_path.stat().st_mtime_ns == mtime
+
+            manifest = OutputManifest(output_path, manifest_path)
+            manifest.write_text(output_path / "new.pyi", "new")
+            manifest.save()
+            assert "old.pyi" not in manifest.manifest_path.read_text()
+            assert "new.pyi" in manifest.manifest_path.read_text()
+
+    def test_is_loaded(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir) / "output"
+            manifest_path = Path(output_dir) / "manifest.json"
+            manifest = OutputManifest(output_path, manifest_path)
+            assert not manifest.is_loaded
+            manifest.write_text(output_path / "old.pyi", "old")
+            manifest.write_text(output_path / "module.pyi", "module")
+            manifest.save()
+            assert manifest.is_loaded
+
+            manifest = OutputManifest(output_path, manifest_path)
+            assert manifest.is_loaded
+            manifest.write_text(output_path / "module.pyi", "module")
+            manifest.write_text(output_path / "new.pyi", "new")
+            assert manifest.get_stale_paths() == [output_path / "old.pyi"]
+
+    def test_no_manifest_path(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            manifest = OutputManifest(output_path)
+            assert manifest.write_text(output_path / "module.pyi", "module")
+            manifest.save()
+            assert not manifest.is_loaded
+            assert list(output_path.iterdir()) == [output_path / "module.pyi"]
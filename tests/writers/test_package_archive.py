@@ -0,0 +1,106 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from mypy_boto3_builder.writers.package_archive import PackageArchive, PackageArchiveError
+
+SETUP_CONTENT = """
+from setuptools import setup
+
+LONG_DESCRIPTION = open("README.md").read()
+
+setup(
+    name="mypy-boto3-s3",
+    version="1.2.3",
+    packages=["mypy_boto3_s3"],
+    description="Type annotations",
+    keywords="boto3 s3",
+    long_description=LONG_DESCRIPTION,
+    long_description_content_type="text/markdown",
+    package_data={"mypy_boto3_s3": ["py.typed", "*.pyi"]},
+    install_requires=["typing-extensions; python_version < '3.9'"],
+    extras_require={"all": ["mypy-boto3-sqs>=1.2.0"]},
+)
+"""
+
+FILES = {
+    "setup.py": SETUP_CONTENT,
+    "README.md": "# mypy-boto3-s3",
+    "LICENSE": "MIT License",
+    "mypy_boto3_s3/__init__.py": "",
+    "mypy_boto3_s3/client.pyi": "class Client: ...",
+    "mypy_boto3_s3/py.typed": "",
+    "mypy_boto3_s3/nested/module.pyi": "",
+}
+
+
+class TestPackageArchive:
+    archive: PackageArchive
+
+    def setup_method(self) -> None:
+        self.archive = PackageArchive(FILES)
+
+    def test_init(self) -> None:
+        assert self.archive.name == "mypy-boto3-s3"
+        assert self.archive.version == "1.2.3"
+        assert self.archive.wheel_file_name == "mypy_boto3_s3-1.2.3-py3-none-any.whl"
+        assert self.archive.sdist_file_name == "mypy_boto3_s3-1.2.3.tar.gz"
+
+        with pytest.raises(PackageArchiveError):
+            PackageArchive({"setup.py": "setup(name=NAME)"})
+        with pytest.raises(PackageArchiveError):
+            PackageArchive({"setup.py": "print()"})
+
+    def test_get_metadata(self) -> None:
+        assert self.archive.get_metadata().split("\n") == [
+            "Metadata-Version: 2.1",
+            "Name: mypy-boto3-s3",
+            "Version: 1.2.3",
+            "Summary: Type annotations",
+            "Keywords: boto3 s3",
+            "Description-Content-Type: text/markdown",
+            "Requires-Dist: typing-extensions; python_version < '3.9'",
+            "Provides-Extra: all",
+            'Requires-Dist: mypy-boto3-sqs>=1.2.0; extra == "all"',
+            "License-File: LICENSE",
+            "",
+            "# mypy-boto3-s3",
+        ]
+
+    def test_build_wheel(self) -> None:
+        data = self.archive.build_wheel()
+        assert data == PackageArchive(FILES).build_wheel()
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert archive.namelist() == [
+                "mypy_boto3_s3/__init__.py",
+                "mypy_boto3_s3/client.pyi",
+                "mypy_boto3_s3/py.typed",
+                "mypy_boto3_s3-1.2.3.dist-info/LICENSE",
+                "mypy_boto3_s3-1.2.3.dist-info/METADATA",
+                "mypy_boto3_s3-1.2.3.dist-info/WHEEL",
+                "mypy_boto3_s3-1.2.3.dist-info/top_level.txt",
+                "mypy_boto3_s3-1.2.3.dist-info/RECORD",
+            ]
+            assert archive.getinfo("mypy_boto3_s3/client.pyi").date_time == (1980, 1, 1, 0, 0, 0)
+            record = archive.read("mypy_boto3_s3-1.2.3.dist-info/RECORD").decode().splitlines()
+            client_hash = "sha256=gvrft4EmmKFzIjFFWb2Gga2G2FYimKmlYp4y-Np4j3w"
+            assert record[1] == f"mypy_boto3_s3/client.pyi,{client_hash},17"
+            assert record[-1] == "mypy_boto3_s3-1.2.3.dist-info/RECORD,,"
+
+    def test_build_sdist(self) -> None:
+        data = self.archive.build_sdist()
+        assert data == PackageArchive(FILES).build_sdist()
+        with tarfile.open(fileobj=io.BytesIO(data)) as archive:
+            assert archive.getnames() == [
+                "mypy_boto3_s3-1.2.3/LICENSE",
+                "mypy_boto3_s3-1.2.3/PKG-INFO",
+                "mypy_boto3_s3-1.2.3/README.md",
+                "mypy_boto3_s3-1.2.3/mypy_boto3_s3/__init__.py",
+                "mypy_boto3_s3-1.2.3/mypy_boto3_s3/client.pyi",
+                "mypy_boto3_s3-1.2.3/mypy_boto3_s3/nested/module.pyi",
+                "mypy_boto3_s3-1.2.3/mypy_boto3_s3/py.typed",
+                "mypy_boto3_s3-1.2.3/setup.py",
+            ]
+            assert archive.getmember("mypy_boto3_s3-1.2.3/setup.py").mtime == 315532800
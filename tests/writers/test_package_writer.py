@@ -0,0 +1,107 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from mypy_boto3_builder.structures.package import Package
+from mypy_boto3_builder.writers.memory_output import MemoryOutput
+from mypy_boto3_builder.writers.output_index import OutputIndex
+from mypy_boto3_builder.writers.output_manifest import OutputManifest
+from mypy_boto3_builder.writers.package_writer import PackageWriter
+
+
+class TestPackageWriter:
+    def test_cleanup(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            writer = PackageWriter(output_path)
+            (output_path / "unknown.pyi").write_text("unknown")
+            manifest = OutputManifest(output_path, writer._get_manifest_path(output_path))
+            manifest.write_text(output_path / "package" / "old.pyi", "old")
+            manifest.write_text(output_path / "package" / "module.pyi", "module")
+            writer._cleanup(
+                [output_path / "package" / "old.pyi", output_path / "package" / "module.pyi"],
+                manifest,
+            )
+            manifest.save()
+            assert not (output_path / "unknown.pyi").exists()
+            assert (output_path / "package" / "old.pyi").exists()
+            assert (output_path / "package" / "module.pyi").exists()
+            assert manifest.manifest_path.exists()
+
+            (output_path / "unknown.pyi").write_text("unknown")
+            manifest = OutputManifest(output_path, writer._get_manifest_path(output_path))
+            manifest.write_text(output_path / "package" / "module.pyi", "module")
+            writer._cleanup([output_path / "package" / "module.pyi"], manifest)
+            manifest.save()
+            assert not (output_path / "package" / "old.pyi").exists()
+            assert (output_path / "package" / "module.pyi").exists()
+            assert not (output_path / "unknown.pyi").exists()
+            assert manifest.manifest_path.exists()
+
+    def test_cleanup_output_index(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            package_path = output_path / "package"
+            package_path.mkdir()
+            (package_path / "unknown.pyi").write_text("unknown")
+            writer = PackageWriter(output_path)
+            OutputIndex.scan(output_path)
+            try:
+                writer._write_tree(package_path, {package_path / "old.pyi": "old"})
+                assert not (package_path / "unknown.pyi").exists()
+                (package_path / "new_unknown.pyi").write_text("unknown")
+                writer._write_tree(package_path, {package_path / "module.pyi": "module"})
+            finally:
+                OutputIndex.clear()
+            assert sorted(i.name for i in package_path.iterdir()) == [
+                "module.pyi",
+                "new_unknown.pyi",
+            ]
+
+            writer._write_tree(package_path, {package_path / "module.pyi": "module"})
+            assert list(package_path.iterdir()) == [package_path / "module.pyi"]
+
+    def test_write_tree(self) -> None:
+        for generate_setup in (True, False):
+            with tempfile.TemporaryDirectory() as output_dir:
+                output_path = Path(output_dir)
+                package_path = output_path / "package"
+                writer = PackageWriter(output_path, generate_setup=generate_setup)
+                writer._write_tree(package_path, {package_path / "module.pyi": "module"})
+                assert list(package_path.iterdir()) == [package_path / "module.pyi"]
+                manifest_path = writer._get_manifest_path(package_path)
+                assert manifest_path == output_path / ".build_manifest" / "output" / "package.json"
+                assert manifest_path.exists()
+
+    def test_write_docs(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir, tempfile.TemporaryDirectory() as templates_dir:
+            output_path = Path(output_dir)
+            templates_path = Path(templates_dir)
+            (templates_path / "README.md.jinja2").write_text("")
+            writer = PackageWriter(output_path)
+            with patch("mypy_boto3_builder.writers.package_writer.render_jinja2_template") as mock:
+                mock.return_value = "# name"
+                writer.write_docs(Package("name", "pypi-name"), templates_path)
+            assert sorted(i.name for i in output_path.iterdir()) == [".build_manifest", "README.md"]
+            assert (output_path / ".build_manifest" / "output" / "__root__.json").exists()
+
+    def test_write_tree_memory_output(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir, tempfile.TemporaryDirectory() as static_dir:
+            output_path = Path(output_dir)
+            static_path = Path(static_dir) / "static.pyi"
+            static_path.write_text("static")
+            writer = PackageWriter(output_path)
+            MemoryOutput.enable()
+            try:
+                writer._write_tree(
+                    output_path,
+                    {output_path / "module.pyi": "module"},
+                    {output_path / "static.pyi": static_path},
+                )
+                assert MemoryOutput.pop_files() == {
+                    output_path / "module.pyi": b"module",
+                    output_path / "static.pyi": b"static",
+                }
+            finally:
+                MemoryOutput.disable()
+            assert list(output_path.iterdir()) == []
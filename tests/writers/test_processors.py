@@ -57,16 +57,16 @@ class TestProcessors:
         parse_master_package_mock.assert_called_with(session_mock, [service_name_mock])
         assert result == parse_master_package_mock()
 
-    @patch("mypy_boto3_builder.writers.processors.parse_service_package")
+    @patch("mypy_boto3_builder.writers.processors.ServicePackageCache")
     @patch("mypy_boto3_builder.writers.processors.PackageWriter")
     def test_process_service(
         self,
         PackageWriterMock: MagicMock,
-        parse_service_package_mock: MagicMock,
+        ServicePackageCacheMock: MagicMock,
     ) -> None:
         session_mock = MagicMock()
         service_name_mock = MagicMock()
-        parse_service_package_mock().typed_dicts = [MagicMock()]
+        ServicePackageCacheMock.get().typed_dicts = [MagicMock()]
         result = process_service(
             session_mock,
             service_name_mock,
@@ -76,15 +76,15 @@ class TestProcessors:
             version="1.2.3",
         )
         PackageWriterMock().write_service_package.assert_called()
-        parse_service_package_mock.assert_called_with(session_mock, service_name_mock)
-        assert result == parse_service_package_mock()
+        ServicePackageCacheMock.get.assert_called_with(session_mock, service_name_mock)
+        assert result == ServicePackageCacheMock.get()
 
-    @patch("mypy_boto3_builder.writers.processors.parse_service_package")
+    @patch("mypy_boto3_builder.writers.processors.ServicePackageCache")
     @patch("mypy_boto3_builder.writers.processors.PackageWriter")
     def test_process_service_docs(
         self,
         PackageWriterMock: MagicMock,
-        parse_service_package_mock: MagicMock,
+        ServicePackageCacheMock: MagicMock,
     ) -> None:
         session_mock = MagicMock()
         service_name_mock = MagicMock()
@@ -95,8 +95,8 @@ class TestProcessors:
             [ServiceName("ec2", "EC2")],
         )
         PackageWriterMock().write_service_docs.assert_called()
-        parse_service_package_mock.assert_called_with(session_mock, service_name_mock)
-        assert result == parse_service_package_mock()
+        ServicePackageCacheMock.get.assert_called_with(session_mock, service_name_mock)
+        assert result == ServicePackageCacheMock.get()
 
     @patch("mypy_boto3_builder.writers.processors.parse_boto3_stubs_package")
     @patch("mypy_boto3_builder.writers.processors.PackageWriter")
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from black import NothingChanged
 
+from mypy_boto3_builder.writers.formatter_cache import FormatterCache
 from mypy_boto3_builder.writers.utils import (
     blackify,
     insert_md_toc,
@@ -12,6 +13,9 @@ from mypy_boto3_builder.writers.utils import (
 
 
 class TestUtils:
+    def setup_method(self) -> None:
+        FormatterCache.clear()
+
     @patch("mypy_boto3_builder.writers.utils.black")
     def test_blackify(self, black_mock: MagicMock):
         file_path_mock = MagicMock()
@@ -29,19 +33,28 @@ class TestUtils:
         assert result == black_mock.format_file_contents()
         black_mock.FileMode.assert_called_with(is_pyi=True, line_length=100)
 
+        black_mock.format_file_contents.reset_mock()
+        assert blackify("my content", file_path_mock) == result
+        black_mock.format_file_contents.assert_not_called()
+
+        FormatterCache.clear()
         black_mock.format_file_contents.side_effect = IndentationError()
         with pytest.raises(ValueError):
             blackify("my content", file_path_mock)
 
         black_mock.format_file_contents.side_effect = NothingChanged()
         assert blackify("my content", file_path_mock) == "my content"
+        assert blackify("my content", file_path_mock) == "my content"
 
     @patch("mypy_boto3_builder.writers.utils.sort_code_string")
     def test_sort_imports(self, sort_code_string_mock: MagicMock):
         sort_code_string_mock.return_value = "output"
         assert sort_imports("test", "mymodule") == "output"
-        sort_code_string_mock.assert_called()
+        sort_code_string_mock.assert_called_once()
+        assert sort_imports("test", "mymodule") == "output"
+        sort_code_string_mock.assert_called_once()
         assert sort_imports("test", "boto3") == "output"
+        assert sort_code_string_mock.call_count == 2
 
     @patch("mypy_boto3_builder.writers.utils.TEMPLATES_PATH")
     @patch("mypy_boto3_builder.writers.utils.JinjaManager")